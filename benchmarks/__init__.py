@@ -0,0 +1,28 @@
+"""
+Synthetic large-scene benchmark suite for CurveEditor.
+
+Measures the code paths that dominate interactive cost on production-sized
+shots (hundreds of tracks, thousands of frames) and stores the timings as JSON
+baselines so regressions can be caught by comparing against a previous run.
+
+Usage:
+    python -m benchmarks --tracks 100 --frames 2000 --save benchmarks/baselines/local.json
+    python -m benchmarks --compare benchmarks/baselines/local.json --threshold 0.25
+
+The suite always runs headless; QT_QPA_PLATFORM defaults to "offscreen".
+"""
+
+from benchmarks.baseline import BenchmarkComparison, compare_results, load_baseline, save_baseline
+from benchmarks.scene_generator import SceneSpec, generate_scene
+from benchmarks.suite import BenchmarkResult, BenchmarkSuite
+
+__all__ = [
+    "BenchmarkComparison",
+    "BenchmarkResult",
+    "BenchmarkSuite",
+    "SceneSpec",
+    "compare_results",
+    "generate_scene",
+    "load_baseline",
+    "save_baseline",
+]
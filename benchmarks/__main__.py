@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Command-line entry point for the benchmark suite.
+
+Examples:
+    # Record a baseline
+    python -m benchmarks --tracks 100 --frames 2000 --save benchmarks/baselines/local.json
+
+    # Compare against it (exit code 1 on regression)
+    python -m benchmarks --compare benchmarks/baselines/local.json --threshold 0.25
+
+    # Run a subset
+    python -m benchmarks --only render_offscreen find_point_at
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="CurveEditor large-scene benchmarks")
+    _ = parser.add_argument("--tracks", type=int, default=100, help="number of curves in the scene")
+    _ = parser.add_argument("--frames", type=int, default=2000, help="frames per curve")
+    _ = parser.add_argument("--gaps", type=int, default=3, help="endframe-terminated gaps per curve")
+    _ = parser.add_argument("--seed", type=int, default=1234, help="scene RNG seed")
+    _ = parser.add_argument("--repeats", type=int, default=5, help="timed iterations per scenario")
+    _ = parser.add_argument("--only", nargs="+", metavar="SCENARIO", help="run only these scenarios")
+    _ = parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    _ = parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    _ = parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    _ = parser.add_argument(
+        "--threshold", type=float, default=0.25, help="allowed relative slowdown before failing (default 0.25)"
+    )
+    _ = parser.add_argument(
+        "--min-delta-ms", type=float, default=0.5, help="ignore slowdowns smaller than this (default 0.5 ms)"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark CLI. Returns the process exit code."""
+    _ = os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    args = _build_parser().parse_args(argv)
+
+    from benchmarks.baseline import compare_results, load_baseline, save_baseline
+    from benchmarks.scene_generator import SceneSpec
+    from benchmarks.suite import BenchmarkSuite
+
+    if args.compare:
+        # The baseline defines the scene so the comparison is like-for-like
+        spec, baseline = load_baseline(args.compare)
+    else:
+        spec = SceneSpec(tracks=args.tracks, frames=args.frames, gaps_per_track=args.gaps, seed=args.seed)
+        baseline = None
+
+    suite = BenchmarkSuite(spec, repeats=args.repeats)
+    if args.list:
+        print("\n".join(suite.scenario_names))
+        return 0
+
+    print(f"Scene: {spec.tracks} tracks x {spec.frames} frames, {spec.gaps_per_track} gaps/track, seed {spec.seed}")
+    results = suite.run(args.only)
+    for result in results.values():
+        print(
+            f"{result.name:<28} median {result.median_ms:>10.2f} ms  (min {result.min_ms:.2f}, max {result.max_ms:.2f})"
+        )
+
+    if args.save:
+        path = save_baseline(results, spec, args.save)
+        print(f"Baseline written to {path}")
+
+    if baseline is not None:
+        comparisons = compare_results(baseline, results, args.threshold, args.min_delta_ms)
+        print(f"\nComparison against {args.compare} (threshold {args.threshold:.0%}):")
+        for comparison in comparisons:
+            print(comparison.describe())
+        regressions = [c for c in comparisons if c.is_regression]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) detected")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    # Keep application debug logging out of the timed regions
+    logging.getLogger().setLevel(logging.WARNING)
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""
+JSON baseline storage and regression comparison for benchmark results.
+
+Baseline file layout:
+    {
+        "format_version": 1,
+        "created": "2025-01-01T12:00:00",
+        "environment": {"python": "3.12.3", "platform": "...", "qt_platform": "offscreen"},
+        "scene": {...SceneSpec fields...},
+        "results": {"render_offscreen": {"median_ms": 12.3, ...}, ...}
+    }
+
+Comparisons use the median, which is robust against the occasional scheduler
+hiccup. Very fast scenarios are protected from noise by an absolute floor:
+a slowdown only counts as a regression if it exceeds both the relative
+threshold and `min_delta_ms`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.scene_generator import SceneSpec
+from benchmarks.suite import BenchmarkResult
+
+BASELINE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    """Comparison of one scenario against its baseline."""
+
+    name: str
+    baseline_ms: float
+    current_ms: float
+    threshold: float
+    min_delta_ms: float
+
+    @property
+    def ratio(self) -> float:
+        """current / baseline (1.0 means unchanged)."""
+        return self.current_ms / self.baseline_ms if self.baseline_ms > 0 else float("inf")
+
+    @property
+    def is_regression(self) -> bool:
+        """True if the slowdown exceeds both the relative and absolute limits."""
+        delta = self.current_ms - self.baseline_ms
+        return delta > self.min_delta_ms and self.ratio > 1.0 + self.threshold
+
+    def describe(self) -> str:
+        """One-line human readable summary."""
+        marker = "REGRESSION" if self.is_regression else "ok"
+        return (
+            f"{self.name:<28} {self.baseline_ms:>10.2f} ms -> {self.current_ms:>10.2f} ms "
+            + f"({(self.ratio - 1.0) * 100:+6.1f}%) {marker}"
+        )
+
+
+def save_baseline(results: dict[str, BenchmarkResult], spec: SceneSpec, path: str | Path) -> Path:
+    """
+    Save benchmark results as a JSON baseline.
+
+    Args:
+        results: Results from BenchmarkSuite.run()
+        spec: Scene the results were measured on
+        path: Destination file (parent directories are created)
+
+    Returns:
+        Path to the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "format_version": BASELINE_FORMAT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt_platform": os.environ.get("QT_QPA_PLATFORM", ""),
+        },
+        "scene": spec.to_dict(),
+        "results": {name: result.to_dict() for name, result in results.items()},
+    }
+    _ = path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def load_baseline(path: str | Path) -> tuple[SceneSpec, dict[str, BenchmarkResult]]:
+    """
+    Load a JSON baseline.
+
+    Args:
+        path: Baseline file written by save_baseline()
+
+    Returns:
+        Tuple of (scene spec, results by scenario name)
+
+    Raises:
+        ValueError: If the file has an unsupported format version
+    """
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    version = payload.get("format_version")
+    if version != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark baseline format version: {version}")
+    spec = SceneSpec(**payload["scene"])
+    results = {name: BenchmarkResult(**data) for name, data in payload["results"].items()}
+    return spec, results
+
+
+def compare_results(
+    baseline: dict[str, BenchmarkResult],
+    current: dict[str, BenchmarkResult],
+    threshold: float = 0.25,
+    min_delta_ms: float = 0.5,
+) -> list[BenchmarkComparison]:
+    """
+    Compare current results against a baseline.
+
+    Scenarios missing from either side are skipped.
+
+    Args:
+        baseline: Baseline results
+        current: Freshly measured results
+        threshold: Allowed relative slowdown (0.25 = 25% slower)
+        min_delta_ms: Absolute slowdown below which changes are treated as noise
+
+    Returns:
+        One comparison per scenario present in both result sets
+    """
+    return [
+        BenchmarkComparison(
+            name=name,
+            baseline_ms=baseline[name].median_ms,
+            current_ms=result.median_ms,
+            threshold=threshold,
+            min_delta_ms=min_delta_ms,
+        )
+        for name, result in current.items()
+        if name in baseline
+    ]
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Deterministic synthetic scene generator for benchmarks.
+
+Produces N tracks x M frames of curve data with the structure real 3DEqualizer
+exports have: keyframes at irregular intervals, tracked runs between them, the
+occasional interpolated stretch, and ENDFRAME-terminated gaps followed by a
+KEYFRAME that restarts the next segment.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from core.type_aliases import CurveDataList
+
+
+@dataclass(frozen=True)
+class SceneSpec:
+    """Shape of a synthetic scene.
+
+    Attributes:
+        tracks: Number of curves in the scene
+        frames: Number of frames per curve (before gaps are cut out)
+        gaps_per_track: Number of ENDFRAME-terminated gaps per curve
+        max_gap_length: Upper bound for the number of frames removed per gap
+        keyframe_interval: Mean spacing between keyframes inside a segment
+        interpolated_ratio: Fraction of non-keyframe points marked interpolated
+        image_width: Plate width used for coordinate ranges
+        image_height: Plate height used for coordinate ranges and Y-flip
+        seed: RNG seed; identical specs always produce identical scenes
+    """
+
+    tracks: int = 100
+    frames: int = 2000
+    gaps_per_track: int = 3
+    max_gap_length: int = 40
+    keyframe_interval: int = 25
+    interpolated_ratio: float = 0.15
+    image_width: int = 1920
+    image_height: int = 1080
+    seed: int = 1234
+
+    @property
+    def total_points_estimate(self) -> int:
+        """Upper bound on the number of points in the scene."""
+        return self.tracks * self.frames
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Serialize for inclusion in benchmark result files."""
+        return asdict(self)
+
+
+def _generate_track(rng: np.random.Generator, spec: SceneSpec) -> CurveDataList:
+    """Generate a single track following the scene spec."""
+    frames = np.arange(1, spec.frames + 1)
+
+    # Smooth random walk across the plate
+    start = rng.uniform(
+        (0.1 * spec.image_width, 0.1 * spec.image_height), (0.9 * spec.image_width, 0.9 * spec.image_height)
+    )
+    steps = rng.normal(0.0, 1.5, size=(spec.frames, 2))
+    xy = start + np.cumsum(steps, axis=0)
+    xy[:, 0] = np.clip(xy[:, 0], 0.0, spec.image_width)
+    xy[:, 1] = np.clip(xy[:, 1], 0.0, spec.image_height)
+
+    statuses = np.where(rng.random(spec.frames) < spec.interpolated_ratio, "interpolated", "tracked").astype(object)
+    keyframe_mask = rng.random(spec.frames) < 1.0 / max(spec.keyframe_interval, 1)
+    statuses[keyframe_mask] = "keyframe"
+    statuses[0] = "keyframe"
+
+    keep = np.ones(spec.frames, dtype=bool)
+    if spec.gaps_per_track > 0 and spec.frames > 4:
+        # Gap starts are spread over the interior so every gap has data on both sides
+        gap_starts = np.sort(rng.choice(np.arange(2, spec.frames - 2), size=spec.gaps_per_track, replace=False))
+        for gap_start in gap_starts:
+            gap_length = int(rng.integers(1, spec.max_gap_length + 1))
+            gap_end = min(int(gap_start) + gap_length, spec.frames - 1)
+            statuses[gap_start - 1] = "endframe"
+            keep[gap_start:gap_end] = False
+            if gap_end < spec.frames:
+                statuses[gap_end] = "keyframe"
+
+    statuses[spec.frames - 1] = "keyframe"
+
+    return [
+        (int(frame), float(x), float(y), str(status))
+        for frame, (x, y), status in zip(frames[keep], xy[keep], statuses[keep], strict=True)
+    ]
+
+
+def generate_scene(spec: SceneSpec) -> dict[str, CurveDataList]:
+    """Generate a multi-curve scene.
+
+    Args:
+        spec: Scene shape
+
+    Returns:
+        Dictionary mapping curve names ("Point001", ...) to curve data
+    """
+    rng = np.random.default_rng(spec.seed)
+    width = max(3, len(str(spec.tracks)))
+    return {f"Point{i + 1:0{width}d}": _generate_track(rng, spec) for i in range(spec.tracks)}
@@ -0,0 +1,469 @@
+#!/usr/bin/env python
+"""
+Benchmark scenarios for CurveEditor hot paths.
+
+Each scenario times one user-visible operation against a synthetic scene:
+file parsing, ApplicationState fan-out, timeline status computation,
+segment lookups, densification, offscreen rendering, culling and
+level-of-detail on a 100k-point curve, dense marker drawing, hit testing,
+rubber-band selection and undo/redo. Setup work is done once per scenario;
+only the operation itself is inside the timed region.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from benchmarks.scene_generator import SceneSpec, generate_scene
+from core.logger_utils import get_logger
+from core.type_aliases import CurveDataList
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
+
+    from ui.curve_view_widget import CurveViewWidget
+
+logger = get_logger("benchmarks")
+
+# Number of hit-test queries issued per find_point_at iteration
+HIT_TEST_QUERIES = 50
+
+# Number of points moved by the undo/redo scenario
+UNDO_MOVE_COUNT = 200
+
+# Point count of the single curve used by the culling/level-of-detail scenario
+LARGE_CURVE_POINTS = 100_000
+
+# Number of visible markers drawn by the dense marker scenario
+DENSE_MARKER_COUNT = 30_000
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timing summary for one scenario (all times in milliseconds)."""
+
+    name: str
+    repeats: int
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_samples(cls, name: str, samples: list[float]) -> BenchmarkResult:
+        """Build a result from raw per-iteration timings in seconds."""
+        samples_ms = [s * 1000.0 for s in samples]
+        return cls(
+            name=name,
+            repeats=len(samples_ms),
+            min_ms=min(samples_ms),
+            median_ms=statistics.median(samples_ms),
+            mean_ms=statistics.fmean(samples_ms),
+            max_ms=max(samples_ms),
+        )
+
+    def to_dict(self) -> dict[str, float | int | str]:
+        """Serialize for JSON baselines."""
+        return asdict(self)
+
+
+class _HeadlessStateManager:
+    """No-op history sink used by _HeadlessMainWindow."""
+
+    def set_history_state(self, can_undo: bool, can_redo: bool, position: int, size: int) -> None:
+        """Ignore history updates; there is no UI to refresh."""
+
+
+class _HeadlessMainWindow:
+    """Minimal stand-in for MainWindow so commands can run without the full UI.
+
+    CommandManager only reports history state to the main window and guards the
+    optional UI hooks with getattr, so a state manager is all that is needed.
+    """
+
+    def __init__(self) -> None:
+        self.state_manager: _HeadlessStateManager = _HeadlessStateManager()
+
+
+class BenchmarkSuite:
+    """
+    Runs the benchmark scenarios against one synthetic scene.
+
+    Usage:
+        suite = BenchmarkSuite(SceneSpec(tracks=50, frames=1000), repeats=5)
+        results = suite.run()
+    """
+
+    def __init__(self, spec: SceneSpec, repeats: int = 5, widget_size: tuple[int, int] = (1920, 1080)) -> None:
+        """
+        Initialize the suite.
+
+        Args:
+            spec: Scene to generate
+            repeats: Timed iterations per scenario (after one warm-up iteration)
+            widget_size: Size of the offscreen curve view and render target
+        """
+        self.spec: SceneSpec = spec
+        self.repeats: int = max(1, repeats)
+        self.widget_size: tuple[int, int] = widget_size
+        self.scene: dict[str, CurveDataList] = generate_scene(spec)
+        self._scenarios: dict[str, Callable[[], Callable[[], object]]] = {
+            "parse_2dtrack": self._setup_parse_2dtrack,
+            "set_curve_data_fanout": self._setup_set_curve_data_fanout,
+            "frame_range_point_status": self._setup_frame_range_point_status,
+            "aggregate_frame_statuses": self._setup_aggregate_frame_statuses,
+            "segmented_curve_lookup": self._setup_segmented_curve_lookup,
+            "densify_curve": self._setup_densify_curve,
+            "render_offscreen": self._setup_render_offscreen,
+            "cull_and_lod_100k": self._setup_cull_and_lod,
+            "draw_markers_30k": self._setup_draw_markers,
+            "find_point_at": self._setup_find_point_at,
+            "rubber_band_select": self._setup_rubber_band_select,
+            "undo_redo": self._setup_undo_redo,
+        }
+        self._tmpdir: tempfile.TemporaryDirectory[str] | None = None
+        self._widget: CurveViewWidget | None = None
+
+    @property
+    def scenario_names(self) -> list[str]:
+        """Names of all available scenarios in execution order."""
+        return list(self._scenarios)
+
+    def run(self, names: list[str] | None = None) -> dict[str, BenchmarkResult]:
+        """
+        Run the selected scenarios.
+
+        Args:
+            names: Scenario names to run. None runs all scenarios.
+
+        Returns:
+            Mapping of scenario name to timing result
+
+        Raises:
+            KeyError: If an unknown scenario name is requested
+        """
+        selected = names if names is not None else self.scenario_names
+        unknown = [name for name in selected if name not in self._scenarios]
+        if unknown:
+            raise KeyError(f"Unknown benchmark scenario(s): {', '.join(unknown)}")
+
+        _ = self._ensure_qapplication()
+        results: dict[str, BenchmarkResult] = {}
+        try:
+            for name in selected:
+                self._reset_state()
+                operation = self._scenarios[name]()
+                results[name] = self._time(name, operation)
+                logger.info(f"{name}: median {results[name].median_ms:.2f} ms")
+        finally:
+            self._teardown()
+        return results
+
+    # ==================== Timing Infrastructure ====================
+
+    def _time(self, name: str, operation: Callable[[], object]) -> BenchmarkResult:
+        """Time an operation: one warm-up call followed by `repeats` timed calls."""
+        from PySide6.QtCore import QCoreApplication
+
+        _ = operation()
+        QCoreApplication.processEvents()
+
+        samples: list[float] = []
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            _ = operation()
+            samples.append(time.perf_counter() - start)
+            # Drain deferred work (deleteLater, queued signals) outside the timed region
+            QCoreApplication.processEvents()
+        return BenchmarkResult.from_samples(name, samples)
+
+    @staticmethod
+    def _ensure_qapplication() -> QApplication:
+        """Create the QApplication on the offscreen platform if none exists."""
+        _ = os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PySide6.QtWidgets import QApplication
+
+        app = QApplication.instance()
+        if app is None:
+            app = QApplication([])
+        return app  # pyright: ignore[reportReturnType]
+
+    def _reset_state(self) -> None:
+        """Give every scenario fresh singletons so results do not depend on ordering."""
+        self._teardown()
+
+        from services import reset_all_services
+        from stores.application_state import reset_application_state
+
+        reset_application_state()
+        reset_all_services()
+
+    def _teardown(self) -> None:
+        """Release the offscreen widget and temp files."""
+        if self._widget is not None:
+            self._widget.deleteLater()
+            self._widget = None
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    def _load_scene_into_state(self) -> str:
+        """Load the scene into ApplicationState and return the active curve name."""
+        from stores.application_state import get_application_state
+
+        app_state = get_application_state()
+        with app_state.batch_updates():
+            for name, data in self.scene.items():
+                app_state.set_curve_data(name, data)
+            active = next(iter(self.scene))
+            app_state.set_active_curve(active)
+            app_state.set_show_all_curves(True)
+        return active
+
+    def _create_view(self) -> CurveViewWidget:
+        """Create an offscreen CurveViewWidget showing the scene."""
+        from ui.curve_view_widget import CurveViewWidget
+
+        _ = self._load_scene_into_state()
+        widget = CurveViewWidget()
+        widget.resize(*self.widget_size)
+        self._widget = widget
+        return widget
+
+    # ==================== Scenarios ====================
+    # Each _setup_* method performs untimed setup and returns the timed operation.
+
+    def _setup_parse_2dtrack(self) -> Callable[[], object]:
+        from services.data_service import DataService
+
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="curveeditor_bench_")
+        path = str(Path(self._tmpdir.name) / "scene.txt")
+        service = DataService()
+        if not service.save_tracked_data(path, self.scene, self.spec.image_height):
+            raise RuntimeError(f"Failed to write benchmark scene to {path}")
+        return lambda: service.load_tracked_data(path)
+
+    def _setup_set_curve_data_fanout(self) -> Callable[[], object]:
+        from stores.application_state import get_application_state
+
+        # A live view makes the fan-out realistic (StateSyncController, caches, repaint scheduling)
+        _ = self._create_view()
+        app_state = get_application_state()
+        active = app_state.active_curve
+        assert active is not None
+        original = self.scene[active]
+        moved = [(p[0], p[1] + 0.5, p[2] + 0.5, *p[3:]) for p in original]
+        toggle = [False]
+
+        def _operation() -> None:
+            toggle[0] = not toggle[0]
+            app_state.set_curve_data(active, moved if toggle[0] else original)
+
+        return _operation
+
+    def _setup_frame_range_point_status(self) -> Callable[[], object]:
+        from services import get_data_service
+
+        service = get_data_service()
+        curve = next(iter(self.scene.values()))
+        return lambda: service.get_frame_range_point_status(curve)
+
+    def _setup_aggregate_frame_statuses(self) -> Callable[[], object]:
+        from services import get_data_service
+
+        _ = self._load_scene_into_state()
+        service = get_data_service()
+        names = list(self.scene)
+        return lambda: service.aggregate_frame_statuses_for_curves(names)
+
+    def _setup_segmented_curve_lookup(self) -> Callable[[], object]:
+        from core.curve_segments import SegmentedCurve
+
+        curve = next(iter(self.scene.values()))
+        segmented = SegmentedCurve.from_curve_data(curve)
+        first, last = curve[0][0], curve[-1][0]
+        frames = range(first, last + 1)
+
+        def _operation() -> None:
+            for frame in frames:
+                _ = segmented.get_position_at_frame(frame)
+
+        return _operation
+
+    def _setup_densify_curve(self) -> Callable[[], object]:
+        from rendering.optimized_curve_renderer import OptimizedCurveRenderer
+
+        renderer = OptimizedCurveRenderer()
+        curve = next(iter(self.scene.values()))
+        return lambda: renderer._densify_curve_for_rendering(curve)  # pyright: ignore[reportPrivateUsage]
+
+    def _setup_render_offscreen(self) -> Callable[[], object]:
+        from PySide6.QtGui import QImage, QPainter
+
+        from core.display_mode import DisplayMode
+        from rendering.optimized_curve_renderer import OptimizedCurveRenderer
+        from rendering.render_state import RenderState
+        from rendering.visual_settings import VisualSettings
+
+        active = self._load_scene_into_state()
+        width, height = self.widget_size
+        render_state = RenderState(
+            points=self.scene[active],
+            current_frame=self.spec.frames // 2,
+            selected_points=set(),
+            widget_width=width,
+            widget_height=height,
+            zoom_factor=1.0,
+            pan_offset_x=0.0,
+            pan_offset_y=0.0,
+            manual_offset_x=0.0,
+            manual_offset_y=0.0,
+            flip_y_axis=False,
+            show_background=False,
+            image_width=self.spec.image_width,
+            image_height=self.spec.image_height,
+            visual=VisualSettings(),
+            curves_data=self.scene,
+            display_mode=DisplayMode.ALL_VISIBLE,
+            selected_curve_names=set(),
+            selected_curves_ordered=[],
+            curve_metadata={name: {"visible": True} for name in self.scene},
+            active_curve_name=active,
+            visible_curves=frozenset(self.scene),
+        )
+        renderer = OptimizedCurveRenderer()
+        image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+
+        def _operation() -> None:
+            image.fill(0)
+            painter = QPainter(image)
+            try:
+                renderer.render(painter, None, render_state)
+            finally:
+                _ = painter.end()
+
+        return _operation
+
+    def _setup_cull_and_lod(self) -> Callable[[], object]:
+        from dataclasses import replace
+
+        import numpy as np
+        from PySide6.QtCore import QRectF
+
+        from core.defaults import RENDER_PADDING
+        from rendering.optimized_curve_renderer import LevelOfDetail, RenderQuality, ViewportCuller
+        from rendering.point_decimation import required_point_mask
+
+        large_spec = replace(self.spec, tracks=1, frames=LARGE_CURVE_POINTS)
+        curve = next(iter(generate_scene(large_spec).values()))
+        width, height = self.widget_size
+        # Zoomed 2x into the plate so part of the curve is culled
+        scale = 2.0 * min(width / large_spec.image_width, height / large_spec.image_height)
+        screen_points = np.array([(p[1], p[2]) for p in curve], dtype=np.float64) * scale
+        viewport = QRectF(0, 0, width, height)
+        culler = ViewportCuller()
+        lod = LevelOfDetail()
+        current_frame = curve[len(curve) // 2][0]
+
+        def _operation() -> None:
+            visible = culler.get_visible_points(screen_points, viewport, padding=RENDER_PADDING)
+            required = required_point_mask(curve, (), current_frame)
+            _ = lod.get_lod_points(screen_points, RenderQuality.NORMAL, visible, required)
+
+        return _operation
+
+    def _setup_draw_markers(self) -> Callable[[], object]:
+        import numpy as np
+        from PySide6.QtGui import QImage, QPainter
+
+        from rendering.optimized_curve_renderer import OptimizedCurveRenderer
+        from rendering.render_state import RenderState
+        from rendering.visual_settings import VisualSettings
+
+        width, height = self.widget_size
+        rng = np.random.default_rng(self.spec.seed)
+        statuses = ("keyframe", "tracked", "interpolated", "normal")
+        screen_points = rng.random((DENSE_MARKER_COUNT, 2)) * (width, height)
+        points: CurveDataList = [
+            (frame, float(x), float(y), statuses[frame % len(statuses)])
+            for frame, (x, y) in enumerate(screen_points.tolist(), start=1)
+        ]
+        render_state = RenderState(
+            points=points,
+            current_frame=DENSE_MARKER_COUNT // 2,
+            selected_points=set(range(0, DENSE_MARKER_COUNT, 100)),
+            widget_width=width,
+            widget_height=height,
+            zoom_factor=1.0,
+            pan_offset_x=0.0,
+            pan_offset_y=0.0,
+            manual_offset_x=0.0,
+            manual_offset_y=0.0,
+            flip_y_axis=False,
+            show_background=False,
+            visual=VisualSettings(),
+        )
+        renderer = OptimizedCurveRenderer()
+        image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+
+        def _operation() -> None:
+            image.fill(0)
+            painter = QPainter(image)
+            try:
+                renderer._render_points_with_status(painter, render_state, screen_points, points)  # pyright: ignore[reportPrivateUsage]
+            finally:
+                _ = painter.end()
+
+        return _operation
+
+    def _setup_find_point_at(self) -> Callable[[], object]:
+        from services import get_interaction_service
+
+        widget = self._create_view()
+        service = get_interaction_service()
+        curve = next(iter(self.scene.values()))
+        step = max(1, len(curve) // HIT_TEST_QUERIES)
+        targets = [widget.data_to_screen(p[1], p[2]) for p in curve[::step][:HIT_TEST_QUERIES]]
+
+        def _operation() -> None:
+            for target in targets:
+                _ = service.find_point_at(widget, target.x(), target.y(), mode="all_visible")
+
+        return _operation
+
+    def _setup_rubber_band_select(self) -> Callable[[], object]:
+        from PySide6.QtCore import QRect
+
+        from services import get_interaction_service
+
+        widget = self._create_view()
+        service = get_interaction_service()
+        width, height = self.widget_size
+        rect = QRect(width // 4, height // 4, width // 2, height // 2)
+        main_window = _HeadlessMainWindow()
+        return lambda: service.select_points_in_rect(widget, main_window, rect)  # pyright: ignore[reportArgumentType]
+
+    def _setup_undo_redo(self) -> Callable[[], object]:
+        from core.commands.curve_commands import BatchMoveCommand
+        from services import get_interaction_service
+
+        active = self._load_scene_into_state()
+        service = get_interaction_service()
+        main_window = _HeadlessMainWindow()
+        curve = self.scene[active]
+        moves = [(i, (p[1], p[2]), (p[1] + 1.0, p[2] + 1.0)) for i, p in enumerate(curve[:UNDO_MOVE_COUNT])]
+        command = BatchMoveCommand(f"Move {len(moves)} points", moves)
+        _ = service.command_manager.execute_command(command, main_window)  # pyright: ignore[reportArgumentType]
+
+        def _operation() -> None:
+            _ = service.command_manager.undo(main_window)  # pyright: ignore[reportArgumentType]
+            _ = service.command_manager.redo(main_window)  # pyright: ignore[reportArgumentType]
+
+        return _operation
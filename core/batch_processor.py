@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+"""
+Headless batch processing of tracking files.
+
+Runs the editor's curve operations over many files without MainWindow or a
+display: loading (with default status assignment), tracking-direction status
+updates, gap filling, smoothing/filters, Insert Track averaging and export.
+The operations are the ones the GUI uses (DataService,
+data.tracking_direction_utils and core.insert_track_algorithm); only the
+application state, commands and undo history are left out.
+
+Files are distributed over a pool of worker processes, each with its own
+DataService, so throughput scales with cores. Every file is timed in its
+worker and failures are reported per file without stopping the batch.
+
+Usage:
+    settings = ProcessingSettings(direction=TrackingDirection.TRACKING_FW, smooth_window=5)
+    result = process_files(files, Path("out"), settings, workers=16)
+    print(result.report())
+
+The process_cli.py entry point next to main.py wraps this module.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from core.curve_data import CurveDataWithMetadata
+from core.logger_utils import get_logger
+from core.models import TrackingDirection
+from core.type_aliases import CurveDataList
+
+if TYPE_CHECKING:
+    from services.data_service import DataService
+
+logger = get_logger("batch_processor")
+
+# Output formats: 2DTrackDatav2 writes one file per input, JSON and CSV one file per curve
+OUTPUT_FORMATS = ("2dtrack", "json", "csv")
+
+# Height used for the Y-flip when a file carries no dimensions (DataService default)
+_DEFAULT_IMAGE_HEIGHT = 720
+
+
+@dataclass(frozen=True)
+class ProcessingSettings:
+    """
+    Operations applied to every file (plain values so settings pickle).
+
+    Operations run in a fixed order: tracking direction, gap filling,
+    median filter, moving average, lowpass filter, averaging. Zero or None
+    disables a step. The tracking direction only changes statuses, so it
+    requires an output format that stores them (json or csv).
+    """
+
+    direction: TrackingDirection | None = None
+    fill_gaps: int = 0  # Largest gap in frames filled by linear interpolation
+    median_window: int = 0
+    smooth_window: int = 0  # Moving average window
+    lowpass_order: int = 0
+    average: bool = False  # Add the Insert Track average of all curves
+    output_format: str = "2dtrack"
+
+    def __post_init__(self) -> None:
+        """Validate settings."""
+        if self.output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format {self.output_format!r}, expected one of {OUTPUT_FORMATS}")
+        if min(self.fill_gaps, self.median_window, self.smooth_window, self.lowpass_order) < 0:
+            raise ValueError("Gap size, window sizes and filter order must not be negative")
+        if self.direction is not None and self.output_format == "2dtrack":
+            # 2DTrackDatav2 stores no statuses, so the direction step would be lost on export
+            raise ValueError("Tracking direction statuses are not stored in 2dtrack output; use json or csv")
+
+
+@dataclass(frozen=True)
+class FileResult:
+    """Outcome and timing of one processed file."""
+
+    input_path: str
+    output_paths: list[str] = field(default_factory=list)
+    curves: int = 0
+    points: int = 0
+    elapsed_s: float = 0.0
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the file was processed and written."""
+        return self.error is None
+
+    def summary(self) -> str:
+        """One-line per-file report."""
+        name = os.path.basename(self.input_path)
+        if self.error is not None:
+            return f"FAILED {name}: {self.error}"
+        return f"{name}: {self.curves} curves, {self.points} points in {self.elapsed_s * 1000:.1f} ms"
+
+
+@dataclass(frozen=True)
+class BatchProcessResult:
+    """Outcome and throughput of a batch run."""
+
+    files: list[FileResult]
+    elapsed_s: float
+    workers: int
+
+    @property
+    def failed_files(self) -> list[FileResult]:
+        """Files that could not be processed."""
+        return [result for result in self.files if not result.succeeded]
+
+    @property
+    def files_processed(self) -> int:
+        """Files processed successfully."""
+        return len(self.files) - len(self.failed_files)
+
+    @property
+    def points_processed(self) -> int:
+        """Points written across all successful files."""
+        return sum(result.points for result in self.files if result.succeeded)
+
+    @property
+    def files_per_second(self) -> float:
+        """Processed files per wall-clock second."""
+        return self.files_processed / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def points_per_second(self) -> float:
+        """Processed points per wall-clock second."""
+        return self.points_processed / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line throughput report."""
+        text = (
+            f"Processed {self.files_processed} files ({self.points_processed} points) in {self.elapsed_s:.2f}s "
+            + f"({self.files_per_second:.1f} files/s, {self.points_per_second:.0f} points/s, {self.workers} worker(s))"
+        )
+        if self.failed_files:
+            text += f", {len(self.failed_files)} failed"
+        return text
+
+    def report(self) -> str:
+        """Per-file lines followed by the throughput summary."""
+        return "\n".join([*(result.summary() for result in self.files), self.summary()])
+
+
+def load_curves(data_service: DataService, file_path: str) -> tuple[dict[str, CurveDataList], int]:
+    """
+    Load all curves of a tracking file with default statuses applied.
+
+    2DTrackDatav2 (multi-point) files are tried first, then single-curve
+    2DTrackData; JSON and CSV files hold one curve named after the file.
+
+    Returns:
+        Tuple of (curve name to points in top-left origin, image height for the Y-flip)
+
+    Raises:
+        ValueError: If no curves could be loaded
+    """
+    stem = Path(file_path).stem
+    suffix = Path(file_path).suffix.lower()
+    curves: dict[str, CurveDataList] = {}
+    image_height = _DEFAULT_IMAGE_HEIGHT
+
+    if suffix == ".json":
+        curves = {stem: data_service.load_json(file_path)}
+    elif suffix == ".csv":
+        curves = {stem: data_service.load_csv(file_path)}
+    else:
+        curves, image_height = data_service.load_tracked_data_with_height(file_path)
+        if not curves:
+            single = data_service.load_2dtrack_data(file_path)
+            points = single
+            if isinstance(single, CurveDataWithMetadata):
+                points = single.to_legacy_format()
+                metadata = single.metadata
+                if metadata is not None and metadata.height:
+                    image_height = metadata.height
+                # Single-curve files keep raw 3DE coordinates; flip like load_tracked_data does
+                if metadata is not None and metadata.needs_y_flip_for_qt:
+                    points = [(point[0], point[1], image_height - point[2], *point[3:]) for point in points]
+            curves = {stem: points}
+
+    curves = {name: points for name, points in curves.items() if points}
+    if not curves:
+        raise ValueError("no curves loaded")
+    return curves, image_height
+
+
+def process_curves(
+    data_service: DataService, curves: dict[str, CurveDataList], settings: ProcessingSettings
+) -> dict[str, CurveDataList]:
+    """
+    Apply the configured operations to every curve.
+
+    Args:
+        data_service: Service providing the filters and gap filling
+        curves: Curve name to points
+        settings: Operations to apply
+
+    Returns:
+        New mapping of curve name to processed points (input is not modified)
+    """
+    from core.insert_track_algorithm import create_averaged_curve
+    from data.tracking_direction_utils import apply_status_changes, compute_tracking_direction_changes
+
+    processed: dict[str, CurveDataList] = {}
+    for name, points in curves.items():
+        result = points
+        if settings.direction is not None:
+            changes = compute_tracking_direction_changes(result, settings.direction)
+            if changes:
+                result = apply_status_changes(result, changes)
+        if settings.fill_gaps > 0:
+            result = data_service.fill_gaps(result, max_gap=settings.fill_gaps)
+        if settings.median_window > 0:
+            result = data_service.filter_median(result, window_size=settings.median_window)
+        if settings.smooth_window > 0:
+            result = data_service.smooth_moving_average(result, window_size=settings.smooth_window)
+        if settings.lowpass_order > 0:
+            result = data_service.filter_butterworth(result, order=settings.lowpass_order)
+        processed[name] = result
+
+    if settings.average and len(processed) > 1:
+        average_name, average_points = create_averaged_curve(processed)
+        if average_points:
+            processed[average_name] = average_points
+
+    return processed
+
+
+def output_paths_for(input_path: str, curve_names: Sequence[str], output_dir: Path, output_format: str) -> list[Path]:
+    """Output files for an input: one 2DTrackDatav2 file, or one JSON/CSV file per curve."""
+    stem = Path(input_path).stem
+    if output_format == "2dtrack":
+        return [output_dir / f"{stem}.txt"]
+    return [output_dir / f"{stem}_{name}.{output_format}" for name in curve_names]
+
+
+def process_file(
+    data_service: DataService, input_path: str, output_dir: Path, settings: ProcessingSettings
+) -> FileResult:
+    """
+    Load, process and export one tracking file, timing it.
+
+    Errors are captured in the result instead of raised so one bad file does
+    not stop a batch.
+    """
+    start = time.perf_counter()
+    try:
+        curves, image_height = load_curves(data_service, input_path)
+        processed = process_curves(data_service, curves, settings)
+
+        names = list(processed)
+        paths = output_paths_for(input_path, names, output_dir, settings.output_format)
+        if settings.output_format == "2dtrack":
+            written = data_service.save_tracked_data(str(paths[0]), processed, image_height)
+        else:
+            save = data_service.save_json if settings.output_format == "json" else data_service.save_csv
+            written = all(save(str(path), processed[name]) for name, path in zip(names, paths, strict=True))
+        if not written:
+            raise OSError(f"failed to write output to {output_dir}")
+
+        return FileResult(
+            input_path=input_path,
+            output_paths=[str(path) for path in paths],
+            curves=len(processed),
+            points=sum(len(points) for points in processed.values()),
+            elapsed_s=time.perf_counter() - start,
+        )
+    except Exception as e:
+        logger.error(f"Failed to process {input_path}: {e}")
+        return FileResult(input_path=input_path, elapsed_s=time.perf_counter() - start, error=str(e))
+
+
+# Per-process state for pool workers (set by _init_worker)
+_worker_data_service: DataService | None = None
+_worker_output_dir: Path | None = None
+_worker_settings: ProcessingSettings | None = None
+
+
+def _init_worker(output_dir: Path, settings: ProcessingSettings) -> None:
+    """Process pool initializer: one DataService per worker process."""
+    global _worker_data_service, _worker_output_dir, _worker_settings
+    from services.data_service import DataService
+
+    _worker_data_service = DataService()
+    _worker_output_dir = output_dir
+    _worker_settings = settings
+
+
+def _process_in_worker(input_path: str) -> FileResult:
+    """Process one file in a worker process."""
+    if _worker_data_service is None or _worker_output_dir is None or _worker_settings is None:
+        raise RuntimeError("Worker not initialized")
+    return process_file(_worker_data_service, input_path, _worker_output_dir, _worker_settings)
+
+
+def process_files(
+    input_paths: Sequence[str], output_dir: Path, settings: ProcessingSettings, workers: int | None = None
+) -> BatchProcessResult:
+    """
+    Process tracking files and write the results to output_dir.
+
+    Args:
+        input_paths: Tracking files to process
+        output_dir: Directory for the processed files (created if missing)
+        settings: Operations and output format
+        workers: Number of worker processes. None uses all cores; 1 processes
+            in this process.
+
+    Returns:
+        Per-file results in input order, and throughput
+    """
+    from services.data_service import DataService
+
+    worker_count = workers if workers is not None else os.cpu_count() or 1
+    worker_count = max(1, min(worker_count, len(input_paths) or 1))
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    if worker_count == 1:
+        data_service = DataService()
+        results = [process_file(data_service, path, output_dir, settings) for path in input_paths]
+    else:
+        # spawn: workers must not inherit Qt or logging state through fork
+        context = multiprocessing.get_context("spawn")
+        results_by_index: dict[int, FileResult] = {}
+        with ProcessPoolExecutor(
+            max_workers=worker_count, mp_context=context, initializer=_init_worker, initargs=(output_dir, settings)
+        ) as pool:
+            futures = {pool.submit(_process_in_worker, path): index for index, path in enumerate(input_paths)}
+            for future in as_completed(futures):
+                results_by_index[futures[future]] = future.result()
+        results = [results_by_index[index] for index in range(len(input_paths))]
+    elapsed = time.perf_counter() - start
+
+    result = BatchProcessResult(files=results, elapsed_s=elapsed, workers=worker_count)
+    logger.info(result.summary())
+    return result
@@ -11,6 +11,7 @@ from core.commands.command_manager import CommandManager
 from core.commands.curve_commands import (
     AddPointCommand,
     BatchMoveCommand,
+    BatchSetPointStatusCommand,
     DeletePointsCommand,
     MovePointCommand,
     SetCurveDataCommand,
@@ -21,6 +22,7 @@ from core.commands.curve_commands import (
 __all__ = [
     "AddPointCommand",
     "BatchMoveCommand",
+    "BatchSetPointStatusCommand",
     "Command",
     "CommandManager",
     "CompositeCommand",
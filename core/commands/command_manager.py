@@ -16,8 +16,10 @@ from typing_extensions import override
 if TYPE_CHECKING:
     from protocols.ui import MainWindowProtocol
 
+from core import tracing
 from core.commands.base_command import Command
 from core.logger_utils import get_logger
+from core.memory_budget import get_memory_budget
 
 logger = get_logger("command_manager")
 
@@ -45,6 +47,7 @@ class CommandManager:
 
         logger.info(f"CommandManager initialized with max_history_size={max_history_size}")
 
+    @tracing.traced("command.execute", "command")
     def execute_command(self, command: Command, main_window: MainWindowProtocol) -> bool:
         """
         Execute a command and add it to the history.
@@ -83,8 +86,9 @@ class CommandManager:
             self._history.append(command)
             self._current_index += 1
 
-            # Enforce history size limit
+            # Enforce history size limit and the shared memory budget
             self._enforce_history_limit()
+            _ = get_memory_budget().enforce()
 
             # Update UI state
             self._update_ui_state(main_window)
@@ -127,8 +131,9 @@ class CommandManager:
             self._history.append(command)
             self._current_index += 1
 
-            # Enforce history size limit
+            # Enforce history size limit and the shared memory budget
             self._enforce_history_limit()
+            _ = get_memory_budget().enforce()
 
             # Update UI state
             self._update_ui_state(main_window)
@@ -143,6 +148,7 @@ class CommandManager:
             logger.error(f"Error adding executed command {command}: {e}")
             return False
 
+    @tracing.traced("command.undo", "command")
     def undo(self, main_window: MainWindowProtocol) -> bool:
         """
         Undo the last command.
@@ -176,6 +182,7 @@ class CommandManager:
             logger.error(f"Error undoing command: {e}")
             return False
 
+    @tracing.traced("command.redo", "command")
     def redo(self, main_window: MainWindowProtocol) -> bool:
         """
         Redo the next command.
@@ -264,6 +271,42 @@ class CommandManager:
             return self._history[self._current_index].description
         return None
 
+    def get_undo_command(self) -> Command | None:
+        """
+        Get the command that would be undone.
+
+        Returns:
+            Command or None if no undo available
+        """
+        if self.can_undo():
+            return self._history[self._current_index]
+        return None
+
+    def replace_undo_command(self, command: Command, main_window: MainWindowProtocol) -> bool:
+        """
+        Replace the command that would be undone with an already-executed command.
+
+        Used to fold edits applied in place afterwards (e.g. an auto-repeat
+        nudge burst) into the history entry of the edit they continue, so one
+        undo reverts both.
+
+        Args:
+            command: Already-executed command covering the old entry and the follow-up edits
+            main_window: Reference to the main application window
+
+        Returns:
+            True if the entry was replaced, False if there is nothing to replace
+        """
+        if not self.can_undo():
+            logger.warning(f"Cannot replace undo entry with {command}: no commands in history")
+            return False
+
+        command.executed = True
+        self._history[self._current_index] = command
+        self._update_ui_state(main_window)
+        logger.debug(f"Replaced undo entry with: {command}")
+        return True
+
     def get_redo_description(self) -> str | None:
         """
         Get description of the command that would be redone.
@@ -298,6 +341,30 @@ class CommandManager:
             self._current_index -= 1
             self._current_index = max(-1, self._current_index)
 
+    def memory_usage_bytes(self) -> int:
+        """Get the approximate bytes held by the command history (memory budget)."""
+        return sum(cmd.get_memory_usage() for cmd in self._history)
+
+    def evict_bytes(self, target_bytes: int) -> int:
+        """
+        Drop the oldest undo steps for the memory budget.
+
+        The most recent undo step and the redo steps are always kept.
+
+        Args:
+            target_bytes: Bytes to free
+
+        Returns:
+            Approximate bytes freed
+        """
+        freed = 0
+        while self._current_index > 0 and freed < target_bytes:
+            freed += self._history.pop(0).get_memory_usage()
+            self._current_index -= 1
+        if freed:
+            logger.info(f"Dropped oldest undo steps to free {freed} bytes (history size: {len(self._history)})")
+        return freed
+
     def _update_ui_state(self, main_window: MainWindowProtocol) -> None:
         """
         Update UI state to reflect current undo/redo availability.
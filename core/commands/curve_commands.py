@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import copy
 from abc import ABC
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
 
 from core.commands.base_command import Command
 from core.logger_utils import get_logger
+from core.memory_budget import estimate_points_bytes
 from core.type_aliases import CurveDataInput, CurveDataList, LegacyPointData
 from services import get_data_service
 from stores.application_state import get_application_state
@@ -260,6 +261,12 @@ class SetCurveDataCommand(CurveDataCommand):
         """Redo by setting the new curve data again."""
         return self._perform_redo(lambda: list(self.new_data))
 
+    @override
+    def get_memory_usage(self) -> int:
+        """Get approximate memory usage, including the stored curve data."""
+        stored_points = len(self.new_data) + (len(self.old_data) if self.old_data is not None else 0)
+        return super().get_memory_usage() + estimate_points_bytes(stored_points)
+
 
 class SmoothCommand(CurveDataCommand):
     """
@@ -395,6 +402,12 @@ class SmoothCommand(CurveDataCommand):
 
         return self._perform_redo(build_redo_data)
 
+    @override
+    def get_memory_usage(self) -> int:
+        """Get approximate memory usage, including the stored before/after points."""
+        stored_points = len(self.old_points or ()) + len(self.new_points or ())
+        return super().get_memory_usage() + estimate_points_bytes(stored_points)
+
     @override
     def can_merge_with(self, other: Command) -> bool:
         """Check if this smooth command can be merged with another."""
@@ -668,6 +681,11 @@ class DeletePointsCommand(CurveDataCommand):
 
         return result
 
+    @override
+    def get_memory_usage(self) -> int:
+        """Get approximate memory usage, including the stored deleted points."""
+        return super().get_memory_usage() + estimate_points_bytes(len(self.deleted_points or ()))
+
 
 class BatchMoveCommand(CurveDataCommand):
     """
@@ -699,6 +717,26 @@ class BatchMoveCommand(CurveDataCommand):
         # Frame-based moves captured during execute for robust undo/redo
         self._frame_moves: list[tuple[int, tuple[float, float], tuple[float, float]]] | None = None
 
+    def mark_applied(self, curve_name: str, curve_data: CurveDataList) -> None:
+        """
+        Record moves that were already applied to the curve (e.g. by an interactive drag).
+
+        Captures the target curve and frame-based moves that execute() would
+        capture, so the command can go straight into history via
+        CommandManager.add_executed_command() and still undo/redo.
+
+        Args:
+            curve_name: Curve the points were moved in
+            curve_data: Current curve data (used to map indices to frames)
+        """
+        self._target_curve = curve_name
+        self._frame_moves = [
+            (int(curve_data[index][0]), old_pos, new_pos)
+            for index, old_pos, new_pos in self.moves
+            if 0 <= index < len(curve_data)
+        ]
+        self.executed = True
+
     @override
     def execute(self, main_window: MainWindowProtocol) -> bool:
         """Execute batch point movement."""
@@ -816,8 +854,14 @@ class BatchMoveCommand(CurveDataCommand):
             description=f"Move {len(merged_moves)} points",
             moves=merged_moves,
         )
-        # Preserve captured frame moves for robustness
-        merged._frame_moves = self._frame_moves
+        # Preserve captured frame moves for robustness: original positions from self, final from other.
+        # Otherwise execute() captures them from the merged moves.
+        if self._frame_moves is not None and other._frame_moves is not None:
+            other_frame_dict = {move[0]: move[2] for move in other._frame_moves}
+            merged._frame_moves = [
+                (frame, old_pos, other_frame_dict[frame]) for frame, old_pos, _ in self._frame_moves
+            ]
+        merged._target_curve = self._target_curve
         return merged
 
 
@@ -849,6 +893,25 @@ class SetPointStatusCommand(CurveDataCommand):
         # Frame-based changes captured during execute for robust undo/redo
         self._frame_changes: list[tuple[int, str, str]] | None = None  # (frame, old_status, new_status)
 
+    def _apply_frame_statuses(self, use_new_status: bool) -> bool:
+        """Write old or new statuses of the captured frames to the target curve."""
+        if not self._frame_changes or self._target_curve is None:
+            return False
+
+        curve_data = get_application_state().get_curve_data(self._target_curve)
+        index_by_frame = {int(point[0]): i for i, point in enumerate(curve_data)}
+        statuses: dict[int, str] = {}
+        for frame, old_status, new_status in self._frame_changes:
+            point_idx = index_by_frame.get(frame)
+            if point_idx is None:
+                logger.warning(f"Could not find point at frame {frame} in {self._target_curve}")
+                continue
+            statuses[point_idx] = new_status if use_new_status else old_status
+
+        # Patches the cached SegmentedCurve in place instead of re-segmenting the curve
+        _ = get_data_service().set_point_statuses(self._target_curve, statuses)
+        return True
+
     @override
     def execute(self, main_window: MainWindowProtocol) -> bool:
         """Execute status changes with gap restoration logic."""
@@ -858,15 +921,7 @@ class SetPointStatusCommand(CurveDataCommand):
             if (result := self._get_active_curve_data()) is None:
                 logger.error("No active curve")
                 return False
-            curve_name, curve_data = result
-
-
-            # Get data service for restoration logic
-            data_service = get_data_service()
-            app_state = get_application_state()
-
-            # Initialize SegmentedCurve with current data
-            data_service.update_curve_data(list(curve_data))
+            _, curve_data = result
 
             # Capture frame-based changes for robust undo/redo
             if self._frame_changes is None:
@@ -875,34 +930,11 @@ class SetPointStatusCommand(CurveDataCommand):
                     if 0 <= index < len(curve_data):
                         frame = int(curve_data[index][0])
                         self._frame_changes.append((frame, old_status, new_status))
+                    else:
+                        logger.warning(f"Point index {index} out of range")
 
-            # Apply status changes through restoration system
-            for index, _, new_status in self.changes:
-                if 0 <= index < len(curve_data):
-                    data_service.handle_point_status_change(index, new_status)
-                else:
-                    logger.warning(f"Point index {index} out of range")
-
-            # Get restored data from SegmentedCurve
-            if data_service.segmented_curve:
-                restored_points = data_service.segmented_curve.all_points
-                updated_data: CurveDataList = [(p.frame, p.x, p.y, p.status.value) for p in restored_points]
-            else:
-                # Fallback: apply changes directly if SegmentedCurve unavailable
-                logger.warning("SegmentedCurve not available, applying changes directly")
-                updated_data = list(curve_data)
-                for index, _, new_status in self.changes:
-                    if 0 <= index < len(updated_data):
-                        point = updated_data[index]
-                        if len(point) >= 3:
-                            updated_data[index] = (point[0], point[1], point[2], new_status)
-                        else:
-                            logger.warning(f"Point {index} has invalid format (need at least 3 elements)")
-
-            # Update ApplicationState with restored data
-            app_state.set_curve_data(curve_name, updated_data)
+            _ = self._apply_frame_statuses(use_new_status=True)
             self.executed = True
-
             return True
 
         return self._safe_execute("executing", _execute_operation)
@@ -911,87 +943,33 @@ class SetPointStatusCommand(CurveDataCommand):
     def undo(self, main_window: MainWindowProtocol) -> bool:
         """Undo status changes with gap restoration logic."""
 
-        def build_undo_data() -> CurveDataList | None:
-            if not self._frame_changes:
+        def _undo_operation() -> bool:
+            if not self._target_curve:
+                logger.error(f"Missing target curve for undo in {self.__class__.__name__}")
+                return False
+            if not self._apply_frame_statuses(use_new_status=False):
                 logger.error("No frame changes captured for undo")
-                return None
-
-            app_state = get_application_state()
-            data_service = get_data_service()
-
-            # Get current curve data from ApplicationState
-            curve_data = list(app_state.get_curve_data(self._target_curve))
-
-            # Initialize SegmentedCurve with current data
-            data_service.update_curve_data(curve_data)
-
-            # Restore original statuses using frame lookup (robust to curve modifications)
-            for frame, old_status, _ in self._frame_changes:
-                point_idx = self._find_point_by_frame(curve_data, frame)
-                if point_idx is not None:
-                    data_service.handle_point_status_change(point_idx, old_status)
-                else:
-                    logger.warning(f"Could not find point at frame {frame} for undo")
-
-            # Get restored data from SegmentedCurve
-            if data_service.segmented_curve:
-                restored_points = data_service.segmented_curve.all_points
-                return [(p.frame, p.x, p.y, p.status.value) for p in restored_points]
-            # Fallback: apply changes directly if SegmentedCurve unavailable
-            logger.warning("SegmentedCurve not available, applying changes directly")
-            updated_data = list(curve_data)
-            for frame, old_status, _ in self._frame_changes:
-                point_idx = self._find_point_by_frame(updated_data, frame)
-                if point_idx is not None:
-                    point = updated_data[point_idx]
-                    if len(point) >= 3:
-                        updated_data[point_idx] = (point[0], point[1], point[2], old_status)
-            return updated_data
+                return False
+            self.executed = False
+            return True
 
-        return self._perform_undo(build_undo_data)
+        return self._safe_execute("undoing", _undo_operation)
 
     @override
     def redo(self, main_window: MainWindowProtocol) -> bool:
         """Redo status changes with gap restoration logic."""
 
-        def build_redo_data() -> CurveDataList | None:
-            if not self._frame_changes:
+        def _redo_operation() -> bool:
+            if not self._target_curve:
+                logger.error(f"Missing target curve for redo in {self.__class__.__name__}")
+                return False
+            if not self._apply_frame_statuses(use_new_status=True):
                 logger.error("No frame changes captured for redo")
-                return None
-
-            app_state = get_application_state()
-            data_service = get_data_service()
-
-            # Get current curve data from ApplicationState
-            curve_data = list(app_state.get_curve_data(self._target_curve))
-
-            # Initialize SegmentedCurve with current data
-            data_service.update_curve_data(curve_data)
-
-            # Apply status changes using frame lookup (robust to curve modifications)
-            for frame, _, new_status in self._frame_changes:
-                point_idx = self._find_point_by_frame(curve_data, frame)
-                if point_idx is not None:
-                    data_service.handle_point_status_change(point_idx, new_status)
-                else:
-                    logger.warning(f"Could not find point at frame {frame} for redo")
-
-            # Get restored data from SegmentedCurve
-            if data_service.segmented_curve:
-                restored_points = data_service.segmented_curve.all_points
-                return [(p.frame, p.x, p.y, p.status.value) for p in restored_points]
-            # Fallback: apply changes directly if SegmentedCurve unavailable
-            logger.warning("SegmentedCurve not available, applying changes directly")
-            updated_data = list(curve_data)
-            for frame, _, new_status in self._frame_changes:
-                point_idx = self._find_point_by_frame(updated_data, frame)
-                if point_idx is not None:
-                    point = updated_data[point_idx]
-                    if len(point) >= 3:
-                        updated_data[point_idx] = (point[0], point[1], point[2], new_status)
-            return updated_data
+                return False
+            self.executed = True
+            return True
 
-        return self._perform_redo(build_redo_data)
+        return self._safe_execute("redoing", _redo_operation)
 
     @override
     def can_merge_with(self, other: Command) -> bool:
@@ -1033,6 +1011,124 @@ class SetPointStatusCommand(CurveDataCommand):
         return merged
 
 
+class BatchSetPointStatusCommand(CurveDataCommand):
+    """
+    Command for changing point statuses across several curves at once.
+
+    Used for batch operations such as changing the tracking direction of many
+    points. All curves are updated inside one ApplicationState batch, so
+    listeners see a single curves_changed signal, and the whole operation is one
+    undo step.
+
+    Unlike SetPointStatusCommand this works on named curves rather than the
+    active curve, and writes statuses directly instead of replaying them
+    through DataService's SegmentedCurve. Segment activity is derived from the
+    statuses when the curve is next loaded, so the resulting data is the same.
+    Changes are stored by frame number so undo/redo survives index shifts.
+    """
+
+    def __init__(
+        self,
+        description: str,
+        changes_by_curve: Mapping[str, Sequence[tuple[int, str, str]]],  # curve -> (index, old, new)
+    ) -> None:
+        """
+        Initialize the batch status command.
+
+        Args:
+            description: Human-readable description
+            changes_by_curve: Mapping of curve name to (index, old_status, new_status) tuples
+                (indices used for initial lookup)
+        """
+        super().__init__(description)
+        self.changes_by_curve: dict[str, list[tuple[int, str, str]]] = {
+            name: list(changes) for name, changes in changes_by_curve.items() if changes
+        }
+        # Frame-based changes captured during execute for robust undo/redo
+        self._frame_changes: dict[str, list[tuple[int, str, str]]] | None = None  # curve -> (frame, old, new)
+
+    def _apply(self, use_new_status: bool) -> bool:
+        """Write old or new statuses for all curves in one batch."""
+        if self._frame_changes is None:
+            return False
+
+        app_state = get_application_state()
+        data_service = get_data_service()
+        curve_names = set(app_state.get_all_curve_names())
+        with app_state.batch_updates():
+            for curve_name, frame_changes in self._frame_changes.items():
+                if curve_name not in curve_names:
+                    logger.warning(f"Curve {curve_name} no longer exists, skipping status change")
+                    continue
+
+                curve_data = app_state.get_curve_data(curve_name)
+                index_by_frame = {int(point[0]): i for i, point in enumerate(curve_data)}
+                statuses: dict[int, str] = {}
+                for frame, old_status, new_status in frame_changes:
+                    point_idx = index_by_frame.get(frame)
+                    if point_idx is None:
+                        logger.warning(f"Could not find point at frame {frame} in {curve_name}")
+                        continue
+                    statuses[point_idx] = new_status if use_new_status else old_status
+                # Patches the cached SegmentedCurve in place instead of re-segmenting the curve
+                _ = data_service.set_point_statuses(curve_name, statuses)
+        return True
+
+    @override
+    def execute(self, main_window: MainWindowProtocol) -> bool:
+        """Execute the status changes on all curves."""
+
+        def _execute_operation() -> bool:
+            if not self.changes_by_curve:
+                logger.warning("No status changes to apply")
+                return False
+
+            # Capture frame-based changes for robust undo/redo
+            if self._frame_changes is None:
+                app_state = get_application_state()
+                self._frame_changes = {}
+                for curve_name, changes in self.changes_by_curve.items():
+                    curve_data = app_state.get_curve_data(curve_name)
+                    self._frame_changes[curve_name] = [
+                        (int(curve_data[index][0]), old_status, new_status)
+                        for index, old_status, new_status in changes
+                        if 0 <= index < len(curve_data)
+                    ]
+
+            if not self._apply(use_new_status=True):
+                return False
+            self.executed = True
+            return True
+
+        return self._safe_execute("executing", _execute_operation)
+
+    @override
+    def undo(self, main_window: MainWindowProtocol) -> bool:
+        """Restore the original statuses on all curves."""
+
+        def _undo_operation() -> bool:
+            if not self._apply(use_new_status=False):
+                logger.error("No frame changes captured for undo")
+                return False
+            self.executed = False
+            return True
+
+        return self._safe_execute("undoing", _undo_operation)
+
+    @override
+    def redo(self, main_window: MainWindowProtocol) -> bool:
+        """Reapply the status changes on all curves."""
+
+        def _redo_operation() -> bool:
+            if not self._apply(use_new_status=True):
+                logger.error("No frame changes captured for redo")
+                return False
+            self.executed = True
+            return True
+
+        return self._safe_execute("redoing", _redo_operation)
+
+
 class AddPointCommand(CurveDataCommand):
     """
     Command for adding new points to the curve.
@@ -11,7 +11,8 @@ providing full undo/redo support for all three scenarios:
 
 from __future__ import annotations
 
-import copy
+from dataclasses import dataclass
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
@@ -20,9 +21,11 @@ if TYPE_CHECKING:
     from protocols.ui import MainWindowProtocol
 
 from core.commands.curve_commands import CurveDataCommand
+from core.frame_indexed_curve import FrameIndexedCurve, to_tuple4
 from core.insert_track_algorithm import (
     average_multiple_sources,
     calculate_offset,
+    calculate_overlap_offsets,
     create_averaged_curve,
     deform_curve_with_interpolated_offset,
     fill_gap_with_source,
@@ -31,12 +34,63 @@ from core.insert_track_algorithm import (
     interpolate_gap,
 )
 from core.logger_utils import get_logger
+from core.memory_budget import estimate_points_bytes
 from core.type_aliases import CurveDataList
 from stores.application_state import get_application_state
 
 logger = get_logger("insert_track_command")
 
 
+@dataclass(frozen=True)
+class CurveRangePatch:
+    """Replacement of one contiguous run of rows in a curve.
+
+    Insert Track only rewrites the rows around the filled gap, so undo/redo
+    keeps those rows instead of deep copies of every selected curve.
+
+    Attributes:
+        start: Index of the first replaced row
+        old_rows: Rows before the change
+        new_rows: Rows after the change
+    """
+
+    start: int
+    old_rows: CurveDataList
+    new_rows: CurveDataList
+
+    @classmethod
+    def between(cls, old_data: CurveDataList, new_data: CurveDataList) -> CurveRangePatch:
+        """Create the patch turning old_data into new_data (common prefix and suffix are left out).
+
+        Args:
+            old_data: Curve data before the change
+            new_data: Curve data after the change
+
+        Returns:
+            Patch covering only the rows that differ
+        """
+        limit = min(len(old_data), len(new_data))
+        start = 0
+        while start < limit and old_data[start] == new_data[start]:
+            start += 1
+        suffix = 0
+        while suffix < limit - start and old_data[-1 - suffix] == new_data[-1 - suffix]:
+            suffix += 1
+        return cls(start, list(old_data[start : len(old_data) - suffix]), list(new_data[start : len(new_data) - suffix]))
+
+    def apply(self, curve_data: CurveDataList) -> CurveDataList:
+        """Return a copy of curve_data with old_rows replaced by new_rows."""
+        return [*curve_data[: self.start], *self.new_rows, *curve_data[self.start + len(self.old_rows) :]]
+
+    def revert(self, curve_data: CurveDataList) -> CurveDataList:
+        """Return a copy of curve_data with new_rows replaced by old_rows."""
+        return [*curve_data[: self.start], *self.old_rows, *curve_data[self.start + len(self.new_rows) :]]
+
+
+def _default(frame: int | None, default: int) -> int:
+    return default if frame is None else frame
+
+
 class InsertTrackCommand(CurveDataCommand):
     """Command for Insert Track operation with undo/redo support.
 
@@ -57,12 +111,16 @@ class InsertTrackCommand(CurveDataCommand):
         self.selected_curves: list[str] = selected_curves
         self.current_frame: int = current_frame
 
-        # State for undo/redo
-        self.original_data: dict[str, CurveDataList] = {}
-        self.new_data: dict[str, CurveDataList] = {}
+        # State for undo/redo: only the changed rows of modified curves are kept
+        self.affected_curves: list[str] = []  # Selected curves that existed at execution (refreshed on undo)
+        self.patches: dict[str, CurveRangePatch] = {}
         self.created_curve_name: str | None = None  # For scenario 3
+        self.created_curve_data: CurveDataList = []  # For scenario 3
         self.scenario: int = 0  # Which scenario was executed
 
+        # Frame indexes of the selected curves, built once per execution
+        self._indexes: dict[str, FrameIndexedCurve] = {}
+
     @override
     def execute(self, main_window: MainWindowProtocol) -> bool:
         """Execute Insert Track operation.
@@ -94,11 +152,15 @@ class InsertTrackCommand(CurveDataCommand):
             # This differs from _get_active_curve_data() which requires active curve
             self._target_curve = self.selected_curves[0]
 
-            # Save original data for undo
+            # Index each selected curve once; the scenarios below reuse the indexes
+            # Remember which curves existed so undo can refresh them
+            self._indexes.clear()
+            self.affected_curves = []
             for curve_name in self.selected_curves:
                 curve_data = app_state.get_curve_data(curve_name)
                 if curve_data is not None:  # pyright: ignore[reportUnnecessaryComparison]
-                    self.original_data[curve_name] = copy.deepcopy(curve_data)
+                    self._indexes[curve_name] = FrameIndexedCurve(curve_data)
+                    self.affected_curves.append(curve_name)
 
             # Determine scenario using gap detection
             # A curve has a "gap" at current frame if find_gap_around_frame() returns non-None
@@ -106,18 +168,18 @@ class InsertTrackCommand(CurveDataCommand):
             curves_without_gap_at_current: list[str] = []  # Curves with complete data at current frame
 
             for curve_name in self.selected_curves:
-                curve_data = app_state.get_curve_data(curve_name)
-                if curve_data is None:  # pyright: ignore[reportUnnecessaryComparison]
+                index = self._indexes.get(curve_name)
+                if index is None:
                     continue
 
                 # Log frames in this curve for diagnostic purposes
-                frames_in_curve = sorted([p[0] for p in curve_data])
+                frames_in_curve = sorted(p[0] for p in index.curve_data)
                 logger.info(
                     f"'{curve_name}' has {len(frames_in_curve)} frames: {frames_in_curve[:10]}...{frames_in_curve[-10:] if len(frames_in_curve) > 10 else ''}"
                 )
 
                 # Check if current frame is inside a gap (continuous sequence of missing frames)
-                gap = find_gap_around_frame(curve_data, self.current_frame)
+                gap = find_gap_around_frame(index, self.current_frame)
 
                 if gap is not None:
                     # Current frame is inside a gap
@@ -126,7 +188,7 @@ class InsertTrackCommand(CurveDataCommand):
                 else:
                     # Current frame has data (not in a gap)
                     curves_without_gap_at_current.append(curve_name)
-                    current_frame_exists = self.current_frame in frames_in_curve
+                    current_frame_exists = index.has_frame(self.current_frame)
                     logger.info(
                         f"'{curve_name}' has NO gap at frame {self.current_frame} (frame exists in data: {current_frame_exists})"
                     )
@@ -155,11 +217,11 @@ class InsertTrackCommand(CurveDataCommand):
                 # Scenario 3: All curves have data at current frame - create averaged curve
                 # BUT: Verify at least one curve actually has data at current frame
                 # (gap detection returns None for frames beyond all data, which isn't a real "no gap")
-                curves_with_actual_data_at_frame: list[str] = []
-                for curve_name in curves_without_gap_at_current:
-                    curve_data = app_state.get_curve_data(curve_name)
-                    if curve_data and any(p[0] == self.current_frame for p in curve_data):
-                        curves_with_actual_data_at_frame.append(curve_name)
+                curves_with_actual_data_at_frame = [
+                    curve_name
+                    for curve_name in curves_without_gap_at_current
+                    if self._indexes[curve_name].has_frame(self.current_frame)
+                ]
 
                 if len(curves_with_actual_data_at_frame) >= 2:
                     # Valid Scenario 3: Multiple curves have actual data at current frame
@@ -184,7 +246,10 @@ class InsertTrackCommand(CurveDataCommand):
 
             return success
 
-        return self._safe_execute("executing", _execute_operation)
+        try:
+            return self._safe_execute("executing", _execute_operation)
+        finally:
+            self._indexes.clear()
 
     def _execute_scenario_1(self, main_window: MainWindowProtocol, target_curve: str) -> bool:
         """Execute Scenario 1: Interpolate gap in single curve.
@@ -200,15 +265,14 @@ class InsertTrackCommand(CurveDataCommand):
         if controller is None:
             logger.error("Multi-point controller not available")
             return False
-        app_state = get_application_state()
-
-        curve_data = app_state.get_curve_data(target_curve)
-        if curve_data is None:  # pyright: ignore[reportUnnecessaryComparison]
+        index = self._index(target_curve)
+        if index is None:
             logger.error(f"No data found for curve '{target_curve}'")
             return False
+        curve_data = index.curve_data
 
         # Find gap
-        gap = find_gap_around_frame(curve_data, self.current_frame)
+        gap = find_gap_around_frame(index, self.current_frame)
         if gap is None:
             logger.warning(f"No gap found around frame {self.current_frame}")
             return False
@@ -216,9 +280,8 @@ class InsertTrackCommand(CurveDataCommand):
         gap_start, gap_end = gap
 
         # Find actual overlap frames (existing frames immediately outside gap boundaries)
-        curve_frames = {p[0] for p in curve_data}
-        overlap_before = max((f for f in curve_frames if f < gap_start), default=gap_start - 1)
-        overlap_after = min((f for f in curve_frames if f > gap_end), default=gap_end + 1)
+        overlap_before = _default(index.frame_before(gap_start), gap_start - 1)
+        overlap_after = _default(index.frame_after(gap_end), gap_end + 1)
 
         # 3DEqualizer-style console output
         logger.info("--------------- insert track v1.0 ---------------")
@@ -237,7 +300,7 @@ class InsertTrackCommand(CurveDataCommand):
             return False
 
         # Update tracked data
-        self.new_data[target_curve] = new_curve_data
+        self.patches[target_curve] = CurveRangePatch.between(curve_data, new_curve_data)
         app_state = get_application_state()
         app_state.set_curve_data(target_curve, new_curve_data)
 
@@ -270,20 +333,19 @@ class InsertTrackCommand(CurveDataCommand):
         if controller is None:
             logger.error("Multi-point controller not available")
             return False
-        app_state = get_application_state()
-
         # Track if at least one target was successfully filled
         any_success = False
 
         # Process each target curve
         for target_name in target_curves:
-            target_data = app_state.get_curve_data(target_name)
-            if target_data is None:  # pyright: ignore[reportUnnecessaryComparison]
+            target = self._index(target_name)
+            if target is None:
                 logger.warning(f"No data found for target curve '{target_name}'")
                 continue
+            target_data = target.curve_data
 
             # Find gap
-            gap = find_gap_around_frame(target_data, self.current_frame)
+            gap = find_gap_around_frame(target, self.current_frame)
             if gap is None:
                 logger.warning(f"No gap found in '{target_name}' around frame {self.current_frame}")
                 continue
@@ -292,18 +354,19 @@ class InsertTrackCommand(CurveDataCommand):
 
             # Collect source data and calculate offsets
             # Also track overlap points for deformation (3DEqualizer's keylist)
-            source_data_list: list[CurveDataList] = []
+            source_names: list[str] = []
+            source_data_list: list[FrameIndexedCurve] = []
             offset_list: list[tuple[float, float]] = []
             overlap_points_per_source: list[list[tuple[int, tuple[float, float]]]] = []
 
             for source_name in source_curves:
-                source_data = app_state.get_curve_data(source_name)
-                if source_data is None:  # pyright: ignore[reportUnnecessaryComparison]
+                source = self._index(source_name)
+                if source is None:
                     logger.warning(f"No data found for source curve '{source_name}'")
                     continue
 
                 # Find overlap frames
-                before_overlap, after_overlap = find_overlap_frames(target_data, source_data, gap_start, gap_end)
+                before_overlap, after_overlap = find_overlap_frames(target, source, gap_start, gap_end)
 
                 # Need at least one overlap frame
                 overlap_frames = before_overlap + after_overlap
@@ -312,24 +375,14 @@ class InsertTrackCommand(CurveDataCommand):
                     continue
 
                 # Calculate average offset (used when only 1 overlap point exists)
-                offset = calculate_offset(target_data, source_data, overlap_frames)
+                offset = calculate_offset(target, source, overlap_frames)
 
                 # Calculate per-frame offsets for deformation (when 2+ overlap points exist)
-                # Build list of (frame, (offset_x, offset_y)) for each overlap frame
-                from core.models import CurvePoint
-
-                target_points_dict = {p[0]: CurvePoint.from_tuple(p) for p in target_data}
-                source_points_dict = {p[0]: CurvePoint.from_tuple(p) for p in source_data}
+                # List of (frame, (offset_x, offset_y)) for each overlap frame
+                overlap_points = calculate_overlap_offsets(target, source, sorted(overlap_frames))
 
-                overlap_points: list[tuple[int, tuple[float, float]]] = []
-                for frame in sorted(overlap_frames):
-                    if frame in target_points_dict and frame in source_points_dict:
-                        t_pt = target_points_dict[frame]
-                        s_pt = source_points_dict[frame]
-                        frame_offset = (t_pt.x - s_pt.x, t_pt.y - s_pt.y)
-                        overlap_points.append((frame, frame_offset))
-
-                source_data_list.append(source_data)
+                source_names.append(source_name)
+                source_data_list.append(source)
                 offset_list.append(offset)
                 overlap_points_per_source.append(overlap_points)
 
@@ -338,9 +391,8 @@ class InsertTrackCommand(CurveDataCommand):
                 continue
 
             # Find actual overlap frames for logging (existing frames immediately outside gap boundaries)
-            target_frames = {p[0] for p in target_data}
-            overlap_before = max((f for f in target_frames if f < gap_start), default=gap_start - 1)
-            overlap_after = min((f for f in target_frames if f > gap_end), default=gap_end + 1)
+            overlap_before = _default(target.frame_before(gap_start), gap_start - 1)
+            overlap_after = _default(target.frame_after(gap_end), gap_end + 1)
 
             # 3DEqualizer-style console output
             total_selected = len(target_curves) + len(source_curves)
@@ -356,11 +408,8 @@ class InsertTrackCommand(CurveDataCommand):
                 logger.info(f"source: {source_curves[0]}")
             else:
                 logger.info(f"averaging {len(source_data_list)} source points:")
-                for source_name in source_curves:
-                    # Check if this source's data is in our source_data_list
-                    src_data = app_state.get_curve_data(source_name)
-                    if src_data is not None and any(src_data == sd for sd in source_data_list):  # pyright: ignore[reportUnnecessaryComparison]
-                        logger.info(source_name)
+                for source_name in source_names:
+                    logger.info(source_name)
 
             logger.info(f"section: [{gap_start}, {gap_end}]")
             logger.info(f"overlap: [{overlap_before}, {overlap_after}]")
@@ -374,13 +423,13 @@ class InsertTrackCommand(CurveDataCommand):
                     # Use deformation (interpolated offset) - 3DEqualizer _deformCurve
                     logger.info(f"Using deformation algorithm ({len(overlap_points)} overlap points)")
                     new_curve_data = deform_curve_with_interpolated_offset(
-                        target_data, source_data_list[0], gap_start, gap_end, overlap_points
+                        target, source_data_list[0], gap_start, gap_end, overlap_points
                     )
                 else:
                     # Use constant offset - 3DEqualizer _offsetCurve
                     logger.info("Using constant offset algorithm (1 overlap point)")
                     new_curve_data = fill_gap_with_source(
-                        target_data, source_data_list[0], gap_start, gap_end, offset_list[0]
+                        target, source_data_list[0], gap_start, gap_end, offset_list[0]
                     )
             else:
                 # Multiple sources - average them
@@ -388,18 +437,13 @@ class InsertTrackCommand(CurveDataCommand):
                 gap_frames = list(range(gap_start, gap_end + 1))
                 averaged_points = average_multiple_sources(source_data_list, gap_frames, offset_list)
 
-                # Merge averaged points with target data
-                from core.models import CurvePoint
-
-                target_points = [CurvePoint.from_tuple(p) for p in target_data]
-                all_points = target_points + averaged_points
-
-                # Sort and convert
-                all_points.sort(key=lambda p: p.frame)
-                new_curve_data = [p.to_tuple4() for p in all_points]
+                # Merge averaged points with target data (stable sort keeps target points first per frame)
+                new_curve_data = [to_tuple4(p) for p in target_data]
+                new_curve_data.extend(p.to_tuple4() for p in averaged_points)
+                new_curve_data.sort(key=itemgetter(0))
 
             # Update tracked data (ensure proper type with list() conversion)
-            self.new_data[target_name] = list(new_curve_data)
+            self.patches[target_name] = CurveRangePatch.between(target_data, new_curve_data)
             app_state = get_application_state()
             app_state.set_curve_data(target_name, list(new_curve_data))
 
@@ -444,11 +488,11 @@ class InsertTrackCommand(CurveDataCommand):
             logger.info(source_name)
 
         # Collect source curves
-        source_curves_dict: dict[str, CurveDataList] = {}
+        source_curves_dict: dict[str, FrameIndexedCurve] = {}
         for name in source_curves:
-            curve_data = app_state.get_curve_data(name)
-            if curve_data is not None:  # pyright: ignore[reportUnnecessaryComparison]
-                source_curves_dict[name] = curve_data
+            index = self._index(name)
+            if index is not None:
+                source_curves_dict[name] = index
 
         # Create averaged curve
         new_curve_name, averaged_data = create_averaged_curve(source_curves_dict)
@@ -470,7 +514,7 @@ class InsertTrackCommand(CurveDataCommand):
         app_state = get_application_state()
         app_state.set_curve_data(new_curve_name, averaged_data)
         self.created_curve_name = new_curve_name
-        self.new_data[new_curve_name] = averaged_data
+        self.created_curve_data = averaged_data
 
         # Update UI - add to tracking panel and select new curve
         self._update_ui_new_curve(main_window, new_curve_name)
@@ -479,6 +523,24 @@ class InsertTrackCommand(CurveDataCommand):
         logger.info("done.")
         return True
 
+    def _index(self, curve_name: str) -> FrameIndexedCurve | None:
+        """Get the frame index of a curve, reusing the one built at execution.
+
+        Args:
+            curve_name: Name of the curve
+
+        Returns:
+            Index over the curve's current data, or None if the curve has no data
+        """
+        index = self._indexes.get(curve_name)
+        if index is None:
+            curve_data = get_application_state().get_curve_data(curve_name)
+            if curve_data is None:  # pyright: ignore[reportUnnecessaryComparison]
+                return None
+            index = FrameIndexedCurve(curve_data)
+            self._indexes[curve_name] = index
+        return index
+
     def _update_ui(self, main_window: MainWindowProtocol, curve_name: str) -> None:
         """Update UI after modifying a curve.
 
@@ -596,10 +658,12 @@ class InsertTrackCommand(CurveDataCommand):
                     app_state.delete_curve(self.created_curve_name)
                     logger.info(f"Removed averaged curve '{self.created_curve_name}'")
 
-            # Scenarios 1 & 2: Restore original data
+            # Scenarios 1 & 2: Restore original rows of modified curves
             app_state = get_application_state()
-            for curve_name, original_data in self.original_data.items():
-                app_state.set_curve_data(curve_name, copy.deepcopy(original_data))
+            for curve_name in self.affected_curves:
+                patch = self.patches.get(curve_name)
+                if patch is not None:
+                    app_state.set_curve_data(curve_name, patch.revert(app_state.get_curve_data(curve_name)))
                 self._update_ui(main_window, curve_name)
 
             # Update tracking panel (controller already checked above)
@@ -635,15 +699,14 @@ class InsertTrackCommand(CurveDataCommand):
             # Scenario 3: Re-add created curve
             if self.scenario == 3 and self.created_curve_name:
                 app_state = get_application_state()
-                app_state.set_curve_data(self.created_curve_name, copy.deepcopy(self.new_data[self.created_curve_name]))
+                app_state.set_curve_data(self.created_curve_name, list(self.created_curve_data))
                 self._update_ui_new_curve(main_window, self.created_curve_name)
 
-            # Scenarios 1 & 2: Re-apply new data (use stored target, NOT current active)
+            # Scenarios 1 & 2: Re-apply changed rows (use stored target, NOT current active)
             app_state = get_application_state()
-            for curve_name, new_data in self.new_data.items():
-                if curve_name != self.created_curve_name:  # Skip scenario 3's created curve
-                    app_state.set_curve_data(curve_name, copy.deepcopy(new_data))
-                    self._update_ui(main_window, curve_name)
+            for curve_name, patch in self.patches.items():
+                app_state.set_curve_data(curve_name, patch.apply(app_state.get_curve_data(curve_name)))
+                self._update_ui(main_window, curve_name)
 
             # Update tracking panel (controller already checked above)
             controller.update_tracking_panel()
@@ -653,3 +716,11 @@ class InsertTrackCommand(CurveDataCommand):
             return True
 
         return self._safe_execute("redoing", _redo_operation)
+
+    @override
+    def get_memory_usage(self) -> int:
+        """Get approximate memory usage, including the stored patches and created curve."""
+        stored_points = len(self.created_curve_data) + sum(
+            len(patch.old_rows) + len(patch.new_rows) for patch in self.patches.values()
+        )
+        return super().get_memory_usage() + estimate_points_bytes(stored_points)
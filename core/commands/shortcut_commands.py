@@ -4,18 +4,29 @@ Concrete implementations of keyboard shortcut commands.
 
 This module provides specific shortcut command implementations for all
 keyboard shortcuts in the application.
+
+Repeatable shortcuts (RepeatableShortcutCommand) are coalesced while their key
+auto-repeats: ShortcutRepeatCoalescer applies the accumulated input at most
+once per display frame and ends the burst with a single undo entry.
 """
 
 from __future__ import annotations
 
+import time
+from abc import abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, cast
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from typing_extensions import override
 
 if TYPE_CHECKING:
+    from core.commands.base_command import Command
+    from core.commands.command_manager import CommandManager
+    from core.commands.curve_commands import BatchMoveCommand
     from core.models import TrackingDirection
     from protocols.ui import MainWindowProtocol
+    from ui.curve_view_widget import CurveViewWidget
 
 from core.commands.shortcut_command import ShortcutCommand, ShortcutContext
 from core.logger_utils import get_logger
@@ -24,6 +35,12 @@ from stores.application_state import get_application_state
 
 logger = get_logger("shortcut_commands")
 
+# Fallback display frame interval when the screen refresh rate is unknown (60 Hz)
+_DEFAULT_FRAME_INTERVAL_MS = 16
+
+# Ends a burst whose final key release was missed (e.g. focus moved to another window)
+REPEAT_IDLE_TIMEOUT_MS = 250
+
 
 class InsertTrackShortcutCommand(ShortcutCommand):
     """Command to execute Insert Track operation (3DEqualizer-style gap filling)."""
@@ -137,15 +154,14 @@ class SetEndframeCommand(ShortcutCommand):
         try:
             app_state = get_application_state()
             # Must have an active curve
-            if (cd := app_state.active_curve_data) is None:
+            if not (active_curve := app_state.active_curve):
                 return False
-            _, curve_data = cd
 
             # Determine valid frame range: max of image sequence or curve data range
             total_frames = app_state.get_total_frames()
-            if curve_data:
-                max_curve_frame = max(point[0] for point in curve_data)
-                total_frames = max(total_frames, max_curve_frame)
+            frame_range = app_state.get_curve_summary(active_curve).frame_range
+            if frame_range is not None:
+                total_frames = max(total_frames, frame_range[1])
 
             return 1 <= context.current_frame <= total_frames
 
@@ -685,8 +701,171 @@ class FitBackgroundCommand(ShortcutCommand):
             return False
 
 
-class NudgePointsCommand(ShortcutCommand):
-    """Command to nudge selected points with arrow keys."""
+class RepeatableShortcutCommand(ShortcutCommand):
+    """Shortcut command whose key auto-repeat is coalesced.
+
+    The first press runs execute() as usual. Auto-repeated presses are routed
+    through ShortcutRepeatCoalescer instead: begin_repeats() starts a burst,
+    add_repeat() only accumulates input, apply_repeats() applies it (at most
+    once per display frame) and finish_repeats() publishes the result and
+    records the undo entry when the key is released.
+    """
+
+    @abstractmethod
+    def begin_repeats(self, context: ShortcutContext) -> bool:
+        """Start a burst of auto-repeated presses.
+
+        Args:
+            context: Context of the first auto-repeated press
+
+        Returns:
+            True if the burst started, False to execute the press normally
+        """
+
+    @abstractmethod
+    def add_repeat(self, context: ShortcutContext) -> None:
+        """Accumulate one auto-repeated press without applying it.
+
+        Args:
+            context: Context of the auto-repeated press
+        """
+
+    @abstractmethod
+    def apply_repeats(self) -> None:
+        """Apply the input accumulated since the last call."""
+
+    @abstractmethod
+    def finish_repeats(self) -> None:
+        """Apply any pending input and end the burst."""
+
+
+class ShortcutRepeatCoalescer:
+    """
+    Coalesces auto-repeat bursts of RepeatableShortcutCommands.
+
+    Holding a key fires a press event 25-40 times a second. Accumulated input
+    is applied at most once per display frame: immediately if nothing was
+    applied during the current frame interval, otherwise by a single-shot
+    timer at the end of it. The burst ends on key release, on any other key
+    press, or after REPEAT_IDLE_TIMEOUT_MS without repeats.
+
+    NOT a QObject - lightweight helper owned by GlobalEventFilter.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no active burst."""
+        self._command: RepeatableShortcutCommand | None = None
+        self._frame_interval_ms: int = _DEFAULT_FRAME_INTERVAL_MS
+        self._last_apply: float = float("-inf")
+
+        self._apply_timer: QTimer = QTimer()
+        self._apply_timer.setSingleShot(True)
+        _ = self._apply_timer.timeout.connect(self._on_apply_timer)
+
+        self._idle_timer: QTimer = QTimer()
+        self._idle_timer.setSingleShot(True)
+        _ = self._idle_timer.timeout.connect(self._on_idle_timer)
+
+    @property
+    def active_command(self) -> RepeatableShortcutCommand | None:
+        """Get the command whose burst is in progress."""
+        return self._command
+
+    def add_repeat(self, command: RepeatableShortcutCommand, context: ShortcutContext) -> bool:
+        """
+        Route an auto-repeated press into the burst of its command.
+
+        Args:
+            command: Command the press triggers
+            context: Context of the press
+
+        Returns:
+            True if the press was coalesced, False if it should execute normally
+        """
+        if command is not self._command:
+            self.finish()
+            if not command.begin_repeats(context):
+                return False
+            self._command = command
+            self._frame_interval_ms = self._get_frame_interval_ms(context)
+            self._last_apply = float("-inf")  # Leading edge applies at once
+
+        command.add_repeat(context)
+        self._idle_timer.start(REPEAT_IDLE_TIMEOUT_MS)
+
+        if self._apply_timer.isActive():
+            return True  # Already scheduled for this frame
+
+        elapsed_ms = (time.perf_counter() - self._last_apply) * 1000.0
+        if elapsed_ms >= self._frame_interval_ms:
+            self.apply()
+        else:
+            self._apply_timer.start(max(1, int(self._frame_interval_ms - elapsed_ms)))
+        return True
+
+    def apply(self) -> None:
+        """Apply the input accumulated by the active burst."""
+        self._apply_timer.stop()
+        if self._command is None:
+            return
+        self._command.apply_repeats()
+        self._last_apply = time.perf_counter()
+
+    def finish(self) -> None:
+        """End the active burst, if any."""
+        if self._command is None:
+            return
+        self._apply_timer.stop()
+        self._idle_timer.stop()
+        command, self._command = self._command, None
+        command.finish_repeats()
+
+    def _get_frame_interval_ms(self, context: ShortcutContext) -> int:
+        curve_widget = context.main_window.curve_widget
+        if curve_widget is None:
+            return _DEFAULT_FRAME_INTERVAL_MS
+        from services.interaction_service import frame_interval_ms
+
+        return frame_interval_ms(curve_widget)
+
+    def _on_apply_timer(self) -> None:
+        """Apply deferred input from the event loop."""
+        try:
+            self.apply()
+        except Exception as e:
+            logger.error(f"Error applying repeated shortcut: {e}", exc_info=True)
+            # Don't propagate to Qt event loop - prevents UI crash
+
+    def _on_idle_timer(self) -> None:
+        """End a burst that stopped without a key release."""
+        try:
+            self.finish()
+        except Exception as e:
+            logger.error(f"Error finishing repeated shortcut: {e}", exc_info=True)
+
+
+@dataclass
+class _NudgeBurst:
+    """State of one auto-repeat nudge burst."""
+
+    main_window: MainWindowProtocol
+    curve_widget: CurveViewWidget
+    curve_name: str
+    indices: list[int]
+    original_positions: dict[int, tuple[float, float]]
+    press_entry: Command | None
+    """Undo entry of the press that started the hold, folded together with the burst."""
+    pending_dx: float = 0.0
+    pending_dy: float = 0.0
+    moved: bool = False
+
+
+class NudgePointsCommand(RepeatableShortcutCommand):
+    """Command to nudge selected points with arrow keys.
+
+    While the key auto-repeats, points are moved in place once per display
+    frame and the whole hold is recorded as one undo entry.
+    """
 
     def __init__(self, key: str, dx: float, dy: float) -> None:
         """Initialize the nudge command.
@@ -708,6 +887,9 @@ class NudgePointsCommand(ShortcutCommand):
         elif dy > 0:
             direction = "down"
         super().__init__(key, f"Nudge points {direction}")
+        # Undo entry created by the last press, extended by a following auto-repeat burst
+        self._press_entry: Command | None = None
+        self._burst: _NudgeBurst | None = None
 
     @override
     def can_execute(self, context: ShortcutContext) -> bool:
@@ -737,6 +919,28 @@ class NudgePointsCommand(ShortcutCommand):
 
         return False
 
+    def _nudge_delta(self, context: ShortcutContext) -> tuple[float, float]:
+        """Get the nudge offset for a press, scaled by its modifiers."""
+        from core.defaults import DEFAULT_NUDGE_AMOUNT
+
+        modifiers = context.key_event.modifiers()
+        clean_modifiers = modifiers & ~Qt.KeyboardModifier.KeypadModifier
+
+        nudge_amount = DEFAULT_NUDGE_AMOUNT
+        if clean_modifiers & Qt.KeyboardModifier.ShiftModifier:
+            nudge_amount = 10.0
+        elif clean_modifiers & Qt.KeyboardModifier.ControlModifier:
+            nudge_amount = 0.1
+
+        return self.base_dx * nudge_amount, self.base_dy * nudge_amount
+
+    @staticmethod
+    def _get_command_manager() -> CommandManager | None:
+        from services import get_interaction_service
+
+        interaction_service = get_interaction_service()
+        return interaction_service.command_manager if interaction_service else None
+
     @override
     def execute(self, context: ShortcutContext) -> bool:
         """Execute the nudge command."""
@@ -745,20 +949,9 @@ class NudgePointsCommand(ShortcutCommand):
             return False
 
         try:
-            # Calculate nudge amount based on modifiers
-            from core.defaults import DEFAULT_NUDGE_AMOUNT
-
-            modifiers = context.key_event.modifiers()
-            clean_modifiers = modifiers & ~Qt.KeyboardModifier.KeypadModifier
-
-            nudge_amount = DEFAULT_NUDGE_AMOUNT
-            if clean_modifiers & Qt.KeyboardModifier.ShiftModifier:
-                nudge_amount = 10.0
-            elif clean_modifiers & Qt.KeyboardModifier.ControlModifier:
-                nudge_amount = 0.1
-
-            dx = self.base_dx * nudge_amount
-            dy = self.base_dy * nudge_amount
+            dx, dy = self._nudge_delta(context)
+            command_manager = self._get_command_manager()
+            entry_before = command_manager.get_undo_command() if command_manager else None
 
             # Nudge selected points or current frame point
             if context.has_curve_selection:
@@ -784,6 +977,10 @@ class NudgePointsCommand(ShortcutCommand):
                     curve_widget.view_camera.center_on_selection()
                     curve_widget.clear_selection()
 
+            # Remember this press's undo entry so a following auto-repeat burst can extend it
+            entry_after = command_manager.get_undo_command() if command_manager else None
+            self._press_entry = entry_after if entry_after is not entry_before else None
+
             curve_widget.update()
             return True
 
@@ -791,6 +988,143 @@ class NudgePointsCommand(ShortcutCommand):
             logger.error(f"Failed to nudge points: {e}")
             return False
 
+    @override
+    def begin_repeats(self, context: ShortcutContext) -> bool:
+        """Start a burst for the selected points or the point at the current frame.
+
+        Points that are not yet keyframes (or endframes) are left to a normal
+        execute(), which converts them; the burst itself only moves points.
+        """
+        curve_widget = self._get_curve_widget(context)
+        app_state = get_application_state()
+        if curve_widget is None or (cd := app_state.active_curve_data) is None:
+            return False
+        curve_name, curve_data = cd
+
+        if context.has_curve_selection:
+            indices = sorted(idx for idx in context.selected_curve_points if 0 <= idx < len(curve_data))
+        elif context.current_frame is not None:
+            point_index = self._find_point_index_at_frame(curve_data, context.current_frame)
+            indices = [point_index] if point_index is not None else []
+        else:
+            indices = []
+        if not indices:
+            return False
+
+        original_positions: dict[int, tuple[float, float]] = {}
+        for idx in indices:
+            point = curve_data[idx]
+            status = PointStatus.from_legacy(point[3]) if len(point) >= 4 else PointStatus.NORMAL
+            if status not in (PointStatus.KEYFRAME, PointStatus.ENDFRAME):
+                return False
+            original_positions[idx] = (point[1], point[2])
+
+        self._burst = _NudgeBurst(
+            main_window=cast("MainWindowProtocol", cast(object, context.main_window)),
+            curve_widget=curve_widget,
+            curve_name=curve_name,
+            indices=indices,
+            original_positions=original_positions,
+            press_entry=self._press_entry,
+        )
+        self._press_entry = None
+        return True
+
+    @override
+    def add_repeat(self, context: ShortcutContext) -> None:
+        """Accumulate the nudge offset of one repeated press."""
+        if self._burst is None:
+            return
+        dx, dy = self._nudge_delta(context)
+        self._burst.pending_dx += dx
+        self._burst.pending_dy += dy
+
+    @override
+    def apply_repeats(self) -> None:
+        """Move the burst's points in place by the accumulated offset and keep them centered."""
+        burst = self._burst
+        if burst is None or (burst.pending_dx == 0.0 and burst.pending_dy == 0.0):
+            return
+
+        from services import get_interaction_service
+
+        positions = get_application_state().translate_points(
+            burst.curve_name, burst.indices, burst.pending_dx, burst.pending_dy
+        )
+        burst.pending_dx = 0.0
+        burst.pending_dy = 0.0
+        if not positions:
+            return
+
+        burst.moved = True
+        interaction_service = get_interaction_service()
+        if interaction_service:
+            interaction_service.selection.update_spatial_index(burst.curve_name, positions)
+        center_x = sum(x for x, _ in positions.values()) / len(positions)
+        center_y = sum(y for _, y in positions.values()) / len(positions)
+        burst.curve_widget.view_camera.center_on_point(center_x, center_y)
+        burst.curve_widget.update()
+
+    @override
+    def finish_repeats(self) -> None:
+        """Publish the moved curve once and record the burst in undo history."""
+        self.apply_repeats()
+        burst, self._burst = self._burst, None
+        if burst is None or not burst.moved:
+            return
+
+        from core.commands.curve_commands import BatchMoveCommand
+
+        app_state = get_application_state()
+        curve_data = app_state.get_curve_data(burst.curve_name)
+        moves = [
+            (idx, burst.original_positions[idx], (curve_data[idx][1], curve_data[idx][2]))
+            for idx in burst.indices
+            if idx < len(curve_data)
+        ]
+        move_command = BatchMoveCommand(
+            description=f"Nudge {len(moves)} point{'s' if len(moves) > 1 else ''}",
+            moves=moves,
+        )
+        move_command.mark_applied(burst.curve_name, curve_data)
+
+        command_manager = self._get_command_manager()
+        if command_manager is not None and not self._extend_press_entry(command_manager, burst, move_command):
+            _ = command_manager.add_executed_command(move_command, burst.main_window)
+
+        # Listeners that skip per-point updates catch up once here
+        app_state.publish_curve_changes(burst.curve_name)
+        burst.curve_widget.update()
+        logger.info(f"Nudged {len(moves)} points with key repeat (curve '{burst.curve_name}')")
+
+    def _extend_press_entry(
+        self, command_manager: CommandManager, burst: _NudgeBurst, move_command: BatchMoveCommand
+    ) -> bool:
+        """Merge the burst's moves into the undo entry of the press that started the hold.
+
+        Returns:
+            True if the entry was extended, False if it is no longer the latest or cannot merge
+        """
+        from core.commands.base_command import CompositeCommand
+        from core.commands.curve_commands import BatchMoveCommand
+
+        entry = burst.press_entry
+        if entry is None or command_manager.get_undo_command() is not entry:
+            return False
+
+        children = entry.commands if isinstance(entry, CompositeCommand) else [entry]
+        for position, child in enumerate(children):
+            if isinstance(child, BatchMoveCommand) and child.can_merge_with(move_command):
+                merged_child = child.merge_with(move_command)
+                merged_child.executed = True
+                if not isinstance(entry, CompositeCommand):
+                    return command_manager.replace_undo_command(merged_child, burst.main_window)
+                merged_children = list(children)
+                merged_children[position] = merged_child
+                merged = CompositeCommand(entry.description, merged_children)
+                return command_manager.replace_undo_command(merged, burst.main_window)
+        return False
+
 
 class UndoCommand(ShortcutCommand):
     """Command to undo the last action."""
@@ -28,6 +28,18 @@ class AppConfig:
     # Default to True - system is production-ready per comprehensive review
     use_metadata_aware_data: bool = True
 
+    # Memory budget shared by all caches in MB (0 = a quarter of physical memory)
+    memory_budget_mb: int = 0
+
+    # Worker processes decoding EXR sequences (None = automatic, 0 = decode in-process)
+    exr_decode_processes: int | None = None
+
+    # Disk cache of display-ready EXR frames in MB (0 = disabled)
+    frame_cache_mb: int = 8192
+
+    # Directory of the frame cache ("" = ~/.curve_editor/frame_cache)
+    frame_cache_dir: str = ""
+
     @classmethod
     def from_environment(cls) -> "AppConfig":
         """Load configuration from environment variables.
@@ -35,16 +47,33 @@ class AppConfig:
         Environment variables:
         - CURVE_EDITOR_DEBUG_VALIDATION: Force debug validation (true/false)
         - USE_METADATA_AWARE_DATA: Use new coordinate metadata system (true/false)
+        - CURVE_EDITOR_MEMORY_BUDGET_MB: Cache memory budget in MB (0 or unset = automatic)
+        - CURVE_EDITOR_EXR_DECODE_PROCESSES: EXR decode worker processes (0 = in-process, unset = automatic)
+        - CURVE_EDITOR_FRAME_CACHE_MB: Disk cache size for decoded EXR frames in MB (0 = disabled)
+        - CURVE_EDITOR_FRAME_CACHE_DIR: Directory of the frame cache
         """
 
         def parse_bool(value: str) -> bool:
             return value.lower() in ("true", "1", "yes", "on")
 
+        def parse_int(value: str) -> int:
+            try:
+                return max(0, int(value))
+            except ValueError:
+                return 0
+
+        def parse_optional_int(value: str) -> int | None:
+            return parse_int(value) if value.strip() else None
+
         return cls(
             force_debug_validation=parse_bool(os.getenv("CURVE_EDITOR_DEBUG_VALIDATION", "")),
             use_metadata_aware_data=parse_bool(
                 os.getenv("USE_METADATA_AWARE_DATA", "true")
             ),  # Default to true per class definition
+            memory_budget_mb=parse_int(os.getenv("CURVE_EDITOR_MEMORY_BUDGET_MB", "0")),
+            exr_decode_processes=parse_optional_int(os.getenv("CURVE_EDITOR_EXR_DECODE_PROCESSES", "")),
+            frame_cache_mb=parse_int(os.getenv("CURVE_EDITOR_FRAME_CACHE_MB", "8192")),
+            frame_cache_dir=os.getenv("CURVE_EDITOR_FRAME_CACHE_DIR", ""),
         )
 
     def summary(self) -> str:
@@ -53,6 +82,9 @@ class AppConfig:
             "CurveEditor Configuration:",
             f"  Debug Validation: {'ON' if self.force_debug_validation else 'OFF'}",
             f"  Metadata-Aware Data: {'ON' if self.use_metadata_aware_data else 'OFF'}",
+            f"  Memory Budget: {f'{self.memory_budget_mb} MB' if self.memory_budget_mb else 'AUTO'}",
+            f"  EXR Decode Processes: {'AUTO' if self.exr_decode_processes is None else self.exr_decode_processes}",
+            f"  Frame Cache: {f'{self.frame_cache_mb} MB' if self.frame_cache_mb else 'OFF'}",
         ]
         return "\n".join(lines)
 
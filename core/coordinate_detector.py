@@ -3,14 +3,23 @@
 This module provides intelligent detection of coordinate systems from various
 file formats, extracting dimensions and coordinate conventions to enable
 proper transformation without manual configuration.
+
+Detection only looks at a bounded prefix of the file content. Loaders that
+have already parsed the coordinates pass them as an Nx2 array, so data-range
+checks (normalized coordinates, inferred dimensions) cover the whole file
+without re-parsing the text.
 """
 
 import os
 import re
+from collections.abc import Iterable
 from pathlib import Path
 from typing import ClassVar
 
-from core.coordinate_system import CoordinateMetadata, CoordinateOrigin, CoordinateSystem
+import numpy as np
+from numpy.typing import ArrayLike
+
+from core.coordinate_system import CoordinateMetadata, CoordinateOrigin, CoordinateSystem, FloatArray
 
 
 class CoordinateDetector:
@@ -41,13 +50,20 @@ class CoordinateDetector:
         r"(?:WIDTH|W)\s*[:=]\s*(\d+).*?(?:HEIGHT|H)\s*[:=]\s*(\d+)", re.IGNORECASE | re.DOTALL
     )
 
+    # Characters of content examined for headers and markers
+    SAMPLE_SIZE: ClassVar[int] = 16 * 1024
+
     @classmethod
-    def detect_from_file(cls, file_path: str, content: str | None = None) -> CoordinateMetadata:
+    def detect_from_file(
+        cls, file_path: str, content: str | None = None, xy: ArrayLike | None = None
+    ) -> CoordinateMetadata:
         """Detect coordinate system from file path and optional content.
 
         Args:
             file_path: Path to the file
-            content: Optional file content (first few lines)
+            content: Optional file content; only the first SAMPLE_SIZE characters are examined
+            xy: Optional Nx2 coordinates already parsed from the file, used for data-range
+                checks instead of the values in the content sample
 
         Returns:
             Detected CoordinateMetadata
@@ -61,6 +77,10 @@ class CoordinateDetector:
             except Exception:
                 content = ""
 
+        if content:
+            content = cls._sample(content)
+        points = cls._coordinate_array(xy) if xy is not None else cls._parse_xy(content or "")
+
         # Try content detection first (more reliable)
         system = None
         if content:
@@ -71,12 +91,12 @@ class CoordinateDetector:
             system = cls._detect_system_from_extension(file_path)
 
         # Extract dimensions from content
-        width, height = cls._extract_dimensions(content) if content else (None, None)
+        width, height = cls._extract_dimensions(content, points) if content else (None, None)
 
         # Check if coordinates are normalized for 3DE
         uses_normalized = False
         if system == CoordinateSystem.THREE_DE_EQUALIZER and content:
-            uses_normalized = cls._has_normalized_coordinates(content)
+            uses_normalized = cls._xy_is_normalized(points)
 
         # Apply defaults based on system
         if system == CoordinateSystem.THREE_DE_EQUALIZER:
@@ -103,6 +123,64 @@ class CoordinateDetector:
             height=height or 1080,
         )
 
+    @classmethod
+    def sample_lines(cls, lines: Iterable[str]) -> str:
+        """Join the leading lines of a file into a detection sample.
+
+        Lets loaders that read whole files pass only what detection examines.
+
+        Args:
+            lines: File lines, including line endings
+
+        Returns:
+            Leading lines totalling at least SAMPLE_SIZE characters (or all lines)
+        """
+        sample: list[str] = []
+        size = 0
+        for line in lines:
+            if size >= cls.SAMPLE_SIZE:
+                break
+            sample.append(line)
+            size += len(line)
+        return "".join(sample)
+
+    @classmethod
+    def _sample(cls, content: str) -> str:
+        """Get the bounded prefix of content used for detection, cut at a line end."""
+        if len(content) <= cls.SAMPLE_SIZE:
+            return content
+        sample = content[: cls.SAMPLE_SIZE]
+        line_end = sample.rfind("\n")
+        return sample[: line_end + 1] if line_end > 0 else sample
+
+    @staticmethod
+    def _coordinate_array(xy: ArrayLike) -> FloatArray:
+        """Get the finite rows of Nx2 coordinates as a float64 array."""
+        points = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        return points[np.isfinite(points).all(axis=1)]
+
+    @classmethod
+    def _parse_xy(cls, content: str) -> FloatArray:
+        """Parse the x/y columns of the data lines in content.
+
+        Args:
+            content: File content; lines with fewer than 3 fields or non-numeric x/y are skipped
+
+        Returns:
+            Nx2 array of finite (x, y) values
+        """
+        values: list[tuple[float, float]] = []
+        for raw_line in content.strip().split("\n"):
+            line = raw_line.strip()
+            if line and not line.startswith("#"):
+                parts = line.split()
+                if len(parts) >= 3:
+                    try:
+                        values.append((float(parts[1]), float(parts[2])))
+                    except ValueError:
+                        continue
+        return cls._coordinate_array(values)
+
     @classmethod
     def _detect_system_from_extension(cls, file_path: str) -> CoordinateSystem | None:
         """Detect coordinate system from file extension.
@@ -298,38 +376,30 @@ class CoordinateDetector:
         Returns:
             True if coordinates appear to be normalized
         """
-        lines = content.strip().split("\n")
+        return cls._xy_is_normalized(cls._parse_xy(content))
 
-        # Collect coordinate data
-        xs: list[float] = []
-        ys: list[float] = []
+    @classmethod
+    def _xy_is_normalized(cls, xy: FloatArray) -> bool:
+        """Check if parsed coordinates are normalized [0-1].
 
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                parts = line.split()
-                if len(parts) >= 3:
-                    try:
-                        x = float(parts[1])
-                        y = float(parts[2])
-                        xs.append(x)
-                        ys.append(y)
-                    except ValueError:
-                        continue
-        if len(xs) < 1:
+        Args:
+            xy: Nx2 coordinates
+
+        Returns:
+            True if coordinates appear to be normalized
+        """
+        if len(xy) < 1:
             return False
 
         # Check if all coordinates are in [0,1] range
-        max_x = max(xs)
-        max_y = max(ys)
-        min_x = min(xs)
-        min_y = min(ys)
+        min_x, min_y = xy.min(axis=0).tolist()
+        max_x, max_y = xy.max(axis=0).tolist()
 
         # Normalized coordinates should all be between 0 and 1
         # Allow small tolerance for floating point precision
         if min_x >= 0 and max_x <= 1.001 and min_y >= 0 and max_y <= 1.001:
             # Handle single point case first
-            if len(xs) == 1:  # Single point case
+            if len(xy) == 1:  # Single point case
                 return True
 
             # Additional check: ensure we don't have degenerate cases
@@ -344,11 +414,12 @@ class CoordinateDetector:
         return False
 
     @classmethod
-    def _extract_dimensions(cls, content: str) -> tuple[int | None, int | None]:
+    def _extract_dimensions(cls, content: str, xy: FloatArray | None = None) -> tuple[int | None, int | None]:
         """Extract image dimensions from file content.
 
         Args:
             content: File content to parse
+            xy: Optional Nx2 coordinates for inferring dimensions (parsed from content if omitted)
 
         Returns:
             Tuple of (width, height) or (None, None)
@@ -380,7 +451,7 @@ class CoordinateDetector:
                 pass
 
         # Try to infer from data range
-        dimensions = cls._infer_dimensions_from_data(content)
+        dimensions = cls._dimensions_from_xy(xy if xy is not None else cls._parse_xy(content))
         if dimensions:
             return dimensions
 
@@ -396,29 +467,23 @@ class CoordinateDetector:
         Returns:
             Inferred (width, height) or None
         """
-        lines = content.strip().split("\n")
-        xs: list[float] = []
-        ys: list[float] = []
+        return cls._dimensions_from_xy(cls._parse_xy(content))
 
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                parts = line.split()
-                if len(parts) >= 3:
-                    try:
-                        x = float(parts[1])
-                        y = float(parts[2])
-                        xs.append(x)
-                        ys.append(y)
-                    except ValueError:
-                        continue
+    @classmethod
+    def _dimensions_from_xy(cls, xy: FloatArray) -> tuple[int, int] | None:
+        """Infer dimensions from the range of parsed coordinates.
+
+        Args:
+            xy: Nx2 coordinates
 
-        if not xs or not ys:
+        Returns:
+            Inferred (width, height) or None
+        """
+        if len(xy) == 0:
             return None
 
         # Check if coordinates look like pixel values
-        max_x = max(xs)
-        max_y = max(ys)
+        max_x, max_y = xy.max(axis=0).tolist()
 
         # Common resolutions
         common_resolutions = [
@@ -446,20 +511,25 @@ class CoordinateDetector:
 
 
 def detect_coordinate_system(
-    file_path: str, content: str | None = None, width: int | None = None, height: int | None = None
+    file_path: str,
+    content: str | None = None,
+    width: int | None = None,
+    height: int | None = None,
+    xy: ArrayLike | None = None,
 ) -> CoordinateMetadata:
     """Convenience function to detect coordinate system.
 
     Args:
         file_path: Path to the file
-        content: Optional file content
+        content: Optional file content (only a bounded prefix is examined)
         width: Optional width override
         height: Optional height override
+        xy: Optional Nx2 coordinates already parsed from the file
 
     Returns:
         Detected or default CoordinateMetadata
     """
-    metadata = CoordinateDetector.detect_from_file(file_path, content)
+    metadata = CoordinateDetector.detect_from_file(file_path, content, xy)
 
     # Apply overrides if provided (create new metadata instance to avoid mutation)
     if width is not None or height is not None:
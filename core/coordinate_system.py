@@ -14,10 +14,15 @@ All transformations go through TransformService as the single source of truth.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Protocol
+from typing import Protocol, TypeAlias
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 # Removed unused TYPE_CHECKING imports to prevent circular dependency
 
+FloatArray: TypeAlias = NDArray[np.float64]
+
 
 class CoordinateOrigin(Enum):
     """Defines where the origin (0,0) is located in a coordinate system."""
@@ -154,6 +159,80 @@ class CoordinateMetadata:
 
         return x, y
 
+    def to_normalized_array(self, xy: ArrayLike) -> FloatArray:
+        """Convert many points from this coordinate system to normalized internal format.
+
+        Array version of to_normalized(): the steps run in the same order, so
+        each row matches the per-point conversion exactly.
+
+        Args:
+            xy: Nx2 (x, y) coordinates in this coordinate system
+
+        Returns:
+            New Nx2 float64 array in normalized internal coordinates
+        """
+        result = np.array(xy, dtype=np.float64).reshape(-1, 2)
+        x = result[:, 0]
+        y = result[:, 1]
+
+        if self.uses_normalized_coordinates:
+            x *= self.width
+            y *= self.height
+
+        if self.pixel_aspect_ratio != 1.0:
+            x *= self.pixel_aspect_ratio
+
+        x *= self.unit_scale
+        y *= self.unit_scale
+
+        if self.origin == CoordinateOrigin.BOTTOM_LEFT:
+            _ = np.subtract(self.height, y, out=y)
+        elif self.origin == CoordinateOrigin.CENTER:
+            x += self.width / 2
+            _ = np.subtract(self.height / 2, y, out=y)
+
+        return result
+
+    def from_normalized_array(self, xy: ArrayLike) -> FloatArray:
+        """Convert many points from normalized internal format to this coordinate system.
+
+        Array version of from_normalized(), matching it row for row.
+
+        Args:
+            xy: Nx2 (x, y) coordinates in normalized internal format
+
+        Returns:
+            New Nx2 float64 array in this coordinate system
+        """
+        result = np.array(xy, dtype=np.float64).reshape(-1, 2)
+        x = result[:, 0]
+        y = result[:, 1]
+
+        if self.origin == CoordinateOrigin.BOTTOM_LEFT:
+            _ = np.subtract(self.height, y, out=y)
+        elif self.origin == CoordinateOrigin.CENTER:
+            x -= self.width / 2
+            _ = np.subtract(self.height / 2, y, out=y)
+
+        if self.unit_scale != 0:
+            x /= self.unit_scale
+            y /= self.unit_scale
+
+        if self.pixel_aspect_ratio != 0:
+            x /= self.pixel_aspect_ratio
+
+        if self.uses_normalized_coordinates:
+            if self.width > 0:
+                x /= self.width
+            else:
+                x[:] = 0.0
+            if self.height > 0:
+                y /= self.height
+            else:
+                y[:] = 0.0
+
+        return result
+
 
 class TransformableData(Protocol):
     """Protocol for data that can be transformed between coordinate systems."""
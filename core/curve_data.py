@@ -5,9 +5,13 @@ alongside curve data, enabling proper transformation through the pipeline
 without relying on scattered flip_y flags.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from itertools import chain
 
-from core.coordinate_system import CoordinateMetadata, CoordinateOrigin, CoordinateSystem
+import numpy as np
+
+from core.coordinate_system import CoordinateMetadata, CoordinateOrigin, CoordinateSystem, FloatArray
 from core.type_aliases import CurveDataInput, CurveDataList, LegacyPointData
 
 
@@ -96,40 +100,12 @@ class CurveDataWithMetadata:
                 is_normalized=True,
             )
 
-        # Transform each point using metadata
-        normalized_data: CurveDataList = []
-        for point in self.data:
-            if len(point) >= 3:
-                frame, x, y = point[:3]
-                norm_x, norm_y = self.metadata.to_normalized(x, y)
-
-                # Preserve additional data like status
-                if len(point) > 3:
-                    # Preserve status field (4th element) if present
-                    status = point[3]
-                    if isinstance(status, str):
-                        normalized_data.append((frame, norm_x, norm_y, status))
-                    else:
-                        # Handle bool status (legacy format)
-                        normalized_data.append((frame, norm_x, norm_y, status))
-                else:
-                    # Point has exactly 3 elements, no status field
-                    normalized_data.append((frame, norm_x, norm_y))
-            else:
-                # Invalid point, keep as-is
-                normalized_data.append(point)
-
-        # Create normalized metadata
-        normalized_metadata = CoordinateMetadata(
-            system=CoordinateSystem.CURVE_EDITOR_INTERNAL,
-            origin=CoordinateOrigin.TOP_LEFT,
-            width=self.metadata.width,
-            height=self.metadata.height,
-            unit_scale=self.metadata.unit_scale,
-            pixel_aspect_ratio=self.metadata.pixel_aspect_ratio,
-        )
+        # Transform all points in one array pass
+        normalized_data = _replace_xy(self.data, self.metadata.to_normalized_array(_points_xy(self.data)))
 
-        return CurveDataWithMetadata(data=normalized_data, metadata=normalized_metadata, is_normalized=True)
+        return CurveDataWithMetadata(
+            data=normalized_data, metadata=_normalized_metadata(self.metadata), is_normalized=True
+        )
 
     def from_normalized(self, target_metadata: CoordinateMetadata) -> "CurveDataWithMetadata":
         """Convert normalized data to a target coordinate system.
@@ -146,26 +122,8 @@ class CurveDataWithMetadata:
         if not self.is_normalized:
             raise ValueError("Data must be normalized before converting to target system")
 
-        # Transform each point to target system
-        converted_data: CurveDataList = []
-        for point in self.data:
-            if len(point) >= 3:
-                frame, x, y = point[:3]
-                target_x, target_y = target_metadata.from_normalized(x, y)
-
-                if len(point) > 3:
-                    # Preserve status field (4th element) if present
-                    status = point[3]
-                    if isinstance(status, str):
-                        converted_data.append((frame, target_x, target_y, status))
-                    else:
-                        # Handle bool status (legacy format)
-                        converted_data.append((frame, target_x, target_y, status))
-                else:
-                    # Point has exactly 3 elements, no status field
-                    converted_data.append((frame, target_x, target_y))
-            else:
-                converted_data.append(point)
+        # Transform all points to target system in one array pass
+        converted_data = _replace_xy(self.data, target_metadata.from_normalized_array(_points_xy(self.data)))
 
         return CurveDataWithMetadata(data=converted_data, metadata=target_metadata, is_normalized=False)
 
@@ -224,6 +182,86 @@ class CurveDataWithMetadata:
         return self.data[index]
 
 
+def _points_xy(data: CurveDataList) -> FloatArray:
+    """Get the Nx2 positions of the points that have (frame, x, y)."""
+    coordinates = chain.from_iterable((point[1], point[2]) for point in data if len(point) >= 3)
+    return np.fromiter(coordinates, dtype=np.float64).reshape(-1, 2)
+
+
+def _replace_xy(data: CurveDataList, xy: FloatArray) -> CurveDataList:
+    """Rebuild curve points with new positions, preserving frames and status.
+
+    Args:
+        data: Original curve points
+        xy: New positions, one row per point of ``data`` that has (frame, x, y)
+
+    Returns:
+        New curve points; invalid points are kept as-is
+    """
+    xs: list[float] = xy[:, 0].tolist()
+    ys: list[float] = xy[:, 1].tolist()
+    if len(xs) == len(data):
+        return [
+            (point[0], x, y, point[3]) if len(point) > 3 else (point[0], x, y)
+            for point, x, y in zip(data, xs, ys, strict=True)
+        ]
+
+    positions = zip(xs, ys, strict=True)
+    converted: CurveDataList = []
+    for point in data:
+        if len(point) < 3:
+            converted.append(point)
+            continue
+        x, y = next(positions)
+        converted.append((point[0], x, y, point[3]) if len(point) > 3 else (point[0], x, y))
+    return converted
+
+
+def _normalized_metadata(metadata: CoordinateMetadata) -> CoordinateMetadata:
+    """Get the metadata of data normalized from ``metadata``."""
+    return CoordinateMetadata(
+        system=CoordinateSystem.CURVE_EDITOR_INTERNAL,
+        origin=CoordinateOrigin.TOP_LEFT,
+        width=metadata.width,
+        height=metadata.height,
+        unit_scale=metadata.unit_scale,
+        pixel_aspect_ratio=metadata.pixel_aspect_ratio,
+    )
+
+
+def normalize_curves(curves: Mapping[str, CurveDataWithMetadata]) -> dict[str, CurveDataWithMetadata]:
+    """Normalize a whole scene of curves.
+
+    Curves sharing one metadata instance (e.g. all points of a multi-point
+    tracking file) are converted together in a single array pass.
+
+    Args:
+        curves: Curves by name
+
+    Returns:
+        Normalized curves by name, same order as ``curves``
+    """
+    normalized: dict[str, CurveDataWithMetadata] = {}
+    groups: dict[int, tuple[CoordinateMetadata, list[str]]] = {}
+    for name, curve in curves.items():
+        if curve.is_normalized or curve.metadata is None:
+            normalized[name] = curve.to_normalized()
+        else:
+            groups.setdefault(id(curve.metadata), (curve.metadata, []))[1].append(name)
+
+    for metadata, names in groups.values():
+        xys = [_points_xy(curves[name].data) for name in names]
+        converted = metadata.to_normalized_array(np.concatenate(xys))
+        target_metadata = _normalized_metadata(metadata)
+        splits = np.cumsum([len(xy) for xy in xys])[:-1]
+        for name, xy in zip(names, np.split(converted, splits), strict=True):
+            normalized[name] = CurveDataWithMetadata(
+                data=_replace_xy(curves[name].data, xy), metadata=target_metadata, is_normalized=True
+            )
+
+    return {name: normalized[name] for name in curves}
+
+
 def create_metadata_from_file_type(
     file_path: str, width: int | None = None, height: int | None = None
 ) -> CoordinateMetadata:
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+"""
+Frame-indexed, array-backed view of one curve.
+
+Insert Track compares many curves frame by frame. Rebuilding CurvePoint
+lists, re-sorting them and scanning for boundaries on every call made the
+cost grow with (sources x frames x calls). A FrameIndexedCurve is built once
+per curve and answers the same questions with array lookups:
+
+- dense frame -> row lookup (missing frames map to -1)
+- sorted frames with data, for before/after and overlap queries
+- endframe and gap-boundary (keyframe/endframe) frame lists for gap detection
+
+Duplicate frames resolve to the last row with that frame, matching the
+``{point.frame: point}`` dictionaries the insert-track code used before.
+"""
+
+from __future__ import annotations
+
+from typing import TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
+
+from core.models import PointStatus
+from core.type_aliases import CurveDataList
+
+FloatArray: TypeAlias = NDArray[np.float64]
+FrameArray: TypeAlias = NDArray[np.int64]
+RowArray: TypeAlias = NDArray[np.intp]
+
+# Status values stored verbatim by to_tuple4(); anything else is normalized through PointStatus.from_legacy()
+_CANONICAL_STATUS_VALUES: frozenset[object] = frozenset(status.value for status in PointStatus)
+
+
+def point_status(point: tuple[object, ...]) -> PointStatus:
+    """Get the status of a curve tuple the way CurvePoint.from_tuple() reads it."""
+    if len(point) < 4:
+        return PointStatus.NORMAL
+    value = point[3]
+    if isinstance(value, str) and value in _CANONICAL_STATUS_VALUES:
+        return PointStatus(value)
+    return PointStatus.from_legacy(value)  # pyright: ignore[reportArgumentType]
+
+
+def to_tuple4(point: tuple[object, ...]) -> tuple[int, float, float, str]:
+    """
+    Normalize a curve tuple to (frame, x, y, status value).
+
+    Equivalent to ``CurvePoint.from_tuple(point).to_tuple4()``, but returns the
+    tuple itself when it is already in that form.
+    """
+    if len(point) == 4 and isinstance(point[3], str) and point[3] in _CANONICAL_STATUS_VALUES:
+        return point  # pyright: ignore[reportReturnType]
+    return (point[0], point[1], point[2], point_status(point).value)  # pyright: ignore[reportReturnType]
+
+
+class FrameIndexedCurve:
+    """
+    Read-only frame index over one curve's data.
+
+    Attributes:
+        curve_data: The indexed curve (not copied; must not be modified while indexed)
+        frames: Sorted unique frames that have data
+        rows: Row in ``curve_data`` for each entry of ``frames``
+        xy: Nx2 positions of every row of ``curve_data``
+        endframes: Sorted frames of ENDFRAME points
+        boundaries: Sorted frames of KEYFRAME and ENDFRAME points (gap terminators)
+    """
+
+    def __init__(self, curve_data: CurveDataList) -> None:
+        """
+        Index a curve.
+
+        Args:
+            curve_data: Curve points (frame, x, y[, status]) in any frame order
+        """
+        self.curve_data: CurveDataList = curve_data
+        count = len(curve_data)
+        all_frames = np.fromiter((point[0] for point in curve_data), dtype=np.int64, count=count)
+        self.xy: FloatArray = (
+            np.array([(point[1], point[2]) for point in curve_data], dtype=np.float64)
+            if count
+            else np.empty((0, 2), dtype=np.float64)
+        )
+
+        # Last row per frame: unique over the reversed frames finds last occurrences
+        unique_frames, reversed_rows = np.unique(all_frames[::-1], return_index=True)
+        self.frames: FrameArray = unique_frames
+        self.rows: RowArray = (count - 1 - reversed_rows).astype(np.intp)
+
+        self._first_frame: int = int(unique_frames[0]) if count else 0
+        span = int(unique_frames[-1]) - self._first_frame + 1 if count else 0
+        self._row_at: RowArray = np.full(span, -1, dtype=np.intp)
+        self._row_at[unique_frames - self._first_frame] = self.rows
+
+        # Curves carry a handful of distinct status values, so classify each distinct value once
+        # (keyed with its type so True and 1 stay apart)
+        status_codes: dict[tuple[type, object], int] = {}
+        codes = np.empty(count, dtype=np.int8)
+        for row, point in enumerate(curve_data):
+            value = point[3] if len(point) >= 4 else None
+            key = (type(value), value)
+            code = status_codes.get(key)
+            if code is None:
+                status = point_status(point)
+                code = status_codes[key] = (
+                    1 if status is PointStatus.ENDFRAME else 2 if status is PointStatus.KEYFRAME else 0
+                )
+            codes[row] = code
+        endframe = codes == 1
+        keyframe = codes == 2
+        self.endframes: FrameArray = np.unique(all_frames[endframe])
+        self.boundaries: FrameArray = np.unique(all_frames[endframe | keyframe])
+
+    def __len__(self) -> int:
+        return len(self.curve_data)
+
+    def has_frame(self, frame: int) -> bool:
+        """Check whether the curve has a point at a frame."""
+        offset = frame - self._first_frame
+        return 0 <= offset < len(self._row_at) and self._row_at[offset] >= 0
+
+    def rows_at(self, frames: FrameArray) -> RowArray:
+        """
+        Look up the rows of many frames at once.
+
+        Args:
+            frames: Frame numbers
+
+        Returns:
+            Row in ``curve_data`` for each frame, -1 where the curve has no point
+        """
+        offsets = np.asarray(frames, dtype=np.int64) - self._first_frame
+        in_span = (offsets >= 0) & (offsets < len(self._row_at))
+        rows = np.full(len(offsets), -1, dtype=np.intp)
+        rows[in_span] = self._row_at[offsets[in_span]]
+        return rows
+
+    def positions_at(self, frames: FrameArray) -> FloatArray:
+        """Get the positions at frames that all have data (Mx2)."""
+        return self.xy[self.rows_at(frames)]
+
+    def frames_between(self, first_frame: int, last_frame: int) -> FrameArray:
+        """Get the frames with data from ``first_frame`` to ``last_frame`` (inclusive)."""
+        start = np.searchsorted(self.frames, first_frame, side="left")
+        stop = np.searchsorted(self.frames, last_frame, side="right")
+        return self.frames[start:stop]
+
+    def frame_before(self, frame: int) -> int | None:
+        """Get the last frame with data before ``frame`` (None if there is none)."""
+        index = int(np.searchsorted(self.frames, frame, side="left"))
+        return int(self.frames[index - 1]) if index > 0 else None
+
+    def frame_after(self, frame: int) -> int | None:
+        """Get the first frame with data after ``frame`` (None if there is none)."""
+        index = int(np.searchsorted(self.frames, frame, side="right"))
+        return int(self.frames[index]) if index < len(self.frames) else None
+
+    def find_gap(self, frame: int) -> tuple[int, int] | None:
+        """
+        Find the gap containing a frame (missing frames or ENDFRAME-to-boundary).
+
+        See insert_track_algorithm.find_gap_around_frame() for the rules.
+
+        Returns:
+            (gap_start, gap_end) frames, or None if the frame is not in a closed gap
+        """
+        if len(self.frames) == 0:
+            return None
+
+        if not self.has_frame(frame):
+            # Missing-frame gap: bounded by the neighbouring frames with data
+            after = self.frame_after(frame)
+            if after is None:
+                return None
+            before = self.frame_before(frame)
+            gap = (before + 1 if before is not None else 1, after - 1)
+            return gap if gap[0] <= frame <= gap[1] else None
+
+        # Status-based gap: after the last ENDFRAME before the frame, up to the next KEYFRAME/ENDFRAME
+        index = int(np.searchsorted(self.endframes, frame, side="left"))
+        if index == 0:
+            return None
+        endframe = int(self.endframes[index - 1])
+        boundary_index = int(np.searchsorted(self.boundaries, endframe, side="right"))
+        if boundary_index == len(self.boundaries):
+            return None
+        gap = (endframe + 1, int(self.boundaries[boundary_index]) - 1)
+        return gap if gap[0] <= frame <= gap[1] else None
+
+    def common_frames(self, *others: FrameIndexedCurve) -> FrameArray:
+        """Get the sorted frames where this curve and all others have data."""
+        frames = self.frames
+        for other in others:
+            frames = np.intersect1d(frames, other.frames, assume_unique=True)
+        return frames
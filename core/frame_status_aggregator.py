@@ -15,6 +15,10 @@ Integration:
     Phase 1A: Core aggregation (this module)
     Phase 1B: Integration into DataService (services/data_service.py)
 
+    FrameStatusTable stores statuses as fixed-width NumPy rows with the same
+    aggregation rules, so the timeline can maintain a multi-curve aggregate by
+    adding and subtracting one curve's rows (ui/timeline_tabs.py: FrameStatusCache).
+
 See Also:
     - ENHANCEMENT_PLAN_3DE_ALIGNMENT.md (Phase 1A/1B)
     - services/data_service.py: get_frame_range_point_status()
@@ -25,11 +29,24 @@ Phase 1A: Core Aggregation Engine (ENHANCEMENT_PLAN_3DE_ALIGNMENT.md lines 114-1
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from typing import TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
 
 from core.models import FrameStatus
 
+StatusRows: TypeAlias = NDArray[np.int32]
+
+# Status row layout: columns 0-7 follow FrameStatus field order, with the three
+# flags stored as counts so rows of several curves can be added and subtracted.
+# COVERED counts the curves that have a status at the frame (0 = no status).
+SELECTED_COLUMN = 7
+COVERED_COLUMN = 8
+STATUS_WIDTH = 9
+
 
 @dataclass
 class FrameStatusAccumulator:
@@ -122,3 +139,125 @@ def aggregate_frame_statuses(statuses: Iterable[FrameStatus]) -> FrameStatus:
         is_inactive=agg.is_inactive,
         has_selected=agg.has_selected,
     )
+
+
+def frame_statuses_to_rows(frame_statuses: Mapping[int, FrameStatus]) -> tuple[int, StatusRows]:
+    """Pack the per-frame statuses of one curve into contiguous status rows.
+
+    Args:
+        frame_statuses: Status by frame number, e.g. from get_frame_range_point_status()
+
+    Returns:
+        (first frame, rows) where row i holds frame ``first + i``; frames without
+        a status have COVERED == 0. Empty input gives (0, a 0-row array).
+    """
+    if not frame_statuses:
+        return 0, np.zeros((0, STATUS_WIDTH), dtype=np.int32)
+
+    frames = np.fromiter(frame_statuses.keys(), dtype=np.int64, count=len(frame_statuses))
+    start = int(frames.min())
+    offsets = frames - start
+    rows = np.zeros((int(offsets.max()) + 1, STATUS_WIDTH), dtype=np.int32)
+    rows[offsets, :COVERED_COLUMN] = np.array(list(frame_statuses.values()), dtype=np.int32)
+    rows[offsets, COVERED_COLUMN] = 1
+    return start, rows
+
+
+def row_to_frame_status(row: StatusRows) -> FrameStatus | None:
+    """Unpack one status row (single curve or summed) into a FrameStatus.
+
+    Applies the aggregation rules of aggregate_frame_statuses(): counts are
+    sums, is_startframe/has_selected are set if any curve sets them, and
+    is_inactive only if every covering curve is inactive.
+
+    Args:
+        row: Status row of STATUS_WIDTH values
+
+    Returns:
+        FrameStatus, or None if no curve has a status at the frame
+    """
+    values = row.tolist()
+    covered = values[COVERED_COLUMN]
+    if covered == 0:
+        return None
+    return FrameStatus(
+        keyframe_count=values[0],
+        interpolated_count=values[1],
+        tracked_count=values[2],
+        endframe_count=values[3],
+        normal_count=values[4],
+        is_startframe=values[5] > 0,
+        is_inactive=values[6] == covered,
+        has_selected=values[SELECTED_COLUMN] > 0,
+    )
+
+
+class FrameStatusTable:
+    """Frame-indexed status rows covering a contiguous, growable frame span.
+
+    Rows are added or subtracted in bulk, so a running multi-curve aggregate
+    is updated by the delta of one curve instead of being recomputed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.start: int = 0
+        self.rows: StatusRows = np.zeros((0, STATUS_WIDTH), dtype=np.int32)
+
+    def _ensure_span(self, start: int, stop: int) -> None:
+        """Grow the table so frames ``start`` to ``stop - 1`` have rows."""
+        if len(self.rows) == 0:
+            self.start = start
+            self.rows = np.zeros((stop - start, STATUS_WIDTH), dtype=np.int32)
+            return
+
+        new_start = min(self.start, start)
+        new_stop = max(self.start + len(self.rows), stop)
+        if new_start == self.start and new_stop == self.start + len(self.rows):
+            return
+
+        grown = np.zeros((new_stop - new_start, STATUS_WIDTH), dtype=np.int32)
+        offset = self.start - new_start
+        grown[offset : offset + len(self.rows)] = self.rows
+        self.start = new_start
+        self.rows = grown
+
+    def add(self, start: int, rows: StatusRows, sign: int = 1) -> None:
+        """Add (sign=1) or subtract (sign=-1) rows beginning at frame ``start``."""
+        if len(rows) == 0:
+            return
+        self._ensure_span(start, start + len(rows))
+        offset = start - self.start
+        if sign >= 0:
+            self.rows[offset : offset + len(rows)] += rows
+        else:
+            self.rows[offset : offset + len(rows)] -= rows
+
+    def adjust(self, frame: int, column: int, delta: int) -> None:
+        """Add ``delta`` to one column of a frame's row."""
+        self._ensure_span(frame, frame + 1)
+        self.rows[frame - self.start, column] += delta
+
+    def set_row(self, frame: int, values: Iterable[int]) -> None:
+        """Overwrite the row of one frame."""
+        self._ensure_span(frame, frame + 1)
+        self.rows[frame - self.start] = np.fromiter(values, dtype=np.int32, count=STATUS_WIDTH)
+
+    def clear_span(self, first: int, last: int) -> None:
+        """Zero the rows of frames ``first`` to ``last`` (inclusive)."""
+        lo = max(first - self.start, 0)
+        hi = min(last - self.start + 1, len(self.rows))
+        if lo < hi:
+            self.rows[lo:hi] = 0
+
+    def get(self, frame: int) -> FrameStatus | None:
+        """Get the status of a frame, or None if the frame has no status."""
+        offset = frame - self.start
+        if not 0 <= offset < len(self.rows):
+            return None
+        return row_to_frame_status(self.rows[offset])
+
+    def clear(self) -> None:
+        """Drop all rows."""
+        self.start = 0
+        self.rows = np.zeros((0, STATUS_WIDTH), dtype=np.int32)
@@ -13,18 +13,67 @@ Based on 3DEqualizer's Insert Track functionality.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from operator import itemgetter
+from typing import TYPE_CHECKING, TypeAlias
+
+import numpy as np
 
 if TYPE_CHECKING:
     from core.type_aliases import CurveDataList
 
+from core.frame_indexed_curve import FloatArray, FrameArray, FrameIndexedCurve, to_tuple4
 from core.logger_utils import get_logger
 from core.models import CurvePoint, PointStatus
 
 logger = get_logger("insert_track_algorithm")
 
+# Curves can be passed as data or as a prebuilt index (callers comparing many curves build each index once)
+CurveInput: TypeAlias = "CurveDataList | FrameIndexedCurve"
+
+
+def _indexed(curve: CurveInput) -> FrameIndexedCurve:
+    return curve if isinstance(curve, FrameIndexedCurve) else FrameIndexedCurve(curve)
+
+
+def _merge_filled_gap(
+    target: FrameIndexedCurve, gap_start: int, gap_end: int, frames: FrameArray, positions: FloatArray
+) -> CurveDataList:
+    """Replace the target's gap frames with TRACKED points and re-activate the gap's ENDFRAME.
+
+    Args:
+        target: Target curve
+        gap_start: First frame of gap
+        gap_end: Last frame of gap
+        frames: Sorted frames to fill
+        positions: Position for each frame to fill
+
+    Returns:
+        New curve data in (frame, x, y, status) form, sorted by frame
+    """
+    result: CurveDataList = [to_tuple4(p) for p in target.curve_data if not (gap_start <= p[0] <= gap_end)]
+    tracked = PointStatus.TRACKED.value
+    result.extend((frame, x, y, tracked) for frame, (x, y) in zip(frames.tolist(), positions.tolist(), strict=True))
+    # Stable sort keeps target points ahead of filled points on the same frame
+    result.sort(key=itemgetter(0))
+
+    # Convert ENDFRAME that created the gap to KEYFRAME (gap is now filled)
+    # The ENDFRAME should be at gap_start - 1
+    endframe_frame = gap_start - 1
+    idx = bisect_left(result, endframe_frame, key=itemgetter(0))
+    while idx < len(result) and result[idx][0] == endframe_frame:
+        point = result[idx]
+        if point[3] == PointStatus.ENDFRAME.value:
+            result[idx] = (point[0], point[1], point[2], PointStatus.KEYFRAME.value)
+            logger.info(f"Converted ENDFRAME at frame {endframe_frame} to KEYFRAME (gap filled)")
+            break
+        idx += 1
 
-def find_gap_around_frame(curve_data: CurveDataList, current_frame: int) -> tuple[int, int] | None:
+    return result
+
+
+def find_gap_around_frame(curve_data: CurveInput, current_frame: int) -> tuple[int, int] | None:
     """Find gap containing current_frame (missing frames OR status-based).
 
     Detects two types of gaps:
@@ -32,7 +81,7 @@ def find_gap_around_frame(curve_data: CurveDataList, current_frame: int) -> tupl
     2. Status-based gaps: Frames between endframe markers (3DEqualizer style)
 
     Args:
-        curve_data: Trajectory data to search
+        curve_data: Trajectory data (or its FrameIndexedCurve) to search
         current_frame: Frame that should be within the gap
 
     Returns:
@@ -46,100 +95,19 @@ def find_gap_around_frame(curve_data: CurveDataList, current_frame: int) -> tupl
         curve_data = [(1, 10, 10, "keyframe"), (5, 20, 20, "endframe"),
                       (10, 30, 30, "tracked"), (15, 40, 40, "keyframe")]
         find_gap_around_frame(curve_data, 10) -> (6, 14)  # Gap from ENDFRAME to KEYFRAME
-    """
-    # Convert to CurvePoint objects
-    points = [CurvePoint.from_tuple(p) for p in curve_data]
 
-    if not points:
-        return None
-
-    # Sort points by frame
-    points.sort(key=lambda p: p.frame)
-    frames_with_data = {p.frame for p in points}
-
-    # TYPE 1: Missing-frame gap detection
-    if current_frame not in frames_with_data:
-        # Find the gap boundaries
-        gap_start = None
-        gap_end = None
-
-        # Find last frame with data before current_frame
-        for point in reversed(points):
-            if point.frame < current_frame:
-                gap_start = point.frame + 1
-                break
-
-        # Find first frame with data after current_frame
-        for point in points:
-            if point.frame > current_frame:
-                gap_end = point.frame - 1
-                break
-
-        # Handle edge cases
-        if gap_start is None:
-            # No data before current_frame - gap starts from first possible frame
-            gap_start = 1 if points else current_frame
-
-        if gap_end is None:
-            # No data after current_frame - gap extends to infinity (or practical limit)
-            # Return None as we can't fill an open-ended gap
-            return None
-
-        # Verify current_frame is actually in the gap
-        if gap_start <= current_frame <= gap_end:
-            return (gap_start, gap_end)
-
-        return None
-
-    # TYPE 2: Status-based gap detection (3DEqualizer endframe markers)
-    # Gap = frames after ENDFRAME until next KEYFRAME or ENDFRAME (whichever comes first)
-    # Find the most recent ENDFRAME before or at current_frame
-    prev_endframe = None
-    for p in reversed(points):
-        if p.frame < current_frame and p.status == PointStatus.ENDFRAME:
-            prev_endframe = p
-            break
-
-    if prev_endframe:
-        # Find the next KEYFRAME or ENDFRAME after the previous ENDFRAME
-        # (both can terminate a gap)
-        next_boundary = None
-        for p in points:
-            if p.frame > prev_endframe.frame and p.status in (
-                PointStatus.KEYFRAME,
-                PointStatus.ENDFRAME,
-            ):
-                next_boundary = p
-                break
-
-        if next_boundary:
-            # Gap is from frame after ENDFRAME to frame before the boundary
-            gap_start = prev_endframe.frame + 1
-            gap_end = next_boundary.frame - 1
-
-            # Check if current_frame is in this gap
-            if gap_start <= current_frame <= gap_end:
-                logger.debug(
-                    f"Status-based gap detected: frames {gap_start}-{gap_end} "
-                    + f"(between ENDFRAME at {prev_endframe.frame} and {next_boundary.status.name} at {next_boundary.frame})"
-                )
-                return (gap_start, gap_end)
-        # ENDFRAME exists but no KEYFRAME/ENDFRAME after it - open-ended gap
-        # Check if current frame is after the ENDFRAME
-        elif current_frame > prev_endframe.frame:
-            # Can't fill open-ended gap
-            logger.debug(
-                f"Open-ended gap detected after ENDFRAME at {prev_endframe.frame} "
-                + "(no KEYFRAME or ENDFRAME found to close gap)"
-            )
-            return None
-
-    # No gap detected
-    return None
+    Note:
+        A missing-frame gap with no data after it, and a status-based gap with no
+        KEYFRAME or ENDFRAME after its ENDFRAME, are open-ended and return None.
+    """
+    gap = _indexed(curve_data).find_gap(current_frame)
+    if gap is not None:
+        logger.debug(f"Gap detected around frame {current_frame}: frames {gap[0]}-{gap[1]}")
+    return gap
 
 
 def find_overlap_frames(
-    target_data: CurveDataList, source_data: CurveDataList, gap_start: int, gap_end: int
+    target_data: CurveInput, source_data: CurveInput, gap_start: int, gap_end: int
 ) -> tuple[list[int], list[int]]:
     """Find frames where both target and source have data, before and after gap.
 
@@ -158,25 +126,14 @@ def find_overlap_frames(
         source: frames [1, 2, 3, 4, 10, 11]
         Result: ([1, 2], [10, 11])  # Overlap before and after gap
     """
-    # Convert to CurvePoint objects
-    target_points = [CurvePoint.from_tuple(p) for p in target_data]
-    source_points = [CurvePoint.from_tuple(p) for p in source_data]
-
-    # Get frames with data for each curve
-    target_frames = {p.frame for p in target_points}
-    source_frames = {p.frame for p in source_points}
-
-    # Find overlap before gap
-    before_overlap = sorted([f for f in target_frames & source_frames if f < gap_start])
-
-    # Find overlap after gap
-    after_overlap = sorted([f for f in target_frames & source_frames if f > gap_end])
-
+    common = _indexed(target_data).common_frames(_indexed(source_data))
+    before_overlap: list[int] = common[common < gap_start].tolist()
+    after_overlap: list[int] = common[common > gap_end].tolist()
     return (before_overlap, after_overlap)
 
 
 def calculate_offset(
-    target_data: CurveDataList, source_data: CurveDataList, overlap_frames: list[int]
+    target_data: CurveInput, source_data: CurveInput, overlap_frames: list[int]
 ) -> tuple[float, float]:
     """Calculate average offset between target and source at overlap frames.
 
@@ -196,44 +153,48 @@ def calculate_offset(
         logger.warning("No overlap frames provided for offset calculation")
         return (0.0, 0.0)
 
-    # Convert to CurvePoint objects first, then create dict
-    target_points_list = [CurvePoint.from_tuple(p) for p in target_data]
-    source_points_list = [CurvePoint.from_tuple(p) for p in source_data]
-
-    target_points = {p.frame: p for p in target_points_list}
-    source_points = {p.frame: p for p in source_points_list}
+    offsets = calculate_overlap_offsets(target_data, source_data, overlap_frames)
+    if not offsets:
+        logger.warning("No valid offset points found at overlap frames")
+        return (0.0, 0.0)
 
-    # Calculate offset at each overlap frame
-    offsets_x: list[float] = []
-    offsets_y: list[float] = []
+    # Average the offsets
+    avg_offset_x = sum(offset[0] for _, offset in offsets) / len(offsets)
+    avg_offset_y = sum(offset[1] for _, offset in offsets) / len(offsets)
 
-    for frame in overlap_frames:
-        if frame in target_points and frame in source_points:
-            target = target_points[frame]
-            source = source_points[frame]
+    logger.debug(f"Calculated offset: ({avg_offset_x:.2f}, {avg_offset_y:.2f}) from {len(offsets)} overlap frames")
 
-            offset_x = target.x - source.x
-            offset_y = target.y - source.y
+    return (avg_offset_x, avg_offset_y)
 
-            offsets_x.append(offset_x)
-            offsets_y.append(offset_y)
 
-    if not offsets_x:
-        logger.warning("No valid offset points found at overlap frames")
-        return (0.0, 0.0)
+def calculate_overlap_offsets(
+    target_data: CurveInput, source_data: CurveInput, overlap_frames: list[int]
+) -> list[tuple[int, tuple[float, float]]]:
+    """Calculate the offset between target and source at each overlap frame.
 
-    # Average the offsets
-    avg_offset_x = sum(offsets_x) / len(offsets_x)
-    avg_offset_y = sum(offsets_y) / len(offsets_y)
+    Args:
+        target_data: Target trajectory
+        source_data: Source trajectory
+        overlap_frames: Candidate frames; frames missing from either curve are skipped
 
-    logger.debug(f"Calculated offset: ({avg_offset_x:.2f}, {avg_offset_y:.2f}) from {len(offsets_x)} overlap frames")
+    Returns:
+        List of (frame, (offset_x, offset_y)) in the order of overlap_frames,
+        as used by deform_curve_with_interpolated_offset()
+    """
+    target = _indexed(target_data)
+    source = _indexed(source_data)
+    frames = np.asarray(overlap_frames, dtype=np.int64)
+    target_rows = target.rows_at(frames)
+    source_rows = source.rows_at(frames)
+    present = (target_rows >= 0) & (source_rows >= 0)
 
-    return (avg_offset_x, avg_offset_y)
+    offsets = target.xy[target_rows[present]] - source.xy[source_rows[present]]
+    return [(frame, (dx, dy)) for frame, (dx, dy) in zip(frames[present].tolist(), offsets.tolist(), strict=True)]
 
 
 def deform_curve_with_interpolated_offset(
-    target_data: CurveDataList,
-    source_data: CurveDataList,
+    target_data: CurveInput,
+    source_data: CurveInput,
     gap_start: int,
     gap_end: int,
     overlap_offsets: list[tuple[int, tuple[float, float]]],
@@ -261,83 +222,42 @@ def deform_curve_with_interpolated_offset(
     if len(overlap_offsets) < 2:
         raise ValueError("deform_curve requires 2+ overlap points")
 
-    # Convert to CurvePoint objects
-    target_points = [CurvePoint.from_tuple(p) for p in target_data]
-    source_points_list = [CurvePoint.from_tuple(p) for p in source_data]
-    source_points = {p.frame: p for p in source_points_list}
-
-    # Create result with existing target points EXCEPT gap frames
-    # (we'll replace gap frames with filled data)
-    result_points = [p for p in target_points if not (gap_start <= p.frame <= gap_end)]
+    target = _indexed(target_data)
+    source = _indexed(source_data)
 
     # Sort overlap offsets by frame (should already be sorted, but ensure)
     overlap_offsets.sort(key=lambda x: x[0])
-
-    # Process each segment between consecutive overlap points
-    gap_frames_filled = 0
-    for i in range(len(overlap_offsets) - 1):
-        # Segment boundaries
-        f0, (xo0, yo0) = overlap_offsets[i]
-        f1, (xo1, yo1) = overlap_offsets[i + 1]
-
-        # Interpolate offset for each frame in this segment
-        for frame in range(f0, f1):
-            if frame < gap_start or frame > gap_end:
-                continue  # Only fill gap frames
-
-            if frame in source_points:
-                source_point = source_points[frame]
-
-                # Linear interpolation of offset (3DEqualizer formula)
-                t = (frame - f0) / (f1 - f0) if f1 != f0 else 0.0
-                interp_offset_x = xo0 + t * (xo1 - xo0)
-                interp_offset_y = yo0 + t * (yo1 - yo0)
-
-                # Apply interpolated offset
-                new_x = source_point.x + interp_offset_x
-                new_y = source_point.y + interp_offset_y
-
-                # All filled points get TRACKED status (tracking data copied from source)
-                # The converted ENDFRAME->KEYFRAME activates the segment
-                point_status = PointStatus.TRACKED
-                new_point = CurvePoint(frame=frame, x=new_x, y=new_y, status=point_status)
-                result_points.append(new_point)
-                gap_frames_filled += 1
+    key_frames = np.array([frame for frame, _ in overlap_offsets], dtype=np.int64)
+    key_offsets = np.array([offset for _, offset in overlap_offsets], dtype=np.float64)
+
+    # Each source frame in the gap falls into the segment [f0, f1) of consecutive overlap points;
+    # frames before the first or at/after the last overlap point are not filled
+    frames = source.frames_between(gap_start, gap_end)
+    segment = np.searchsorted(key_frames, frames, side="right") - 1
+    inside = (segment >= 0) & (segment < len(key_frames) - 1)
+    frames = frames[inside]
+    segment = segment[inside]
+
+    # Linear interpolation of offset (3DEqualizer formula)
+    f0 = key_frames[segment]
+    f1 = key_frames[segment + 1]
+    t = ((frames - f0) / (f1 - f0))[:, np.newaxis]
+    offset0 = key_offsets[segment]
+    offsets = offset0 + t * (key_offsets[segment + 1] - offset0)
+
+    # All filled points get TRACKED status (tracking data copied from source)
+    # The converted ENDFRAME->KEYFRAME activates the segment
+    result = _merge_filled_gap(target, gap_start, gap_end, frames, source.positions_at(frames) + offsets)
 
     logger.info(
-        f"Filled {gap_frames_filled} frames in gap [{gap_start}, {gap_end}] " +
-        f"using interpolated offset across {len(overlap_offsets)} overlap points"
+        f"Filled {len(frames)} frames in gap [{gap_start}, {gap_end}] "
+        + f"using interpolated offset across {len(overlap_offsets)} overlap points"
     )
-
-    # Sort by frame
-    result_points.sort(key=lambda p: p.frame)
-
-    # Convert ENDFRAME that created the gap to KEYFRAME (gap is now filled)
-    # The ENDFRAME should be at gap_start - 1
-    endframe_idx = None
-    for idx, point in enumerate(result_points):
-        if point.frame == gap_start - 1 and point.status == PointStatus.ENDFRAME:
-            endframe_idx = idx
-            break
-
-    if endframe_idx is not None:
-        old_point = result_points[endframe_idx]
-        # Create new point with KEYFRAME status (preserving position)
-        new_point = CurvePoint(
-            frame=old_point.frame,
-            x=old_point.x,
-            y=old_point.y,
-            status=PointStatus.KEYFRAME
-        )
-        result_points[endframe_idx] = new_point
-        logger.info(f"Converted ENDFRAME at frame {gap_start - 1} to KEYFRAME (gap filled)")
-
-    # Convert back to tuple format
-    return [p.to_tuple4() for p in result_points]
+    return result
 
 
 def fill_gap_with_source(
-    target_data: CurveDataList, source_data: CurveDataList, gap_start: int, gap_end: int, offset: tuple[float, float]
+    target_data: CurveInput, source_data: CurveInput, gap_start: int, gap_end: int, offset: tuple[float, float]
 ) -> CurveDataList:
     """Fill target's gap with source data, applying offset correction.
 
@@ -356,67 +276,20 @@ def fill_gap_with_source(
         - Adds source data (with offset) for gap frames where source has data
         - Marks gap boundaries as keyframes
     """
-    # Convert to CurvePoint objects
-    target_points = [CurvePoint.from_tuple(p) for p in target_data]
-    source_points_list = [CurvePoint.from_tuple(p) for p in source_data]
-    source_points = {p.frame: p for p in source_points_list}
+    source = _indexed(source_data)
+    frames = source.frames_between(gap_start, gap_end)
 
-    offset_x, offset_y = offset
+    # All filled points get TRACKED status (tracking data copied from source)
+    # The converted ENDFRAME->KEYFRAME activates the segment
+    positions = source.positions_at(frames) + np.asarray(offset, dtype=np.float64)
+    result = _merge_filled_gap(_indexed(target_data), gap_start, gap_end, frames, positions)
 
-    # Create result with existing target points EXCEPT gap frames
-    # (we'll replace gap frames with filled data)
-    result_points = [p for p in target_points if not (gap_start <= p.frame <= gap_end)]
-
-    # Add source data for gap frames
-    gap_frames_filled = 0
-    for frame in range(gap_start, gap_end + 1):
-        if frame in source_points:
-            source_point = source_points[frame]
-            # Apply offset
-            new_x = source_point.x + offset_x
-            new_y = source_point.y + offset_y
-
-            # All filled points get TRACKED status (tracking data copied from source)
-            # The converted ENDFRAME->KEYFRAME activates the segment
-            point_status = PointStatus.TRACKED
-            new_point = CurvePoint(frame=frame, x=new_x, y=new_y, status=point_status)
-            result_points.append(new_point)
-            gap_frames_filled += 1
-
-    logger.info(f"Filled {gap_frames_filled} frames in gap [{gap_start}, {gap_end}]")
-
-    # Keep all points with their original status (no keyframe marking)
-    final_points: list[CurvePoint] = list(result_points)
-
-    # Sort by frame
-    final_points.sort(key=lambda p: p.frame)
-
-    # Convert ENDFRAME that created the gap to KEYFRAME (gap is now filled)
-    # The ENDFRAME should be at gap_start - 1
-    endframe_idx = None
-    for idx, point in enumerate(final_points):
-        if point.frame == gap_start - 1 and point.status == PointStatus.ENDFRAME:
-            endframe_idx = idx
-            break
-
-    if endframe_idx is not None:
-        old_point = final_points[endframe_idx]
-        # Create new point with KEYFRAME status (preserving position)
-        new_point = CurvePoint(
-            frame=old_point.frame,
-            x=old_point.x,
-            y=old_point.y,
-            status=PointStatus.KEYFRAME
-        )
-        final_points[endframe_idx] = new_point
-        logger.info(f"Converted ENDFRAME at frame {gap_start - 1} to KEYFRAME (gap filled)")
-
-    # Convert back to tuple format
-    return [p.to_tuple4() for p in final_points]
+    logger.info(f"Filled {len(frames)} frames in gap [{gap_start}, {gap_end}]")
+    return result
 
 
 def average_multiple_sources(
-    source_data_list: list[CurveDataList], gap_frames: list[int], offset_list: list[tuple[float, float]]
+    source_data_list: Sequence[CurveInput], gap_frames: list[int], offset_list: list[tuple[float, float]]
 ) -> list[CurvePoint]:
     """Average positions from multiple source curves at each gap frame.
 
@@ -438,45 +311,27 @@ def average_multiple_sources(
     if len(source_data_list) != len(offset_list):
         raise ValueError("source_data_list and offset_list must have same length")
 
-    # Convert source data to frame-indexed dictionaries
-    source_points_list: list[dict[int, CurvePoint]] = []
-    for source_data in source_data_list:
-        points_list = [CurvePoint.from_tuple(p) for p in source_data]
-        points_dict = {p.frame: p for p in points_list}
-        source_points_list.append(points_dict)
+    sources = [_indexed(source_data) for source_data in source_data_list]
 
     # Find frames where ALL sources have data (within gap range)
     # This matches 3DEqualizer's behavior
-    gap_frames_set = set(gap_frames)
-    all_source_frames: list[set[int]] = [set(points.keys()) & gap_frames_set for points in source_points_list]
-
-    if all_source_frames:
-        common_frames: set[int] = all_source_frames[0].intersection(*all_source_frames[1:])
+    if sources:
+        common_frames = np.intersect1d(
+            sources[0].common_frames(*sources[1:]), np.asarray(gap_frames, dtype=np.int64), assume_unique=False
+        )
     else:
-        common_frames = set()
-
-    averaged_points: list[CurvePoint] = []
-
-    # Only average frames where ALL sources have data
-    for frame in sorted(common_frames):
-        positions_x: list[float] = []
-        positions_y: list[float] = []
-
-        # Collect positions from ALL sources (we know all have data at this frame)
-        for i, source_points in enumerate(source_points_list):
-            source_point = source_points[frame]
-            offset_x, offset_y = offset_list[i]
+        common_frames = np.empty(0, dtype=np.int64)
 
-            # Apply offset
-            positions_x.append(source_point.x + offset_x)
-            positions_y.append(source_point.y + offset_y)
+    # Sum the offset positions of all sources (we know all have data at these frames), then average
+    total = np.zeros((len(common_frames), 2), dtype=np.float64)
+    for source, offset in zip(sources, offset_list, strict=True):
+        total = total + (source.positions_at(common_frames) + np.asarray(offset, dtype=np.float64))
+    averaged = total / len(sources) if sources else total
 
-        # Average all sources
-        avg_x = sum(positions_x) / len(positions_x)
-        avg_y = sum(positions_y) / len(positions_y)
-
-        avg_point = CurvePoint(frame=frame, x=avg_x, y=avg_y, status=PointStatus.TRACKED)
-        averaged_points.append(avg_point)
+    averaged_points = [
+        CurvePoint(frame=frame, x=x, y=y, status=PointStatus.TRACKED)
+        for frame, (x, y) in zip(common_frames.tolist(), averaged.tolist(), strict=True)
+    ]
 
     logger.info(
         f"Averaged {len(averaged_points)} points from {len(source_data_list)} sources "
@@ -551,7 +406,7 @@ def interpolate_gap(curve_data: CurveDataList, gap_start: int, gap_end: int) ->
     return [p.to_tuple4() for p in final_points]
 
 
-def create_averaged_curve(source_curves: dict[str, CurveDataList]) -> tuple[str, CurveDataList]:
+def create_averaged_curve(source_curves: Mapping[str, CurveInput]) -> tuple[str, CurveDataList]:
     """Create new curve averaging all source curves (Scenario 3).
 
     Args:
@@ -567,46 +422,30 @@ def create_averaged_curve(source_curves: dict[str, CurveDataList]) -> tuple[str,
     if not source_curves:
         raise ValueError("No source curves provided")
 
-    # Convert all curves to frame-indexed dictionaries
-    curve_points_dict: dict[str, dict[int, CurvePoint]] = {}
-    for curve_name, curve_data in source_curves.items():
-        points_list = [CurvePoint.from_tuple(p) for p in curve_data]
-        points_dict = {p.frame: p for p in points_list}
-        curve_points_dict[curve_name] = points_dict
+    sources = [_indexed(curve_data) for curve_data in source_curves.values()]
 
     # Find frames where ALL curves have data
-    all_frames: list[set[int]] = [set(points.keys()) for points in curve_points_dict.values()]
-    if all_frames:
-        common_frames: set[int] = all_frames[0].intersection(*all_frames[1:])
-    else:
-        common_frames = set()
-
-    if not common_frames:
+    common_frames = sources[0].common_frames(*sources[1:])
+    if len(common_frames) == 0:
         logger.warning("No common frames found across all source curves")
         return ("avrg_01", [])
 
     # Average positions at each common frame
-    averaged_points: list[CurvePoint] = []
-    for frame in sorted(common_frames):
-        positions_x: list[float] = []
-        positions_y: list[float] = []
-
-        for points in curve_points_dict.values():
-            point = points[frame]
-            positions_x.append(point.x)
-            positions_y.append(point.y)
-
-        avg_x = sum(positions_x) / len(positions_x)
-        avg_y = sum(positions_y) / len(positions_y)
+    total = np.zeros((len(common_frames), 2), dtype=np.float64)
+    for source in sources:
+        total = total + source.positions_at(common_frames)
+    averaged = total / len(sources)
 
-        avg_point = CurvePoint(frame=frame, x=avg_x, y=avg_y, status=PointStatus.NORMAL)
-        averaged_points.append(avg_point)
+    normal = PointStatus.NORMAL.value
+    averaged_data: CurveDataList = [
+        (frame, x, y, normal) for frame, (x, y) in zip(common_frames.tolist(), averaged.tolist(), strict=True)
+    ]
 
     # Generate unique name
     curve_name = "avrg_01"
 
     logger.info(
-        f"Created averaged curve '{curve_name}' with {len(averaged_points)} points from {len(source_curves)} sources"
+        f"Created averaged curve '{curve_name}' with {len(averaged_data)} points from {len(source_curves)} sources"
     )
 
-    return (curve_name, [p.to_tuple4() for p in averaged_points])
+    return (curve_name, averaged_data)
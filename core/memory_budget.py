@@ -0,0 +1,362 @@
+#!/usr/bin/env python
+"""
+Process-wide memory budget shared by CurveEditor's caches.
+
+Caches (decoded frames, thumbnails, directory scans, SegmentedCurves, undo
+history) each used to cap themselves by entry count, which says nothing about
+bytes: 100 4K frames can swap a small machine and leave most of a large one
+unused. Each cache now reports an estimate of its size in bytes and can evict
+its own least recently used entries. The budget adds the estimates up and,
+when the total exceeds the configured limit, asks caches to evict, lowest
+priority first, until the total fits again.
+
+Caches keep their count limits as upper bounds. They call enforce() after they
+grow, outside of their own locks, because enforce() may call back into any
+registered cache.
+
+Registrations hold weak references, so a cache that is garbage collected drops
+out of the budget. Registering a name again replaces the previous cache.
+
+Environment:
+    CURVE_EDITOR_MEMORY_BUDGET_MB=mb   Override the budget (default: a quarter of
+                                       physical memory, at least 1 GiB)
+
+Usage:
+    from core.memory_budget import get_memory_budget
+
+    budget = get_memory_budget()
+    budget.register("image_cache", cache, priority=PRIORITY_IMAGES, description="Decoded frames")
+    ...
+    budget.enforce()  # after adding to the cache
+    print(budget.format_report())
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Protocol
+
+from core.logger_utils import get_logger
+
+logger = get_logger("memory_budget")
+
+MIB = 1024 * 1024
+GIB = 1024 * MIB
+
+# Budget used when physical memory cannot be determined
+FALLBACK_BUDGET_BYTES = 4 * GIB
+
+# Smallest automatic budget
+MIN_AUTO_BUDGET_BYTES = 1 * GIB
+
+# Fraction of physical memory used by the automatic budget
+AUTO_BUDGET_FRACTION = 0.25
+
+# Eviction priorities: lower priorities are evicted first
+PRIORITY_THUMBNAILS = 10
+PRIORITY_DIRECTORY_SCANS = 20
+PRIORITY_SEGMENTED_CURVES = 40
+PRIORITY_IMAGES = 60
+PRIORITY_UNDO_HISTORY = 90
+
+# Rough size of one curve point held in Python containers: a 3-4 item tuple,
+# its int and float objects and the list slot pointing at it
+POINT_SIZE_ESTIMATE = 160
+
+
+class BudgetedCache(Protocol):
+    """Cache that can take part in the memory budget."""
+
+    def memory_usage_bytes(self) -> int:
+        """Estimated bytes held by the cache."""
+        ...
+
+    def evict_bytes(self, target_bytes: int) -> int:
+        """
+        Evict least valuable entries until at least target_bytes are freed or the cache is empty.
+
+        Returns:
+            Estimated bytes freed
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class CacheUsage:
+    """Memory use of one registered cache."""
+
+    name: str
+    description: str
+    priority: int
+    bytes_used: int
+
+
+@dataclass(frozen=True)
+class _Registration:
+    name: str
+    description: str
+    priority: int
+    cache: weakref.ReferenceType[BudgetedCache]
+
+
+def estimate_points_bytes(point_count: int) -> int:
+    """Estimate the bytes held by point_count curve points."""
+    return point_count * POINT_SIZE_ESTIMATE
+
+
+def detect_physical_memory() -> int | None:
+    """
+    Get the physical memory size.
+
+    Returns:
+        Physical memory in bytes, or None if the platform does not report it
+    """
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        pass
+
+    try:
+        import ctypes
+
+        class _MemoryStatusEx(ctypes.Structure):
+            _fields_ = [  # pyright: ignore[reportUnannotatedClassAttribute]
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = _MemoryStatusEx()
+        status.dwLength = ctypes.sizeof(_MemoryStatusEx)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):  # pyright: ignore[reportAttributeAccessIssue]
+            return int(status.ullTotalPhys)
+    except (AttributeError, OSError):
+        pass
+    return None
+
+
+def default_budget_bytes() -> int:
+    """
+    Get the budget used when none is configured.
+
+    Returns:
+        A quarter of physical memory (at least 1 GiB), or 4 GiB if physical memory is unknown
+    """
+    physical = detect_physical_memory()
+    if physical is None:
+        return FALLBACK_BUDGET_BYTES
+    return max(MIN_AUTO_BUDGET_BYTES, int(physical * AUTO_BUDGET_FRACTION))
+
+
+class MemoryBudget:
+    """
+    Accountant that enforces one byte budget across registered caches.
+
+    One process-wide instance is returned by get_memory_budget().
+    """
+
+    def __init__(self, budget_bytes: int | None = None) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            budget_bytes: Budget in bytes, None for default_budget_bytes()
+
+        Raises:
+            ValueError: If budget_bytes <= 0
+        """
+        self._budget_bytes: int = default_budget_bytes() if budget_bytes is None else budget_bytes
+        if self._budget_bytes <= 0:
+            raise ValueError(f"budget_bytes must be positive, got {self._budget_bytes}")
+
+        self._registrations: dict[str, _Registration] = {}
+        self._lock: threading.Lock = threading.Lock()
+        # Held while evicting; eviction that grows another cache must not recurse
+        self._enforce_lock: threading.Lock = threading.Lock()
+        self._evicted_bytes: int = 0
+
+        logger.debug(f"MemoryBudget initialized with {self._budget_bytes / MIB:.0f} MB")
+
+    @property
+    def budget_bytes(self) -> int:
+        """Get the budget in bytes."""
+        return self._budget_bytes
+
+    def set_budget_bytes(self, budget_bytes: int) -> None:
+        """
+        Change the budget and evict down to it.
+
+        Args:
+            budget_bytes: New budget in bytes
+
+        Raises:
+            ValueError: If budget_bytes <= 0
+        """
+        if budget_bytes <= 0:
+            raise ValueError(f"budget_bytes must be positive, got {budget_bytes}")
+        self._budget_bytes = budget_bytes
+        logger.info(f"Memory budget set to {budget_bytes / MIB:.0f} MB")
+        _ = self.enforce()
+
+    def register(self, name: str, cache: BudgetedCache, priority: int, description: str = "") -> None:
+        """
+        Add a cache to the budget.
+
+        Args:
+            name: Unique cache name; registering a name again replaces the previous cache
+            cache: Cache to account for (held by weak reference)
+            priority: Eviction priority, lower priorities are evicted first
+            description: Human-readable label for reports
+        """
+        registration = _Registration(name, description or name, priority, weakref.ref(cache))
+        with self._lock:
+            self._registrations[name] = registration
+        logger.debug(f"Registered cache '{name}' (priority {priority})")
+
+    def unregister(self, name: str) -> None:
+        """Remove a cache from the budget (no-op if not registered)."""
+        with self._lock:
+            _ = self._registrations.pop(name, None)
+
+    def _live_caches(self) -> list[tuple[_Registration, BudgetedCache]]:
+        """Registered caches that are still alive, lowest priority first."""
+        with self._lock:
+            registrations = list(self._registrations.values())
+
+        live: list[tuple[_Registration, BudgetedCache]] = []
+        dead: list[str] = []
+        for registration in registrations:
+            cache = registration.cache()
+            if cache is None:
+                dead.append(registration.name)
+            else:
+                live.append((registration, cache))
+
+        if dead:
+            with self._lock:
+                for name in dead:
+                    current = self._registrations.get(name)
+                    if current is not None and current.cache() is None:
+                        del self._registrations[name]
+
+        live.sort(key=lambda entry: entry[0].priority)
+        return live
+
+    def usage(self) -> list[CacheUsage]:
+        """
+        Get the memory use of every registered cache.
+
+        Returns:
+            Usage per cache, highest first
+        """
+        usages = [
+            CacheUsage(registration.name, registration.description, registration.priority, cache.memory_usage_bytes())
+            for registration, cache in self._live_caches()
+        ]
+        usages.sort(key=lambda usage: usage.bytes_used, reverse=True)
+        return usages
+
+    def total_bytes(self) -> int:
+        """Get the estimated bytes held by all registered caches."""
+        return sum(cache.memory_usage_bytes() for _, cache in self._live_caches())
+
+    @property
+    def evicted_bytes(self) -> int:
+        """Get the total bytes evicted by the budget since startup."""
+        return self._evicted_bytes
+
+    def enforce(self) -> int:
+        """
+        Evict from registered caches until their total fits the budget.
+
+        Caches are asked in ascending priority order; each evicts its own
+        least recently used entries. Returns immediately if another thread is
+        already enforcing or if called from inside an eviction.
+
+        Returns:
+            Estimated bytes freed
+        """
+        if not self._enforce_lock.acquire(blocking=False):
+            return 0
+        try:
+            caches = self._live_caches()
+            sizes = [cache.memory_usage_bytes() for _, cache in caches]
+            excess = sum(sizes) - self._budget_bytes
+            if excess <= 0:
+                return 0
+
+            freed_total = 0
+            for (registration, cache), size in zip(caches, sizes, strict=True):
+                if excess <= 0:
+                    break
+                if size <= 0:
+                    continue
+                freed = cache.evict_bytes(excess)
+                if freed > 0:
+                    logger.debug(f"Evicted {freed / MIB:.1f} MB from '{registration.name}'")
+                    freed_total += freed
+                    excess -= freed
+
+            self._evicted_bytes += freed_total
+            if excess > 0:
+                logger.warning(f"Caches remain {excess / MIB:.1f} MB over the memory budget after eviction")
+            return freed_total
+        finally:
+            self._enforce_lock.release()
+
+    def format_report(self) -> str:
+        """
+        Format a per-cache memory breakdown.
+
+        Returns:
+            Multi-line report with one row per cache, the total and the budget
+        """
+        usages = self.usage()
+        total = sum(usage.bytes_used for usage in usages)
+        width = max([len(usage.description) for usage in usages] + [len("Total")])
+
+        lines = ["Cache memory (estimated):"]
+        for usage in usages:
+            lines.append(f"  {usage.description:<{width}}  {usage.bytes_used / MIB:10.1f} MB  (priority {usage.priority})")
+        lines.append(f"  {'Total':<{width}}  {total / MIB:10.1f} MB")
+        lines.append(f"  {'Budget':<{width}}  {self._budget_bytes / MIB:10.1f} MB  ({total / self._budget_bytes:.0%} used)")
+        lines.append(f"  {'Evicted':<{width}}  {self._evicted_bytes / MIB:10.1f} MB  (since startup)")
+        return "\n".join(lines)
+
+
+_memory_budget: MemoryBudget | None = None
+_memory_budget_lock = threading.Lock()
+
+
+def get_memory_budget() -> MemoryBudget:
+    """
+    Get the process-wide memory budget.
+
+    The budget comes from AppConfig.memory_budget_mb (CURVE_EDITOR_MEMORY_BUDGET_MB)
+    when set, otherwise default_budget_bytes().
+    """
+    global _memory_budget
+    if _memory_budget is None:
+        with _memory_budget_lock:
+            if _memory_budget is None:
+                from core.config import get_config
+
+                budget_mb = get_config().memory_budget_mb
+                _memory_budget = MemoryBudget(budget_mb * MIB if budget_mb > 0 else None)
+    return _memory_budget
+
+
+def reset_memory_budget() -> None:
+    """Reset the process-wide memory budget (mainly for testing)."""
+    global _memory_budget
+    with _memory_budget_lock:
+        _memory_budget = None
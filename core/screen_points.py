@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+"""
+Array-backed cache of screen positions for one curve.
+
+Holds the screen coordinates of every point of a curve as an Nx2 float array,
+plus a boolean visibility mask for the last viewport tested. The render cache
+controller owns one instance for the active curve; the renderer and the
+spatial index read the same array instead of transforming the curve again.
+"""
+# pyright: reportImportCycles=false
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
+
+from core.type_aliases import CurveDataList
+
+if TYPE_CHECKING:
+    from services.transform_service import Transform
+
+FloatArray: TypeAlias = NDArray[np.float64]
+BoolArray: TypeAlias = NDArray[np.bool_]
+IntArray: TypeAlias = NDArray[np.intp]
+
+
+def curve_xy_array(curve_data: CurveDataList) -> FloatArray:
+    """
+    Extract the (x, y) data coordinates of a curve as an Nx2 array.
+
+    Args:
+        curve_data: Curve points (frame, x, y[, status])
+
+    Returns:
+        Nx2 float array, shape (0, 2) for an empty curve
+    """
+    if not curve_data:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.array([(point[1], point[2]) for point in curve_data], dtype=np.float64)
+
+
+def visible_mask(points: FloatArray, left: float, top: float, right: float, bottom: float) -> BoolArray:
+    """
+    Test which screen points fall inside a rectangle (edges inclusive).
+
+    Args:
+        points: Nx2 screen coordinates
+        left, top, right, bottom: Rectangle bounds in screen coordinates
+
+    Returns:
+        Boolean mask of length N
+    """
+    x = points[:, 0]
+    y = points[:, 1]
+    return (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+
+
+def polygon_mask(points: FloatArray, polygon: FloatArray) -> BoolArray:
+    """
+    Test which screen points fall inside a polygon (even-odd rule).
+
+    Points outside the polygon's bounding box are rejected first, then each
+    polygon edge is tested against all remaining candidates at once.
+
+    Args:
+        points: Nx2 screen coordinates
+        polygon: Mx2 polygon vertices in screen coordinates (closing edge implied)
+
+    Returns:
+        Boolean mask of length N (all False for fewer than three vertices)
+    """
+    mask = np.zeros(len(points), dtype=np.bool_)
+    if len(polygon) < 3 or len(points) == 0:
+        return mask
+
+    left, top = polygon.min(axis=0)
+    right, bottom = polygon.max(axis=0)
+    candidates = np.flatnonzero(visible_mask(points, left, top, right, bottom))
+    if len(candidates) == 0:
+        return mask
+
+    x = points[candidates, 0]
+    y = points[candidates, 1]
+    inside = np.zeros(len(candidates), dtype=np.bool_)
+    vertices = polygon.tolist()
+    prev_x, prev_y = vertices[-1]
+    for vert_x, vert_y in vertices:
+        if vert_y != prev_y:
+            crosses = (vert_y > y) != (prev_y > y)
+            cross_x = (prev_x - vert_x) * (y - vert_y) / (prev_y - vert_y) + vert_x
+            inside ^= crosses & (x < cross_x)
+        prev_x, prev_y = vert_x, vert_y
+
+    mask[candidates] = inside
+    return mask
+
+
+class ScreenPointCache:
+    """
+    Screen positions of one curve under one transform.
+
+    The cache is valid for a (curve name, transform, point count) triple.
+    Moving points does not change that triple, so drags patch single rows
+    or index ranges in place instead of rebuilding.
+
+    Attributes:
+        curve_name: Curve the positions belong to (None when empty)
+        transform: Transform the positions were computed with
+        points: Nx2 screen coordinates, row i is curve point i
+        visible: Visibility mask for ``visible_rect``
+        visible_rect: (left, top, right, bottom) the mask was computed for
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.curve_name: str | None = None
+        self.transform: Transform | None = None
+        self.points: FloatArray = np.empty((0, 2), dtype=np.float64)
+        self.visible: BoolArray = np.zeros(0, dtype=np.bool_)
+        self.visible_rect: tuple[float, float, float, float] | None = None
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def is_valid_for(self, curve_name: str | None, transform: Transform, count: int) -> bool:
+        """
+        Check whether the cached positions can be used for a curve.
+
+        Args:
+            curve_name: Curve being drawn or searched
+            transform: Current view transform
+            count: Current number of points in the curve
+
+        Returns:
+            True if the cache was built for this curve, transform and point count
+        """
+        return (
+            self.transform is not None
+            and self.curve_name == curve_name
+            and len(self.points) == count
+            and self.transform == transform
+        )
+
+    def get(self, curve_name: str | None, transform: Transform, count: int) -> FloatArray | None:
+        """
+        Get the cached positions if they are valid for a curve.
+
+        Returns:
+            Nx2 screen coordinates, or None if the cache is stale
+        """
+        return self.points if self.is_valid_for(curve_name, transform, count) else None
+
+    def rebuild(self, curve_name: str | None, curve_data: CurveDataList, transform: Transform) -> None:
+        """
+        Transform a whole curve into the cache.
+
+        Args:
+            curve_name: Curve the data belongs to
+            curve_data: Curve points
+            transform: View transform
+        """
+        self.curve_name = curve_name
+        self.transform = transform
+        self.points = transform.batch_data_to_screen(curve_xy_array(curve_data))
+        self.visible = np.zeros(len(self.points), dtype=np.bool_)
+        self.visible_rect = None
+
+    def update_range(self, curve_data: CurveDataList, start: int, stop: int) -> None:
+        """
+        Recompute the positions of points ``start`` to ``stop - 1``.
+
+        Args:
+            curve_data: Full curve data (same point count as the cache)
+            start: First index to update
+            stop: One past the last index to update
+        """
+        if self.transform is None:
+            return
+        start = max(0, start)
+        stop = min(stop, len(self.points), len(curve_data))
+        if start >= stop:
+            return
+
+        updated = self.transform.batch_data_to_screen(curve_xy_array(curve_data[start:stop]))
+        self.points[start:stop] = updated
+        if self.visible_rect is not None:
+            self.visible[start:stop] = visible_mask(updated, *self.visible_rect)
+
+    def update_point(self, index: int, x: float, y: float) -> None:
+        """
+        Recompute the position of a single point.
+
+        Args:
+            index: Point index
+            x: New X coordinate in data space
+            y: New Y coordinate in data space
+        """
+        if self.transform is None or not 0 <= index < len(self.points):
+            return
+
+        screen_x, screen_y = self.transform.data_to_screen(x, y)
+        self.points[index] = (screen_x, screen_y)
+        if self.visible_rect is not None:
+            left, top, right, bottom = self.visible_rect
+            self.visible[index] = left <= screen_x <= right and top <= screen_y <= bottom
+
+    def update_visibility(self, left: float, top: float, right: float, bottom: float) -> BoolArray:
+        """
+        Recompute the visibility mask for a rectangle.
+
+        Returns:
+            The new visibility mask
+        """
+        self.visible = visible_mask(self.points, left, top, right, bottom)
+        self.visible_rect = (left, top, right, bottom)
+        return self.visible
+
+    def visible_indices(self, left: float, top: float, right: float, bottom: float) -> IntArray:
+        """
+        Get the indices of points inside a rectangle.
+
+        Reuses the stored mask when it was computed for the same rectangle.
+
+        Returns:
+            Sorted array of visible point indices
+        """
+        if self.visible_rect != (left, top, right, bottom):
+            _ = self.update_visibility(left, top, right, bottom)
+        return np.flatnonzero(self.visible)
+
+    def clear(self) -> None:
+        """Drop all cached positions."""
+        self.curve_name = None
+        self.transform = None
+        self.points = np.empty((0, 2), dtype=np.float64)
+        self.visible = np.zeros(0, dtype=np.bool_)
+        self.visible_rect = None
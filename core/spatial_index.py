@@ -2,8 +2,10 @@
 """
 Spatial indexing for efficient point lookups in CurveEditor.
 
-This module provides a simple grid-based spatial index for O(1) point
-lookups instead of O(n) linear search.
+This module provides a grid-based spatial index for O(1) point lookups
+instead of O(n) linear search. DataPointIndex bins data positions once per
+curve version and maps screen queries into data space, so it survives pan
+and zoom. InteractionService uses it for all hit testing.
 """
 # pyright: reportImportCycles=false
 
@@ -11,376 +13,160 @@ from __future__ import annotations
 
 import math
 import threading
-from typing import TYPE_CHECKING, Protocol
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
-    from protocols.ui import CurveViewProtocol
     from services.transform_service import Transform
 
 from core.logger_utils import get_logger
+from core.screen_points import FloatArray, IntArray, curve_xy_array, visible_mask
 from core.type_aliases import CurveDataList
 
 logger = get_logger("spatial_index")
 
 
-class HasDimensionsProtocol(Protocol):
-    """Minimal protocol for objects that provide width and height."""
-
-    def width(self) -> int:
-        """Get widget width."""
-        ...
-
-    def height(self) -> int:
-        """Get widget height."""
-        ...
+class DataPointIndex:
+    """
+    Uniform grid over one curve's data coordinates.
 
+    Built once per curve data version; screen queries are mapped into data
+    space through the inverse of the view's axis-aligned transform, so panning
+    and zooming never rebuild it. Point rows are stored sorted by cell
+    (row-major), so the cells of one grid row are a single contiguous slice.
 
-class PointIndex:
+    Points moved by update_points() keep their original cell entry and are
+    tracked as displaced; queries check them directly until enough have moved
+    to make a rebuild worthwhile.
     """
-    Simple grid-based spatial index for efficient point lookups.
 
-    Divides the screen space into a grid and stores point indices in each cell
-    for O(1) lookup performance instead of O(n) linear search.
-    """
+    # Average points per occupied cell the grid is sized for
+    _TARGET_POINTS_PER_CELL: float = 4.0
+    # Displaced points tolerated before rebuilding (at least this many, or 1/8 of the curve)
+    _MIN_REBUILD_DISPLACED: int = 64
 
-    grid_width: int
-    grid_height: int
     _lock: threading.RLock
 
-    def __init__(self, screen_width: float = 800.0, screen_height: float = 600.0):
-        """
-        Initialize the spatial index with adaptive grid size.
-
-        Args:
-            screen_width: Screen width in pixels for adaptive grid calculation
-            screen_height: Screen height in pixels for adaptive grid calculation
-        """
-        # Calculate adaptive grid size targeting 40-50 pixels per cell
-        target_cell_size = 45.0  # pixels
-        self.grid_width = max(10, min(50, int(screen_width / target_cell_size)))
-        self.grid_height = max(10, min(50, int(screen_height / target_cell_size)))
-        self.cell_width: float = 0.0
-        self.cell_height: float = 0.0
-        self.screen_width: float = screen_width
-        self.screen_height: float = screen_height
-
-        # Cache the target cell size for recalculation
-        self._target_cell_size: float = 45.0
-
-        # Grid structure: dict[tuple[int, int], list[int]]
-        # Key is (grid_x, grid_y), value is list of point indices
-        self._grid: dict[tuple[int, int], list[int]] = {}
-
-        # Track when index was last built
-        self._last_transform_hash: str | None = None
-        self._last_point_count: int = 0
-
-        # Thread safety
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._xy: FloatArray = np.empty((0, 2), dtype=np.float64)
+        self._origin: tuple[float, float] = (0.0, 0.0)
+        self.cell_size: float = 1.0
+        self.grid_width: int = 0
+        self.grid_height: int = 0
+
+        # Rows sorted by cell id; rows of cell c are _rows[_cell_starts[c]:_cell_starts[c + 1]]
+        self._rows: IntArray = np.empty(0, dtype=np.intp)
+        self._cell_starts: IntArray = np.zeros(1, dtype=np.intp)
+        # Cell each row was indexed under (-1 for points without finite coordinates)
+        self._row_cells: IntArray = np.empty(0, dtype=np.intp)
+        # Rows whose current position lies outside the cell they are indexed under
+        self._displaced: set[int] = set()
+
+        self._version: int | None = None
         self._lock = threading.RLock()
 
-    def _get_cell_coords(self, screen_x: float, screen_y: float) -> tuple[int, int]:
-        """
-        Get grid cell coordinates for screen position.
-
-        Args:
-            screen_x: Screen X coordinate
-            screen_y: Screen Y coordinate
-
-        Returns:
-            Tuple of (grid_x, grid_y)
-        """
-        if self.cell_width == 0 or self.cell_height == 0:
-            return (0, 0)
-
-        grid_x = min(int(screen_x / self.cell_width), self.grid_width - 1)
-        grid_y = min(int(screen_y / self.cell_height), self.grid_height - 1)
-
-        # Ensure coordinates are within bounds
-        grid_x = max(0, grid_x)
-        grid_y = max(0, grid_y)
+    def __len__(self) -> int:
+        return len(self._xy)
 
-        return (grid_x, grid_y)
+    @property
+    def version(self) -> int | None:
+        """Curve data version the index was built for (None if not built)."""
+        return self._version
 
-    def update_screen_dimensions(self, screen_width: float, screen_height: float) -> bool:
+    def sync(self, curve_data: CurveDataList, version: int) -> bool:
         """
-        Update screen dimensions and recalculate adaptive grid size if needed.
+        Make sure the index reflects a curve version, rebuilding only if it does not.
 
         Args:
-            screen_width: New screen width in pixels
-            screen_height: New screen height in pixels
+            curve_data: Current curve data
+            version: Data version of curve_data (e.g. ApplicationState.get_curve_version())
 
         Returns:
-            True if grid was resized, False if no change needed
+            True if the index was rebuilt
         """
         with self._lock:
-            # Check if dimensions changed significantly
-            width_change = abs(screen_width - self.screen_width)
-            height_change = abs(screen_height - self.screen_height)
-
-            # Only recalculate if change is significant (>10% or >100 pixels)
-            threshold = max(100.0, min(self.screen_width * 0.1, self.screen_height * 0.1))
-
-            if width_change > threshold or height_change > threshold:
-                # Update dimensions
-                self.screen_width = screen_width
-                self.screen_height = screen_height
-
-                # Recalculate adaptive grid size
-                old_grid_width = self.grid_width
-                old_grid_height = self.grid_height
-
-                self.grid_width = max(10, min(50, int(screen_width / self._target_cell_size)))
-                self.grid_height = max(10, min(50, int(screen_height / self._target_cell_size)))
-
-                # Clear index if grid size changed
-                if self.grid_width != old_grid_width or self.grid_height != old_grid_height:
-                    self._grid.clear()
-                    self._last_transform_hash = None  # Force rebuild
-                    logger.debug(
-                        f"Adaptive grid resized: {old_grid_width}x{old_grid_height} -> "
-                        + f"{self.grid_width}x{self.grid_height} for {screen_width}x{screen_height} screen"
-                    )
-                    return True
-
-            return False
-
-    def _get_nearby_cells(self, grid_x: int, grid_y: int, radius: int = 1) -> list[tuple[int, int]]:
+            if self._version == version and len(self._xy) == len(curve_data):
+                return False
+            self._build(_finite_xy(curve_data))
+            self._version = version
+            return True
+
+    def update_points(self, positions: Mapping[int, tuple[float, float]], version: int) -> bool:
         """
-        Get list of nearby grid cells within radius.
+        Move individual points without a rebuild.
 
         Args:
-            grid_x: Center grid X coordinate
-            grid_y: Center grid Y coordinate
-            radius: Search radius in grid cells
+            positions: New (x, y) data coordinates by point index
+            version: Curve data version after the move
 
         Returns:
-            List of (grid_x, grid_y) tuples
-        """
-        cells: list[tuple[int, int]] = []
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                nx = grid_x + dx
-                ny = grid_y + dy
-                if 0 <= nx < self.grid_width and 0 <= ny < self.grid_height:
-                    cells.append((nx, ny))
-        return cells
-
-    def rebuild_index(self, curve_data: CurveDataList, view: HasDimensionsProtocol, transform: Transform) -> None:
-        """
-        Rebuild the spatial index from curve data.
-
-        Args:
-            curve_data: The curve data to index
-            view: Object with width() and height() methods (for screen dimensions)
-            transform: Transform for coordinate conversion
+            True if the index was updated, False if it was not built or an index is out of range
         """
         with self._lock:
-            # Check if rebuild is needed
-            current_transform_hash = transform.stability_hash
-            current_point_count = len(curve_data)
-
-            if (
-                self._last_transform_hash == current_transform_hash
-                and self._last_point_count == current_point_count
-                and self._grid
-            ):
-                # Index is still valid
-                return
-
-            # Clear existing index
-            self._grid.clear()
-
-            # Update screen dimensions and recalculate grid if needed
-            new_width = float(getattr(view, "width", lambda: 800.0)())
-            new_height = float(getattr(view, "height", lambda: 600.0)())
-            _ = self.update_screen_dimensions(new_width, new_height)
-
-            # Calculate cell dimensions
-            self.cell_width = self.screen_width / self.grid_width
-            self.cell_height = self.screen_height / self.grid_height
-
-            # Build index from curve data
-            if curve_data:
-                for idx, point in enumerate(curve_data):
-                    if len(point) >= 3:
-                        # Convert data point to screen coordinates
-                        screen_x, screen_y = transform.data_to_screen(point[1], point[2])
-
-                        # Get grid cell
-                        grid_x, grid_y = self._get_cell_coords(screen_x, screen_y)
-
-                        # Add point index to cell
-                        cell_key = (grid_x, grid_y)
-                        if cell_key not in self._grid:
-                            self._grid[cell_key] = []
-                        self._grid[cell_key].append(idx)
-
-            # Update tracking
-            self._last_transform_hash = current_transform_hash
-            self._last_point_count = current_point_count
-
-    def find_point_at_position(
-        self,
-        curve_data: CurveDataList,
-        transform: Transform,
-        x: float,
-        y: float,
-        threshold: float = 5.0,
-        view: CurveViewProtocol | None = None,
-    ) -> int:
+            if self._version is None or any(not 0 <= idx < len(self._xy) for idx in positions):
+                return False
+
+            for idx, (x, y) in positions.items():
+                self._xy[idx] = (x, y)
+                if self._cell_of(float(x), float(y)) == self._row_cells[idx]:
+                    self._displaced.discard(idx)
+                else:
+                    self._displaced.add(idx)
+            self._version = version
+
+            if len(self._displaced) > max(self._MIN_REBUILD_DISPLACED, len(self._xy) // 8):
+                self._build(self._xy)
+            return True
+
+    def find_point_at_position(self, transform: Transform, x: float, y: float, threshold: float = 5.0) -> int:
         """
-        Find point at given screen position using spatial indexing.
+        Find the point closest to a screen position.
 
         Args:
-            curve_data: The curve data to search
-            transform: Transform for coordinate conversion
+            transform: Current view transform
             x: Screen X coordinate
             y: Screen Y coordinate
             threshold: Selection threshold in screen pixels
-            view: Optional curve view (for screen dimensions, uses defaults if None)
 
         Returns:
-            Point index or -1 if no point found
+            Point index or -1 if no point is within threshold
         """
-        if not curve_data:
-            return -1
-
-        # Rebuild index if needed (use view for screen dimensions, or create dummy)
-        dimensions_view: HasDimensionsProtocol
-        if view is None:
-            # Create a minimal view object for dimensions
-            class DummyView:
-                def width(self) -> int:
-                    return 800
-
-                def height(self) -> int:
-                    return 600
-
-            dimensions_view = DummyView()
-        else:
-            dimensions_view = view
-
-        self.rebuild_index(curve_data, dimensions_view, transform)
-
-        # Type-safe curve data access
-        typed_curve_data = curve_data
-
-        # Get grid cell for position
-        grid_x, grid_y = self._get_cell_coords(x, y)
-
-        # Check nearby cells (threshold might span multiple cells)
-        cell_radius = (
-            max(1, int(threshold / min(self.cell_width, self.cell_height)) + 1)
-            if self.cell_width > 0 and self.cell_height > 0
-            else 1
-        )
-        nearby_cells = self._get_nearby_cells(grid_x, grid_y, cell_radius)
+        with self._lock:
+            rows = self._candidate_rows(transform, x - threshold, y - threshold, x + threshold, y + threshold)
+            if len(rows) == 0:
+                return -1
 
-        closest_idx = -1
-        closest_distance: float = float("inf")
+            screen = transform.batch_data_to_screen(self._xy[rows])
+            distances = np.hypot(screen[:, 0] - x, screen[:, 1] - y)
+            best = int(np.argmin(distances))
+            return int(rows[best]) if distances[best] <= threshold else -1
 
-        # Check points in nearby cells
-        with self._lock:
-            for cell_key in nearby_cells:
-                if cell_key in self._grid:
-                    for point_idx in self._grid[cell_key]:
-                        if point_idx < len(typed_curve_data):
-                            point = typed_curve_data[point_idx]
-                            if len(point) >= 3:
-                                # Convert to screen coordinates
-                                screen_coords = transform.data_to_screen(point[1], point[2])
-                                screen_px: float = screen_coords[0]
-                                screen_py: float = screen_coords[1]
-
-                                # Calculate distance using math.sqrt for type safety
-                                dx = float(screen_px - x)
-                                dy = float(screen_py - y)
-                                distance = math.sqrt(dx * dx + dy * dy)
-
-                                # Check if within threshold and closer than previous
-                                if distance <= threshold and distance < closest_distance:
-                                    closest_distance = distance
-                                    closest_idx = point_idx
-        return closest_idx
-
-    def get_points_in_rect(
-        self,
-        curve_data: CurveDataList,
-        transform: Transform,
-        x1: float,
-        y1: float,
-        x2: float,
-        y2: float,
-        view: CurveViewProtocol | None = None,
-    ) -> list[int]:
+    def get_points_in_rect(self, transform: Transform, x1: float, y1: float, x2: float, y2: float) -> list[int]:
         """
-        Find all points within a rectangular region using spatial indexing.
+        Find all points within a screen rectangle (edges inclusive).
 
         Args:
-            curve_data: The curve data to search
-            transform: Transform for coordinate conversion
-            x1, y1: Top-left corner of rectangle (screen coordinates)
-            x2, y2: Bottom-right corner of rectangle (screen coordinates)
-            view: Optional curve view (for screen dimensions, uses defaults if None)
+            transform: Current view transform
+            x1, y1: One corner of the rectangle (screen coordinates)
+            x2, y2: Opposite corner of the rectangle (screen coordinates)
 
         Returns:
-            List of point indices within the rectangle
+            Sorted point indices within the rectangle
         """
-        if not curve_data:
-            return []
-
-        # Rebuild index if needed
-        dimensions_view: HasDimensionsProtocol
-        if view is None:
-            # Create a minimal view object for dimensions
-            class DummyView:
-                def width(self) -> int:
-                    return 800
-
-                def height(self) -> int:
-                    return 600
-
-            dimensions_view = DummyView()
-        else:
-            dimensions_view = view
-
-        self.rebuild_index(curve_data, dimensions_view, transform)
-
-        # Type-safe curve data access
-        typed_curve_data = curve_data
-
-        # Ensure proper bounds
-        left = min(x1, x2)
-        right = max(x1, x2)
-        top = min(y1, y2)
-        bottom = max(y1, y2)
-
-        # Get grid cells covering the rectangle
-        top_left_cell = self._get_cell_coords(left, top)
-        bottom_right_cell = self._get_cell_coords(right, bottom)
+        left, right = min(x1, x2), max(x1, x2)
+        top, bottom = min(y1, y2), max(y1, y2)
+        with self._lock:
+            rows = self._candidate_rows(transform, left, top, right, bottom)
+            if len(rows) == 0:
+                return []
 
-        result_indices: list[int] = []
+            screen = transform.batch_data_to_screen(self._xy[rows])
+            return rows[visible_mask(screen, left, top, right, bottom)].tolist()
 
-        # Check all cells in the rectangle
-        with self._lock:
-            for gx in range(top_left_cell[0], bottom_right_cell[0] + 1):
-                for gy in range(top_left_cell[1], bottom_right_cell[1] + 1):
-                    cell_key = (gx, gy)
-                    if cell_key in self._grid:
-                        for point_idx in self._grid[cell_key]:
-                            if point_idx < len(typed_curve_data):
-                                point = typed_curve_data[point_idx]
-                                if len(point) >= 3:
-                                    # Convert to screen coordinates
-                                    screen_px, screen_py = transform.data_to_screen(point[1], point[2])
-
-                                    # Check if point is within rectangle
-                                    if left <= screen_px <= right and top <= screen_py <= bottom:
-                                        result_indices.append(point_idx)
-
-        return result_indices
-
-    def get_stats(self) -> dict[str, int | float | tuple[int, int] | tuple[float, float] | str | None]:
+    def get_stats(self) -> dict[str, int | float | tuple[int, int] | str | None]:
         """
         Get spatial index statistics.
 
@@ -388,28 +174,123 @@ class PointIndex:
             Dictionary with index statistics
         """
         with self._lock:
-            occupied_cells = len(self._grid)
+            counts = np.diff(self._cell_starts)
+            occupied_cells = int(np.count_nonzero(counts))
             total_cells = self.grid_width * self.grid_height
-            total_points = sum(len(points) for points in self._grid.values())
-
-            avg_points_per_cell = total_points / occupied_cells if occupied_cells > 0 else 0
-
+            total_points = len(self._rows)
             return {
                 "grid_size": (self.grid_width, self.grid_height),
-                "screen_size": (self.screen_width, self.screen_height),
-                "cell_size": (self.cell_width, self.cell_height),
+                "cell_size": self.cell_size,
                 "occupied_cells": occupied_cells,
                 "total_cells": total_cells,
                 "occupancy_ratio": occupied_cells / total_cells if total_cells > 0 else 0,
                 "total_points": total_points,
-                "avg_points_per_cell": avg_points_per_cell,
-                "transform_hash": self._last_transform_hash,
+                "avg_points_per_cell": total_points / occupied_cells if occupied_cells > 0 else 0,
+                "displaced_points": len(self._displaced),
+                "data_version": self._version,
             }
 
     def clear_cache(self) -> None:
-        """Clear the spatial index cache to force rebuild on next access."""
+        """Clear the index to force a rebuild on next sync."""
         with self._lock:
-            self._grid.clear()
-            self._last_transform_hash = None
-            self._last_point_count = 0
-            logger.debug("Spatial index cache cleared")
+            self._build(np.empty((0, 2), dtype=np.float64))
+            self._version = None
+
+    def _build(self, xy: FloatArray) -> None:
+        """Bin every finite point of xy into a grid sized for the data extent."""
+        self._xy = np.array(xy, dtype=np.float64)
+        self._displaced.clear()
+        finite = np.flatnonzero(np.isfinite(self._xy).all(axis=1))
+
+        if len(finite) == 0:
+            self._origin = (0.0, 0.0)
+            self.cell_size = 1.0
+            self.grid_width = self.grid_height = 0
+            self._rows = np.empty(0, dtype=np.intp)
+            self._cell_starts = np.zeros(1, dtype=np.intp)
+            self._row_cells = np.full(len(self._xy), -1, dtype=np.intp)
+            return
+
+        points = self._xy[finite]
+        low = points.min(axis=0)
+        extent = points.max(axis=0) - low
+        target_cells = max(1.0, len(points) / self._TARGET_POINTS_PER_CELL)
+        if extent[0] > 0 and extent[1] > 0:
+            cell_size = math.sqrt(float(extent[0] * extent[1]) / target_cells)
+        else:
+            cell_size = float(extent.max()) / target_cells
+        # Keep cells positive and the grid no larger than a few cells per point
+        cell_size = max(cell_size, float(extent.max()) / (4 * target_cells), 1e-9)
+
+        self._origin = (float(low[0]), float(low[1]))
+        self.cell_size = cell_size
+        self.grid_width = int(extent[0] / cell_size) + 1
+        self.grid_height = int(extent[1] / cell_size) + 1
+
+        cells = self._cells_of(points)
+        order = np.argsort(cells, kind="stable")
+        self._rows = finite[order].astype(np.intp)
+        self._cell_starts = np.searchsorted(cells[order], np.arange(self.grid_width * self.grid_height + 1)).astype(
+            np.intp
+        )
+        self._row_cells = np.full(len(self._xy), -1, dtype=np.intp)
+        self._row_cells[finite] = cells
+
+    def _grid_coords(self, x: FloatArray | float, y: FloatArray | float) -> tuple[IntArray, IntArray]:
+        """Get clipped (column, row) grid coordinates; points beyond the grid fall in its edge cells."""
+        columns = np.clip(np.floor((np.asarray(x) - self._origin[0]) / self.cell_size), 0, self.grid_width - 1)
+        rows = np.clip(np.floor((np.asarray(y) - self._origin[1]) / self.cell_size), 0, self.grid_height - 1)
+        return columns.astype(np.intp), rows.astype(np.intp)
+
+    def _cells_of(self, points: FloatArray) -> IntArray:
+        columns, rows = self._grid_coords(points[:, 0], points[:, 1])
+        return rows * self.grid_width + columns
+
+    def _cell_of(self, x: float, y: float) -> int:
+        if self.grid_width == 0 or not (math.isfinite(x) and math.isfinite(y)):
+            return -1
+        column, row = self._grid_coords(x, y)
+        return int(row) * self.grid_width + int(column)
+
+    def _candidate_rows(self, transform: Transform, left: float, top: float, right: float, bottom: float) -> IntArray:
+        """
+        Get the sorted rows that may lie inside a screen rectangle.
+
+        Args:
+            transform: Current view transform
+            left, top, right, bottom: Screen rectangle bounds
+
+        Returns:
+            Rows in the grid cells covering the rectangle plus all displaced rows
+        """
+        displaced = np.fromiter(self._displaced, dtype=np.intp, count=len(self._displaced))
+        if self.grid_width == 0:
+            return np.sort(displaced)
+
+        scale_x, _, scale_y, _ = transform.affine
+        corners = transform.batch_screen_to_data(np.array([[left, top], [right, bottom]], dtype=np.float64))
+        low = corners.min(axis=0)
+        high = corners.max(axis=0)
+        column_low, row_low = self._grid_coords(low[0], low[1])
+        column_high, row_high = self._grid_coords(high[0], high[1])
+        covered_cells = (int(column_high) - int(column_low) + 1) * (int(row_high) - int(row_low) + 1)
+
+        if scale_x == 0 or scale_y == 0 or covered_cells >= len(self._rows):
+            # Degenerate transform or zoomed far out: testing every point is cheaper than walking cells
+            return np.flatnonzero(np.isfinite(self._xy).all(axis=1))
+
+        # Cells of one grid row are contiguous, so each grid row is one slice of _rows
+        first_cells = np.arange(int(row_low), int(row_high) + 1) * self.grid_width
+        starts = self._cell_starts[first_cells + int(column_low)]
+        stops = self._cell_starts[first_cells + int(column_high) + 1]
+        slices = [self._rows[start:stop] for start, stop in zip(starts.tolist(), stops.tolist(), strict=True)]
+        return np.unique(np.concatenate([*slices, displaced]))
+
+
+def _finite_xy(curve_data: CurveDataList) -> FloatArray:
+    """Get Nx2 data coordinates, NaN for points without coordinates."""
+    if all(len(point) >= 3 for point in curve_data):
+        return curve_xy_array(curve_data)
+    return np.array(
+        [(point[1], point[2]) if len(point) >= 3 else (np.nan, np.nan) for point in curve_data], dtype=np.float64
+    ).reshape(-1, 2)
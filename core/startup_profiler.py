@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""
+Startup-time profiling for CurveEditor.
+
+Breaks cold start into named phases (imports, QApplication, MainWindow
+construction, first show, deferred session load) and reports each phase's
+wall time and the number of modules it imported. The total is checked
+against a budget so regressions on slow workstations are visible in the log.
+
+Each phase is also recorded as a core.tracing span, so an exported trace
+shows startup alongside the first frames. For a per-module import
+breakdown, run with ``python -X importtime main.py``.
+
+Environment:
+    CURVE_EDITOR_STARTUP_BUDGET_MS=ms   Override the startup budget (default 2000)
+    CURVE_EDITOR_STARTUP_REPORT=path    Write the report as JSON to this file
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from core import tracing
+from core.logger_utils import get_logger
+
+logger = get_logger("startup_profiler")
+
+# Cold-start budget measured from profiler creation to the end of the last phase
+DEFAULT_STARTUP_BUDGET_MS = 2000.0
+
+
+@dataclass(frozen=True)
+class StartupPhase:
+    """One timed startup phase."""
+
+    name: str
+    start_ms: float
+    duration_ms: float
+    modules_imported: int
+
+
+@dataclass(frozen=True)
+class StartupReport:
+    """Completed startup breakdown."""
+
+    phases: tuple[StartupPhase, ...]
+    total_ms: float
+    budget_ms: float
+
+    @property
+    def over_budget(self) -> bool:
+        """Check whether startup exceeded the budget."""
+        return self.total_ms > self.budget_ms
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "total_ms": round(self.total_ms, 3),
+            "budget_ms": self.budget_ms,
+            "over_budget": self.over_budget,
+            "phases": [
+                {
+                    "name": p.name,
+                    "start_ms": round(p.start_ms, 3),
+                    "duration_ms": round(p.duration_ms, 3),
+                    "modules_imported": p.modules_imported,
+                }
+                for p in self.phases
+            ],
+        }
+
+    def format(self) -> str:
+        """Format the report as an aligned multi-line table."""
+        lines = [f"{'phase':<28}{'start':>10}{'duration':>10}{'modules':>9}"]
+        lines.extend(
+            f"{p.name:<28}{p.start_ms:>8.1f}ms{p.duration_ms:>8.1f}ms{p.modules_imported:>9}" for p in self.phases
+        )
+        status = "OVER BUDGET" if self.over_budget else "within budget"
+        lines.append(f"{'total':<28}{'':>10}{self.total_ms:>8.1f}ms  ({status}, budget {self.budget_ms:.0f}ms)")
+        return "\n".join(lines)
+
+
+def startup_budget_from_environment() -> float:
+    """Read the startup budget from CURVE_EDITOR_STARTUP_BUDGET_MS."""
+    raw = os.environ.get("CURVE_EDITOR_STARTUP_BUDGET_MS", "")
+    if not raw:
+        return DEFAULT_STARTUP_BUDGET_MS
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning(f"Invalid CURVE_EDITOR_STARTUP_BUDGET_MS={raw!r}, using {DEFAULT_STARTUP_BUDGET_MS:.0f}ms")
+        return DEFAULT_STARTUP_BUDGET_MS
+
+
+class StartupProfiler:
+    """
+    Records startup phases relative to its own creation time.
+
+    Create it as early as possible in the entry point, wrap each startup step
+    in phase(), then call finish() once the application is interactive.
+    """
+
+    def __init__(self, budget_ms: float | None = None) -> None:
+        self.budget_ms: float = startup_budget_from_environment() if budget_ms is None else budget_ms
+        self._origin_ns: int = time.perf_counter_ns()
+        self._phases: list[StartupPhase] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a startup phase.
+
+        Args:
+            name: Phase name shown in the report (e.g. "import.main_window")
+        """
+        modules_before = len(sys.modules)
+        start_ns = time.perf_counter_ns()
+        try:
+            with tracing.span(f"startup.{name}", "startup"):
+                yield
+        finally:
+            end_ns = time.perf_counter_ns()
+            self._phases.append(
+                StartupPhase(
+                    name=name,
+                    start_ms=(start_ns - self._origin_ns) / 1e6,
+                    duration_ms=(end_ns - start_ns) / 1e6,
+                    modules_imported=len(sys.modules) - modules_before,
+                )
+            )
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the profiler was created."""
+        return (time.perf_counter_ns() - self._origin_ns) / 1e6
+
+    def finish(self) -> StartupReport:
+        """
+        Build the report, log it and optionally write it to disk.
+
+        The report is logged at INFO, or WARNING when over budget. If
+        CURVE_EDITOR_STARTUP_REPORT is set, it is also written there as JSON.
+
+        Returns:
+            Completed startup report
+        """
+        report = StartupReport(phases=tuple(self._phases), total_ms=self.elapsed_ms(), budget_ms=self.budget_ms)
+
+        if report.over_budget:
+            logger.warning(f"Startup took {report.total_ms:.0f}ms, over the {report.budget_ms:.0f}ms budget")
+            logger.warning(f"Startup breakdown:\n{report.format()}")
+        else:
+            logger.info(f"Startup breakdown:\n{report.format()}")
+
+        report_path = os.environ.get("CURVE_EDITOR_STARTUP_REPORT", "")
+        if report_path:
+            write_startup_report(report, report_path)
+
+        return report
+
+
+def write_startup_report(report: StartupReport, path: str | Path) -> Path:
+    """
+    Write a startup report as JSON.
+
+    Args:
+        report: Report to write
+        path: Destination file
+
+    Returns:
+        Path to the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    logger.info(f"Wrote startup report to {path}")
+    return path
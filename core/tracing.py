@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+"""
+Lightweight span/counter instrumentation for CurveEditor.
+
+Records timed spans and counters from any thread into a bounded in-memory
+buffer, keeps rolling per-stage timings for the live performance HUD, and
+exports the buffer as Chrome trace-event JSON (open in chrome://tracing or
+https://ui.perfetto.dev).
+
+Tracing is disabled by default. When disabled, span() returns a shared no-op
+context manager and counter() returns immediately, so instrumented hot paths
+pay one global flag check per call.
+
+Environment:
+    CURVE_EDITOR_TRACE=1           Enable tracing at startup
+    CURVE_EDITOR_TRACE_FILE=path   Enable tracing and write a trace file on exit
+
+Usage:
+    from core import tracing
+
+    with tracing.span("frame_change.background", "frame_change", frame=frame):
+        load_background(frame)
+
+    tracing.counter("image_cache.size", len(cache), "image_cache")
+
+    @tracing.traced("command.execute", "command")
+    def execute(...): ...
+
+    tracing.export_chrome_trace("/tmp/curveeditor_trace.json")
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import ParamSpec, TypeVar
+
+from core.logger_utils import get_logger
+
+logger = get_logger("tracing")
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Maximum number of events retained; oldest events are dropped first
+DEFAULT_BUFFER_SIZE = 200_000
+
+# Smoothing factor for the rolling average shown in the HUD
+_EWMA_ALPHA = 0.2
+
+# Event tuple layout: (phase, name, category, ts_us, dur_us, tid, args)
+_Event = tuple[str, str, str, float, float, int, dict[str, object] | None]
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Rolling timing for one span name (milliseconds)."""
+
+    name: str
+    last_ms: float
+    avg_ms: float
+    max_ms: float
+    count: int
+
+
+class _NullSpan:
+    """No-op context manager returned when tracing is disabled."""
+
+    __slots__: tuple[str, ...] = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Active span; records a complete ("X") event on exit."""
+
+    __slots__: tuple[str, ...] = ("_args", "_category", "_name", "_start_ns", "_tracer")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict[str, object] | None) -> None:
+        self._tracer: Tracer = tracer
+        self._name: str = name
+        self._category: str = category
+        self._args: dict[str, object] | None = args
+        self._start_ns: int = 0
+
+    def __enter__(self) -> _Span:
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        end_ns = time.perf_counter_ns()
+        self._tracer.record_span(self._name, self._category, self._start_ns, end_ns, self._args)
+
+
+class Tracer:
+    """
+    Collects trace events and per-stage timings.
+
+    One process-wide instance lives in this module; use the module-level
+    functions rather than instantiating this class directly.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        self.enabled: bool = False
+        self._events: deque[_Event] = deque(maxlen=buffer_size)
+        self._stages: dict[str, list[float]] = {}  # name -> [last_ms, avg_ms, max_ms, count]
+        self._thread_ids: dict[int, int] = {}
+        self._thread_names: dict[int, str] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._origin_ns: int = time.perf_counter_ns()
+
+    def _tid(self) -> int:
+        """Small stable thread id for trace output."""
+        ident = threading.get_ident()
+        tid = self._thread_ids.get(ident)
+        if tid is None:
+            with self._lock:
+                tid = self._thread_ids.setdefault(ident, len(self._thread_ids) + 1)
+                self._thread_names[tid] = threading.current_thread().name
+        return tid
+
+    def record_span(
+        self, name: str, category: str, start_ns: int, end_ns: int, args: dict[str, object] | None = None
+    ) -> None:
+        """Record a completed span."""
+        duration_ms = (end_ns - start_ns) / 1e6
+        ts_us = (start_ns - self._origin_ns) / 1e3
+        self._events.append(("X", name, category, ts_us, duration_ms * 1e3, self._tid(), args))
+
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                self._stages[name] = [duration_ms, duration_ms, duration_ms, 1.0]
+            else:
+                stage[0] = duration_ms
+                stage[1] += _EWMA_ALPHA * (duration_ms - stage[1])
+                stage[2] = max(stage[2], duration_ms)
+                stage[3] += 1.0
+
+    def record_counter(self, name: str, value: float, category: str) -> None:
+        """Record a counter sample."""
+        ts_us = (time.perf_counter_ns() - self._origin_ns) / 1e3
+        self._events.append(("C", name, category, ts_us, 0.0, self._tid(), {name: value}))
+
+    def record_instant(self, name: str, category: str, args: dict[str, object] | None) -> None:
+        """Record an instant event."""
+        ts_us = (time.perf_counter_ns() - self._origin_ns) / 1e3
+        self._events.append(("i", name, category, ts_us, 0.0, self._tid(), args))
+
+    def clear(self) -> None:
+        """Drop all recorded events and stage timings."""
+        with self._lock:
+            self._events.clear()
+            self._stages.clear()
+
+    def stage_timings(self) -> dict[str, StageTiming]:
+        """Snapshot of rolling per-stage timings."""
+        with self._lock:
+            return {
+                name: StageTiming(name=name, last_ms=s[0], avg_ms=s[1], max_ms=s[2], count=int(s[3]))
+                for name, s in self._stages.items()
+            }
+
+    def event_count(self) -> int:
+        """Number of buffered events."""
+        return len(self._events)
+
+    def to_chrome_trace(self) -> dict[str, object]:
+        """Build a Chrome trace-event document from the buffered events."""
+        pid = os.getpid()
+        trace_events: list[dict[str, object]] = []
+        for tid, thread_name in list(self._thread_names.items()):
+            trace_events.append(
+                {"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+            )
+        for phase, name, category, ts_us, dur_us, tid, args in list(self._events):
+            event: dict[str, object] = {"ph": phase, "name": name, "cat": category, "ts": ts_us, "pid": pid, "tid": tid}
+            if phase == "X":
+                event["dur"] = dur_us
+            elif phase == "i":
+                event["s"] = "t"
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
+
+
+def is_enabled() -> bool:
+    """Check whether tracing is currently recording."""
+    return _tracer.enabled
+
+
+def enable() -> None:
+    """Start recording spans and counters."""
+    if not _tracer.enabled:
+        _tracer.enabled = True
+        logger.info("Tracing enabled")
+
+
+def disable() -> None:
+    """Stop recording. Already buffered events are kept until clear()."""
+    if _tracer.enabled:
+        _tracer.enabled = False
+        logger.info("Tracing disabled")
+
+
+def clear() -> None:
+    """Drop all buffered events and stage timings."""
+    _tracer.clear()
+
+
+def span(name: str, category: str = "app", **args: object) -> _Span | _NullSpan:
+    """
+    Time a block of code.
+
+    Args:
+        name: Span name; also the key for HUD stage timings
+        category: Trace category (e.g. "render", "frame_change")
+        **args: Extra values attached to the trace event. Keep them cheap to
+            compute, they are evaluated even when tracing is disabled.
+
+    Returns:
+        Context manager that records the span on exit
+    """
+    if not _tracer.enabled:
+        return _NULL_SPAN
+    return _Span(_tracer, name, category, args or None)
+
+
+def counter(name: str, value: float, category: str = "app") -> None:
+    """Record a counter sample (e.g. cache size, hit count)."""
+    if _tracer.enabled:
+        _tracer.record_counter(name, value, category)
+
+
+def instant(name: str, category: str = "app", **args: object) -> None:
+    """Record a point-in-time event (e.g. cache eviction)."""
+    if _tracer.enabled:
+        _tracer.record_instant(name, category, args or None)
+
+
+def traced(name: str | None = None, category: str = "app") -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator that wraps a function call in a span.
+
+    Args:
+        name: Span name. Defaults to the function's qualified name.
+        category: Trace category
+
+    Returns:
+        Decorator preserving the wrapped function's signature
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(_tracer, span_name, category, None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_stage_timings() -> dict[str, StageTiming]:
+    """Rolling per-stage timings keyed by span name."""
+    return _tracer.stage_timings()
+
+
+def export_chrome_trace(path: str | Path) -> Path:
+    """
+    Write buffered events as Chrome trace-event JSON.
+
+    Args:
+        path: Destination file
+
+    Returns:
+        Path to the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = _tracer.to_chrome_trace()
+    _ = path.write_text(json.dumps(document), encoding="utf-8")
+    logger.info(f"Wrote {_tracer.event_count()} trace events to {path}")
+    return path
+
+
+def configure_from_environment() -> None:
+    """Enable tracing from CURVE_EDITOR_TRACE / CURVE_EDITOR_TRACE_FILE."""
+    trace_file = os.environ.get("CURVE_EDITOR_TRACE_FILE", "")
+    if trace_file:
+        enable()
+        _ = atexit.register(export_chrome_trace, trace_file)
+    elif os.environ.get("CURVE_EDITOR_TRACE", "").lower() in ("1", "true", "yes", "on"):
+        enable()
+
+
+configure_from_environment()
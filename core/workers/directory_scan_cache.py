@@ -12,9 +12,24 @@ from pathlib import Path
 from typing import Any
 
 from core.logger_utils import get_logger
+from core.memory_budget import get_memory_budget
 
 logger = get_logger("directory_scan_cache")
 
+# Rough sizes for memory budget accounting: one sequence dictionary, and one
+# file of a sequence (file name string, frame number and their list slots)
+_SEQUENCE_SIZE_ESTIMATE = 1024
+_FILE_SIZE_ESTIMATE = 160
+
+
+def _estimate_entry_bytes(sequences: list[dict[str, Any]]) -> int:
+    """Estimate the bytes held by the scan results of one directory."""
+    total = 0
+    for sequence in sequences:
+        file_list = sequence.get("file_list")
+        total += _SEQUENCE_SIZE_ESTIMATE + _FILE_SIZE_ESTIMATE * (len(file_list) if isinstance(file_list, list) else 0)
+    return total
+
 
 @dataclass(frozen=True)
 class CacheKey:
@@ -60,6 +75,7 @@ class DirectoryScanCache:
     - LRU eviction policy
     - Thread-safe for read/write operations
     - Configurable maximum size
+    - Estimated size accounted in the shared memory budget (core.memory_budget)
 
     Cache stores raw sequence dictionaries as returned by DirectoryScanWorker,
     not ImageSequence objects (those are created on-demand in the UI layer).
@@ -74,6 +90,7 @@ class DirectoryScanCache:
         """
         self._cache: OrderedDict[CacheKey, list[dict[str, Any]]] = OrderedDict()
         self._max_size: int = max_size
+        self._cache_bytes: int = 0  # Estimated bytes of all entries
         logger.info(f"Initialized DirectoryScanCache with max_size={max_size}")
 
     def get(self, directory: str) -> list[dict[str, Any]] | None:
@@ -109,7 +126,7 @@ class DirectoryScanCache:
 
         # Remove stale entries
         for stale_key in stale_keys:
-            del self._cache[stale_key]
+            _ = self._remove(stale_key)
             logger.debug(f"Removed stale cache entry for {directory} (mtime changed)")
 
         logger.debug(f"Cache miss for {directory}")
@@ -129,15 +146,30 @@ class DirectoryScanCache:
             return
 
         # Store in cache
+        if cache_key in self._cache:
+            _ = self._remove(cache_key)
         self._cache[cache_key] = sequences
-        self._cache.move_to_end(cache_key)
+        self._cache_bytes += _estimate_entry_bytes(sequences)
 
         # Evict oldest entries if cache is full
         while len(self._cache) > self._max_size:
-            evicted_key, _ = self._cache.popitem(last=False)
+            evicted_key = next(iter(self._cache))
+            _ = self._remove(evicted_key)
             logger.debug(f"Evicted cache entry for {evicted_key.directory} (LRU)")
 
         logger.debug(f"Cached {len(sequences)} sequences for {directory}")
+        _ = get_memory_budget().enforce()
+
+    def _remove(self, key: CacheKey) -> int:
+        """
+        Remove an entry and update the byte estimate.
+
+        Returns:
+            Estimated bytes freed
+        """
+        freed = _estimate_entry_bytes(self._cache.pop(key))
+        self._cache_bytes -= freed
+        return freed
 
     def invalidate(self, directory: str) -> None:
         """
@@ -149,15 +181,35 @@ class DirectoryScanCache:
         keys_to_remove = [key for key in self._cache if key.directory == directory]
 
         for key in keys_to_remove:
-            del self._cache[key]
+            _ = self._remove(key)
             logger.debug(f"Invalidated cache entry for {directory}")
 
     def clear(self) -> None:
         """Clear all cache entries."""
         count = len(self._cache)
         self._cache.clear()
+        self._cache_bytes = 0
         logger.info(f"Cleared {count} cache entries")
 
+    def memory_usage_bytes(self) -> int:
+        """Get the estimated bytes held by cached scan results."""
+        return self._cache_bytes
+
+    def evict_bytes(self, target_bytes: int) -> int:
+        """
+        Evict least recently used directories for the shared memory budget.
+
+        Args:
+            target_bytes: Bytes to free
+
+        Returns:
+            Estimated bytes freed
+        """
+        freed = 0
+        while self._cache and freed < target_bytes:
+            freed += self._remove(next(iter(self._cache)))
+        return freed
+
     def get_size(self) -> int:
         """
         Get current cache size.
@@ -21,10 +21,16 @@ if TYPE_CHECKING:
 
 # Configure logger
 from core.logger_utils import get_logger
+from core.memory_budget import get_memory_budget
 
 logger = get_logger("thumbnail_cache")
 
 
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    """Estimate the pixel bytes of a pixmap."""
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
 class ThumbnailCache:
     """
     Two-tier caching system for thumbnails.
@@ -33,6 +39,7 @@ class ThumbnailCache:
     - Memory cache (LRU): Fast access, limited size
     - Disk cache: Persistent storage, larger capacity
     - Automatic cleanup of old disk cache entries
+    - Memory tier accounted in the shared memory budget (core.memory_budget)
     """
 
     def __init__(
@@ -52,6 +59,7 @@ class ThumbnailCache:
         # Memory cache (LRU)
         self._memory_cache: OrderedDict[str, QPixmap] = OrderedDict()
         self._memory_cache_size: int = memory_cache_size
+        self._memory_bytes: int = 0  # Estimated pixel bytes of the memory cache
 
         # Disk cache directory
         if cache_dir is None:
@@ -144,7 +152,11 @@ class ThumbnailCache:
             pixmap: Pixmap to store
         """
         # Add to cache
+        previous = self._memory_cache.get(cache_key)
+        if previous is not None:
+            self._memory_bytes -= _pixmap_bytes(previous)
         self._memory_cache[cache_key] = pixmap
+        self._memory_bytes += _pixmap_bytes(pixmap)
 
         # Move to end (most recently used)
         self._memory_cache.move_to_end(cache_key)
@@ -152,9 +164,11 @@ class ThumbnailCache:
         # Evict oldest if over limit
         if len(self._memory_cache) > self._memory_cache_size:
             oldest_key = next(iter(self._memory_cache))
-            del self._memory_cache[oldest_key]
+            self._memory_bytes -= _pixmap_bytes(self._memory_cache.pop(oldest_key))
             logger.debug(f"Evicted from memory cache: {oldest_key}")
 
+        _ = get_memory_budget().enforce()
+
     def _get_from_disk(self, cache_key: str) -> QPixmap | None:
         """
         Load pixmap from disk cache.
@@ -246,8 +260,32 @@ class ThumbnailCache:
     def clear_memory_cache(self) -> None:
         """Clear all entries from memory cache."""
         self._memory_cache.clear()
+        self._memory_bytes = 0
         logger.debug("Memory cache cleared")
 
+    def memory_usage_bytes(self) -> int:
+        """Get the estimated pixel bytes held by the memory cache."""
+        return self._memory_bytes
+
+    def evict_bytes(self, target_bytes: int) -> int:
+        """
+        Evict least recently used thumbnails from memory for the shared memory budget.
+
+        Evicted thumbnails stay in the disk cache.
+
+        Args:
+            target_bytes: Bytes to free
+
+        Returns:
+            Estimated bytes freed
+        """
+        freed = 0
+        while self._memory_cache and freed < target_bytes:
+            _, pixmap = self._memory_cache.popitem(last=False)
+            freed += _pixmap_bytes(pixmap)
+        self._memory_bytes -= freed
+        return freed
+
     def clear_disk_cache(self) -> None:
         """Delete all files from disk cache."""
         try:
@@ -282,6 +320,7 @@ class ThumbnailCache:
         return {
             "memory_entries": len(self._memory_cache),
             "memory_limit": self._memory_cache_size,
+            "memory_size_bytes": self._memory_bytes,
             "disk_entries": len(disk_files),
             "disk_size_bytes": disk_size,
             "disk_size_mb": disk_size / (1024 * 1024),
@@ -13,10 +13,7 @@ Based on 3DEqualizer behavior patterns:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from core.models import PointStatus, TrackingDirection
+import numpy as np
 
 from core.logger_utils import get_logger
 from core.models import PointStatus, TrackingDirection
@@ -287,3 +284,95 @@ def update_keyframe_status_for_tracking_direction(
             curve_data, previous_direction or TrackingDirection.TRACKING_FW
         )
     # All TrackingDirection enum cases exhaustively handled above
+
+
+# Status codes used by the vectorized pass; only keyframes and endframes change
+_OTHER_CODE = 0
+_KEYFRAME_CODE = 1
+_ENDFRAME_CODE = 2
+
+
+def compute_tracking_direction_changes(
+    curve_data: CurveDataInput, new_direction: TrackingDirection, previous_direction: TrackingDirection | None = None
+) -> list[tuple[int, str, str]]:
+    """Compute the status changes for a tracking direction change in one vectorized pass.
+
+    Applies the same rules as update_keyframe_status_for_tracking_direction, but
+    evaluates the whole curve as NumPy arrays and returns only the points whose
+    status changes. Used for batch direction changes across many curves.
+
+    Args:
+        curve_data: List of point tuples
+        new_direction: New tracking direction
+        previous_direction: Previous tracking direction (needed for bidirectional)
+
+    Returns:
+        List of (index, old_status, new_status) tuples for changed points
+    """
+    n = len(curve_data)
+    if n == 0:
+        return []
+
+    # Bidirectional only changes anything when coming from backward tracking
+    if new_direction == TrackingDirection.TRACKING_FW_BW and (
+        (previous_direction or TrackingDirection.TRACKING_FW) != TrackingDirection.TRACKING_BW
+    ):
+        return []
+
+    # Map raw status values to codes once per distinct value (3-element tuples are keyframes)
+    code_cache: dict[object, int] = {}
+    codes = np.empty(n, dtype=np.int8)
+    for i, point in enumerate(curve_data):
+        raw = point[3] if len(point) > 3 else "keyframe"
+        code = code_cache.get(raw)
+        if code is None:
+            status = PointStatus.from_legacy(raw)
+            code = (
+                _KEYFRAME_CODE
+                if status == PointStatus.KEYFRAME
+                else _ENDFRAME_CODE
+                if status == PointStatus.ENDFRAME
+                else _OTHER_CODE
+            )
+            code_cache[raw] = code
+        codes[i] = code
+
+    xs = np.fromiter((p[1] for p in curve_data), dtype=np.float64, count=n)
+    ys = np.fromiter((p[2] for p in curve_data), dtype=np.float64, count=n)
+    valid = (xs != -1) | (ys != -1)
+
+    # Backward tracking looks at the previous frame, forward and bidirectional at the next
+    neighbour_valid = np.zeros(n, dtype=bool)
+    if new_direction == TrackingDirection.TRACKING_BW:
+        neighbour_valid[1:] = valid[:-1]
+    else:
+        neighbour_valid[:-1] = valid[1:]
+
+    to_keyframe = (codes == _ENDFRAME_CODE) & valid & neighbour_valid
+    to_endframe = (codes == _KEYFRAME_CODE) & valid & ~neighbour_valid
+
+    keyframe_value = PointStatus.KEYFRAME.value
+    endframe_value = PointStatus.ENDFRAME.value
+    changes: list[tuple[int, str, str]] = [
+        (int(i), endframe_value, keyframe_value) for i in np.flatnonzero(to_keyframe)
+    ]
+    changes.extend((int(i), keyframe_value, endframe_value) for i in np.flatnonzero(to_endframe))
+    changes.sort()
+    return changes
+
+
+def apply_status_changes(curve_data: CurveDataInput, changes: list[tuple[int, str, str]]) -> CurveDataList:
+    """Return a copy of curve_data with the new statuses from changes applied.
+
+    Args:
+        curve_data: List of point tuples
+        changes: (index, old_status, new_status) tuples
+
+    Returns:
+        Updated curve data; unchanged points are shared with the input
+    """
+    updated_data = list(curve_data)
+    for index, _, new_status in changes:
+        frame, x, y = updated_data[index][:3]
+        updated_data[index] = (frame, x, y, new_status)
+    return updated_data
@@ -0,0 +1,376 @@
+"""
+Process-pool EXR decoding with shared-memory handoff.
+
+EXR decode and tone mapping are CPU-heavy NumPy and codec work. In Python
+threads they hold the GIL against the UI, so playback stutters while frames
+are prefetched. This module runs io_utils.exr_loader in worker processes
+instead:
+
+1. A worker decodes and tone maps the file, creates a shared memory block and
+   writes the 8-bit RGB pixels straight into it, then returns only the block
+   name and dimensions.
+2. The UI process attaches to the block, unlinks its name right away and wraps
+   the mapping as a QImage without copying. The mapping stays valid until the
+   last QImage sharing it is destroyed; then the block is closed and the OS
+   frees it.
+
+Unlinking on attach means no block outlives the frames using it, even if the
+app crashes later. Blocks whose results are never collected (cancelled
+prefetch) are attached and released by a done-callback.
+
+Shared memory names must outlive the worker's handle, which holds on POSIX
+only. On other platforms, when disabled, or if the pool breaks, decoding falls
+back to the in-process loader (load_exr_as_qimage) transparently.
+
+Configuration:
+    CURVE_EDITOR_EXR_DECODE_PROCESSES=n   Worker processes (0 = decode in-process,
+                                          unset = CPU count - 1, at most 8)
+
+Usage:
+    pool = get_exr_decode_pool()
+    image = pool.decode(path) if pool else load_exr_as_qimage(path)
+    for image in pool.decode_ordered(paths, lookahead=8): ...
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import threading
+import weakref
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.logger_utils import get_logger
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+    from PySide6.QtGui import QImage
+
+logger = get_logger("exr_decode_pool")
+
+# Upper bound for the automatic process count; decode is memory-bandwidth bound beyond this
+MAX_AUTO_PROCESSES = 8
+
+# RGB888 pixels written by workers
+_CHANNELS = 3
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """A decoded frame waiting in a shared memory block (returned by workers)."""
+
+    name: str
+    width: int
+    height: int
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the pixel data in bytes."""
+        return self.width * self.height * _CHANNELS
+
+
+def shared_memory_supported() -> bool:
+    """Whether shared memory blocks outlive the creating handle (POSIX)."""
+    if os.name != "posix":
+        return False
+    try:
+        from multiprocessing import shared_memory  # noqa: F401  # pyright: ignore[reportUnusedImport]
+    except ImportError:
+        return False
+    return True
+
+
+def default_process_count() -> int:
+    """Get the automatic worker count: all cores but one for the UI, at most MAX_AUTO_PROCESSES."""
+    return max(1, min(MAX_AUTO_PROCESSES, (os.cpu_count() or 2) - 1))
+
+
+def decode_to_shared_memory(file_path: str) -> SharedFrame | None:
+    """
+    Decode and tone map an EXR file into a new shared memory block (runs in a worker).
+
+    The worker closes its handle before returning; the block stays alive under
+    its name until the UI process attaches and unlinks it.
+
+    Args:
+        file_path: Path to the EXR file
+
+    Returns:
+        Block name and dimensions, or None if the file could not be decoded
+    """
+    from multiprocessing import shared_memory
+
+    from io_utils.exr_loader import read_exr_tone_mapped, to_rgb8
+
+    tone_mapped = read_exr_tone_mapped(file_path)
+    if tone_mapped is None:
+        return None
+
+    height, width = tone_mapped.shape[:2]
+    block = shared_memory.SharedMemory(create=True, size=max(1, width * height * _CHANNELS))
+    try:
+        pixels = np.ndarray((height, width, _CHANNELS), dtype=np.uint8, buffer=block.buf)
+        _ = to_rgb8(tone_mapped, out=pixels)
+        del pixels  # Release the export so the handle can close
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    block.close()
+    return SharedFrame(block.name, width, height)
+
+
+def _attach(frame: SharedFrame) -> tuple[SharedMemory, np.ndarray]:
+    """Attach to a worker's block and unlink its name; the mapping lives on until closed."""
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=frame.name)
+    block.unlink()
+    pixels = np.ndarray((frame.height, frame.width, _CHANNELS), dtype=np.uint8, buffer=block.buf)
+    return block, pixels
+
+
+def _release(frame: SharedFrame) -> None:
+    """Free a block whose frame is not needed."""
+    try:
+        block, pixels = _attach(frame)
+        del pixels
+        block.close()
+    except FileNotFoundError:
+        pass
+
+
+class ExrDecodePool:
+    """
+    Worker processes that decode EXR files into shared memory.
+
+    Thread-safe: the preload thread and the UI thread may decode concurrently.
+    Workers start on first use.
+    """
+
+    def __init__(self, processes: int) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            processes: Number of worker processes
+
+        Raises:
+            ValueError: If processes <= 0
+        """
+        if processes <= 0:
+            raise ValueError(f"processes must be positive, got {processes}")
+        self._processes: int = processes
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock: threading.Lock = threading.Lock()
+        self._broken: bool = False
+        self._live_frames: int = 0
+        self._live_bytes: int = 0
+
+    @property
+    def processes(self) -> int:
+        """Get the number of worker processes."""
+        return self._processes
+
+    @property
+    def available(self) -> bool:
+        """Whether the pool can still decode (False after a worker crash or shutdown)."""
+        return not self._broken
+
+    @property
+    def live_frames(self) -> int:
+        """Get the number of shared memory frames still referenced by QImages."""
+        return self._live_frames
+
+    @property
+    def live_bytes(self) -> int:
+        """Get the bytes held by shared memory frames still referenced by QImages."""
+        return self._live_bytes
+
+    def _get_executor(self) -> ProcessPoolExecutor | None:
+        with self._lock:
+            if self._broken:
+                return None
+            if self._executor is None:
+                # spawn: workers must not inherit Qt state through fork
+                context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self._processes, mp_context=context)
+                logger.info(f"Started {self._processes} EXR decode processes")
+            return self._executor
+
+    def _mark_broken(self, error: BaseException) -> None:
+        with self._lock:
+            if self._broken:
+                return
+            self._broken = True
+            executor, self._executor = self._executor, None
+        logger.warning(f"EXR decode processes unavailable, decoding in-process: {error}")
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, file_path: str) -> Future[SharedFrame | None] | None:
+        """
+        Start decoding a file in a worker.
+
+        Returns:
+            Future for the shared frame, or None if the pool is unavailable
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return None
+        try:
+            return executor.submit(decode_to_shared_memory, file_path)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._mark_broken(e)
+            return None
+
+    def wrap(self, frame: SharedFrame) -> QImage:
+        """
+        Wrap a shared frame as a QImage without copying its pixels.
+
+        The block is closed when the last QImage sharing the pixels is
+        destroyed (PySide6 keeps the buffer alive for the QImage's data).
+        """
+        from PySide6.QtGui import QColorSpace, QImage
+
+        block, pixels = _attach(frame)
+        image = QImage(pixels, frame.width, frame.height, frame.width * _CHANNELS, QImage.Format.Format_RGB888)
+        image.setColorSpace(QColorSpace(QColorSpace.NamedColorSpace.SRgb))
+
+        with self._lock:
+            self._live_frames += 1
+            self._live_bytes += frame.size_bytes
+        _ = weakref.finalize(pixels, self._on_frame_released, block, frame.size_bytes)
+        return image
+
+    def _on_frame_released(self, block: SharedMemory, size_bytes: int) -> None:
+        block.close()
+        with self._lock:
+            self._live_frames -= 1
+            self._live_bytes -= size_bytes
+
+    def result(self, file_path: str, future: Future[SharedFrame | None] | None) -> QImage | None:
+        """
+        Wait for a submitted decode and wrap it, decoding in-process on failure.
+
+        Args:
+            file_path: File the future decodes (used for the fallback)
+            future: Future from submit(), or None to decode in-process
+
+        Returns:
+            QImage or None if the file cannot be decoded at all
+        """
+        from io_utils.exr_loader import load_exr_as_qimage
+
+        if future is not None:
+            try:
+                frame = future.result()
+                if frame is not None:
+                    return self.wrap(frame)
+                # Worker could not decode: the in-process loader logs the reason
+            except BrokenProcessPool as e:
+                self._mark_broken(e)
+            except Exception as e:
+                logger.warning(f"EXR decode process failed for {file_path}: {e}")
+        return load_exr_as_qimage(file_path)
+
+    def decode(self, file_path: str) -> QImage | None:
+        """Decode one file in a worker and wait for it (in-process if the pool is unavailable)."""
+        return self.result(file_path, self.submit(file_path))
+
+    def decode_ordered(self, file_paths: Sequence[str], lookahead: int | None = None) -> Iterator[QImage | None]:
+        """
+        Decode files in parallel, yielding images in input order.
+
+        Keeps up to lookahead decodes in flight. Closing the iterator early
+        cancels queued decodes and frees the blocks of finished ones.
+
+        Args:
+            file_paths: Files to decode
+            lookahead: Decodes in flight (default: twice the process count)
+        """
+        window = lookahead if lookahead is not None else self._processes * 2
+        pending: deque[tuple[str, Future[SharedFrame | None] | None]] = deque()
+        paths = iter(file_paths)
+        try:
+            for path in paths:
+                pending.append((path, self.submit(path)))
+                if len(pending) >= window:
+                    break
+            while pending:
+                path, future = pending.popleft()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    pending.append((next_path, self.submit(next_path)))
+                yield self.result(path, future)
+        finally:
+            for _, future in pending:
+                if future is not None and not future.cancel():
+                    future.add_done_callback(_discard_result)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; later decodes run in-process."""
+        with self._lock:
+            self._broken = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+            logger.debug("EXR decode processes stopped")
+
+
+def _discard_result(future: Future[SharedFrame | None]) -> None:
+    """Free the block of a decode whose result is no longer wanted."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    frame = future.result()
+    if frame is not None:
+        _release(frame)
+
+
+_exr_decode_pool: ExrDecodePool | None = None
+_exr_decode_pool_created = False
+_exr_decode_pool_lock = threading.Lock()
+
+
+def get_exr_decode_pool() -> ExrDecodePool | None:
+    """
+    Get the process-wide EXR decode pool.
+
+    Returns:
+        The pool, or None when EXR files should be decoded in-process
+        (disabled by AppConfig.exr_decode_processes, shared memory unsupported,
+        or running inside a worker process)
+    """
+    global _exr_decode_pool, _exr_decode_pool_created
+    if not _exr_decode_pool_created:
+        with _exr_decode_pool_lock:
+            if not _exr_decode_pool_created:
+                _exr_decode_pool_created = True
+                from core.config import get_config
+
+                configured = get_config().exr_decode_processes
+                processes = default_process_count() if configured is None else configured
+                if processes > 0 and shared_memory_supported() and multiprocessing.parent_process() is None:
+                    _exr_decode_pool = ExrDecodePool(processes)
+                    _ = atexit.register(_exr_decode_pool.shutdown)
+    return _exr_decode_pool
+
+
+def reset_exr_decode_pool() -> None:
+    """Shut down and forget the process-wide pool (mainly for testing)."""
+    global _exr_decode_pool, _exr_decode_pool_created
+    with _exr_decode_pool_lock:
+        if _exr_decode_pool is not None:
+            _exr_decode_pool.shutdown()
+            atexit.unregister(_exr_decode_pool.shutdown)
+        _exr_decode_pool = None
+        _exr_decode_pool_created = False
@@ -35,6 +35,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Tone mapping parameters (see _tone_map_hdr)
+TONE_MAP_TARGET_MID_GRAY = 0.18  # Standard 18% gray target for the median
+TONE_MAP_EXPOSURE_RANGE = (0.5, 4.0)  # Clamp to avoid over-brightening dark images
+TONE_MAP_GAMMA = 2.2
+
+# Identifies the tone mapping output; change it whenever _tone_map_hdr changes
+# so frames cached on disk (io_utils.frame_disk_cache) are not reused
+TONE_MAP_SIGNATURE = (
+    f"median{TONE_MAP_TARGET_MID_GRAY}-exposure{TONE_MAP_EXPOSURE_RANGE[0]}:{TONE_MAP_EXPOSURE_RANGE[1]}"
+    + f"-softclip-gamma{TONE_MAP_GAMMA}-rgb8"
+)
+
 
 def load_exr_as_qimage(file_path: str) -> "QImage | None":
     """
@@ -77,6 +89,75 @@ def load_exr_as_qimage(file_path: str) -> "QImage | None":
     return None
 
 
+def read_exr_tone_mapped(file_path: str) -> "NDArray[np.floating[Any]] | None":
+    """
+    Read an OpenEXR image and tone map it to display-referred RGB, without Qt.
+
+    Same backends and order as load_exr_as_qimage. Used where QImage is not
+    available or wanted, e.g. in decode worker processes.
+
+    Args:
+        file_path: Path to the EXR file
+
+    Returns:
+        HxWx3 array in 0-1 range, or None if loading failed
+    """
+    for read in (_read_exr_with_oiio, _read_exr_with_openexr, _read_exr_with_pillow, _read_exr_with_imageio):
+        img_data = read(file_path)
+        if img_data is not None:
+            return _tone_map_hdr(img_data)
+
+    logger.error(f"Failed to load EXR file {file_path}. " + "Consider installing: pip install OpenEXR")
+    return None
+
+
+def to_rgb8(tone_mapped: "NDArray[np.floating[Any]]", out: "NDArray[np.uint8] | None" = None) -> "NDArray[np.uint8]":
+    """
+    Convert tone-mapped 0-1 RGB data to 8-bit.
+
+    Args:
+        tone_mapped: HxWx3 array in 0-1 range
+        out: Optional HxWx3 uint8 array to write into (e.g. a shared memory block)
+
+    Returns:
+        The 8-bit array (out if given)
+    """
+    if out is None:
+        return (tone_mapped * 255).astype(np.uint8)
+    np.copyto(out, tone_mapped * 255, casting="unsafe")
+    return out
+
+
+def _rgb8_to_qimage(img_8bit: "NDArray[np.uint8]") -> "QImage":
+    """
+    Create an sRGB-tagged QImage that owns a copy of 8-bit RGB data.
+
+    Args:
+        img_8bit: HxWx3 uint8 array
+
+    Returns:
+        QImage in Format_RGB888
+    """
+    from PySide6.QtGui import QColorSpace, QImage
+
+    height, width = img_8bit.shape[:2]
+    bytes_per_line = width * 3
+    qimage = QImage(
+        img_8bit.data,
+        width,
+        height,
+        bytes_per_line,
+        QImage.Format.Format_RGB888,
+    )
+
+    # Copy to ensure data persists
+    qimage = qimage.copy()
+
+    # Set color space to sRGB (tone mapping already applied gamma correction)
+    qimage.setColorSpace(QColorSpace(QColorSpace.NamedColorSpace.SRgb))
+    return qimage
+
+
 def _load_exr_with_oiio(file_path: str) -> "QImage | None":
     """
     Load EXR using OpenImageIO (commonly available in VFX facilities).
@@ -87,9 +168,26 @@ def _load_exr_with_oiio(file_path: str) -> "QImage | None":
     Returns:
         QImage object or None if loading failed
     """
+    img_data = _read_exr_with_oiio(file_path)
+    if img_data is None:
+        return None
+    qimage = _rgb8_to_qimage(to_rgb8(_tone_map_hdr(img_data)))
+    logger.debug(f"Loaded EXR with OIIO: {file_path}")
+    return qimage
+
+
+def _read_exr_with_oiio(file_path: str) -> "NDArray[np.floating[Any]] | None":
+    """
+    Read EXR pixels using OpenImageIO.
+
+    Args:
+        file_path: Path to the EXR file
+
+    Returns:
+        HxWx3 float RGB array (scene-linear) or None if loading failed
+    """
     try:
         import OpenImageIO as oiio
-        from PySide6.QtGui import QColorSpace, QImage
 
         # Open the image file
         img_input = oiio.ImageInput.open(file_path)
@@ -137,30 +235,8 @@ def _load_exr_with_oiio(file_path: str) -> "QImage | None":
             logger.debug(f"Unsupported channel count: {channels}")
             return None
 
-        # Apply tone mapping (HDR -> LDR conversion)
-        img_data = _tone_map_hdr(img_data)
-
-        # Convert to 8-bit
-        img_8bit = (img_data * 255).astype(np.uint8)
-
-        # Create QImage
-        bytes_per_line = width * 3
-        qimage = QImage(
-            img_8bit.data,
-            width,
-            height,
-            bytes_per_line,
-            QImage.Format.Format_RGB888,
-        )
-
-        # Copy to ensure data persists
-        qimage = qimage.copy()
-
-        # Set color space to sRGB (tone mapping already applied gamma correction)
-        qimage.setColorSpace(QColorSpace(QColorSpace.NamedColorSpace.SRgb))
-
-        logger.debug(f"Loaded EXR with OIIO: {file_path} ({width}x{height})")
-        return qimage
+        logger.debug(f"Read EXR with OIIO: {file_path} ({width}x{height})")
+        return img_data
 
     except ImportError:
         logger.debug("OpenImageIO not available")
@@ -180,10 +256,27 @@ def _load_exr_with_openexr(file_path: str) -> "QImage | None":
     Returns:
         QImage object or None if loading failed
     """
+    img_data = _read_exr_with_openexr(file_path)
+    if img_data is None:
+        return None
+    qimage = _rgb8_to_qimage(to_rgb8(_tone_map_hdr(img_data)))
+    logger.debug(f"Loaded EXR with OpenEXR: {file_path}")
+    return qimage
+
+
+def _read_exr_with_openexr(file_path: str) -> "NDArray[np.floating[Any]] | None":
+    """
+    Read EXR pixels using the official OpenEXR library.
+
+    Args:
+        file_path: Path to the EXR file
+
+    Returns:
+        HxWx3 float RGB array (scene-linear) or None if loading failed
+    """
     try:
         import Imath
         import OpenEXR
-        from PySide6.QtGui import QColorSpace, QImage
 
         # Open the EXR file
         exr_file = OpenEXR.InputFile(file_path)
@@ -223,33 +316,10 @@ def _load_exr_with_openexr(file_path: str) -> "QImage | None":
         g_data = np.frombuffer(g_str, dtype=np.float32).reshape(height, width)
         b_data = np.frombuffer(b_str, dtype=np.float32).reshape(height, width)
 
-        # Stack into RGB image
-        img_data = np.stack([r_data, g_data, b_data], axis=-1)
-
-        # Apply tone mapping (HDR -> LDR conversion)
-        img_data = _tone_map_hdr(img_data)
-
-        # Convert to 8-bit
-        img_8bit = (img_data * 255).astype(np.uint8)
-
-        # Create QImage
-        bytes_per_line = width * 3
-        qimage = QImage(
-            img_8bit.data,
-            width,
-            height,
-            bytes_per_line,
-            QImage.Format.Format_RGB888,
-        )
+        logger.debug(f"Read EXR with OpenEXR: {file_path} ({width}x{height})")
 
-        # Copy to ensure data persists
-        qimage = qimage.copy()
-
-        # Set color space to sRGB (tone mapping already applied gamma correction)
-        qimage.setColorSpace(QColorSpace(QColorSpace.NamedColorSpace.SRgb))
-
-        logger.debug(f"Loaded EXR with OpenEXR: {file_path} ({width}x{height})")
-        return qimage
+        # Stack into RGB image
+        return np.stack([r_data, g_data, b_data], axis=-1)
 
     except ImportError:
         logger.debug("OpenEXR library not available")
@@ -269,9 +339,26 @@ def _load_exr_with_pillow(file_path: str) -> "QImage | None":
     Returns:
         QImage object or None if loading failed
     """
+    img_data = _read_exr_with_pillow(file_path)
+    if img_data is None:
+        return None
+    qimage = _rgb8_to_qimage(to_rgb8(_tone_map_hdr(img_data)))
+    logger.debug(f"Loaded EXR with Pillow: {file_path}")
+    return qimage
+
+
+def _read_exr_with_pillow(file_path: str) -> "NDArray[np.floating[Any]] | None":
+    """
+    Read EXR pixels using Pillow (requires OpenEXR support).
+
+    Args:
+        file_path: Path to the EXR file
+
+    Returns:
+        HxWx3 float RGB array or None if loading failed
+    """
     try:
         from PIL import Image
-        from PySide6.QtGui import QColorSpace, QImage
 
         # Try to open with Pillow
         with Image.open(file_path) as img:
@@ -281,34 +368,9 @@ def _load_exr_with_pillow(file_path: str) -> "QImage | None":
             # Convert to numpy array for tone mapping
             img_data = np.array(img, dtype=np.float32)
 
-            # EXR data is typically 0-1 range but can exceed 1.0 (HDR)
-            # Normalize if needed
-            img_data = _tone_map_hdr(img_data / 255.0 if img_data.max() > 1.0 else img_data)
-
-            # Convert to 8-bit
-            img_8bit = (img_data * 255).astype(np.uint8)
-
-            # Get dimensions
-            height, width = img_8bit.shape[:2]
-            bytes_per_line = width * 3
-
-            # Create QImage
-            qimage = QImage(
-                img_8bit.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888,
-            )
-
-            # Copy to ensure data persists
-            qimage = qimage.copy()
-
-            # Set color space to sRGB (tone mapping already applied gamma correction)
-            qimage.setColorSpace(QColorSpace(QColorSpace.NamedColorSpace.SRgb))
-
-            logger.debug(f"Loaded EXR with Pillow: {file_path} ({width}x{height})")
-            return qimage
+        # EXR data is typically 0-1 range but can exceed 1.0 (HDR)
+        # Normalize if needed
+        return img_data / 255.0 if img_data.max() > 1.0 else img_data
 
     except ImportError:
         logger.debug("Pillow not available")
@@ -328,52 +390,35 @@ def _load_exr_with_imageio(file_path: str) -> "QImage | None":
     Returns:
         QImage object or None if loading failed
     """
+    img_data = _read_exr_with_imageio(file_path)
+    if img_data is None:
+        return None
+    try:
+        # Tone mapping keeps RGB only, so the result is always RGB888
+        qimage = _rgb8_to_qimage(to_rgb8(_tone_map_hdr(img_data)))
+    except Exception as e:
+        logger.debug(f"imageio couldn't load EXR {file_path}: {e}")
+        return None
+    logger.debug(f"Loaded EXR with imageio: {file_path}")
+    return qimage
+
+
+def _read_exr_with_imageio(file_path: str) -> "NDArray[np.floating[Any]] | None":
+    """
+    Read EXR pixels using imageio (auto-detects available backend).
+
+    Args:
+        file_path: Path to the EXR file
+
+    Returns:
+        HxWxC float array or None if loading failed
+    """
     try:
         import imageio.v3 as iio
-        from PySide6.QtGui import QColorSpace, QImage
 
         # Read EXR file using imageio with auto-detection
         # Will try available plugins (pillow, etc.) automatically
-        img_data = iio.imread(file_path)
-
-        # Apply tone mapping (HDR -> LDR conversion)
-        img_data = _tone_map_hdr(img_data)
-
-        # Convert to 8-bit RGB
-        img_8bit = (img_data * 255).astype(np.uint8)
-
-        # Get dimensions
-        height, width = img_8bit.shape[:2]
-        bytes_per_line = width * 3
-
-        # Handle RGB vs RGBA
-        if img_8bit.shape[2] == 4:
-            # RGBA format
-            qimage = QImage(
-                img_8bit.data,
-                width,
-                height,
-                img_8bit.strides[0],
-                QImage.Format.Format_RGBA8888,
-            )
-        else:
-            # RGB format
-            qimage = QImage(
-                img_8bit.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888,
-            )
-
-        # Copy the image data to ensure it persists
-        qimage = qimage.copy()
-
-        # Set color space to sRGB (tone mapping already applied gamma correction)
-        qimage.setColorSpace(QColorSpace(QColorSpace.NamedColorSpace.SRgb))
-
-        logger.debug(f"Loaded EXR with imageio: {file_path} ({width}x{height})")
-        return qimage
+        return np.asarray(iio.imread(file_path))
 
     except ImportError:
         logger.debug("imageio not available")
@@ -446,12 +491,12 @@ def _tone_map_hdr(img_data: NDArray[np.floating[Any]]) -> NDArray[np.floating[An
     # Calculate luminance-based exposure
     # Use a percentile-based exposure to avoid being thrown off by outliers
     mid_gray = np.percentile(img_data, 50)  # Median brightness
-    target_mid_gray = 0.18  # Standard 18% gray target
+    target_mid_gray = TONE_MAP_TARGET_MID_GRAY
 
     if mid_gray > 0:
         exposure = target_mid_gray / mid_gray
         # Clamp exposure to reasonable range to avoid over-brightening dark images
-        exposure = np.clip(exposure, 0.5, 4.0)
+        exposure = np.clip(exposure, *TONE_MAP_EXPOSURE_RANGE)
         logger.debug(
             f"Tone mapping: median={mid_gray:.4f}, target={target_mid_gray:.4f}, " +
             f"raw_exposure={target_mid_gray/mid_gray:.4f}, clamped_exposure={exposure:.4f}"
@@ -475,7 +520,7 @@ def _tone_map_hdr(img_data: NDArray[np.floating[Any]]) -> NDArray[np.floating[An
     # Note: Pure gamma 2.2 approximates sRGB transfer function (< 1% difference)
     # True sRGB uses piecewise: linear for x ≤ 0.0031308, gamma ~2.4 above
     # This approximation is standard practice for display-oriented tone mapping
-    gamma = 2.2
+    gamma = TONE_MAP_GAMMA
     tone_mapped = np.power(img_data, 1.0 / gamma)
 
     # Ensure RGB channels (handle grayscale or RGBA)
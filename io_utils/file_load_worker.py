@@ -12,9 +12,10 @@ from typing import ClassVar
 from PySide6.QtCore import QMutex, QMutexLocker, QThread, Signal
 from typing_extensions import override
 
+from core import tracing
 from core.config import get_config
 from core.coordinate_detector import detect_coordinate_system
-from core.curve_data import CurveDataWithMetadata
+from core.curve_data import CurveDataWithMetadata, normalize_curves
 from core.type_aliases import CurveDataList
 
 logger = logging.getLogger(__name__)
@@ -113,16 +114,19 @@ class FileLoadWorker(QThread):
                     # Check if we should use metadata-aware loading
                     config = get_config()
 
-                    if config.use_metadata_aware_data:
-                        # New unified transformation approach - load raw data with metadata
-                        logger.info("[COORD] Using metadata-aware data loading")
-                        curve_data = self._load_2dtrack_data_metadata_aware(self.tracking_file_path)
-                        # Emit the full metadata-aware data so coordinate transforms work correctly
-                        data = curve_data
-                    else:
-                        # Legacy approach - apply flip_y to match manual loading behavior
-                        # 3DEqualizer uses bottom-origin coordinates, flip to top-origin
-                        data = self._load_2dtrack_data_direct(self.tracking_file_path, flip_y=True, image_height=720)
+                    with tracing.span("file_load.tracking_data", "file_load"):
+                        if config.use_metadata_aware_data:
+                            # New unified transformation approach - load raw data with metadata
+                            logger.info("[COORD] Using metadata-aware data loading")
+                            curve_data = self._load_2dtrack_data_metadata_aware(self.tracking_file_path)
+                            # Emit the full metadata-aware data so coordinate transforms work correctly
+                            data = curve_data
+                        else:
+                            # Legacy approach - apply flip_y to match manual loading behavior
+                            # 3DEqualizer uses bottom-origin coordinates, flip to top-origin
+                            data = self._load_2dtrack_data_direct(
+                                self.tracking_file_path, flip_y=True, image_height=720
+                            )
 
                     if data:
                         logger.info(
@@ -159,7 +163,8 @@ class FileLoadWorker(QThread):
 
                 try:
                     # Directly scan for image files without creating DataService
-                    image_files = self._scan_image_directory(self.image_dir_path)
+                    with tracing.span("file_load.scan_images", "file_load"):
+                        image_files = self._scan_image_directory(self.image_dir_path)
 
                     if image_files:
                         logger.info(
@@ -401,13 +406,16 @@ class FileLoadWorker(QThread):
 
             # Handle dict case (multi-point data)
             if isinstance(curve_data, dict):
-                # Return dict of legacy format for each point
-                result_dict: dict[str, CurveDataList] = {}
-                for point_name, point_curve in curve_data.items():
-                    if flip_y and point_curve.needs_y_flip_for_display:
-                        result_dict[point_name] = point_curve.to_normalized().to_legacy_format()
-                    else:
-                        result_dict[point_name] = point_curve.to_legacy_format()
+                # Return dict of legacy format for each point, normalizing all flipped points in one pass
+                normalized: dict[str, CurveDataWithMetadata] = {}
+                if flip_y:
+                    normalized = normalize_curves(
+                        {name: curve for name, curve in curve_data.items() if curve.needs_y_flip_for_display}
+                    )
+                result_dict: dict[str, CurveDataList] = {
+                    point_name: normalized.get(point_name, point_curve).to_legacy_format()
+                    for point_name, point_curve in curve_data.items()
+                }
                 # Runtime type is compatible despite variance rules
                 return result_dict  # pyright: ignore[reportReturnType]
             # Single point data (CurveDataWithMetadata) - to_legacy_format returns CurveDataList
@@ -0,0 +1,347 @@
+"""
+Disk cache of display-ready EXR frames.
+
+Decoding and tone mapping an EXR plate costs the same every session and again
+after SafeImageCacheManager evicts a frame. This cache keeps the tone-mapped
+8-bit result on disk so a second pass over a plate only reads it back:
+
+- One uncompressed file per frame: a 64-byte header (magic, width, height,
+  bytes per line, QImage format) followed by the raw RGB888 scanlines.
+- Hits are memory-mapped and wrapped as a QImage without copying or decoding;
+  the page cache serves repeated passes from RAM.
+- Entries are keyed by the source path, its mtime and size, and the tone
+  mapping signature (exr_loader.TONE_MAP_SIGNATURE), so edited plates and
+  tone mapping changes never return stale frames.
+- Least recently used entries are deleted when the total size exceeds the
+  limit. Use is tracked by the entry file's mtime, so the order survives
+  restarts.
+
+Files are written to a temporary name and renamed into place, so a crash or a
+second editor instance never sees a partial frame.
+
+Configuration:
+    CURVE_EDITOR_FRAME_CACHE_MB=n     Size limit in MB (0 = disabled, default 8192)
+    CURVE_EDITOR_FRAME_CACHE_DIR=dir  Location (default ~/.curve_editor/frame_cache)
+
+Usage:
+    cache = get_frame_disk_cache()
+    image = cache.load(path) if cache else None
+    if image is None:
+        image = decode(path)
+        if cache: cache.store(path, image)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.logger_utils import get_logger
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QImage
+
+logger = get_logger("frame_disk_cache")
+
+MIB = 1024 * 1024
+
+FRAME_FILE_SUFFIX = ".frame"
+
+# Bump the magic when the file layout changes; old entries then read as corrupt and are dropped
+_MAGIC = b"CEFRAME1"
+_HEADER = struct.Struct("<8sIIIi")  # magic, width, height, bytes per line, QImage.Format value
+HEADER_SIZE = 64  # Header padded so scanlines start aligned
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache location next to the application logs."""
+    return Path.home() / ".curve_editor" / "frame_cache"
+
+
+class FrameDiskCache:
+    """
+    Size-limited LRU cache of tone-mapped frames in memory-mappable files.
+
+    Thread-safe: the preload worker stores frames while the UI thread loads
+    them. The index of entries is built from the directory on first use.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the frame files (created on first use)
+            max_bytes: Total size limit of all entries
+
+        Raises:
+            ValueError: If max_bytes <= 0
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self._directory: Path = directory
+        self._max_bytes: int = max_bytes
+        self._lock: threading.Lock = threading.Lock()
+        # Entry key -> file size, least recently used first
+        self._index: OrderedDict[str, int] | None = None
+        self._total_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def directory(self) -> Path:
+        """Get the cache directory."""
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        """Get the total size limit."""
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """Get the total size of all entries."""
+        with self._lock:
+            _ = self._ensure_index()
+            return self._total_bytes
+
+    @property
+    def entry_count(self) -> int:
+        """Get the number of cached frames."""
+        with self._lock:
+            return len(self._ensure_index())
+
+    @property
+    def hits(self) -> int:
+        """Get the number of loads served from disk."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of loads not in the cache."""
+        return self._misses
+
+    def key_for(self, file_path: str) -> str | None:
+        """
+        Get the entry key for the current version of a source file.
+
+        Returns:
+            Hex digest of path, mtime, size and tone mapping, or None if the file is missing
+        """
+        from io_utils.exr_loader import TONE_MAP_SIGNATURE
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        identity = f"{os.path.abspath(file_path)}\0{stat.st_mtime_ns}\0{stat.st_size}\0{TONE_MAP_SIGNATURE}"
+        return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+    def contains(self, file_path: str) -> bool:
+        """Check whether the current version of a source file is cached."""
+        key = self.key_for(file_path)
+        if key is None:
+            return False
+        with self._lock:
+            return key in self._ensure_index()
+
+    def load(self, file_path: str) -> QImage | None:
+        """
+        Get a cached frame, memory-mapped straight into a QImage.
+
+        The mapping stays open as long as any QImage sharing the pixels is
+        alive; evicting the entry meanwhile is safe.
+
+        Args:
+            file_path: Source file of the frame
+
+        Returns:
+            sRGB-tagged QImage, or None on a miss
+        """
+        from PySide6.QtGui import QColorSpace, QImage
+
+        key = self.key_for(file_path)
+        with self._lock:
+            if key is None or key not in self._ensure_index():
+                self._misses += 1
+                return None
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, width, height, bytes_per_line, image_format = _HEADER.unpack_from(mapping)
+            if magic != _MAGIC or len(mapping) < HEADER_SIZE + bytes_per_line * height:
+                raise ValueError("not a complete frame file")
+            pixels = np.frombuffer(mapping, dtype=np.uint8, count=bytes_per_line * height, offset=HEADER_SIZE)
+            image = QImage(pixels, width, height, bytes_per_line, QImage.Format(image_format))
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Dropping unreadable frame cache entry {entry_path.name}: {e}")
+            self._discard(key)
+            with self._lock:
+                self._misses += 1
+            return None
+
+        image.setColorSpace(QColorSpace(QColorSpace.NamedColorSpace.SRgb))
+        try:
+            os.utime(entry_path)  # Record use for LRU order across restarts
+        except OSError:
+            pass
+        with self._lock:
+            if self._index is not None and key in self._index:
+                self._index.move_to_end(key)
+            self._hits += 1
+        return image
+
+    def store(self, file_path: str, image: QImage) -> bool:
+        """
+        Cache a display-ready frame, evicting least recently used entries past the limit.
+
+        Args:
+            file_path: Source file the frame was decoded from
+            image: Tone-mapped frame (converted to RGB888 if needed)
+
+        Returns:
+            True if the frame is cached
+        """
+        from PySide6.QtGui import QImage
+
+        key = self.key_for(file_path)
+        if key is None:
+            return False
+        with self._lock:
+            if key in self._ensure_index():
+                return True
+
+        if image.format() != QImage.Format.Format_RGB888:
+            image = image.convertToFormat(QImage.Format.Format_RGB888)
+        width, height, bytes_per_line = image.width(), image.height(), image.bytesPerLine()
+        size = HEADER_SIZE + bytes_per_line * height
+        if size > self._max_bytes:
+            return False
+
+        header = _HEADER.pack(_MAGIC, width, height, bytes_per_line, image.format().value).ljust(HEADER_SIZE, b"\0")
+        temp_path: str | None = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                _ = f.write(header)
+                _ = f.write(memoryview(image.constBits())[: bytes_per_line * height])
+            os.replace(temp_path, self._entry_path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to cache frame for {file_path}: {e}")
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            return False
+
+        with self._lock:
+            index = self._ensure_index()
+            if key not in index:
+                index[key] = size
+                self._total_bytes += size
+            self._evict_locked()
+        return True
+
+    def clear(self) -> None:
+        """Delete all cached frames."""
+        with self._lock:
+            index = self._ensure_index()
+            for key in list(index):
+                self._remove_locked(key)
+        logger.info(f"Frame cache cleared: {self._directory}")
+
+    def _entry_path(self, key: str) -> Path:
+        return self._directory / f"{key}{FRAME_FILE_SUFFIX}"
+
+    def _ensure_index(self) -> OrderedDict[str, int]:
+        """Build the index from the directory on first use (lock must be held)."""
+        if self._index is not None:
+            return self._index
+
+        entries: list[tuple[float, str, int]] = []
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            with os.scandir(self._directory) as scan:
+                for entry in scan:
+                    if entry.name.endswith(FRAME_FILE_SUFFIX) and entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, entry.name[: -len(FRAME_FILE_SUFFIX)], stat.st_size))
+        except OSError as e:
+            logger.warning(f"Frame cache directory unavailable ({self._directory}): {e}")
+
+        self._index = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._total_bytes = sum(self._index.values())
+        self._evict_locked()
+        logger.debug(f"Frame cache: {len(self._index)} frames, {self._total_bytes / MIB:.1f} MB in {self._directory}")
+        return self._index
+
+    def _evict_locked(self) -> None:
+        """Delete least recently used entries until under the limit (lock must be held)."""
+        if self._index is None:
+            return
+        while self._index and self._total_bytes > self._max_bytes:
+            oldest_key = next(iter(self._index))
+            self._remove_locked(oldest_key)
+            logger.debug(f"Frame cache EVICT: {oldest_key}")
+
+    def _remove_locked(self, key: str) -> None:
+        if self._index is None or key not in self._index:
+            return
+        self._total_bytes -= self._index.pop(key)
+        try:
+            self._entry_path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # Windows refuses to delete files that are still mapped; the scan picks them up again
+            logger.debug(f"Could not delete frame cache entry {key}: {e}")
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            self._remove_locked(key)
+
+
+_frame_disk_cache: FrameDiskCache | None = None
+_frame_disk_cache_created = False
+_frame_disk_cache_lock = threading.Lock()
+
+
+def get_frame_disk_cache() -> FrameDiskCache | None:
+    """
+    Get the process-wide frame cache.
+
+    Returns:
+        The cache, or None when disabled (AppConfig.frame_cache_mb = 0)
+    """
+    global _frame_disk_cache, _frame_disk_cache_created
+    if not _frame_disk_cache_created:
+        with _frame_disk_cache_lock:
+            if not _frame_disk_cache_created:
+                _frame_disk_cache_created = True
+                from core.config import get_config
+
+                config = get_config()
+                if config.frame_cache_mb > 0:
+                    directory = Path(config.frame_cache_dir) if config.frame_cache_dir else default_cache_dir()
+                    _frame_disk_cache = FrameDiskCache(directory, config.frame_cache_mb * MIB)
+    return _frame_disk_cache
+
+
+def reset_frame_disk_cache() -> None:
+    """Forget the process-wide cache so it is recreated from the config (mainly for testing)."""
+    global _frame_disk_cache, _frame_disk_cache_created
+    with _frame_disk_cache_lock:
+        _frame_disk_cache = None
+        _frame_disk_cache_created = False
@@ -1,17 +1,20 @@
 #!/usr/bin/env python
 
 import logging
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtWidgets import QApplication
+from core.startup_profiler import StartupProfiler
 
-from ui.main_window import MainWindow
+if TYPE_CHECKING:
+    from ui.main_window import MainWindow
 
 
-def main():
-    """Main entry point for the application."""
+def _setup_logging() -> Path:
+    """Configure root logging and return the log file path."""
     # Setup logging directory
     log_dir = Path.home() / ".curve_editor" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -21,11 +24,11 @@ def main():
 
     # Load logging configuration - simplified for startup
     # config = logging_config.load_config()  # Disabled - config module not available
-    config: dict[str, str | dict[str, str]] = {"global": "DEBUG", "services": {}}  # DEBUG mode for zoom investigation
+    # INFO by default: at DEBUG every hot-path logger.debug f-string is formatted and written
+    # to disk. Use LOG_LEVEL=DEBUG when investigating.
+    config: dict[str, str | dict[str, str]] = {"global": "INFO", "services": {}}
 
     # Get logging level from environment or config
-    import os
-
     global_level_raw = os.environ.get("LOG_LEVEL", config.get("global", "INFO"))
     # Ensure global_level is a string
     global_level: str = global_level_raw if isinstance(global_level_raw, str) else "INFO"
@@ -60,12 +63,49 @@ def main():
         module_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
         logger.debug(f"Set {module} log level to {level}")
 
+    return log_file
+
+
+def _finish_startup(window: "MainWindow", profiler: StartupProfiler) -> None:
+    """Run deferred startup work once the window has been shown.
+
+    The start time of the session.load phase is the time to the first event loop iteration.
+    """
+    # Session restore starts file loading; deferring it keeps it off the first paint
+    with profiler.phase("session.load"):
+        window.load_initial_session()
+
+    _ = profiler.finish()
+
+
+def main():
+    """Main entry point for the application.
+
+    Startup is staged so the window is shown before session data loads. The
+    profiler logs the timing of each stage and compares it with the budget
+    (see core.startup_profiler).
+    """
+    profiler = StartupProfiler()
+
+    with profiler.phase("logging"):
+        log_file = _setup_logging()
+    logger = logging.getLogger("main")
+
+    # Heavy imports are done here, not at module level, so they show up in the startup report
+    with profiler.phase("import.qt"):
+        from PySide6.QtCore import QTimer
+        from PySide6.QtWidgets import QApplication
+
     # Initialize Qt application
-    app = QApplication(sys.argv)
+    with profiler.phase("qapplication"):
+        app = QApplication(sys.argv)
 
     # Qt object pooling is not currently implemented
     logger.info("Using standard Qt rendering")
 
+    with profiler.phase("import.main_window"):
+        from ui.main_window import MainWindow
+
     # Create main window with service registry
     logger.info("Creating main window...")
 
@@ -76,7 +116,9 @@ def main():
         logger.warning("Modern UI requested but no longer available - using standard MainWindow")
 
     logger.info("Using standard MainWindow")
-    window = MainWindow()
+    with profiler.phase("main_window.construct"):
+        # Session data is loaded after show() by _finish_startup
+        window = MainWindow(auto_load_data=False)
 
     # Install event filter for debugging key events
     # Note: This was causing issues with key event propagation
@@ -84,9 +126,13 @@ def main():
     app.installEventFilter(window)
 
     # Show window
-    window.show()
+    with profiler.phase("main_window.show"):
+        window.show()
     logger.info("Main window displayed successfully")
 
+    # Deferred work runs on the first event loop iteration, after the window is painted
+    QTimer.singleShot(0, lambda: _finish_startup(window, profiler))
+
     # Verify logging is working
     if log_file.exists():
         logger.info(f"Log file verified: {log_file} (size: {log_file.stat().st_size} bytes)")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""Command-line batch processing of tracking files without the editor.
+
+Applies tracking-direction statuses, gap filling, smoothing/filters and
+Insert Track averaging to many 2DTrackDatav2/2DTrackData/JSON/CSV files and
+exports the results. Files are distributed over worker processes (see
+core.batch_processor); a per-file timing report and the overall throughput
+are printed at the end.
+
+Example:
+    python process_cli.py exports/ -o processed/ --fill-gaps 5 --smooth 5 -j 16
+    python process_cli.py exports/ -o processed/ --direction forward --format json
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import cast
+
+# Extensions picked up when a directory is given
+TRACKING_EXTENSIONS = {".txt", ".json", ".csv"}
+
+
+def parse_positive_int(value: str) -> int:
+    """Parse a positive integer argument (window size, gap length, filter order)."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid value {value!r}, expected an integer") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"Value must be positive: {value!r}")
+    return number
+
+
+def collect_input_files(inputs: list[str]) -> list[str]:
+    """Expand directories to the tracking files they contain, in name order; keep files as given."""
+    files: list[str] = []
+    for entry in inputs:
+        path = Path(entry)
+        if path.is_dir():
+            files.extend(
+                str(file_path)
+                for file_path in sorted(path.iterdir())
+                if file_path.is_file() and file_path.suffix.lower() in TRACKING_EXTENSIONS
+            )
+        else:
+            files.append(entry)
+    # Drop duplicates, keeping the first occurrence
+    return list(dict.fromkeys(files))
+
+
+def main() -> None:
+    """Main entry point for CLI."""
+    parser = argparse.ArgumentParser(description="Process tracking files headlessly and export the results")
+    parser.add_argument("inputs", nargs="+", help="Tracking files or directories of tracking files")
+    parser.add_argument("-o", "--output", required=True, help="Output directory")
+    parser.add_argument(
+        "--direction",
+        choices=["forward", "backward", "bidirectional"],
+        default=None,
+        help="Update keyframe/endframe statuses for a tracking direction (needs --format json or csv)",
+    )
+    parser.add_argument(
+        "--fill-gaps", type=parse_positive_int, default=0, help="Fill gaps up to N frames by interpolation"
+    )
+    parser.add_argument("--median", type=parse_positive_int, default=0, help="Median filter window")
+    parser.add_argument("--smooth", type=parse_positive_int, default=0, help="Moving average window")
+    parser.add_argument("--lowpass", type=parse_positive_int, default=0, help="Lowpass filter order")
+    parser.add_argument("--average", action="store_true", help="Add the Insert Track average of all curves")
+    parser.add_argument(
+        "--format", choices=["2dtrack", "json", "csv"], default="2dtrack", help="Output format (default: 2dtrack)"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count, 1 = in-process)"
+    )
+    parser.add_argument("--report", default=None, help="Also write the per-file report as JSON to this path")
+
+    args = parser.parse_args()
+    if args.direction is not None and args.format == "2dtrack":
+        parser.error("--direction only changes point statuses, which 2dtrack output does not store; use json or csv")
+
+    # Imported after argument parsing so --help stays fast
+    from core.batch_processor import ProcessingSettings, process_files
+    from core.models import TrackingDirection
+
+    input_files = collect_input_files(cast("list[str]", args.inputs))
+    missing = [path for path in input_files if not os.path.isfile(path)]
+    if missing:
+        print(f"Error: Tracking file not found: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+    if not input_files:
+        print("Error: No tracking files found", file=sys.stderr)
+        sys.exit(1)
+
+    direction = cast("str | None", args.direction)
+    settings = ProcessingSettings(
+        direction=TrackingDirection(direction) if direction is not None else None,
+        fill_gaps=cast("int", args.fill_gaps),
+        median_window=cast("int", args.median),
+        smooth_window=cast("int", args.smooth),
+        lowpass_order=cast("int", args.lowpass),
+        average=cast("bool", args.average),
+        output_format=cast("str", args.format),
+    )
+
+    output_dir = Path(cast("str", args.output))
+    result = process_files(input_files, output_dir, settings, workers=cast("int | None", args.workers))
+    print(result.report())
+
+    report_path = cast("str | None", args.report)
+    if report_path is not None:
+        report = {
+            "files": [
+                {
+                    "input": file_result.input_path,
+                    "outputs": file_result.output_paths,
+                    "curves": file_result.curves,
+                    "points": file_result.points,
+                    "elapsed_s": file_result.elapsed_s,
+                    "error": file_result.error,
+                }
+                for file_result in result.files
+            ],
+            "elapsed_s": result.elapsed_s,
+            "workers": result.workers,
+            "files_per_second": result.files_per_second,
+            "points_per_second": result.points_per_second,
+        }
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if result.failed_files:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from PySide6.QtCore import QPoint
-    from PySide6.QtGui import QImage
+    from PySide6.QtGui import QImage, QPolygonF
     from PySide6.QtWidgets import QDoubleSpinBox, QPushButton, QRubberBand, QStatusBar
 
     from rendering.visual_settings import VisualSettings
@@ -249,6 +249,9 @@ class CurveViewProtocol(Protocol):
     rubber_band_active: bool
     rubber_band_origin: QtPointF
 
+    # Lasso selection outline while drawing (screen coordinates), None when inactive
+    lasso_polygon: "QPolygonF | None"
+
     # Visualization settings
     show_grid: bool
     show_background: bool
@@ -533,6 +536,10 @@ class MultiCurveViewProtocol(CurveViewProtocol, Protocol):
         """Fit view to show all curve data."""
         ...
 
+    def set_performance_hud_enabled(self, enabled: bool) -> None:
+        """Show or hide the performance HUD overlay."""
+        ...
+
 
 class QLabelProtocol(Protocol):
     """Protocol for QLabel widgets."""
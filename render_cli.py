@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""Command-line batch rendering of track overlays for review sequences.
+
+Renders the curves of a tracking file over the plate sequence to one image per
+frame, without opening the editor. Frames are distributed over worker
+processes (see rendering.batch_renderer).
+
+Example:
+    python render_cli.py shot.2dtrack --images plates/ --output review/ --frames 1001-1100 --size 1920x1080
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import cast
+
+# Same sequence extensions as DataService.load_image_sequence
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".gif", ".exr"}
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    """Parse a WIDTHxHEIGHT size argument."""
+    try:
+        width_text, height_text = value.lower().split("x")
+        width, height = int(width_text), int(height_text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size {value!r}, expected WIDTHxHEIGHT") from None
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"Size must be positive: {value!r}")
+    return width, height
+
+
+def parse_frame_range(value: str) -> tuple[int, int]:
+    """Parse a FIRST-LAST (or single FRAME) range argument."""
+    try:
+        if "-" in value:
+            first_text, last_text = value.split("-", 1)
+            first, last = int(first_text), int(last_text)
+        else:
+            first = last = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid frame range {value!r}, expected FIRST-LAST") from None
+    if last < first:
+        raise argparse.ArgumentTypeError(f"Frame range is reversed: {value!r}")
+    return first, last
+
+
+def list_image_files(directory: Path) -> list[str]:
+    """List plate files in sequence order."""
+    return [
+        str(file_path)
+        for file_path in sorted(directory.iterdir())
+        if file_path.is_file() and file_path.suffix.lower() in IMAGE_EXTENSIONS
+    ]
+
+
+def main() -> None:
+    """Main entry point for CLI."""
+    parser = argparse.ArgumentParser(description="Render track overlays over a plate sequence to image files")
+    parser.add_argument("tracking_file", help="2D track file with one or more curves")
+    parser.add_argument("-o", "--output", required=True, help="Output directory")
+    parser.add_argument("--images", default=None, help="Plate image sequence directory (default: no plate)")
+    parser.add_argument(
+        "--frames", type=parse_frame_range, default=None, help="Frame range FIRST-LAST (default: all tracked frames)"
+    )
+    parser.add_argument("--size", type=parse_size, default=(1920, 1080), help="Output size WxH (default: 1920x1080)")
+    parser.add_argument(
+        "--plate-size",
+        type=parse_size,
+        default=None,
+        help="Plate size WxH used to fit the view when no plate is loaded (default: output size)",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count, 1 = in-process)"
+    )
+    parser.add_argument(
+        "--pattern",
+        default="overlay.{frame:04d}.png",
+        help="Output file name pattern (default: overlay.{frame:04d}.png)",
+    )
+    parser.add_argument("--point-radius", type=float, default=2.5, help="Point radius in pixels (default: 2.5)")
+    parser.add_argument("--line-width", type=int, default=2, help="Curve line width in pixels (default: 2)")
+    parser.add_argument("--labels", action="store_true", help="Draw point labels")
+    parser.add_argument("--no-lines", action="store_true", help="Draw points only")
+    parser.add_argument("--active", default=None, help="Curve to highlight as active")
+
+    args = parser.parse_args()
+
+    # Imported after argument parsing so --help stays fast
+    from rendering.batch_renderer import OverlayRenderJob, OverlayRenderSettings, render_overlays
+    from services.data_service import DataService
+
+    tracking_file = cast("str", args.tracking_file)
+    if not os.path.isfile(tracking_file):
+        print(f"Error: Tracking file not found: {tracking_file}", file=sys.stderr)
+        sys.exit(1)
+
+    curves = DataService().load_tracked_data(tracking_file)
+    if not curves:
+        print(f"Error: No curves loaded from {tracking_file}", file=sys.stderr)
+        sys.exit(1)
+
+    image_files: list[str] = []
+    images_dir = cast("str | None", args.images)
+    if images_dir is not None:
+        if not os.path.isdir(images_dir):
+            print(f"Error: Image directory not found: {images_dir}", file=sys.stderr)
+            sys.exit(1)
+        image_files = list_image_files(Path(images_dir))
+
+    frame_range = cast("tuple[int, int] | None", args.frames)
+    if frame_range is None:
+        tracked_frames = [point[0] for points in curves.values() for point in points]
+        frame_range = (min(tracked_frames), max(tracked_frames))
+
+    width, height = cast("tuple[int, int]", args.size)
+    plate_width, plate_height = cast("tuple[int, int] | None", args.plate_size) or (width, height)
+    settings = OverlayRenderSettings(
+        width=width,
+        height=height,
+        plate_width=plate_width,
+        plate_height=plate_height,
+        show_background=bool(image_files),
+        show_lines=not cast("bool", args.no_lines),
+        show_labels=cast("bool", args.labels),
+        point_radius=cast("float", args.point_radius),
+        line_width=cast("int", args.line_width),
+        output_pattern=cast("str", args.pattern),
+    )
+    job = OverlayRenderJob(
+        curves=curves,
+        image_files=image_files,
+        frames=range(frame_range[0], frame_range[1] + 1),
+        output_dir=Path(cast("str", args.output)),
+        settings=settings,
+        active_curve=cast("str | None", args.active),
+    )
+
+    result = render_overlays(job, workers=cast("int | None", args.workers))
+    print(result.summary())
+    if result.failed_frames:
+        print(f"Failed frames: {', '.join(str(f) for f in result.failed_frames)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
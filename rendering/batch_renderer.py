@@ -0,0 +1,345 @@
+#!/usr/bin/env python
+"""
+Offscreen batch renderer for track overlay review sequences.
+
+Renders curve overlays over the plate for a frame range to image files
+without a CurveViewWidget, using OptimizedCurveRenderer and RenderState
+directly. Frames are distributed over a pool of worker processes; each
+worker owns its own QGuiApplication, renderer, QImage target and QPainter,
+and decodes plates through the image cache decode path. Processes rather
+than threads are used so Python-side render work is not serialized by the
+GIL and throughput scales with cores.
+
+Usage:
+    job = OverlayRenderJob(curves=curves, image_files=files, frames=range(1, 101), output_dir=Path("out"))
+    result = render_overlays(job, workers=8)
+    print(result.summary())
+
+The render_cli.py entry point next to main.py wraps this module.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from core.logger_utils import get_logger
+from core.type_aliases import CurveDataList
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QGuiApplication, QImage
+
+    from rendering.optimized_curve_renderer import OptimizedCurveRenderer
+    from rendering.render_state import RenderState
+
+logger = get_logger("batch_renderer")
+
+DEFAULT_OUTPUT_PATTERN = "overlay.{frame:04d}.png"
+
+# Chunks per worker; more chunks balance uneven frames, fewer reduce IPC overhead
+_CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class OverlayRenderSettings:
+    """Output and style settings for overlay rendering (plain values so jobs pickle)."""
+
+    width: int = 1920
+    height: int = 1080
+    plate_width: int = 1920  # Used to fit the view when no plate image is available
+    plate_height: int = 1080
+    show_background: bool = True
+    show_lines: bool = True
+    show_labels: bool = False
+    point_radius: float = 2.5
+    line_width: int = 2
+    output_pattern: str = DEFAULT_OUTPUT_PATTERN  # str.format pattern with {frame}
+
+    def __post_init__(self) -> None:
+        """Validate output dimensions."""
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError(f"Output dimensions must be positive: {self.width}x{self.height}")
+        if self.plate_width <= 0 or self.plate_height <= 0:
+            raise ValueError(f"Plate dimensions must be positive: {self.plate_width}x{self.plate_height}")
+
+
+@dataclass(frozen=True)
+class OverlayRenderJob:
+    """A frame range to render."""
+
+    curves: dict[str, CurveDataList]
+    image_files: list[str]  # Plate files; frame N uses image_files[N - 1]
+    frames: Sequence[int]
+    output_dir: Path
+    settings: OverlayRenderSettings = field(default_factory=OverlayRenderSettings)
+    active_curve: str | None = None
+
+    def output_path(self, frame: int) -> Path:
+        """Output file path for a frame."""
+        return self.output_dir / self.settings.output_pattern.format(frame=frame)
+
+    def image_file_for_frame(self, frame: int) -> str | None:
+        """Plate file for a frame, or None if out of range."""
+        index = frame - 1
+        if 0 <= index < len(self.image_files):
+            return self.image_files[index]
+        return None
+
+
+@dataclass(frozen=True)
+class BatchRenderResult:
+    """Outcome and throughput of a batch render."""
+
+    frames_rendered: int
+    failed_frames: list[int]
+    elapsed_s: float
+    workers: int
+
+    @property
+    def frames_per_second(self) -> float:
+        """Rendered frames per wall-clock second."""
+        return self.frames_rendered / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line throughput report."""
+        text = (
+            f"Rendered {self.frames_rendered} frames in {self.elapsed_s:.2f}s "
+            + f"({self.frames_per_second:.1f} frames/s, {self.workers} worker(s))"
+        )
+        if self.failed_frames:
+            text += f", {len(self.failed_frames)} failed"
+        return text
+
+
+class OverlayFrameRenderer:
+    """
+    Renders frames of one job into a reused QImage.
+
+    One instance per worker: it owns the renderer, the target QImage and the
+    base RenderState, and only swaps the frame and plate per call. Requires a
+    QGuiApplication in the current process (fonts and image I/O).
+    """
+
+    def __init__(self, job: OverlayRenderJob) -> None:
+        from PySide6.QtGui import QImage
+
+        from rendering.optimized_curve_renderer import OptimizedCurveRenderer, RenderQuality
+
+        self.job: OverlayRenderJob = job
+        settings = job.settings
+        self._renderer: OptimizedCurveRenderer = OptimizedCurveRenderer()
+        # Batch output must not drop detail based on interactive frame times
+        self._renderer.set_render_quality(RenderQuality.HIGH)
+        self._image: QImage = QImage(settings.width, settings.height, QImage.Format.Format_ARGB32_Premultiplied)
+        self._base_state: RenderState = self._build_base_state()
+        self._fit_cache: dict[tuple[int, int], tuple[float, float, float]] = {}
+
+    def _build_base_state(self) -> RenderState:
+        """Build the frame-independent part of the render state."""
+        from core.display_mode import DisplayMode
+        from rendering.render_state import RenderState
+        from rendering.visual_settings import VisualSettings
+
+        job = self.job
+        settings = job.settings
+        visual = VisualSettings(
+            show_grid=False,
+            show_lines=settings.show_lines,
+            show_labels=settings.show_labels,
+            point_radius=settings.point_radius,
+            selected_point_radius=settings.point_radius,
+            line_width=settings.line_width,
+        )
+        active_points = job.curves.get(job.active_curve, []) if job.active_curve else []
+        return RenderState(
+            points=active_points,
+            current_frame=1,
+            selected_points=set(),
+            widget_width=settings.width,
+            widget_height=settings.height,
+            zoom_factor=1.0,
+            pan_offset_x=0.0,
+            pan_offset_y=0.0,
+            manual_offset_x=0.0,
+            manual_offset_y=0.0,
+            flip_y_axis=False,
+            show_background=settings.show_background,
+            image_width=settings.plate_width,
+            image_height=settings.plate_height,
+            visual=visual,
+            curves_data=job.curves,
+            display_mode=DisplayMode.ALL_VISIBLE,
+            selected_curve_names=set(),
+            selected_curves_ordered=[],
+            curve_metadata={name: {"visible": True} for name in job.curves},
+            active_curve_name=job.active_curve,
+            visible_curves=frozenset(job.curves),
+            # Job curves never change within a worker, so one version keys their cached segments
+            curve_versions=dict.fromkeys(job.curves, 1),
+            show_info=False,
+        )
+
+    def _fit(self, plate_width: int, plate_height: int, has_background: bool) -> tuple[float, float, float]:
+        """Zoom and pan that fit the plate into the output, centered."""
+        key = (plate_width, plate_height)
+        fit = self._fit_cache.get(key)
+        if fit is None:
+            settings = self.job.settings
+            zoom = min(settings.width / plate_width, settings.height / plate_height)
+            pan_x = (settings.width - plate_width * zoom) / 2
+            pan_y = (settings.height - plate_height * zoom) / 2
+            fit = (zoom, pan_x, pan_y)
+            self._fit_cache[key] = fit
+        # The transform already centers the view when a background image is set
+        return fit if not has_background else (fit[0], 0.0, 0.0)
+
+    def render_frame(self, frame: int) -> Path:
+        """
+        Render one frame and write it to the job's output directory.
+
+        Args:
+            frame: Frame number (1-based, matching curve data)
+
+        Returns:
+            Path to the written image
+
+        Raises:
+            OSError: If the image cannot be written
+        """
+        from PySide6.QtGui import QPainter
+
+        from services.image_cache_manager import decode_image_file
+
+        job = self.job
+        settings = job.settings
+
+        background: QImage | None = None
+        if settings.show_background and (image_file := job.image_file_for_frame(frame)) is not None:
+            background = decode_image_file(image_file)
+
+        if background is not None:
+            zoom, pan_x, pan_y = self._fit(background.width(), background.height(), has_background=True)
+        else:
+            zoom, pan_x, pan_y = self._fit(settings.plate_width, settings.plate_height, has_background=False)
+
+        render_state = replace(
+            self._base_state,
+            current_frame=frame,
+            background_image=background,
+            zoom_factor=zoom,
+            pan_offset_x=pan_x,
+            pan_offset_y=pan_y,
+        )
+
+        self._image.fill(0xFF000000)
+        painter = QPainter(self._image)
+        try:
+            self._renderer.render(painter, None, render_state)
+        finally:
+            _ = painter.end()
+
+        output_path = job.output_path(frame)
+        if not self._image.save(str(output_path)):
+            raise OSError(f"Failed to write {output_path}")
+        return output_path
+
+    def render_frames(self, frames: Sequence[int]) -> list[int]:
+        """
+        Render several frames, continuing past failures.
+
+        Returns:
+            Frames that failed to render
+        """
+        failed: list[int] = []
+        for frame in frames:
+            try:
+                _ = self.render_frame(frame)
+            except Exception as e:
+                logger.error(f"Failed to render frame {frame}: {e}")
+                failed.append(frame)
+        return failed
+
+
+# Per-process state for pool workers (set by _init_worker)
+_worker_app: QGuiApplication | None = None
+_worker_renderer: OverlayFrameRenderer | None = None
+
+
+def _ensure_gui_application() -> QGuiApplication | None:
+    """Create a QGuiApplication if this process has none (offscreen unless a platform is set)."""
+    from PySide6.QtGui import QGuiApplication
+
+    if QGuiApplication.instance() is not None:
+        return None
+    _ = os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QGuiApplication([])
+
+
+def _init_worker(job: OverlayRenderJob) -> None:
+    """Process pool initializer: one application and renderer per worker process."""
+    global _worker_app, _worker_renderer
+    _worker_app = _ensure_gui_application()
+    _worker_renderer = OverlayFrameRenderer(job)
+
+
+def _render_chunk(frames: list[int]) -> list[int]:
+    """Render a chunk of frames in a worker process; returns failed frames."""
+    if _worker_renderer is None:
+        raise RuntimeError("Worker renderer not initialized")
+    return _worker_renderer.render_frames(frames)
+
+
+def _chunk_frames(frames: Sequence[int], workers: int) -> list[list[int]]:
+    """Split frames into contiguous chunks for the pool."""
+    frame_list = list(frames)
+    chunk_size = max(1, math.ceil(len(frame_list) / (workers * _CHUNKS_PER_WORKER)))
+    return [frame_list[i : i + chunk_size] for i in range(0, len(frame_list), chunk_size)]
+
+
+def render_overlays(job: OverlayRenderJob, workers: int | None = None) -> BatchRenderResult:
+    """
+    Render all frames of a job to image files.
+
+    Args:
+        job: Frames, curves, plates and output settings
+        workers: Number of worker processes. None uses all cores; 1 renders in
+            this process (a QGuiApplication is created if none exists).
+
+    Returns:
+        Frame counts, failures and throughput
+    """
+    worker_count = workers if workers is not None else os.cpu_count() or 1
+    worker_count = max(1, min(worker_count, len(job.frames) or 1))
+    job.output_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    failed: list[int] = []
+    if worker_count == 1:
+        _app = _ensure_gui_application()
+        failed = OverlayFrameRenderer(job).render_frames(job.frames)
+    else:
+        # spawn: Qt state must not be inherited through fork
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=worker_count, mp_context=context, initializer=_init_worker, initargs=(job,)
+        ) as pool:
+            futures = [pool.submit(_render_chunk, chunk) for chunk in _chunk_frames(job.frames, worker_count)]
+            for future in as_completed(futures):
+                failed.extend(future.result())
+    elapsed = time.perf_counter() - start
+
+    result = BatchRenderResult(
+        frames_rendered=len(job.frames) - len(failed),
+        failed_frames=sorted(failed),
+        elapsed_s=elapsed,
+        workers=worker_count,
+    )
+    logger.info(result.summary())
+    return result
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""
+Bulk line emission for the curve renderer.
+
+Converts NumPy screen-coordinate arrays into QPolygonF buffers without a
+Python call per point, and groups polylines by pen so every opaque solid pen
+is drawn with a single QPainter.drawLines() call, however many segments and
+curves share it. Dashed pens keep one drawPolyline() per polyline so the
+dash pattern runs continuously along each segment, and so do translucent
+pens: separate line segments overlap at shared vertices and would be
+composited twice there.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from typing import TypeAlias
+
+import numpy as np
+import shiboken6
+from numpy.typing import NDArray
+from PySide6.QtCore import QByteArray, QDataStream, QPointF, Qt
+from PySide6.QtGui import QPainter, QPen, QPolygonF
+
+FloatArray: TypeAlias = NDArray[np.float64]
+IndexArray: TypeAlias = NDArray[np.intp]
+
+_PenKey: TypeAlias = tuple[int, float, Qt.PenStyle, Qt.PenCapStyle, Qt.PenJoinStyle, bool]
+
+
+def _supports_direct_write() -> bool:
+    """Check that QPolygonF stores its points as contiguous (double x, double y) pairs."""
+    polygon = QPolygonF()
+    polygon.resize(2)
+    buffer = (ctypes.c_double * 4).from_address(shiboken6.getCppPointer(polygon.data())[0])
+    np.frombuffer(buffer, dtype=np.float64)[:] = (1.0, 2.0, 3.0, 4.0)
+    return polygon.at(0) == QPointF(1.0, 2.0) and polygon.at(1) == QPointF(3.0, 4.0)
+
+
+_DIRECT_WRITE = _supports_direct_write()
+
+
+def polygon_from_array(points: FloatArray) -> QPolygonF:
+    """
+    Build a QPolygonF from an Nx2 coordinate array in bulk.
+
+    Writes straight into the polygon's point storage when qreal is double,
+    otherwise deserializes the array through QDataStream.
+
+    Args:
+        points: Nx2 screen coordinates
+
+    Returns:
+        Polygon with the same N points
+    """
+    count = len(points)
+    polygon = QPolygonF()
+    if count == 0:
+        return polygon
+
+    if _DIRECT_WRITE:
+        polygon.resize(count)
+        address = shiboken6.getCppPointer(polygon.data())[0]
+        buffer = (ctypes.c_double * (2 * count)).from_address(address)
+        np.frombuffer(buffer, dtype=np.float64).reshape(count, 2)[:] = points
+        return polygon
+
+    # QDataStream format: big-endian uint32 count followed by (x, y) doubles
+    payload = np.array([count], dtype=">u4").tobytes() + np.asarray(points, dtype=">f8").tobytes()
+    stream = QDataStream(QByteArray(payload))
+    stream >> polygon  # pyright: ignore[reportUnusedExpression]
+    return polygon
+
+
+def _pen_key(pen: QPen) -> _PenKey:
+    return (pen.color().rgba(), pen.widthF(), pen.style(), pen.capStyle(), pen.joinStyle(), pen.isCosmetic())
+
+
+class FrameRows:
+    """
+    Rows of a curve's points ordered by frame, for slicing segments in bulk.
+
+    Attributes:
+        rows: Row indices into the curve data, sorted by frame
+        frames: Frame number of each entry in ``rows``
+    """
+
+    def __init__(self, frames: NDArray[np.int64], include: NDArray[np.bool_] | None = None) -> None:
+        """
+        Index the rows of a curve.
+
+        Args:
+            frames: Frame number of every row of the curve data
+            include: Optional mask of rows to index (others are never returned)
+        """
+        rows = np.flatnonzero(include) if include is not None else np.arange(len(frames))
+        self.rows: IndexArray = rows[np.argsort(frames[rows], kind="stable")]
+        self.frames: NDArray[np.int64] = frames[self.rows]
+
+    def between(self, first_frame: int, last_frame: int) -> IndexArray:
+        """Get the rows with frames from ``first_frame`` to ``last_frame`` (inclusive), in frame order."""
+        start = int(np.searchsorted(self.frames, first_frame, side="left"))
+        stop = int(np.searchsorted(self.frames, last_frame, side="right"))
+        return self.rows[start:stop]
+
+
+class LineBatch:
+    """
+    Polylines grouped by pen, drawn with as few QPainter calls as possible.
+
+    Usage:
+        lines = LineBatch()
+        lines.add_polyline(active_pen, segment_points)
+        lines.add_polyline(gap_pen, gap_points)
+        lines.flush(painter)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty batch."""
+        self._pens: dict[_PenKey, QPen] = {}
+        self._polylines: dict[_PenKey, list[FloatArray]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(polylines) for polylines in self._polylines.values())
+
+    def add_polyline(self, pen: QPen, points: FloatArray) -> None:
+        """
+        Queue a polyline connecting consecutive points.
+
+        Args:
+            pen: Pen to draw with (grouped with equal pens)
+            points: Nx2 screen coordinates; fewer than two points are ignored
+        """
+        if len(points) < 2:
+            return
+        key = _pen_key(pen)
+        if key not in self._pens:
+            self._pens[key] = QPen(pen)
+            self._polylines[key] = []
+        self._polylines[key].append(points)
+
+    def flush(self, painter: QPainter) -> None:
+        """Draw all queued polylines, one drawLines() call per opaque solid pen, then clear the batch."""
+        for key, pen in self._pens.items():
+            polylines = self._polylines[key]
+            painter.setPen(pen)
+            if len(polylines) > 1 and _is_batchable(pen):
+                painter.drawLines(polygon_from_array(_line_pairs(polylines)))
+            else:
+                for polyline in polylines:
+                    painter.drawPolyline(polygon_from_array(polyline))
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all queued polylines."""
+        self._pens.clear()
+        self._polylines.clear()
+
+
+def _is_batchable(pen: QPen) -> bool:
+    """Check whether a pen can draw polylines as independent segments without visible overlaps."""
+    return pen.style() == Qt.PenStyle.SolidLine and pen.color().alpha() == 255
+
+
+def _line_pairs(polylines: list[FloatArray]) -> FloatArray:
+    """Flatten polylines into (start, end) point pairs for QPainter.drawLines()."""
+    starts = np.concatenate([polyline[:-1] for polyline in polylines])
+    ends = np.concatenate([polyline[1:] for polyline in polylines])
+    pairs = np.empty((2 * len(starts), 2), dtype=np.float64)
+    pairs[0::2] = starts
+    pairs[1::2] = ends
+    return pairs
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Batched point marker and label drawing for the curve renderer.
+
+Every marker is a filled circle, which QPainter draws as a point with a
+round-capped pen as wide as the circle. Each color and radius bucket is
+drawn with one QPainter.drawPoints() call on a QPolygonF filled in bulk
+from the screen-coordinate array, so markers keep their sub-pixel
+positions and there is no Python call per marker. State labels are cached
+as QStaticText so their glyph layout is computed once per label.
+"""
+
+from __future__ import annotations
+
+from typing import TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QColor, QFont, QFontMetricsF, QPainter, QPen, QStaticText
+
+from rendering.line_batch import polygon_from_array
+
+FloatArray: TypeAlias = NDArray[np.float64]
+
+
+def marker_pen(color: QColor, radius: float) -> QPen:
+    """
+    Get the pen that draws a point as a filled circle.
+
+    Args:
+        color: Fill color
+        radius: Circle radius in logical pixels
+
+    Returns:
+        Solid round-capped pen with a width of 2 * radius
+    """
+    pen = QPen(color, 2 * radius)
+    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+    return pen
+
+
+def draw_markers(painter: QPainter, color: QColor, radius: float, points: FloatArray) -> int:
+    """
+    Draw a filled circle centered on every point with one drawPoints() call.
+
+    Leaves the marker pen set on the painter.
+
+    Args:
+        painter: Active painter
+        color: Fill color
+        radius: Circle radius in logical pixels
+        points: Nx2 screen coordinates
+
+    Returns:
+        Number of markers drawn
+    """
+    if len(points) == 0:
+        return 0
+
+    painter.setPen(marker_pen(color, radius))
+    painter.drawPoints(polygon_from_array(np.asarray(points, dtype=np.float64)))
+    return len(points)
+
+
+class StaticLabelCache:
+    """
+    QStaticText labels for one font, laid out once and reused across frames.
+
+    QStaticText takes its color from the painter's pen when drawn, so one
+    entry serves every color of the same text.
+    """
+
+    def __init__(self, font: QFont, max_size: int = 256) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            font: Font all labels are drawn with
+            max_size: Number of labels kept before the cache is cleared
+        """
+        self.font: QFont = font
+        self._labels: dict[str, QStaticText] = {}
+        self._max_size: int = max_size
+        self._ascent: float | None = None
+
+    def label(self, text: str) -> QStaticText:
+        """Get the static text for a label, preparing its layout on first use."""
+        cached = self._labels.get(text)
+        if cached is not None:
+            return cached
+
+        if len(self._labels) >= self._max_size:
+            self._labels.clear()
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.prepare(font=self.font)
+        self._labels[text] = static_text
+        return static_text
+
+    def draw(self, painter: QPainter, x: float, baseline_y: float, text: str) -> None:
+        """
+        Draw a label with its baseline at ``baseline_y`` (like QPainter.drawText).
+
+        Args:
+            painter: Active painter; its pen sets the text color
+            x: Left edge of the text
+            baseline_y: Y of the text baseline
+            text: Label text
+        """
+        if self._ascent is None:
+            self._ascent = QFontMetricsF(self.font).ascent()
+        painter.drawStaticText(QPointF(x, baseline_y - self._ascent), self.label(text))
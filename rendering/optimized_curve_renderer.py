@@ -9,21 +9,28 @@ This renderer addresses the critical performance issues identified in the analys
 """
 # pyright: reportImportCycles=false
 
+import functools
 import time
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from enum import Enum
 from typing import TYPE_CHECKING, Any, TypeAlias
 
 import numpy as np
 from numpy.typing import NDArray
-from PySide6.QtCore import QPointF, QRectF, Qt
-from PySide6.QtGui import QBrush, QColor, QFont, QImage, QPainter, QPainterPath, QPen
+from PySide6.QtCore import QPointF, QRectF
+from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPen
 
+from core import tracing
 from core.curve_segments import CurveSegment, SegmentedCurve
-from core.defaults import GRID_CELL_SIZE, RENDER_PADDING
+from core.defaults import RENDER_PADDING
 from core.logger_utils import get_logger
-from core.models import CurvePoint
+from core.memory_budget import estimate_points_bytes, get_memory_budget
+from core.models import CurvePoint, PointStatus
+from core.screen_points import BoolArray, visible_mask
 from core.type_aliases import CurveDataList
+from rendering.line_batch import FrameRows, LineBatch, polygon_from_array
+from rendering.marker_batch import StaticLabelCache, draw_markers
+from rendering.point_decimation import decimate_with_required, required_point_mask
 from ui.color_constants import CurveColors
 
 if TYPE_CHECKING:
@@ -37,9 +44,90 @@ else:
 # NumPy array type aliases - performance critical for vectorized operations
 FloatArray: TypeAlias = NDArray[np.float64]  # np.ndarray with float64 elements
 IntArray: TypeAlias = NDArray[np.int32]  # np.ndarray with int32 elements
+# SegmentedCurve cache key: (curve name, ApplicationState data version, which points were segmented)
+SegmentKey: TypeAlias = tuple[str, int, str]
 
 logger = get_logger("optimized_curve_renderer")
 
+# Status values that end an active segment
+_ENDFRAME_STATUSES: frozenset[object] = frozenset({PointStatus.ENDFRAME, PointStatus.ENDFRAME.value})
+
+
+def _curve_frames(
+    curve_data: Sequence[tuple[int, float, float] | tuple[int, float, float, str | bool]],
+) -> NDArray[np.int64]:
+    """Get the frame number of every point as an array."""
+    return np.fromiter((pt[0] for pt in curve_data), dtype=np.int64, count=len(curve_data))
+
+
+def _curve_endframe_mask(
+    curve_data: Sequence[tuple[int, float, float] | tuple[int, float, float, str | bool]],
+) -> NDArray[np.bool_]:
+    """Get a mask of the points whose status is ENDFRAME."""
+    return np.fromiter(
+        (len(pt) > 3 and pt[3] in _ENDFRAME_STATUSES for pt in curve_data), dtype=np.bool_, count=len(curve_data)
+    )
+
+
+# Marker status buckets in draw order (later buckets are drawn on top)
+_MARKER_DRAW_ORDER: tuple[str, ...] = ("endframe", "interpolated", "normal", "tracked", "keyframe")
+_MARKER_STATUS_CODES: dict[object, int] = {status: code for code, status in enumerate(_MARKER_DRAW_ORDER)}
+_MARKER_NORMAL = _MARKER_STATUS_CODES["normal"]
+_MARKER_ENDFRAME = _MARKER_STATUS_CODES["endframe"]
+
+
+@functools.lru_cache(maxsize=64, typed=True)
+def _is_endframe_status(value: object) -> bool:
+    """Check whether a raw tuple status value means ENDFRAME (as CurvePoint.from_tuple reads it)."""
+    return PointStatus.from_legacy(value) is PointStatus.ENDFRAME  # pyright: ignore[reportArgumentType]
+
+
+def _marker_frames_and_codes(
+    curve_data: Sequence[tuple[int, float, float] | tuple[int, float, float, str | bool]],
+    original: NDArray[np.intp],
+    valid: NDArray[np.bool_],
+) -> tuple[NDArray[np.int64], NDArray[np.int8]]:
+    """
+    Get the frame and marker status bucket of the points behind some markers.
+
+    Only string statuses select a bucket; anything else counts as normal.
+    Markers without a valid original index get frame -1 and the normal bucket.
+    """
+    rows = original[valid].tolist()
+    frames = np.full(len(original), -1, dtype=np.int64)
+    codes = np.full(len(original), _MARKER_NORMAL, dtype=np.int8)
+    frames[valid] = np.fromiter((curve_data[row][0] for row in rows), dtype=np.int64, count=len(rows))
+    codes[valid] = np.fromiter(
+        (
+            _MARKER_STATUS_CODES.get(point[3], _MARKER_NORMAL) if len(point) > 3 else _MARKER_NORMAL
+            for point in (curve_data[row] for row in rows)
+        ),
+        dtype=np.int8,
+        count=len(rows),
+    )
+    return frames, codes
+
+
+def _inactive_frame_mask(segmented_curve: SegmentedCurve, frames: NDArray[np.int64]) -> NDArray[np.bool_]:
+    """
+    Mark the frames whose segment is inactive, for many frames at once.
+
+    Matches SegmentedCurve.get_segment_at_frame(): the first segment whose
+    range contains the frame decides.
+    """
+    segments = segmented_curve.segments
+    if not segments or not any(not segment.is_active for segment in segments):
+        return np.zeros(len(frames), dtype=np.bool_)
+
+    starts = np.array([segment.start_frame for segment in segments], dtype=np.int64)
+    ends = np.array([segment.end_frame for segment in segments], dtype=np.int64)
+    inactive = np.array([not segment.is_active for segment in segments], dtype=np.bool_)
+    # Segments are ordered by frame, so the first one ending at or after a frame is the only candidate
+    candidate = np.searchsorted(ends, frames, side="left")
+    found = candidate < len(segments)
+    candidate = np.minimum(candidate, len(segments) - 1)
+    return found & (starts[candidate] <= frames) & inactive[candidate]
+
 
 class RenderQuality(Enum):
     """Rendering quality levels for adaptive performance."""
@@ -50,127 +138,75 @@ class RenderQuality(Enum):
 
 
 class ViewportCuller:
-    """Efficient viewport culling with spatial indexing."""
-
-    def __init__(self):
-        self._grid_size: float = GRID_CELL_SIZE  # Grid cell size for spatial indexing
-        self._spatial_index: dict[tuple[int, int], list[int]] = {}
-
-    def update_spatial_index(self, points: FloatArray, viewport: QRectF) -> None:  # pyright: ignore[reportUnusedParameter]
-        """Update spatial index for the given points."""
-        self._spatial_index.clear()
-
-        if len(points) == 0:
-            return
-
-        # Create grid-based spatial index
-        for i, (x, y) in enumerate(points):
-            grid_x = int(x // self._grid_size)
-            grid_y = int(y // self._grid_size)
-            key = (grid_x, grid_y)
-
-            if key not in self._spatial_index:
-                self._spatial_index[key] = []
-            self._spatial_index[key].append(i)
+    """Viewport culling with a boolean mask over the screen-coordinate array."""
 
     def get_visible_points(self, points: FloatArray, viewport: QRectF, padding: float = 50) -> IntArray:
-        """Get indices of points visible in viewport using spatial indexing."""
+        """Get indices of points visible in the viewport expanded by ``padding``."""
         if len(points) == 0:
-            return np.array([], dtype=int)
-
-        # Expand viewport by padding
-        expanded = QRectF(
-            viewport.x() - padding,
-            viewport.y() - padding,
-            viewport.width() + 2 * padding,
-            viewport.height() + 2 * padding,
+            return np.array([], dtype=np.int32)
+
+        mask = visible_mask(
+            points,
+            viewport.left() - padding,
+            viewport.top() - padding,
+            viewport.right() + padding,
+            viewport.bottom() + padding,
         )
-
-        # Fast path: if we have many points, use spatial indexing
-        if len(points) > 1000:
-            return self._get_visible_points_spatial(points, expanded)
-        return self._get_visible_points_simple(points, expanded)
-
-    def _get_visible_points_spatial(self, points: FloatArray, viewport: QRectF) -> IntArray:
-        """Use spatial index for large datasets."""
-        visible: list[int] = []
-
-        # Find grid cells that intersect with viewport
-        min_grid_x = int(viewport.left() // self._grid_size) - 1
-        max_grid_x = int(viewport.right() // self._grid_size) + 1
-        min_grid_y = int(viewport.top() // self._grid_size) - 1
-        max_grid_y = int(viewport.bottom() // self._grid_size) + 1
-
-        # Check each intersecting grid cell
-        for grid_x in range(min_grid_x, max_grid_x + 1):
-            for grid_y in range(min_grid_y, max_grid_y + 1):
-                key = (grid_x, grid_y)
-                if key in self._spatial_index:
-                    for idx in self._spatial_index[key]:
-                        # Bounds check to prevent index errors
-                        if 0 <= idx < len(points):
-                            x, y = points[idx]
-                            if viewport.contains(x, y):
-                                visible.append(idx)
-
-        return np.array(visible, dtype=int)
-
-    def _get_visible_points_simple(self, points: FloatArray, viewport: QRectF) -> IntArray:
-        """Simple viewport culling for smaller datasets."""
-        if len(points) == 0:
-            return np.array([], dtype=int)
-
-        # Vectorized viewport test
-        x_coords = points[:, 0]
-        y_coords = points[:, 1]
-
-        visible_mask = (
-            (x_coords >= viewport.left())
-            & (x_coords <= viewport.right())
-            & (y_coords >= viewport.top())
-            & (y_coords <= viewport.bottom())
-        )
-
-        return np.where(visible_mask)[0].astype(np.int32)
+        return np.flatnonzero(mask).astype(np.int32)
 
 
 class LevelOfDetail:
-    """Level-of-detail system for adaptive rendering."""
+    """Level-of-detail system for adaptive rendering.
+
+    Decimates in screen space with point_decimation.decimate_min_max(), which
+    keeps the drawn shape (including spikes) instead of striding over points.
+    """
 
     def __init__(self):
         self._lod_thresholds: dict[RenderQuality, int] = {
-            RenderQuality.DRAFT: 100,  # Target ~100 points for fast rendering
-            RenderQuality.NORMAL: 1000,  # Target ~1000 points for normal quality
+            RenderQuality.DRAFT: 100,  # Decimate above ~100 points for fast rendering
+            RenderQuality.NORMAL: 1000,  # Decimate above ~1000 points for normal quality
             RenderQuality.HIGH: 1,  # Show all points for high quality
         }
+        # Pixel column width used for min/max decimation
+        self._column_widths: dict[RenderQuality, float] = {
+            RenderQuality.DRAFT: 4.0,
+            RenderQuality.NORMAL: 1.0,
+        }
 
-    def get_lod_points(
-        self, points: FloatArray, quality: RenderQuality, visible_indices: IntArray | None = None
-    ) -> tuple[FloatArray, int]:
-        """Get points for the specified level of detail."""
-        if len(points) == 0:
-            return points, 1
-
-        # Use visible indices if provided, otherwise use all points
-        working_points = points[visible_indices] if visible_indices is not None and len(visible_indices) > 0 else points
+    def should_decimate(self, count: int, quality: RenderQuality) -> bool:
+        """Check whether ``count`` points would be decimated at the given quality."""
+        return quality != RenderQuality.HIGH and count > self._lod_thresholds[quality]
 
-        threshold = self._lod_thresholds[quality]
+    def get_lod_points(
+        self,
+        points: FloatArray,
+        quality: RenderQuality,
+        visible_indices: IntArray | None = None,
+        required: BoolArray | None = None,
+    ) -> tuple[FloatArray, IntArray]:
+        """Get points for the specified level of detail.
 
-        # For high quality or small datasets, return all points
-        if quality == RenderQuality.HIGH or len(working_points) <= threshold:
-            return working_points, 1
+        Args:
+            points: Nx2 screen coordinates of the whole curve
+            quality: Render quality
+            visible_indices: Sorted indices of the points to consider (all if None or empty)
+            required: Optional mask over all N points that must be kept
+                (see point_decimation.required_point_mask())
 
-        # Calculate step size for sub-sampling to get approximately 'threshold' points
-        step = max(1, len(working_points) // threshold)
-        # If step is 1, we need to increase it to actually reduce point count
-        if step == 1:
-            step = max(2, len(working_points) // threshold + 1)
+        Returns:
+            (lod_points, lod_indices) where lod_indices are the indices into ``points``
+        """
+        if visible_indices is not None and len(visible_indices) > 0:
+            working_indices = np.asarray(visible_indices, dtype=np.intp)
+        else:
+            working_indices = np.arange(len(points), dtype=np.intp)
 
-        # Sub-sample points evenly
-        sampled_indices = np.arange(0, len(working_points), step)
-        lod_points = working_points[sampled_indices]
+        if not self.should_decimate(len(working_indices), quality):
+            return points[working_indices], working_indices
 
-        return lod_points, step
+        lod_indices = decimate_with_required(points, working_indices, self._column_widths[quality], required)
+        return points[lod_indices], lod_indices
 
 
 class VectorizedTransform:
@@ -223,57 +259,115 @@ class OptimizedCurveRenderer:
         self._fps_target: float = 30.0
         self._quality_auto_adjust: bool = True
         self._last_fps: float = 60.0
+        # Draft quality while the timeline is scrubbed, overriding the quality above
+        self._scrubbing: bool = False
 
-        # Initialize cache variables
-        self._last_point_count: int = 0
+        # Number of points that survived culling in the last single-curve render (info overlay)
+        self._last_visible_count: int = 0
 
-        # Caching
-        self._last_viewport: QRectF | None = None
-        self._cached_visible_indices: IntArray | None = None
-        self._cache_valid: bool = False
+        # State label layouts, reused across frames
+        self._state_labels: StaticLabelCache | None = None
 
-        # SegmentedCurve cache for gap rendering (keyed by object ID)
-        self._segmented_curves: dict[int, SegmentedCurve] = {}
-        self._max_segmented_cache_size: int = 10
+        # SegmentedCurve cache for gap rendering: (curve name, role) -> (data version, curve)
+        self._segmented_curves: dict[tuple[str, str], tuple[int, SegmentedCurve]] = {}
 
         logger.info("OptimizedCurveRenderer initialized with adaptive quality")
 
-    def _get_segmented_curve(self, points: list[CurvePoint]) -> SegmentedCurve:
+    @staticmethod
+    def _segment_key(render_state: "RenderState", curve_name: str | None, role: str) -> SegmentKey | None:
+        """Get the SegmentedCurve cache key of a live curve.
+
+        Args:
+            render_state: Render state carrying the curve data versions
+            curve_name: Curve whose points are segmented
+            role: Which points of the curve are segmented (e.g. "stored", "explicit", "dense")
+
+        Returns:
+            Cache key, or None if the curve has no ApplicationState data version
+        """
+        if curve_name is None or not render_state.curve_versions:
+            return None
+        version = render_state.curve_versions.get(curve_name, 0)
+        if not version:
+            return None
+        return (curve_name, version, role)
+
+    def _get_segmented_curve(self, points: list[CurvePoint], segment_key: SegmentKey | None = None) -> SegmentedCurve:
         """Get cached or create new SegmentedCurve.
 
         Performance optimization: ~5-20x speedup by caching SegmentedCurve instances.
 
+        The cache holds one entry per curve and role, valid for one data
+        version, so lookups are O(1) and do not hash the points.
+
         Args:
             points: List of CurvePoint objects
+            segment_key: Cache key from _segment_key(); without one the curve is built uncached
 
         Returns:
             Cached or newly created SegmentedCurve
         """
-        points_id = id(points)
-        if points_id in self._segmented_curves:
-            return self._segmented_curves[points_id]
+        if segment_key is None:
+            return SegmentedCurve.from_points(points)
+
+        curve_name, version, role = segment_key
+        cached = self._segmented_curves.get((curve_name, role))
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
-        # Create new
         segmented_curve = SegmentedCurve.from_points(points)
+        self._segmented_curves[(curve_name, role)] = (version, segmented_curve)
+        _ = get_memory_budget().enforce()
+        return segmented_curve
 
-        # Add to cache with LRU eviction
-        if len(self._segmented_curves) >= self._max_segmented_cache_size:
-            first_key = next(iter(self._segmented_curves))
-            del self._segmented_curves[first_key]
+    def evict_removed_curves(self, curve_names: Collection[str]) -> None:
+        """Drop cached SegmentedCurves of curves that are no longer rendered.
 
-        self._segmented_curves[points_id] = segmented_curve
-        return segmented_curve
+        Args:
+            curve_names: Curves that are still live
+        """
+        stale = [key for key in self._segmented_curves if key[0] not in curve_names]
+        for key in stale:
+            del self._segmented_curves[key]
 
     def clear_segmented_curve_cache(self) -> None:
         """Clear all cached SegmentedCurve instances."""
         self._segmented_curves.clear()
 
+    def memory_usage_bytes(self) -> int:
+        """Get the estimated bytes held by cached SegmentedCurves (memory budget)."""
+        return sum(estimate_points_bytes(len(curve.all_points)) for _, curve in self._segmented_curves.values())
+
+    def evict_bytes(self, target_bytes: int) -> int:
+        """Evict cached SegmentedCurves, oldest first, for the memory budget.
+
+        Args:
+            target_bytes: Bytes to free
+
+        Returns:
+            Estimated bytes freed
+        """
+        freed = 0
+        while self._segmented_curves and freed < target_bytes:
+            _, curve = self._segmented_curves.pop(next(iter(self._segmented_curves)))
+            freed += estimate_points_bytes(len(curve.all_points))
+        return freed
+
     def set_render_quality(self, quality: RenderQuality) -> None:
         """Set the rendering quality level."""
         self._render_quality = quality
         self._quality_auto_adjust = False
         logger.info(f"Render quality set to {quality.value}")
 
+    def set_scrubbing(self, scrubbing: bool) -> None:
+        """Render at draft quality while the timeline is scrubbed; the previous quality resumes after."""
+        self._scrubbing = scrubbing
+
+    @property
+    def effective_quality(self) -> RenderQuality:
+        """Get the quality used for rendering (draft while scrubbing)."""
+        return RenderQuality.DRAFT if self._scrubbing else self._render_quality
+
     def enable_auto_quality(self, target_fps: float = 30.0) -> None:
         """Enable automatic quality adjustment based on performance."""
         self._quality_auto_adjust = True
@@ -361,12 +455,12 @@ class OptimizedCurveRenderer:
             return transform_service.create_transform_from_view_state(view_state)
         except Exception as e:
             logger.warning(f"Failed to create transform from render state: {e}")
-            # Return a simple mock transform if creation fails
-            from types import SimpleNamespace
+            # Fall back to plain zoom scaling if creation fails
+            from services.transform_service import Transform
 
-            return SimpleNamespace(
-                data_to_screen=lambda x, y: (x * render_state.zoom_factor, y * render_state.zoom_factor)
-            )  # pyright: ignore[reportReturnType]
+            return Transform(
+                scale=render_state.zoom_factor, center_offset_x=0.0, center_offset_y=0.0, scale_to_image=False
+            )
 
     def render(self, painter: QPainter, _event: object | None, render_state: "RenderState") -> None:
         """Render complete curve view with optimized performance."""
@@ -378,46 +472,52 @@ class OptimizedCurveRenderer:
             logger.warning("No visual settings in RenderState - skipping render")
             return
 
-        # Auto-adjust quality based on performance
-        if self._quality_auto_adjust:
+        # Auto-adjust quality based on performance (scrub frame times would skew it)
+        if self._quality_auto_adjust and not self._scrubbing:
             self._adjust_quality_for_performance()
 
-        # Save painter state
-        painter.save()
-
-        try:
-            # Render background if available
-            show_bg = render_state.show_background
-            bg_img = render_state.background_image
-            if show_bg and bg_img:
-                self._render_background_optimized(painter, render_state)
-
-            # Render grid if needed
-            if render_state.visual.show_grid:
-                self._render_grid_optimized(painter, render_state)
-
-            # Check if render_state supports multi-curve rendering
-            from core.display_mode import DisplayMode
-
-            has_multi_curve = render_state.curves_data is not None
-            is_multi_curve_mode = render_state.display_mode in (DisplayMode.ALL_VISIBLE, DisplayMode.SELECTED)
-
-            if has_multi_curve and render_state.curves_data and is_multi_curve_mode:
-                # Render multiple curves (all visible or selected based on display mode)
-                self._render_multiple_curves(painter, render_state)
-            # Render single curve with advanced optimizations (backward compatibility)
-            elif render_state.points:
-                self._render_points_ultra_optimized(painter, render_state)
+        with tracing.span("render", "render"):
+            # Save painter state
+            painter.save()
 
-            # Render info overlay (skip in test environments due to text rendering issues)
-            import os
-
-            if os.getenv("PYTEST_CURRENT_TEST") is None:
-                self._render_info_optimized(painter, render_state)
-
-        finally:
-            # Restore painter state
-            painter.restore()
+            try:
+                # Render background if available
+                show_bg = render_state.show_background
+                bg_img = render_state.background_image
+                if show_bg and bg_img:
+                    with tracing.span("render.background", "render"):
+                        self._render_background_optimized(painter, render_state)
+
+                # Render grid if needed
+                if render_state.visual.show_grid:
+                    with tracing.span("render.grid", "render"):
+                        self._render_grid_optimized(painter, render_state)
+
+                # Check if render_state supports multi-curve rendering
+                from core.display_mode import DisplayMode
+
+                has_multi_curve = render_state.curves_data is not None
+                is_multi_curve_mode = render_state.display_mode in (DisplayMode.ALL_VISIBLE, DisplayMode.SELECTED)
+
+                if has_multi_curve and render_state.curves_data and is_multi_curve_mode:
+                    # Render multiple curves (all visible or selected based on display mode)
+                    with tracing.span("render.curves", "render"):
+                        self._render_multiple_curves(painter, render_state)
+                # Render single curve with advanced optimizations (backward compatibility)
+                elif render_state.points:
+                    with tracing.span("render.single_curve", "render"):
+                        self._render_points_ultra_optimized(painter, render_state)
+
+                # Render info overlay (skip in test environments due to text rendering issues)
+                import os
+
+                if render_state.show_info and os.getenv("PYTEST_CURRENT_TEST") is None:
+                    with tracing.span("render.info", "render"):
+                        self._render_info_optimized(painter, render_state)
+
+            finally:
+                # Restore painter state
+                painter.restore()
 
         # Update performance metrics
         render_time = time.perf_counter() - start_time
@@ -466,82 +566,42 @@ class OptimizedCurveRenderer:
 
         # Get viewport for culling
         viewport = QRectF(0, 0, render_state.widget_width, render_state.widget_height)
+        transform = self._create_transform_from_render_state(render_state)
 
-        # Check if viewport or point count changed
-        viewport_changed = self._last_viewport != viewport
-        point_count_changed = self._last_point_count != len(point_data)
-
-        if viewport_changed or point_count_changed:
-            self._last_viewport = viewport
-            self._last_point_count = len(point_data)
-            self._cache_valid = False
-
-            # Initialize point count if not set
-            # Initialize cache if not present - _last_point_count is always initialized in __init__
-            # This check is redundant but kept for defensive programming
-
-            # Transform all points using the Transform service for consistency with background
-            transform = self._create_transform_from_render_state(render_state)
-            # Transform each point through the same pipeline as background
-            screen_points = np.zeros((len(point_data), 2))
-            for i, point in enumerate(point_data):
-                x, y = transform.data_to_screen(point[1], point[2])
-                screen_points[i] = [x, y]
-        else:
-            # Fallback to old method if transform not available
-            zoom = render_state.zoom_factor
-
-            # Calculate center offset (like in Transform)
-            image_width = render_state.image_width
-            image_height = render_state.image_height
-            scaled_width = image_width * zoom
-            scaled_height = image_height * zoom
-            center_x = (render_state.widget_width - scaled_width) / 2
-            center_y = (render_state.widget_height - scaled_height) / 2
-
-            # Calculate total offsets (center + pan + manual)
-            offset_x = center_x + render_state.pan_offset_x + render_state.manual_offset_x
-            offset_y = center_y + render_state.pan_offset_y + render_state.manual_offset_y
-
-            screen_points = VectorizedTransform.transform_points_batch(
-                point_data,
-                zoom,
-                offset_x,
-                offset_y,
-                render_state.flip_y_axis,
-                render_state.widget_height,
-            )
+        # Reuse the widget's cached screen positions when they were built for this curve and view;
+        # the cache holds every point, so it does not apply when filtering to the current frame
+        shared = render_state.screen_points
+        screen_points: FloatArray | None = None
+        if shared is not None and not render_state.show_current_point_only:
+            screen_points = shared.get(render_state.active_curve_name, transform, len(point_data))
 
         # Viewport culling - get visible points
-        if not self._cache_valid or viewport_changed or point_count_changed:
-            self._cached_visible_indices = self._viewport_culler.get_visible_points(
-                screen_points, viewport, padding=RENDER_PADDING
+        if shared is not None and screen_points is not None:
+            visible_indices = shared.visible_indices(
+                -RENDER_PADDING, -RENDER_PADDING, viewport.width() + RENDER_PADDING, viewport.height() + RENDER_PADDING
             )
-            self._cache_valid = True
-
-        visible_indices = self._cached_visible_indices
+        else:
+            screen_points = transform.batch_data_to_screen(point_data)
+            visible_indices = self._viewport_culler.get_visible_points(screen_points, viewport, padding=RENDER_PADDING)
+        self._last_visible_count = len(visible_indices)
 
         # Early exit if no points are visible
-        if visible_indices is None or len(visible_indices) == 0:
+        if len(visible_indices) == 0:
             logger.warning(f"No visible points after culling! Total points: {len(screen_points)}, Viewport: {viewport}")
             if len(screen_points) > 0:
                 logger.warning(f"Sample screen points: {screen_points[:3]}")
             return
 
-        # Validate indices are within bounds
-        max_index = len(screen_points) - 1
-        if max_index >= 0:
-            # At this point visible_indices is guaranteed to not be None due to check above
-            assert visible_indices is not None
-            visible_indices = visible_indices[visible_indices <= max_index]
-
-        # Apply level of detail
-        visible_screen_points = screen_points[visible_indices]
-        lod_points, step = self._lod_system.get_lod_points(visible_screen_points, self._render_quality, None)
-
         # Get curve data for status checking
         curve_data = render_state.points
 
+        # Apply level of detail; keyframes, endframes, selected and current-frame points always survive
+        required: BoolArray | None = None
+        quality = self.effective_quality
+        if self._lod_system.should_decimate(len(visible_indices), quality):
+            required = required_point_mask(points, render_state.selected_points, render_state.current_frame)
+        lod_points, lod_indices = self._lod_system.get_lod_points(screen_points, quality, visible_indices, required)
+
         # Render lines using unified method that respects segments and LOD
         # Check ALL points to ensure we detect endframes anywhere in curve
         has_status = any(len(pt) > 3 for pt in curve_data if pt)
@@ -554,6 +614,7 @@ class OptimizedCurveRenderer:
                 screen_points=screen_points,
                 curve_color=None,  # Use default white
                 line_width=2,
+                segment_key=self._segment_key(render_state, render_state.active_curve_name, "explicit"),
             )
         else:
             # Use LOD points for simple rendering (performance optimization for legacy data)
@@ -567,20 +628,20 @@ class OptimizedCurveRenderer:
             )
 
         # Render points with batching
-        self._render_point_markers_optimized(painter, render_state, lod_points, visible_indices, step)
+        self._render_point_markers_optimized(painter, render_state, lod_points, lod_indices, 1)
 
         # Render state labels for selected points and current frame
         if has_status:
-            self._render_point_state_labels(painter, render_state, lod_points, visible_indices, curve_data)
+            self._render_point_state_labels(painter, render_state, lod_points, lod_indices, curve_data)
 
         # Render frame numbers if enabled (with heavy culling)
         # Note: show_all_frame_numbers is an optional future feature - not in current RenderState
         # Future enhancement: Add show_all_frame_numbers to RenderState for debug visualization
         # if render_state.show_all_frame_numbers and self._render_quality == RenderQuality.HIGH:
-        #     self._render_frame_numbers_optimized(painter, render_state, lod_points, visible_indices, step)
+        #     self._render_frame_numbers_optimized(painter, render_state, lod_points, lod_indices, 1)
 
     def _render_lines_optimized(self, painter: QPainter, screen_points: FloatArray, _step: int) -> None:
-        """Render lines between points using optimized QPainterPath."""
+        """Render lines between points with a single bulk polyline."""
         if len(screen_points) < 2:
             return
 
@@ -588,20 +649,8 @@ class OptimizedCurveRenderer:
         pen = CurveColors.get_active_pen()
         painter.setPen(pen)
 
-        # Use QPainterPath for batch line drawing
-        line_path = QPainterPath()
-
-        # Start path at first point
-        first_point = screen_points[0]
-        line_path.moveTo(first_point[0], first_point[1])
-
-        # Add lines to remaining points
-        for i in range(1, len(screen_points)):
-            point = screen_points[i]
-            line_path.lineTo(point[0], point[1])
-
         # Draw all lines at once
-        painter.drawPath(line_path)
+        painter.drawPolyline(polygon_from_array(screen_points))
 
     def _render_segmented_lines(
         self,
@@ -633,110 +682,81 @@ class OptimizedCurveRenderer:
         active_pen = CurveColors.get_active_pen()
         inactive_pen = CurveColors.get_inactive_pen()
 
-        # Create frame-to-index mapping for O(1) lookups
-        frame_to_index = {pt[0]: i for i, pt in enumerate(curve_data)}
+        # Frame-sorted rows for slicing segments out of the screen array
+        frame_rows = FrameRows(_curve_frames(curve_data))
+        is_endframe = _curve_endframe_mask(curve_data)
 
-        # Draw each segment separately
+        # Queue each segment, then draw every pen group at once
+        lines = LineBatch()
         for segment in segmented_curve.segments:
             if segment.point_count == 0:
                 continue
 
             if segment.is_active:
-                # Draw active segments with regular line connections
-                self._draw_active_segment(painter, segment, screen_points, frame_to_index, active_pen)
+                self._draw_active_segment(lines, segment, screen_points, frame_rows, active_pen, is_endframe)
             else:
-                # Draw inactive segments as held position gaps
-                self._draw_gap_segment(painter, segment, segmented_curve, screen_points, frame_to_index, inactive_pen)
+                self._draw_gap_segment(lines, segment, segmented_curve, screen_points, frame_rows, inactive_pen)
+        lines.flush(painter)
 
     def _draw_active_segment(
         self,
-        painter: QPainter,
+        lines: LineBatch,
         segment: "CurveSegment",
         screen_points: FloatArray,
-        frame_to_index: dict[int, int],
+        frame_rows: FrameRows,
         pen: QPen,
+        is_endframe: NDArray[np.bool_] | None = None,
     ) -> None:
-        """Draw an active segment with normal line connections.
+        """Queue an active segment with normal line connections.
 
         Args:
-            painter: Qt painter for drawing
+            lines: Line batch to add the segment to
             segment: The active segment to draw
             screen_points: Array of screen coordinates
-            frame_to_index: Mapping from frame numbers to indices
+            frame_rows: Frame-sorted rows of the curve data
             pen: Pen to use for drawing
+            is_endframe: Per-row ENDFRAME mask of the curve data
         """
         if segment.point_count < 2:
             return
 
-        painter.setPen(pen)
-        segment_path = QPainterPath()
-
-        # Find screen points for this segment
-        first_in_segment = True
-        for point in segment.points:
-            # Find this point's index in the original data (O(1) lookup)
-            point_idx = frame_to_index.get(point.frame, -1)
-
-            if point_idx >= 0 and point_idx < len(screen_points):
-                screen_pos = screen_points[point_idx]
-                if first_in_segment:
-                    segment_path.moveTo(screen_pos[0], screen_pos[1])
-                    first_in_segment = False
-                # Don't connect to ENDFRAME points
-                elif not point.is_endframe:
-                    segment_path.lineTo(screen_pos[0], screen_pos[1])
-
-        painter.drawPath(segment_path)
+        rows = frame_rows.between(segment.start_frame, segment.end_frame)
+        rows = rows[rows < len(screen_points)]
+        if is_endframe is not None and len(rows) > 1:
+            # Don't connect to ENDFRAME points (the first point still starts the line)
+            keep = ~is_endframe[rows]
+            keep[0] = True
+            rows = rows[keep]
+        lines.add_polyline(pen, screen_points[rows])
 
     def _draw_gap_segment(
         self,
-        painter: QPainter,
+        lines: LineBatch,
         segment: "CurveSegment",
         _segmented_curve: "SegmentedCurve",
         screen_points: FloatArray,
-        frame_to_index: dict[int, int],
+        frame_rows: FrameRows,
         pen: QPen,
     ) -> None:
-        """Draw an inactive segment with dashed lines following actual tracked positions.
+        """Queue an inactive segment as dashed lines following actual tracked positions.
 
         Shows dashed lines connecting the tracked points in the inactive segment,
         visualizing the tracked data that is held but not active.
 
         Args:
-            painter: Qt painter for drawing
+            lines: Line batch to add the segment to
             segment: The inactive segment to draw
             segmented_curve: The complete segmented curve for context
             screen_points: Array of screen coordinates
-            frame_to_index: Mapping from frame numbers to indices
+            frame_rows: Frame-sorted rows of the curve data
             pen: Pen to use for drawing (should be dashed)
         """
         # Only draw if we have at least 2 points (need 2 points to draw a line)
         if segment.point_count < 2:
             return
 
-        painter.setPen(pen)
-
-        # Draw dashed lines connecting the actual tracked points in the segment
-        gap_path = QPainterPath()
-        first_point = True
-
-        for point in segment.points:
-            # Get the screen position for this point
-            point_idx = frame_to_index.get(point.frame, -1)
-
-            if point_idx >= 0 and point_idx < len(screen_points):
-                screen_x = screen_points[point_idx][0]
-                screen_y = screen_points[point_idx][1]
-
-                if first_point:
-                    gap_path.moveTo(screen_x, screen_y)
-                    first_point = False
-                else:
-                    gap_path.lineTo(screen_x, screen_y)
-
-        # Draw the dashed path
-        if not first_point:  # Only draw if we had at least one valid point
-            painter.drawPath(gap_path)
+        rows = frame_rows.between(segment.start_frame, segment.end_frame)
+        lines.add_polyline(pen, screen_points[rows[rows < len(screen_points)]])
 
     def _render_lines_with_segments(
         self,
@@ -748,6 +768,8 @@ class OptimizedCurveRenderer:
         screen_points: FloatArray,
         curve_color: QColor | None = None,
         line_width: int = 2,
+        lines: LineBatch | None = None,
+        segment_key: SegmentKey | None = None,
     ) -> None:
         """Unified line rendering with optional segment support for gaps.
 
@@ -762,6 +784,9 @@ class OptimizedCurveRenderer:
             screen_points: Transformed screen coordinates
             curve_color: Color for the lines (default white)
             line_width: Width of the lines (default 2)
+            lines: Line batch shared across curves; drawn by the caller. When None
+                the lines are drawn before returning.
+            segment_key: SegmentedCurve cache key of the curve's explicit points
         """
         if len(screen_points) < 2 or len(curve_data) < 2:
             return
@@ -777,11 +802,11 @@ class OptimizedCurveRenderer:
         if has_status:
             # Render with segment awareness (gaps at ENDFRAME points)
             self._render_lines_segmented_aware(
-                painter, render_state, curve_data, screen_points, curve_color, line_width
+                painter, render_state, curve_data, screen_points, curve_color, line_width, lines, segment_key
             )
         else:
             # Render simple continuous lines
-            self._render_lines_simple(painter, screen_points, curve_color, line_width)
+            self._render_lines_simple(painter, screen_points, curve_color, line_width, lines)
 
     def _render_lines_segmented_aware(
         self,
@@ -793,33 +818,40 @@ class OptimizedCurveRenderer:
         screen_points: FloatArray,
         curve_color: QColor,
         line_width: int,
+        lines: LineBatch | None = None,
+        segment_key: SegmentKey | None = None,
     ) -> None:
         """Render lines with segment awareness for gaps at ENDFRAME points."""
         # Create SegmentedCurve from EXPLICIT points only (exclude INTERPOLATED frames)
         # This ensures correct segment detection based on explicit ENDFRAME/KEYFRAME points
         # Densified data includes interpolated frames which would create incorrect segments
-        explicit_points = [CurvePoint.from_tuple(pt) for pt in curve_data if len(pt) > 3 and pt[3] != "INTERPOLATED"]
-        segmented_curve = self._get_segmented_curve(explicit_points)
-
+        is_explicit = np.fromiter(
+            (len(pt) > 3 and pt[3] != "INTERPOLATED" for pt in curve_data), dtype=np.bool_, count=len(curve_data)
+        )
+        explicit_points = [CurvePoint.from_tuple(curve_data[row]) for row in np.flatnonzero(is_explicit).tolist()]
+        segmented_curve = self._get_segmented_curve(explicit_points, segment_key)
 
         # Set line styles for different segment types
         active_pen = CurveColors.get_active_pen(color=curve_color, width=line_width)
         inactive_pen = CurveColors.get_inactive_pen(width=max(1, line_width - 1))
 
-        # Create frame-to-index mapping for O(1) lookups
-        frame_to_index = {pt[0]: i for i, pt in enumerate(curve_data)}
+        # Frame-sorted explicit rows for slicing segments out of the screen array
+        frame_rows = FrameRows(_curve_frames(curve_data), is_explicit)
+        is_endframe = _curve_endframe_mask(curve_data)
 
-        # Draw each segment separately
+        # Queue each segment; pens shared with other segments (and curves) draw in one call
+        batch = lines if lines is not None else LineBatch()
         for segment in segmented_curve.segments:
             if segment.point_count == 0:
                 continue
 
             if segment.is_active:
-                # Draw active segments with regular line connections
-                self._draw_active_segment(painter, segment, screen_points, frame_to_index, active_pen)
+                self._draw_active_segment(batch, segment, screen_points, frame_rows, active_pen, is_endframe)
             else:
-                # Draw inactive segments as held position gaps
-                self._draw_gap_segment(painter, segment, segmented_curve, screen_points, frame_to_index, inactive_pen)
+                self._draw_gap_segment(batch, segment, segmented_curve, screen_points, frame_rows, inactive_pen)
+
+        if lines is None:
+            batch.flush(painter)
 
     def _render_lines_simple(
         self,
@@ -827,26 +859,19 @@ class OptimizedCurveRenderer:
         screen_points: FloatArray,
         curve_color: QColor,
         line_width: int,
+        lines: LineBatch | None = None,
     ) -> None:
         """Render simple continuous lines between all points."""
         pen = QPen(curve_color)
         pen.setWidth(line_width)
-        painter.setPen(pen)
-
-        # Use QPainterPath for batch line drawing
-        line_path = QPainterPath()
-
-        # Start path at first point
-        first_point = screen_points[0]
-        line_path.moveTo(first_point[0], first_point[1])
 
-        # Add lines to remaining points
-        for i in range(1, len(screen_points)):
-            point = screen_points[i]
-            line_path.lineTo(point[0], point[1])
+        if lines is not None:
+            lines.add_polyline(pen, screen_points)
+            return
 
         # Draw all lines at once
-        painter.drawPath(line_path)
+        painter.setPen(pen)
+        painter.drawPolyline(polygon_from_array(screen_points))
 
     def _render_points_with_status(
         self,
@@ -861,6 +886,8 @@ class OptimizedCurveRenderer:
         base_point_radius: float | None = None,
         curve_color: QColor | None = None,
         is_active_curve: bool = True,
+        selected_points: set[int] | None = None,
+        segment_key: SegmentKey | None = None,
     ) -> None:
         """Unified point rendering with status, selection, and current frame highlighting.
 
@@ -874,6 +901,8 @@ class OptimizedCurveRenderer:
             base_point_radius: Override point radius (uses curve_view.point_radius if None)
             curve_color: Base color for the curve (used for inactive curves)
             is_active_curve: Whether this is the active curve
+            selected_points: Selected indices into points_data (uses render_state.selected_points if None)
+            segment_key: SegmentedCurve cache key of points_data
         """
         if len(screen_points) == 0:
             return
@@ -887,124 +916,84 @@ class OptimizedCurveRenderer:
         base_radius = base_point_radius if base_point_radius is not None else render_state.visual.point_radius
         # Scale radius based on zoom for visual consistency
         point_radius = self._calculate_scaled_point_radius(base_radius, render_state.zoom_factor)
-        selected_points = render_state.selected_points
+        if selected_points is None:
+            selected_points = render_state.selected_points
 
         # Get current frame directly from render_state
         current_frame = render_state.current_frame
 
-        # Import PointStatus for status checking
-        from core.models import PointStatus
-
         # Create SegmentedCurve to check for inactive segments
-        # Only create if we have status information
+        # Only endframes start gaps, so curves without one cannot have inactive segments
         # Check ALL points, not just first 100, to ensure we detect endframes anywhere in curve
         segmented_curve = None
-        has_status = any(len(pt) > 3 for pt in points_data if pt)
-        if has_status:
+        has_endframe = any(len(pt) > 3 and _is_endframe_status(pt[3]) for pt in points_data if pt)
+        if has_endframe:
             points = [CurvePoint.from_tuple(pt) for pt in points_data]
-            segmented_curve = self._get_segmented_curve(points)
-
-        # Batch points by state for efficient rendering
-        points_by_status: dict[str, list[Any]] = {
-            "normal": [],
-            "keyframe": [],
-            "tracked": [],
-            "interpolated": [],
-            "endframe": [],
-        }
-        selected_points_list: list[Any] = []
-        current_frame_points: list[Any] = []
+            segmented_curve = self._get_segmented_curve(points, segment_key)
+
+        # Map screen points back to original indices (accounting for LOD step); -1 for unmapped
+        count = len(screen_points)
+        if visible_indices is not None:
+            positions = np.arange(count) * step
+            in_range = positions < len(visible_indices)
+            original = np.full(count, -1, dtype=np.intp)
+            original[in_range] = np.asarray(visible_indices)[positions[in_range]]
+        else:
+            # Direct mapping when no LOD is used
+            original = np.arange(count, dtype=np.intp)
+        valid = (original >= 0) & (original < len(points_data))
 
-        for i, screen_pos in enumerate(screen_points):
-            # Map back to original index (accounting for LOD step)
-            if visible_indices is not None:
-                original_idx = visible_indices[i * step] if i * step < len(visible_indices) else -1
-            else:
-                # Direct mapping when no LOD is used
-                original_idx = i
-
-            # Check if this point is on the current frame
-            is_current_frame = False
-            status = "normal"  # Default status
-            frame = -1  # Initialize frame
-
-            if 0 <= original_idx < len(points_data):
-                point_data = points_data[original_idx]
-                # Extract frame from point tuple (frame is first element)
-                if len(point_data) >= 3:
-                    frame = point_data[0]
-                    is_current_frame = frame == current_frame
-
-                    # Check for status (4th element if present)
-                    if len(point_data) > 3:
-                        status_value = point_data[3]
-                        if isinstance(status_value, str):
-                            # Map string status to our categories
-                            if status_value == PointStatus.KEYFRAME.value:
-                                status = "keyframe"
-                            elif status_value == PointStatus.TRACKED.value:
-                                status = "tracked"
-                            elif status_value == PointStatus.INTERPOLATED.value:
-                                status = "interpolated"
-                            elif status_value == PointStatus.ENDFRAME.value:
-                                status = "endframe"
-
-            # Skip rendering points in inactive segments EXCEPT endframes
-            # (endframes are gap boundaries and must always be visible)
-            if segmented_curve and frame != -1 and status != "endframe":
-                segment = segmented_curve.get_segment_at_frame(frame)
-                if segment and not segment.is_active:
-                    continue  # Don't render non-endframe points in inactive gap segments
-
-            if is_current_frame:
-                current_frame_points.append(screen_pos)
-            elif original_idx in selected_points:
-                selected_points_list.append(screen_pos)
-            else:
-                points_by_status[status].append(screen_pos)
+        frames, codes = _marker_frames_and_codes(points_data, original, valid)
 
-        # Set painter for point drawing
-        painter.setPen(Qt.PenStyle.NoPen)
+        # Classify every marker at once: current frame wins over selection, selection over status
+        is_current_frame = valid & (frames == current_frame)
+        is_selected = ~is_current_frame & np.isin(original, np.fromiter(selected_points, dtype=np.intp))
+        by_status = ~is_current_frame & ~is_selected
+
+        # Skip rendering points in inactive segments EXCEPT endframes
+        # (endframes are gap boundaries and must always be visible)
+        if segmented_curve:
+            hidden = valid & (codes != _MARKER_ENDFRAME) & _inactive_frame_mask(segmented_curve, frames)
+            is_current_frame &= ~hidden
+            is_selected &= ~hidden
+            by_status &= ~hidden
 
         # Import centralized colors
         from ui.color_manager import SPECIAL_COLORS, get_status_color
 
         # Draw points in order: endframe, interpolated, normal, tracked, keyframe
         # (so more important statuses appear on top)
-        draw_order = ["endframe", "interpolated", "normal", "tracked", "keyframe"]
-
-        for status in draw_order:
-            if points_by_status[status]:
-                if is_active_curve or status != "normal":
-                    # Use status color for active curves or special statuses
-                    color = get_status_color(status)
-                else:
-                    # Use base curve color for normal points on inactive curves
-                    color = curve_color.name() if curve_color else get_status_color(status)
-
-                painter.setBrush(QBrush(QColor(color)))
-                for pos in points_by_status[status]:
-                    painter.drawEllipse(QPointF(pos[0], pos[1]), point_radius, point_radius)
+        for code, status in enumerate(_MARKER_DRAW_ORDER):
+            bucket = by_status & (codes == code)
+            if not bucket.any():
+                continue
+            if is_active_curve or status != "normal":
+                # Use status color for active curves or special statuses
+                color = get_status_color(status)
+            else:
+                # Use base curve color for normal points on inactive curves
+                color = curve_color.name() if curve_color else get_status_color(status)
+            _ = draw_markers(painter, QColor(color), point_radius, screen_points[bucket])
 
         # Draw selected points on top with larger radius (use visual.selected_point_radius directly)
-        if selected_points_list:
-            painter.setBrush(QBrush(QColor(SPECIAL_COLORS["selected_point"])))
+        if is_selected.any():
             # Use visual.selected_point_radius, scaled by zoom for consistency
             selected_radius = self._calculate_scaled_point_radius(
                 render_state.visual.selected_point_radius, render_state.zoom_factor
             )
-            for pos in selected_points_list:
-                painter.drawEllipse(QPointF(pos[0], pos[1]), selected_radius, selected_radius)
+            _ = draw_markers(
+                painter, QColor(SPECIAL_COLORS["selected_point"]), selected_radius, screen_points[is_selected]
+            )
 
         # Draw current frame points with purple color and larger radius
-        if current_frame_points:
-            painter.setBrush(QBrush(QColor(SPECIAL_COLORS["current_frame"])))  # Magenta for current frame
+        if is_current_frame.any():
             # Current frame uses selected_point_radius + 1 for visual hierarchy
             current_frame_radius = self._calculate_scaled_point_radius(
                 render_state.visual.selected_point_radius + 1, render_state.zoom_factor
             )
-            for pos in current_frame_points:
-                painter.drawEllipse(QPointF(pos[0], pos[1]), current_frame_radius, current_frame_radius)
+            _ = draw_markers(
+                painter, QColor(SPECIAL_COLORS["current_frame"]), current_frame_radius, screen_points[is_current_frame]
+            )
 
     def _render_point_markers_optimized(
         self,
@@ -1023,6 +1012,7 @@ class OptimizedCurveRenderer:
             points_data=render_state.points,
             visible_indices=visible_indices,
             step=step,
+            segment_key=self._segment_key(render_state, render_state.active_curve_name, "stored"),
         )
 
     def _render_frame_numbers_optimized(
@@ -1084,12 +1074,21 @@ class OptimizedCurveRenderer:
         # Get current frame directly from render_state
         current_frame = render_state.current_frame
 
-        # Convert to CurvePoints for status checking
-        points_list = [CurvePoint.from_tuple(pt) for pt in curve_data]
+        count = min(len(screen_points), len(visible_indices))
+        original = np.asarray(visible_indices[:count], dtype=np.intp)
+        valid = (original >= 0) & (original < len(curve_data))
+        frames, _ = _marker_frames_and_codes(curve_data, original, valid)
+        show_label = valid & (
+            np.isin(original, np.fromiter(selected_points, dtype=np.intp)) | (frames == current_frame)
+        )
+        if not show_label.any():
+            return
 
-        # Set up text rendering
-        font = QFont("Arial", 9, QFont.Weight.Bold)
-        painter.setFont(font)
+        # Set up text rendering; label layouts are cached across frames
+        if self._state_labels is None:
+            self._state_labels = StaticLabelCache(QFont("Arial", 9, QFont.Weight.Bold))
+        labels = self._state_labels
+        painter.setFont(labels.font)
 
         # Import centralized colors for state labels
         from ui.color_manager import get_status_color
@@ -1104,31 +1103,29 @@ class OptimizedCurveRenderer:
         # Startframe uses keyframe color
         state_colors["startframe"] = state_colors["keyframe"]
 
-        for i, screen_pos in enumerate(screen_points):
-            # Map to original index
-            original_idx = visible_indices[i] if i < len(visible_indices) else -1
-
-            if 0 <= original_idx < len(points_list):
-                point = points_list[original_idx]
-
-                # Only show label for selected or current frame points
-                show_label = original_idx in selected_points or point.frame == current_frame
-
-                if show_label:
-                    # Get contextual label
-                    prev_point = points_list[original_idx - 1] if original_idx > 0 else None
-                    label = point.get_contextual_status_label(prev_point)
-
-                    # Set color based on status
-                    color = state_colors.get(label, state_colors["normal"])
-                    painter.setPen(QPen(color))
-
-                    # Draw label offset from point
-                    label_x = int(screen_pos[0] + 15)
-                    label_y = int(screen_pos[1] + 5)
-                    painter.drawText(label_x, label_y, label.upper())
-
-    def _densify_curve_for_rendering(self, curve_data: CurveDataList) -> CurveDataList:
+        current_color: QColor | None = None
+        for i in np.flatnonzero(show_label).tolist():
+            original_idx = int(original[i])
+            point = CurvePoint.from_tuple(curve_data[original_idx])
+
+            # Get contextual label
+            prev_point = CurvePoint.from_tuple(curve_data[original_idx - 1]) if original_idx > 0 else None
+            label = point.get_contextual_status_label(prev_point)
+
+            # Set color based on status
+            color = state_colors.get(label, state_colors["normal"])
+            if color is not current_color:
+                painter.setPen(QPen(color))
+                current_color = color
+
+            # Draw label offset from point
+            label_x = int(screen_points[i][0] + 15)
+            label_y = int(screen_points[i][1] + 5)
+            labels.draw(painter, label_x, label_y, label.upper())
+
+    def _densify_curve_for_rendering(
+        self, curve_data: CurveDataList, curve_name: str | None = None, segment_key: SegmentKey | None = None
+    ) -> CurveDataList:
         """
         Fill in interpolated frames for active segments to enable continuous line rendering.
 
@@ -1138,6 +1135,9 @@ class OptimizedCurveRenderer:
 
         Args:
             curve_data: Sparse curve data (may have gaps in active segments)
+            curve_name: ApplicationState curve that curve_data is the live data of, for
+                version-keyed position lookups
+            segment_key: SegmentedCurve cache key of curve_data
 
         Returns:
             Dense curve data with all frames in active segments filled in
@@ -1171,7 +1171,7 @@ class OptimizedCurveRenderer:
             return curve_data
 
         # Create segmented curve to identify active segments
-        segmented_curve = self._get_segmented_curve(points)
+        segmented_curve = self._get_segmented_curve(points, segment_key)
 
         # Build densified data by filling in all frames in active segments
         data_service = get_data_service()
@@ -1188,7 +1188,7 @@ class OptimizedCurveRenderer:
 
             if existing_point:
                 # Always include explicit points (even in gap segments)
-                position = data_service.get_position_at_frame(curve_data, frame)
+                position = data_service.get_position_at_frame(curve_data, frame, curve_name)
                 if position is None:
                     continue
                 x, y = position
@@ -1196,7 +1196,7 @@ class OptimizedCurveRenderer:
                 densified.append((frame, x, y, status_str))
             elif segment and segment.is_active:
                 # Interpolate frames only in active segments
-                position = data_service.get_position_at_frame(curve_data, frame)
+                position = data_service.get_position_at_frame(curve_data, frame, curve_name)
                 if position is None:
                     continue
                 x, y = position
@@ -1233,8 +1233,18 @@ class OptimizedCurveRenderer:
         selected_curves_ordered = render_state.selected_curves_ordered or []
         visible_curves = render_state.visible_curves
 
-        # Get transform once for all curves
+        # Get transform and viewport once for all curves
         transform = self._create_transform_from_render_state(render_state)
+        viewport = QRectF(0, 0, render_state.widget_width, render_state.widget_height)
+
+        # Cached segments of deleted curves are not looked up again
+        if render_state.curve_versions is not None:
+            self.evict_removed_curves(render_state.curve_versions)
+
+        # Lines of all curves are queued by pen and drawn together; markers are drawn on top afterwards
+        lines = LineBatch()
+        marker_jobs: list[dict[str, Any]] = []
+        frame_label_points: tuple[FloatArray, FloatArray] | None = None
 
         for curve_name, curve_points in curves_data.items():
             if not curve_points:
@@ -1244,10 +1254,23 @@ class OptimizedCurveRenderer:
             if visible_curves is None or curve_name not in visible_curves:
                 continue
 
+            # Selection indices refer to the stored points; remember their frames
+            # so they can be located again after densification
+            selected_frames: set[int] | None = None
+            if render_state.curve_selections is not None:
+                selection = render_state.curve_selections.get(curve_name, set())
+                selected_frames = {curve_points[i][0] for i in selection if 0 <= i < len(curve_points)}
+
             # Densify curve data to fill in interpolated frames for continuous rendering
             # This ensures lines are drawn through interpolated regions (e.g., between
             # keyframes created beyond original curve range)
-            curve_points = self._densify_curve_for_rendering(curve_points)
+            # Live ApplicationState curves get O(1) version-keyed position lookups
+            versions = render_state.curve_versions or {}
+            live_name = curve_name if curve_name in versions else None
+            with tracing.span("render.densify", "render"):
+                curve_points = self._densify_curve_for_rendering(
+                    curve_points, live_name, self._segment_key(render_state, curve_name, "stored")
+                )
 
             if not curve_points:
                 continue
@@ -1259,6 +1282,15 @@ class OptimizedCurveRenderer:
                 if not curve_points:
                     # No point at current frame for this curve - skip it
                     continue
+                # The filtered points are not the curve's, so they are segmented uncached
+                explicit_key = dense_key = None
+            else:
+                explicit_key = self._segment_key(render_state, curve_name, "dense_explicit")
+                dense_key = self._segment_key(render_state, curve_name, "dense")
+
+            curve_selected: set[int] | None = None
+            if selected_frames is not None:
+                curve_selected = {i for i, point in enumerate(curve_points) if point[0] in selected_frames}
 
             # Determine curve styling
             is_active = curve_name == active_curve
@@ -1294,50 +1326,74 @@ class OptimizedCurveRenderer:
                 continue
 
             # Transform points to screen coordinates
-            screen_points = np.zeros((len(point_data), 2))
-            for i, point in enumerate(point_data):
-                x, y = transform.data_to_screen(point[1], point[2])
-                screen_points[i] = [x, y]
+            with tracing.span("render.transform", "render"):
+                screen_points = transform.batch_data_to_screen(point_data)
 
             # Render curve lines using unified segmented rendering
             if len(screen_points) > 1:
                 # Use visual.selected_line_width for active curve, visual.line_width for inactive
                 line_width = render_state.visual.selected_line_width if is_active else render_state.visual.line_width
-                self._render_lines_with_segments(
-                    painter=painter,
-                    render_state=render_state,
-                    curve_data=curve_points,
-                    screen_points=screen_points,
-                    curve_color=curve_color,
-                    line_width=line_width,
-                )
+                with tracing.span("render.line_geometry", "render"):
+                    self._render_lines_with_segments(
+                        painter=painter,
+                        render_state=render_state,
+                        curve_data=curve_points,
+                        screen_points=screen_points,
+                        curve_color=curve_color,
+                        line_width=line_width,
+                        lines=lines,
+                        segment_key=explicit_key,
+                    )
 
             # Render points using unified status-aware rendering
             # Use visual.selected_point_radius for active curve, visual.point_radius for inactive
             point_radius = render_state.visual.selected_point_radius if is_active else render_state.visual.point_radius
 
-            # Use the unified point rendering that handles status, selection, and current frame
-            self._render_points_with_status(
-                painter=painter,
-                render_state=render_state,
-                screen_points=screen_points,
-                points_data=curve_points,
-                visible_indices=None,  # No LOD for multi-curve rendering
-                step=1,
-                base_point_radius=point_radius,
-                curve_color=curve_color,
-                is_active_curve=is_active,
+            # Cull and decimate markers (lines above still use every point)
+            marker_indices = self._viewport_culler.get_visible_points(screen_points, viewport, padding=RENDER_PADDING)
+            if len(marker_indices) == 0:
+                continue
+            required: BoolArray | None = None
+            if self._lod_system.should_decimate(len(marker_indices), self.effective_quality):
+                marker_selection = curve_selected if curve_selected is not None else render_state.selected_points
+                required = required_point_mask(curve_points, marker_selection, render_state.current_frame)
+            marker_points, marker_indices = self._lod_system.get_lod_points(
+                screen_points, self.effective_quality, marker_indices, required
             )
 
-            # Label active curve points with frame numbers if in debug mode
-            # Future enhancement: Add show_all_frame_numbers to RenderState for debug visualization
+            marker_jobs.append(
+                {
+                    "screen_points": marker_points,
+                    "points_data": curve_points,
+                    "visible_indices": marker_indices,
+                    "base_point_radius": point_radius,
+                    "curve_color": curve_color,
+                    "is_active_curve": is_active,
+                    "selected_points": curve_selected,
+                    "segment_key": dense_key,
+                }
+            )
             if is_active:
-                for i, (x, y) in enumerate(screen_points):
-                    # Skip points outside viewport
-                    if x < -50 or x > render_state.widget_width + 50 or y < -50 or y > render_state.widget_height + 50:
-                        continue
-                    frame_num = int(point_data[i][0])
-                    painter.drawText(QPointF(x + 10, y - 10), str(frame_num))
+                frame_label_points = (screen_points, point_data)
+
+        with tracing.span("render.lines", "render"):
+            lines.flush(painter)
+
+        # Use the unified point rendering that handles status, selection, and current frame
+        with tracing.span("render.markers", "render"):
+            for job in marker_jobs:
+                self._render_points_with_status(painter=painter, render_state=render_state, step=1, **job)
+
+        # Label active curve points with frame numbers if in debug mode
+        # Future enhancement: Add show_all_frame_numbers to RenderState for debug visualization
+        if frame_label_points is not None:
+            screen_points, point_data = frame_label_points
+            for i, (x, y) in enumerate(screen_points):
+                # Skip points outside viewport
+                if x < -50 or x > render_state.widget_width + 50 or y < -50 or y > render_state.widget_height + 50:
+                    continue
+                frame_num = int(point_data[i][0])
+                painter.drawText(QPointF(x + 10, y - 10), str(frame_num))
 
     def _render_background_optimized(self, painter: QPainter, render_state: "RenderState") -> None:
         """Optimized background rendering with proper color space handling for EXR."""
@@ -1346,7 +1402,7 @@ class OptimizedCurveRenderer:
             return
 
         # Use smooth transform hint for better quality
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self._render_quality == RenderQuality.HIGH)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self.effective_quality == RenderQuality.HIGH)
 
         # Get the transform from render_state to apply the same transformations as curve points
         transform = self._create_transform_from_render_state(render_state)
@@ -1447,9 +1503,7 @@ class OptimizedCurveRenderer:
 
     def _render_info_optimized(self, painter: QPainter, render_state: "RenderState") -> None:
         """Render info overlay with performance metrics."""
-        # Skip info rendering if show_info is explicitly False
-        # Note: show_info is an optional future feature - not in current RenderState
-        # Future enhancement: Add show_info to RenderState for selective info display
+        # Callers skip this when render_state.show_info is False (e.g. offscreen batch output)
 
         from ui.color_manager import COLORS_DARK
 
@@ -1467,11 +1521,10 @@ class OptimizedCurveRenderer:
 
         # Add performance info
         info_text += f" | {self._last_fps:.1f} FPS"
-        info_text += f" | Quality: {self._render_quality.value.upper()}"
+        info_text += f" | Quality: {self.effective_quality.value.upper()}"
 
         # Add optimization status (always show visible count for debugging)
-        visible_count = len(self._cached_visible_indices) if self._cached_visible_indices is not None else 0
-        info_text += f" | Visible: {visible_count}"
+        info_text += f" | Visible: {self._last_visible_count}"
 
         # Only draw text if painter is active and in safe environment
         try:
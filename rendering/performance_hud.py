@@ -0,0 +1,63 @@
+"""Performance HUD overlay for the curve view.
+
+Draws a compact table of per-stage timings collected by core.tracing in the
+top-right corner of the view. Timings are read, never computed here, so the
+overlay costs one snapshot of the tracer's stage dictionary per paint.
+"""
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+
+from core.tracing import StageTiming
+
+__all__ = ["HUD_MAX_ROWS", "draw_performance_hud"]
+
+# Only the slowest stages are listed to keep the overlay readable
+HUD_MAX_ROWS = 14
+
+_HUD_MARGIN = 8
+_HUD_PADDING = 6
+
+
+def draw_performance_hud(painter: QPainter, timings: dict[str, StageTiming], view_width: int) -> None:
+    """
+    Draw the per-stage timing overlay.
+
+    Rows are sorted by rolling average, slowest first.
+
+    Args:
+        painter: Active painter on the curve view
+        timings: Stage timings from core.tracing.get_stage_timings()
+        view_width: Width of the view, used to right-align the panel
+    """
+    rows = sorted(timings.values(), key=lambda t: t.avg_ms, reverse=True)[:HUD_MAX_ROWS]
+    if rows:
+        lines = [f"{'stage':<34}{'last':>8}{'avg':>8}{'max':>8}"]
+        lines.extend(f"{t.name[:33]:<34}{t.last_ms:>8.2f}{t.avg_ms:>8.2f}{t.max_ms:>8.2f}" for t in rows)
+    else:
+        lines = ["Performance HUD: no spans recorded yet"]
+
+    painter.save()
+    try:
+        font = QFont("Monospace", 8)
+        font.setStyleHint(QFont.StyleHint.TypeWriter)
+        painter.setFont(font)
+        metrics = QFontMetrics(font)
+        line_height = metrics.height()
+        text_width = max(metrics.horizontalAdvance(line) for line in lines)
+
+        panel_width = text_width + 2 * _HUD_PADDING
+        panel_height = line_height * len(lines) + 2 * _HUD_PADDING
+        panel = QRectF(view_width - panel_width - _HUD_MARGIN, _HUD_MARGIN, panel_width, panel_height)
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 170))
+        painter.drawRoundedRect(panel, 4, 4)
+
+        painter.setPen(QColor(220, 220, 220))
+        y = panel.top() + _HUD_PADDING + metrics.ascent()
+        for line in lines:
+            painter.drawText(int(panel.left() + _HUD_PADDING), int(y), line)
+            y += line_height
+    finally:
+        painter.restore()
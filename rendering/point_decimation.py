@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+Screen-space point decimation for level-of-detail rendering.
+
+Reduces a curve's screen points to the ones that change what is drawn.
+Consecutive points falling into the same pixel column are collapsed to the
+first, last, lowest and highest point of the run (min/max or "M4" decimation),
+so spikes and the overall shape survive while dense stretches shrink to at most
+four points per column. Points that carry meaning on their own - keyframes,
+endframes, selected points and the current frame - can be forced to stay.
+
+All functions work on NumPy arrays and return index arrays into the input,
+so callers can map decimated points back to their curve data.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
+
+from core.models import PointStatus
+from core.type_aliases import CurveDataList
+
+FloatArray: TypeAlias = NDArray[np.float64]
+BoolArray: TypeAlias = NDArray[np.bool_]
+IndexArray: TypeAlias = NDArray[np.intp]
+
+# Point statuses that are never decimated away
+ALWAYS_KEPT_STATUSES: frozenset[object] = frozenset(
+    {PointStatus.KEYFRAME, PointStatus.KEYFRAME.value, PointStatus.ENDFRAME, PointStatus.ENDFRAME.value}
+)
+
+
+def decimate_min_max(points: FloatArray, column_width: float = 1.0) -> IndexArray:
+    """
+    Select the points needed to draw a polyline at a given horizontal resolution.
+
+    Points are grouped into runs of consecutive points whose X falls into the
+    same column of ``column_width`` pixels. Every run keeps its first and last
+    point (so the lines into and out of the column are unchanged) plus the
+    points with the minimum and maximum Y (so spikes are preserved).
+
+    Args:
+        points: Nx2 screen coordinates in drawing order
+        column_width: Column width in pixels (larger values decimate harder)
+
+    Returns:
+        Sorted indices of the kept points (all indices for fewer than 3 points)
+    """
+    count = len(points)
+    if count < 3:
+        return np.arange(count, dtype=np.intp)
+
+    columns = np.floor(points[:, 0] / max(column_width, 1e-9)).astype(np.int64)
+    run_starts = np.flatnonzero(np.concatenate(([True], columns[1:] != columns[:-1])))
+    if len(run_starts) == count:
+        # Every point is in its own column run - nothing to merge
+        return np.arange(count, dtype=np.intp)
+
+    run_ids = np.repeat(np.arange(len(run_starts)), np.diff(np.append(run_starts, count)))
+    y = points[:, 1]
+
+    keep = np.zeros(count, dtype=np.bool_)
+    keep[run_starts] = True
+    keep[np.append(run_starts[1:], count) - 1] = True
+    for reduce in (np.minimum, np.maximum):
+        extremes = reduce.reduceat(y, run_starts)
+        hits = np.flatnonzero(y == extremes[run_ids])
+        # First hit of each run only, so ties do not keep whole flat stretches
+        hit_runs = run_ids[hits]
+        keep[hits[np.concatenate(([True], hit_runs[1:] != hit_runs[:-1]))]] = True
+
+    return np.flatnonzero(keep)
+
+
+def required_point_mask(
+    curve_data: CurveDataList,
+    selected_indices: Iterable[int] = (),
+    current_frame: int | None = None,
+) -> BoolArray:
+    """
+    Mark the points that must survive decimation.
+
+    Args:
+        curve_data: Curve points (frame, x, y[, status])
+        selected_indices: Indices of selected points
+        current_frame: Frame whose point is highlighted (None for none)
+
+    Returns:
+        Boolean mask of length len(curve_data); True for keyframes, endframes,
+        selected points and points on the current frame
+    """
+    mask = np.fromiter(
+        ((len(point) > 3 and point[3] in ALWAYS_KEPT_STATUSES) or point[0] == current_frame for point in curve_data),
+        dtype=np.bool_,
+        count=len(curve_data),
+    )
+    selected = np.fromiter(selected_indices, dtype=np.intp)
+    selected = selected[(selected >= 0) & (selected < len(mask))]
+    mask[selected] = True
+    return mask
+
+
+def decimate_with_required(
+    points: FloatArray,
+    indices: IndexArray,
+    column_width: float,
+    required: BoolArray | None = None,
+) -> IndexArray:
+    """
+    Decimate a subset of points and add back the required ones.
+
+    Args:
+        points: Nx2 screen coordinates of the whole curve
+        indices: Sorted indices of the points to consider (e.g. the visible ones)
+        column_width: Column width in pixels for decimate_min_max()
+        required: Optional mask over all N points of points that must be kept
+
+    Returns:
+        Sorted indices into ``points`` of the kept points
+    """
+    kept = indices[decimate_min_max(points[indices], column_width)]
+    if required is None:
+        return kept
+
+    forced = indices[required[indices]]
+    if len(forced) == 0:
+        return kept
+    return np.union1d(kept, forced)
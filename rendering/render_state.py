@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any
 
 from PySide6.QtGui import QImage
 
+from core.screen_points import ScreenPointCache
 from core.type_aliases import CurveDataList
 from rendering.visual_settings import VisualSettings
 
@@ -70,6 +71,8 @@ class RenderState:
     selected_curves_ordered: list[str] | None = None  # Ordered list for visual differentiation
     curve_metadata: dict[str, dict[str, object]] | None = None
     active_curve_name: str | None = None
+    curve_selections: dict[str, set[int]] | None = None  # Selected point indices per visible curve
+    curve_versions: dict[str, int] | None = None  # ApplicationState data versions (None: curves not from app state)
 
     # Pre-computed visibility (performance optimization)
     visible_curves: frozenset[str] | None = None  # Pre-computed set of curves that should render
@@ -77,6 +80,12 @@ class RenderState:
     # Display mode options
     show_current_point_only: bool = False  # 3DEqualizer-style: show only point at current frame
 
+    # Info overlay (point count, zoom, FPS); disabled for offscreen batch output
+    show_info: bool = True
+
+    # Cached screen positions of the active curve (shared with the widget's render cache)
+    screen_points: ScreenPointCache | None = None
+
     def __post_init__(self) -> None:
         """Validate render state after initialization."""
         # Ensure widget dimensions are positive
@@ -161,6 +170,15 @@ class RenderState:
                 elif curve_name == app_state.active_curve:
                     visible_curves.add(curve_name)
 
+        # Data versions of the live curves, for version-keyed caches during rendering
+        curve_versions = {curve_name: app_state.get_curve_version(curve_name) for curve_name in curves_data}
+
+        # Point selections of every visible curve (multi-curve selection highlighting)
+        curve_selections = {curve_name: app_state.get_selection(curve_name) for curve_name in visible_curves}
+
+        # Active curve screen positions maintained by the widget's render cache
+        shared_points: object = getattr(getattr(widget, "render_cache", None), "screen_points_cache", None)
+
         # Create RenderState with all necessary data
         return cls(
             # Core data
@@ -193,8 +211,11 @@ class RenderState:
             selected_curves_ordered=widget.selected_curves_ordered,
             curve_metadata=curve_metadata,
             active_curve_name=app_state.active_curve,
+            curve_selections=curve_selections,
+            curve_versions=curve_versions,
             # Pre-computed visibility
             visible_curves=frozenset(visible_curves),
+            screen_points=shared_points if isinstance(shared_points, ScreenPointCache) else None,
         )
 
     def should_render(self, curve_name: str) -> bool:
@@ -1,7 +1,9 @@
 """
 Quick memory measurement script for Week 10 validation.
 
-Measures memory usage of ApplicationState with typical 3-curve, 10K-point dataset.
+Measures memory usage of ApplicationState with typical 3-curve, 10K-point dataset,
+then prints the cache breakdown of the shared memory budget (the same report
+as View > Memory Usage in the app).
 """
 
 import sys
@@ -11,6 +13,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.memory_budget import get_memory_budget
 from stores.application_state import get_application_state, reset_application_state
 
 
@@ -35,6 +38,18 @@ def measure_application_state_memory():
     return current, peak
 
 
+def report_cache_budget():
+    """Fill the SegmentedCurve cache for the dataset and return the memory budget report."""
+    from services import get_data_service
+
+    data_service = get_data_service()
+    state = get_application_state()
+    for curve_name in state.get_all_curve_names():
+        _ = data_service.get_position_at_frame(state.get_curve_data(curve_name), 0, curve_name)
+
+    return get_memory_budget().format_report()
+
+
 def main():
     """Run memory measurements."""
     print("=" * 60)
@@ -63,6 +78,8 @@ def main():
     else:
         print("  ⚠️  WARNING: Memory over target")
 
+    print()
+    print(report_cache_budget())
     print()
     print("=" * 60)
 
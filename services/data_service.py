@@ -12,14 +12,21 @@ This service handles:
 import csv
 import json
 import statistics
+from collections.abc import Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
-from core.coordinate_detector import detect_coordinate_system
+from core.coordinate_detector import CoordinateDetector, detect_coordinate_system
 from core.curve_data import CurveDataWithMetadata
 from core.curve_segments import SegmentedCurve
 from core.error_handling import safe_execute, safe_execute_optional
 from core.logger_utils import get_logger
+from core.memory_budget import (
+    PRIORITY_IMAGES,
+    PRIORITY_SEGMENTED_CURVES,
+    estimate_points_bytes,
+    get_memory_budget,
+)
 from core.models import FrameStatus, PointStatus
 from core.type_aliases import CurveDataInput, CurveDataList, LegacyPointData
 from services.service_protocols import LoggingServiceProtocol, StatusServiceProtocol
@@ -28,11 +35,26 @@ if TYPE_CHECKING:
     from PySide6.QtGui import QImage
     from PySide6.QtWidgets import QWidget
 
+    from services.image_cache_manager import SafeImageCacheManager
+
 # Simple filter import (replaces scipy dependency)
 from core.simple_filters import simple_lowpass_filter
 
 logger = get_logger("data_service")
 
+# Upper bound on cached background frames; their bytes are bounded by the memory budget
+IMAGE_CACHE_MAX_FRAMES = 1000
+
+
+def _is_numeric_row(line: str) -> bool:
+    """Check whether a 2DTrackDatav2 line holds only numbers (a count, identifier or data line)."""
+    try:
+        for part in line.split():
+            _ = float(part)
+    except ValueError:
+        return False
+    return True
+
 
 class DataService:
     """
@@ -63,15 +85,53 @@ class DataService:
 
         # SegmentedCurve cache for performance (keyed by content-based tuple)
         # Content-based key avoids id() collision after GC
-        self._segmented_curves: dict[tuple[int, int, int, int, int], SegmentedCurve] = {}
+        self._segmented_curves: dict[tuple[int, int, int, int, int, int], SegmentedCurve] = {}
         self._max_segmented_cache_size: int = 10  # Limit cache size
 
+        # SegmentedCurve per ApplicationState curve, stamped with the curve's data version.
+        # (curve_name, version) is an O(1) key; an entry goes stale only when its own curve changes.
+        self._curve_segmented_curves: dict[str, tuple[int, SegmentedCurve]] = {}
+
         # Persistent SegmentedCurve for restoration functionality (separate from cache)
         self._segmented_curve: SegmentedCurve | None = None
         self._current_curve_data: CurveDataList | None = None
+        # (curve_name, version) the persistent curve was built from, None if unknown or edited since
+        self._current_curve_version: tuple[str, int] | None = None
 
         # Phase 2C: Image cache manager for efficient background image loading
-        self._safe_image_cache: SafeImageCacheManager = SafeImageCacheManager(max_cache_size=100)
+        self._safe_image_cache: SafeImageCacheManager = SafeImageCacheManager(max_cache_size=IMAGE_CACHE_MAX_FRAMES)
+
+        memory_budget = get_memory_budget()
+        memory_budget.register("image_cache", self._safe_image_cache, PRIORITY_IMAGES, "Decoded frames")
+        memory_budget.register(
+            "data_service.segmented_curves", self, PRIORITY_SEGMENTED_CURVES, "Segmented curves (data service)"
+        )
+
+    def memory_usage_bytes(self) -> int:
+        """Get the estimated bytes held by cached SegmentedCurves (memory budget)."""
+        return sum(estimate_points_bytes(len(curve.all_points)) for curve in self._segmented_curves.values()) + sum(
+            estimate_points_bytes(len(curve.all_points)) for _, curve in self._curve_segmented_curves.values()
+        )
+
+    def evict_bytes(self, target_bytes: int) -> int:
+        """Evict cached SegmentedCurves, oldest first, for the memory budget.
+
+        The persistent SegmentedCurve used for restoration is never evicted.
+
+        Args:
+            target_bytes: Bytes to free
+
+        Returns:
+            Estimated bytes freed
+        """
+        freed = 0
+        while self._segmented_curves and freed < target_bytes:
+            curve = self._segmented_curves.pop(next(iter(self._segmented_curves)))
+            freed += estimate_points_bytes(len(curve.all_points))
+        while self._curve_segmented_curves and freed < target_bytes:
+            _, curve = self._curve_segmented_curves.pop(next(iter(self._curve_segmented_curves)))
+            freed += estimate_points_bytes(len(curve.all_points))
+        return freed
 
     @property
     def segmented_curve(self) -> SegmentedCurve | None:
@@ -82,21 +142,22 @@ class DataService:
         """
         return self._segmented_curve
 
-    def _make_curve_cache_key(self, points: CurveDataList) -> tuple[int, int, int, int, int]:
+    def _make_curve_cache_key(self, points: CurveDataList) -> tuple[int, int, int, int, int, int]:
         """Generate content-based cache key for curve data.
 
-        Uses (length, first_frame, last_frame, frames_hash, status_hash) to avoid
-        id()-based collisions after GC. Safe even when object IDs are reused.
-        Includes status hash to distinguish curves with different gap configurations.
+        Uses (length, first_frame, last_frame, frames_hash, status_hash, coords_hash)
+        to avoid id()-based collisions after GC. Safe even when object IDs are reused.
+        Includes status hash to distinguish curves with different gap configurations,
+        and coordinate hash so tracks sharing a frame range resolve to their own curve.
 
         Args:
             points: Curve data points
 
         Returns:
-            Tuple key for cache lookup (length, first_frame, last_frame, frames_hash, status_hash)
+            Tuple key for cache lookup (length, first_frame, last_frame, frames_hash, status_hash, coords_hash)
         """
         if not points:
-            return (0, 0, 0, 0, 0)
+            return (0, 0, 0, 0, 0, 0)
 
         length = len(points)
         first_frame = int(points[0][0])
@@ -105,7 +166,9 @@ class DataService:
         frames_hash = hash(tuple(int(p[0]) for p in points))
         # Hash of statuses to distinguish curves with different gap configurations
         status_hash = hash(tuple(p[3] if len(p) > 3 else "normal" for p in points))
-        return (length, first_frame, last_frame, frames_hash, status_hash)
+        # Hash of positions; without it tracks with identical frames share one cache entry
+        coords_hash = hash(tuple((p[1], p[2]) for p in points))
+        return (length, first_frame, last_frame, frames_hash, status_hash, coords_hash)
 
     # ==================== Public File I/O Methods (Sprint 11.5) ====================
 
@@ -164,6 +227,19 @@ class DataService:
         """
         return self._save_json(filepath, data, label="", color="")
 
+    def save_csv(self, filepath: str, data: CurveDataList) -> bool:
+        """
+        Public method to save data as CSV programmatically.
+
+        Args:
+            filepath: Path to save CSV file
+            data: Curve data to save
+
+        Returns:
+            True if successful
+        """
+        return self._save_csv(filepath, data, include_header=True)
+
     # ==================== Core Analysis Methods ====================
 
     def smooth_moving_average(self, data: CurveDataInput, window_size: int = 5) -> CurveDataList:
@@ -313,8 +389,29 @@ class DataService:
             self._logger.log_info(f"Detected {len(outliers)} outliers")
         return outliers
 
-    def analyze_points(self, points: CurveDataInput) -> dict[str, object]:
-        """Analyze curve points and return statistics."""
+    def analyze_points(self, points: CurveDataInput, curve_name: str | None = None) -> dict[str, object]:
+        """Analyze curve points and return statistics.
+
+        Args:
+            points: Curve points (tuples or CurvePoint objects)
+            curve_name: ApplicationState curve that points is the current data of. When given,
+                the statistics come from the curve's cached summary instead of a pass over points.
+        """
+        if curve_name is not None and points:
+            from stores.application_state import get_application_state
+
+            app_state = get_application_state()
+            if app_state.get_curve_version(curve_name):
+                summary = app_state.get_curve_summary(curve_name)
+                if summary.frame_range is not None and summary.bounds is not None:
+                    min_x, min_y, max_x, max_y = summary.bounds
+                    return {
+                        "count": summary.point_count,
+                        "min_frame": summary.frame_range[0],
+                        "max_frame": summary.frame_range[1],
+                        "bounds": {"min_x": min_x, "max_x": max_x, "min_y": min_y, "max_y": max_y},
+                    }
+
         if not points:
             return {
                 "count": 0,
@@ -396,19 +493,23 @@ class DataService:
 
         return (keyframe_count, interpolated_count, False)
 
-    def get_position_at_frame(self, points: CurveDataList, frame: int) -> tuple[float, float] | None:
+    def get_position_at_frame(
+        self, points: CurveDataList, frame: int, curve_name: str | None = None
+    ) -> tuple[float, float] | None:
         """Get position at a specific frame using gap-aware interpolation.
 
         Uses SegmentedCurve logic to handle gaps properly:
         - Active segments: Normal interpolation between keyframes
         - Inactive segments (gaps): Returns held position from preceding endframe
 
-        Performance: Caches SegmentedCurve instances by content-based key for ~5-20x speedup.
+        Performance: Caches SegmentedCurve instances for ~5-20x speedup. With curve_name the
+        cache key is the curve's ApplicationState version (O(1)); otherwise it is content-based (O(n)).
         Priority: Uses persistent curve if available (for restoration logic), then cache, then creates new.
 
         Args:
             points: List of curve data points
             frame: Frame number to get position for
+            curve_name: ApplicationState curve that points is the current data of, if any
 
         Returns:
             Tuple of (x, y) coordinates or None if no position available
@@ -420,7 +521,13 @@ class DataService:
         if self._current_curve_data is points and self._segmented_curve:
             return self._segmented_curve.get_position_at_frame(frame)
 
-        # Priority 2: Check cache using content-based key (avoids id() collision after GC)
+        # Priority 2a: Versioned cache for ApplicationState curves
+        if curve_name is not None:
+            segmented = self._get_versioned_segmented_curve(curve_name, points)
+            if segmented is not None:
+                return segmented.get_position_at_frame(frame)
+
+        # Priority 2b: Check cache using content-based key (avoids id() collision after GC)
         cache_key = self._make_curve_cache_key(points)
         if cache_key in self._segmented_curves:
             return self._segmented_curves[cache_key].get_position_at_frame(frame)
@@ -437,7 +544,31 @@ class DataService:
         self._segmented_curves[cache_key] = segmented_curve
         return segmented_curve.get_position_at_frame(frame)
 
-    def update_curve_data(self, points: CurveDataList) -> None:
+    def _get_versioned_segmented_curve(self, curve_name: str, points: CurveDataList) -> SegmentedCurve | None:
+        """Get the cached SegmentedCurve of an ApplicationState curve, rebuilding it if the curve changed.
+
+        Args:
+            curve_name: Curve whose current data is points
+            points: Current data of the curve
+
+        Returns:
+            SegmentedCurve for the curve, or None if ApplicationState does not know the curve
+        """
+        from stores.application_state import get_application_state
+
+        version = get_application_state().get_curve_version(curve_name)
+        if version == 0:
+            return None
+
+        entry = self._curve_segmented_curves.get(curve_name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        segmented_curve = SegmentedCurve.from_curve_data(points)
+        self._curve_segmented_curves[curve_name] = (version, segmented_curve)
+        return segmented_curve
+
+    def update_curve_data(self, points: CurveDataList, curve_name: str | None = None) -> None:
         """Update persistent SegmentedCurve and invalidate cache.
 
         This should be called whenever curve data is modified to ensure:
@@ -446,25 +577,115 @@ class DataService:
 
         Args:
             points: Updated curve data points
+            curve_name: ApplicationState curve that points is the current data of. When given,
+                the rebuild is skipped if the persistent curve already holds this curve version.
         """
+        version_key: tuple[str, int] | None = None
+        if curve_name is not None:
+            from stores.application_state import get_application_state
+
+            version = get_application_state().get_curve_version(curve_name)
+            if version:
+                version_key = (curve_name, version)
+                if version_key == self._current_curve_version and self._segmented_curve is not None:
+                    self._current_curve_data = points
+                    return
+
         # Update persistent SegmentedCurve for restoration functionality
         self._current_curve_data = points
+        self._current_curve_version = version_key
         if points:
             self._segmented_curve = SegmentedCurve.from_curve_data(points)
         else:
             self._segmented_curve = None
 
+        if version_key is not None:
+            # Versioned entries are never stale for their version; no content hash needed
+            return
+
         # Invalidate cache entry for this data using content-based key
         cache_key = self._make_curve_cache_key(points)
         if cache_key in self._segmented_curves:
             del self._segmented_curves[cache_key]
 
+    def evict_changed_curves(self) -> None:
+        """Drop cached SegmentedCurves of curves that changed or were deleted.
+
+        Entries of unchanged curves are kept, so editing one curve does not
+        force every other curve to be re-segmented.
+        """
+        from stores.application_state import get_application_state
+
+        app_state = get_application_state()
+        stale = [
+            name
+            for name, (version, _) in self._curve_segmented_curves.items()
+            if app_state.get_curve_version(name) != version
+        ]
+        for name in stale:
+            del self._curve_segmented_curves[name]
+        if stale:
+            logger.debug(f"Evicted SegmentedCurve cache for {len(stale)} changed curve(s)")
+
     def clear_segmented_curve_cache(self) -> None:
         """Clear all cached SegmentedCurve instances.
 
         Call this when curve data is replaced (e.g., new file loaded).
         """
         self._segmented_curves.clear()
+        self._curve_segmented_curves.clear()
+
+    def set_point_status(self, curve_name: str, index: int, status: str | PointStatus) -> bool:
+        """Change a point's status in ApplicationState, updating its cached SegmentedCurve in place.
+
+        Args:
+            curve_name: Curve containing the point
+            index: Point index
+            status: New status
+
+        Returns:
+            True if the status was set, False if the curve or index is invalid
+        """
+        return self.set_point_statuses(curve_name, {index: status})
+
+    def set_point_statuses(self, curve_name: str, statuses: Mapping[int, str | PointStatus]) -> bool:
+        """Change point statuses in ApplicationState, updating the cached SegmentedCurve in place.
+
+        A cached SegmentedCurve that is current for the curve is patched with
+        update_segment_activity() and re-stamped with the new version instead
+        of being rebuilt from the whole curve.
+
+        Args:
+            curve_name: Curve containing the points
+            statuses: New status by point index
+
+        Returns:
+            True if any status was set, False if the curve is missing or no index is valid
+        """
+        from stores.application_state import get_application_state
+
+        app_state = get_application_state()
+        version = app_state.get_curve_version(curve_name)
+        curve_data = app_state.get_curve_data(curve_name)
+
+        # Hold the entry aside so the curves_changed handlers do not evict it
+        entry = self._curve_segmented_curves.pop(curve_name, None)
+        if not app_state.set_point_statuses(curve_name, statuses):
+            if entry is not None:
+                self._curve_segmented_curves[curve_name] = entry
+            return False
+
+        if entry is not None and entry[0] == version:
+            segmented_curve = entry[1]
+            # SegmentedCurve points are sorted by frame, curve indices may not be
+            sorted_index = {point.frame: i for i, point in enumerate(segmented_curve.all_points)}
+            for index, status in statuses.items():
+                if not (0 <= index < len(curve_data)):
+                    continue
+                status_enum = PointStatus.from_legacy(status) if isinstance(status, str) else status
+                segmented_curve.update_segment_activity(sorted_index[int(curve_data[index][0])], status_enum)
+            self._curve_segmented_curves[curve_name] = (app_state.get_curve_version(curve_name), segmented_curve)
+        return True
 
     def handle_point_status_change(self, point_index: int, new_status: str | PointStatus) -> None:
         """Handle point status changes with restoration logic.
@@ -495,6 +716,9 @@ class DataService:
         else:
             status_enum = new_status
 
+        # The persistent curve no longer matches any ApplicationState version
+        self._current_curve_version = None
+
         # Update the persistent SegmentedCurve with restoration logic
         def _update_activity() -> bool:
             if self._segmented_curve is None:
@@ -879,6 +1103,35 @@ class DataService:
         """
         return self._safe_image_cache.get_image(frame)
 
+    def get_scrub_background_image(self, frame: int) -> "tuple[QImage | None, bool]":
+        """
+        Get a background image for scrubbing without decoding from disk.
+
+        Args:
+            frame: Frame number (0-indexed)
+
+        Returns:
+            Tuple of (the frame if cached, else the nearest cached frame or None;
+            whether it is the requested frame)
+        """
+        return self._safe_image_cache.get_cached_or_nearest(frame)
+
+    def request_background_image(self, frame: int) -> None:
+        """
+        Decode a background image in the background, without blocking (scrubbing).
+
+        The image cache's frame_ready signal reports when it is available.
+
+        Args:
+            frame: Frame number (0-indexed)
+        """
+        self._safe_image_cache.request_frame(frame)
+
+    @property
+    def image_cache(self) -> "SafeImageCacheManager":
+        """Get the background image cache (for its signals)."""
+        return self._safe_image_cache
+
     def preload_around_frame(self, frame: int, window_size: int = 20) -> None:
         """
         Preload frames around current frame (background operation).
@@ -1026,49 +1279,58 @@ class DataService:
         """Load 2DTrackDatav2 format with multiple tracking points.
 
         Returns a dictionary where keys are point names and values are trajectories.
+        See load_tracked_data_with_height for the format.
+        """
+        return self.load_tracked_data_with_height(file_path)[0]
+
+    def load_tracked_data_with_height(self, file_path: str) -> tuple[dict[str, CurveDataList], int]:
+        """Load 2DTrackDatav2 format and report the image height used for the Y-flip.
 
-        Format for each point:
-        - Version number line (e.g., "12")
-        - Point name line (e.g., "Point1" or "Point02")
+        save_tracked_data needs the same height to write the curves back in
+        3DEqualizer coordinates.
+
+        Format: a track count line (e.g., "12"), then for each point:
+        - Point name line (e.g., "Point1", "Point02" or "avrg_01")
         - Identifier line (e.g., "0")
         - Point count line (e.g., "37")
         - Data lines: frame_number x_coordinate y_coordinate
+
+        Any line followed by an identifier and a point count is a point name,
+        unless it is a number or a data line itself.
+
+        Returns:
+            Tuple of (point name to trajectory, image height); ({}, 720) on failure
         """
 
-        def _load() -> dict[str, CurveDataList] | None:
-            tracked_data = {}
+        def _load() -> tuple[dict[str, CurveDataList], int] | None:
+            tracked_data: dict[str, CurveDataList] = {}
 
             with open(file_path, encoding="utf-8") as f:
                 lines = f.readlines()
 
-            # Detect dimensions from file content using public interface
-            content = "".join(lines)
-            detected_metadata = detect_coordinate_system(file_path, content)
-            # Use detected height or fallback to 720
-            image_height = detected_metadata.height if detected_metadata.height else 720
+            raw_tracks: dict[str, list[tuple[int, float, float]]] = {}
 
             i = 0
             while i < len(lines):
-                # Look for point name lines (e.g., "Point1", "Point02")
+                # Look for point name lines (e.g., "Point1", "Point02", "avrg_01")
                 line = lines[i].strip()
 
-                if line.startswith("Point"):
-                    # Found a point name
+                if line and not _is_numeric_row(line):
+                    # Candidate point name
                     point_name = line
 
                     # Check if we have the required header lines after it
-                    if i - 1 >= 0 and i + 2 < len(lines):
+                    if i + 2 < len(lines):
                         try:
                             # The format is:
-                            # version (line before point name)
                             # point_name (current line)
                             # identifier (next line)
                             # count (line after identifier)
-                            _ = lines[i + 1].strip()  # identifier - not used
+                            _ = int(lines[i + 1].strip())  # identifier - not used
                             point_count = int(lines[i + 2].strip())
 
                             # Read the trajectory data starting from i+3
-                            trajectory: CurveDataList = []
+                            trajectory: list[tuple[int, float, float]] = []
                             data_start = i + 3
 
                             for j in range(data_start, min(data_start + point_count, len(lines))):
@@ -1082,15 +1344,12 @@ class DataService:
                                         frame = int(parts[0])
                                         x = float(parts[1])
                                         y = float(parts[2])
-                                        # Apply Y-flip for 3DEqualizer coordinates (bottom-origin to top-origin)
-                                        y = image_height - y
                                         trajectory.append((frame, x, y))
                                     except (ValueError, IndexError):
                                         continue
 
-                            # Store the trajectory with post-processing
                             if trajectory:
-                                tracked_data[point_name] = self._apply_default_statuses(trajectory)
+                                raw_tracks[point_name] = trajectory
 
                             # Move past this point's data
                             i = data_start + point_count
@@ -1101,13 +1360,59 @@ class DataService:
 
                 i += 1
 
+            # Detect dimensions from the file header and the parsed coordinates
+            xy = [(x, y) for trajectory in raw_tracks.values() for _, x, y in trajectory]
+            detected_metadata = detect_coordinate_system(file_path, CoordinateDetector.sample_lines(lines), xy=xy)
+            # Use detected height or fallback to 720
+            image_height = detected_metadata.height if detected_metadata.height else 720
+
+            for point_name, trajectory in raw_tracks.items():
+                # Apply Y-flip for 3DEqualizer coordinates (bottom-origin to top-origin)
+                flipped: CurveDataList = [(frame, x, image_height - y) for frame, x, y in trajectory]
+                tracked_data[point_name] = self._apply_default_statuses(flipped)
+
             if self._logger:
                 self._logger.log_info(f"Loaded {len(tracked_data)} tracking points from {file_path}")
 
-            return tracked_data
+            return tracked_data, image_height
 
         result = safe_execute_optional(f"loading tracked data from {file_path}", _load, "DataService")
-        return result if result is not None else {}
+        return result if result is not None else ({}, 720)
+
+    def save_tracked_data(self, file_path: str, curves: Mapping[str, CurveDataList], image_height: int) -> bool:
+        """Save curves in 2DTrackDatav2 format, the inverse of load_tracked_data.
+
+        Format: a track count line, then per track its name, an identifier
+        ("0"), a point count and "frame x y" lines. Y is flipped back to
+        3DEqualizer's bottom-left origin; statuses are not stored.
+
+        Args:
+            file_path: Path to save the file
+            curves: Point name to trajectory (top-left origin, as loaded)
+            image_height: Image height used for the Y-flip
+
+        Returns:
+            True if successful
+        """
+
+        def _save() -> bool:
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+            lines = [str(len(curves))]
+            for point_name, points in curves.items():
+                lines.extend((point_name, "0", str(len(points))))
+                lines.extend(
+                    f"{point[0]} {float(point[1]):.15f} {image_height - float(point[2]):.15f}" for point in points
+                )
+
+            with open(file_path, "w", encoding="utf-8") as f:
+                _ = f.write("\n".join(lines) + "\n")
+
+            if self._logger:
+                self._logger.log_info(f"Saved {len(curves)} tracking points to {file_path}")
+            return True
+
+        return safe_execute(f"saving tracked data to {file_path}", _save, "DataService")
 
     def _load_2dtrack_data(self, file_path: str) -> "CurveDataList | CurveDataWithMetadata":
         """Load 2DTrackData.txt format file (single curve).
@@ -1142,10 +1447,6 @@ class DataService:
                     self._logger.log_error(f"File not found: {file_path}")
                 return _create_empty_result()
 
-            # Detect dimensions from file content using public interface
-            content = "".join(lines)
-            detected_metadata = detect_coordinate_system(file_path, content)
-
             curve_data: CurveDataList = []
 
             # Skip the 4-line header
@@ -1176,6 +1477,10 @@ class DataService:
                                 self._logger.log_error(f"Invalid data at line {line_num}: {e}")
                             continue
 
+            # Detect dimensions from the file header and the parsed coordinates
+            xy = [(point[1], point[2]) for point in curve_data]
+            detected_metadata = detect_coordinate_system(file_path, CoordinateDetector.sample_lines(lines), xy=xy)
+
             # Apply default status rules
             result = self._apply_default_statuses(curve_data)
 
@@ -24,12 +24,104 @@ from typing import TYPE_CHECKING, ClassVar
 from PySide6.QtCore import QObject, Qt, QThread, Signal, Slot
 from typing_extensions import override
 
+from core import tracing
+from core.memory_budget import get_memory_budget
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from PySide6.QtGui import QImage
 
+    from io_utils.exr_decode_pool import ExrDecodePool
+    from io_utils.frame_disk_cache import FrameDiskCache
+
 logger = logging.getLogger(__name__)
 
 
+def decode_image_file(file_path: str) -> "QImage | None":
+    """
+    Decode an image file from disk (handles EXR and standard formats).
+
+    Shared decode path for the cache, the preload worker and the offscreen
+    batch renderer. Creates QImage only, so it is safe to call from any thread.
+
+    Args:
+        file_path: Absolute path to image file
+
+    Returns:
+        QImage object or None if loading fails
+    """
+    from PySide6.QtGui import QImage
+
+    try:
+        path = Path(file_path)
+
+        if not path.exists():
+            logger.error(f"Image file not found: {file_path}")
+            return None
+
+        # EXR format requires special loader
+        if path.suffix.lower() == ".exr":
+            from io_utils.exr_loader import load_exr_as_qimage
+
+            image = load_exr_as_qimage(str(file_path))
+            if image is None:
+                logger.error(f"Failed to load EXR image: {file_path}")
+                return None
+            return image
+
+        # Standard formats (PNG, JPG, etc.)
+        # CRITICAL: QImage is thread-safe, QPixmap is NOT
+        image = QImage(str(file_path))
+        if image.isNull():
+            logger.error(f"Failed to load image (QImage.isNull): {file_path}")
+            return None
+
+        return image
+
+    except Exception as e:
+        logger.error(f"Exception loading image {file_path}: {e}")
+        return None
+
+
+def get_exr_decode_pool_for(file_paths: "Sequence[str]") -> "ExrDecodePool | None":
+    """
+    Get the EXR decode pool if all files are EXR and worker decoding is available.
+
+    Args:
+        file_paths: Files about to be decoded
+
+    Returns:
+        The pool, or None to decode with decode_image_file in this process
+    """
+    if not file_paths or any(Path(file_path).suffix.lower() != ".exr" for file_path in file_paths):
+        return None
+    from io_utils.exr_decode_pool import get_exr_decode_pool
+
+    pool = get_exr_decode_pool()
+    return pool if pool is not None and pool.available else None
+
+
+def get_frame_disk_cache_for(file_paths: "Sequence[str]") -> "FrameDiskCache | None":
+    """
+    Get the frame disk cache if all files are EXR and the cache is enabled.
+
+    Only EXR frames are cached: standard formats decode about as fast as the
+    cache could read them back.
+
+    Args:
+        file_paths: Files about to be decoded
+
+    Returns:
+        The cache, or None to always decode
+    """
+    if not file_paths or any(Path(file_path).suffix.lower() != ".exr" for file_path in file_paths):
+        return None
+    from io_utils.frame_disk_cache import get_frame_disk_cache
+
+    return get_frame_disk_cache()
+
+
 class SafeImagePreloadWorker(QThread):
     """
     Background worker thread for preloading images.
@@ -50,17 +142,19 @@ class SafeImagePreloadWorker(QThread):
     image_loaded: ClassVar[Signal] = Signal(int, object)  # (frame, QImage) - use object for QImage type
     progress: ClassVar[Signal] = Signal(int, int)  # (loaded_count, total_count)
 
-    def __init__(self, image_files: list[str], frames_to_load: list[int]) -> None:
+    def __init__(self, image_files: list[str], frames_to_load: list[int], sequence_id: int = 0) -> None:
         """
         Initialize preload worker.
 
         Args:
             image_files: Complete list of image file paths (indexed by frame number)
             frames_to_load: Frame numbers to preload (filtered to exclude cached frames)
+            sequence_id: Image sequence the frames belong to (see SafeImageCacheManager)
         """
         super().__init__()
         self._image_files: list[str] = image_files
         self._frames_to_load: list[int] = frames_to_load
+        self.sequence_id: int = sequence_id
         # Thread-safe: Python GIL ensures atomic bool assignment
         # Worker reads, main thread writes (write-once: False → True)
         self._stop_requested: bool = False
@@ -79,41 +173,58 @@ class SafeImagePreloadWorker(QThread):
         Emits progress signal after each load attempt.
         Stops gracefully when _stop_requested is True.
         """
-        total = len(self._frames_to_load)
-        loaded = 0
+        self._load_frames(self._frames_to_load)
 
-        for frame in self._frames_to_load:
-            # Check for stop request
-            if self._stop_requested:
-                logger.debug(f"Preload worker stopped (loaded {loaded}/{total} frames)")
-                return
-
-            # Backpressure: wait if too many images pending in main thread queue
-            while self.should_pause() and not self._stop_requested:
-                time.sleep(0.01)  # 10ms pause
+    def _load_frames(self, frames_to_load: list[int]) -> None:
+        """
+        Load frames in order, emitting image_loaded for each one.
 
-            if self._stop_requested:
-                logger.debug(f"Preload worker stopped during backpressure (loaded {loaded}/{total} frames)")
-                return
+        Args:
+            frames_to_load: Frame numbers to load (out-of-bounds frames are skipped)
+        """
+        total = len(frames_to_load)
+        loaded = 0
 
+        frames: list[int] = []
+        for frame in frames_to_load:
             # Validate frame bounds
             if frame < 0 or frame >= len(self._image_files):
                 logger.debug(f"Skipping out-of-bounds frame {frame}")
                 continue
+            frames.append(frame)
 
-            # Load image
-            file_path = self._image_files[frame]
-            image = self._load_image(file_path)
-
-            if image is not None:
-                # Increment pending before emit (decremented by main thread in _on_image_preloaded)
-                self.increment_pending()
-                # Emit signal with loaded image (QueuedConnection to main thread)
-                self.image_loaded.emit(frame, image)
-                loaded += 1
-                self.progress.emit(loaded, total)
-            else:
-                logger.warning(f"Failed to preload frame {frame}: {file_path}")
+        images = self._decode_frames(frames)
+        try:
+            for frame in frames:
+                # Check for stop request
+                if self._interrupted():
+                    logger.debug(f"Preload worker stopped (loaded {loaded}/{total} frames)")
+                    return
+
+                # Backpressure: wait if too many images pending in main thread queue
+                while self.should_pause() and not self._interrupted():
+                    time.sleep(0.01)  # 10ms pause
+
+                if self._interrupted():
+                    logger.debug(f"Preload worker stopped during backpressure (loaded {loaded}/{total} frames)")
+                    return
+
+                # Load image
+                file_path = self._image_files[frame]
+                with tracing.span("image_cache.preload_decode", "image_cache", frame=frame):
+                    image = next(images)
+
+                if image is not None:
+                    # Increment pending before emit (decremented by main thread in _on_image_preloaded)
+                    self.increment_pending()
+                    # Emit signal with loaded image (QueuedConnection to main thread)
+                    self.image_loaded.emit(frame, image)
+                    loaded += 1
+                    self.progress.emit(loaded, total)
+                else:
+                    logger.warning(f"Failed to preload frame {frame}: {file_path}")
+        finally:
+            images.close()
 
         logger.debug(f"Preload worker complete: {loaded}/{total} frames loaded")
 
@@ -121,6 +232,10 @@ class SafeImagePreloadWorker(QThread):
         """Request worker to stop loading frames."""
         self._stop_requested = True
 
+    def _interrupted(self) -> bool:
+        """Check whether the frames being loaded are no longer wanted."""
+        return self._stop_requested
+
     def increment_pending(self) -> None:
         """Increment pending count (called before emit)."""
         with self._pending_lock:
@@ -148,37 +263,109 @@ class SafeImagePreloadWorker(QThread):
         Returns:
             QImage object or None if loading fails
         """
-        from PySide6.QtGui import QImage
+        return decode_image_file(file_path)
+
+    def _decode_frames(self, frames: list[int]) -> "Iterator[QImage | None]":
+        """
+        Decode frames in order.
+
+        EXR frames already in the frame disk cache are memory-mapped from it
+        (see io_utils.frame_disk_cache). The remaining EXR frames are decoded
+        ahead in the EXR decode processes when available (see
+        io_utils.exr_decode_pool) and stored in the disk cache; everything
+        else is decoded here, one frame per step.
 
+        Args:
+            frames: In-bounds frame numbers to decode
+
+        Yields:
+            QImage or None for each frame
+        """
+        file_paths = [self._image_files[frame] for frame in frames]
+        disk_cache = get_frame_disk_cache_for(file_paths)
+        cached = {path for path in file_paths if disk_cache.contains(path)} if disk_cache is not None else set()
+        misses = [path for path in file_paths if path not in cached]
+
+        pool = get_exr_decode_pool_for(misses)
+        decoded = pool.decode_ordered(misses) if pool is not None else (self._load_image(path) for path in misses)
         try:
-            path = Path(file_path)
+            for file_path in file_paths:
+                image = disk_cache.load(file_path) if disk_cache is not None and file_path in cached else None
+                if image is not None:
+                    yield image
+                    continue
+                # Entry evicted since the check: decode it here
+                image = self._load_image(file_path) if file_path in cached else next(decoded)
+                if image is not None and disk_cache is not None:
+                    _ = disk_cache.store(file_path, image)
+                yield image
+        finally:
+            # Cancels decodes still in flight in the EXR decode processes
+            decoded.close()
 
-            if not path.exists():
-                logger.error(f"Image file not found: {file_path}")
-                return None
 
-            # EXR format requires special loader
-            if path.suffix.lower() == ".exr":
-                from io_utils.exr_loader import load_exr_as_qimage
+class SafeImageScrubWorker(SafeImagePreloadWorker):
+    """
+    Worker decoding the frames of the latest scrub request.
 
-                image = load_exr_as_qimage(str(file_path))
-                if image is None:
-                    logger.error(f"Failed to load EXR image: {file_path}")
-                    return None
-                return image
+    Requests replace each other (latest wins): a newer request is picked up
+    as soon as the frame being decoded is done, and the queued decodes of
+    the old one are cancelled. One thread serves the scrub while there is
+    work, so stale scrub positions never decode concurrently with the
+    current one. The thread exits once it runs out of requests.
+    """
 
-            # Standard formats (PNG, JPG, etc.)
-            # CRITICAL: QImage is thread-safe, QPixmap is NOT
-            image = QImage(str(file_path))
-            if image.isNull():
-                logger.error(f"Failed to load image (QImage.isNull): {file_path}")
-                return None
+    def __init__(self, image_files: list[str], sequence_id: int = 0) -> None:
+        """
+        Initialize scrub worker.
 
-            return image
+        Args:
+            image_files: Complete list of image file paths (indexed by frame number)
+            sequence_id: Image sequence the frames belong to (see SafeImageCacheManager)
+        """
+        super().__init__(image_files, [], sequence_id)
+        self._request_lock: threading.Lock = threading.Lock()
+        # Latest request not yet picked up by the worker (None: nothing new)
+        self._requested_frames: list[int] | None = None
+        # Set once the worker has run out of requests and is exiting
+        self._exiting: bool = False
 
-        except Exception as e:
-            logger.error(f"Exception loading image {file_path}: {e}")
-            return None
+    def request(self, frames: list[int]) -> bool:
+        """
+        Replace the pending request with frames (called from the main thread).
+
+        Args:
+            frames: Frame numbers to decode, in order; empty cancels the current request
+
+        Returns:
+            False if the worker is exiting and will not serve the request
+        """
+        with self._request_lock:
+            if self._exiting:
+                return False
+            self._requested_frames = frames
+            return True
+
+    @override
+    def run(self) -> None:
+        """Serve requests until stopped."""
+        while (frames := self._take_request()) is not None:
+            self._load_frames(frames)
+        logger.debug("Scrub worker stopped")
+
+    @override
+    def _interrupted(self) -> bool:
+        """Check for a stop request or a newer scrub request."""
+        return self._stop_requested or self._requested_frames is not None
+
+    def _take_request(self) -> list[int] | None:
+        """Take the pending request; None once stopped or out of requests."""
+        with self._request_lock:
+            if self._stop_requested or self._requested_frames is None:
+                self._exiting = True
+                return None
+            frames, self._requested_frames = self._requested_frames, None
+            return frames
 
 
 class SafeImageCacheManager(QObject):
@@ -195,9 +382,11 @@ class SafeImageCacheManager(QObject):
     - Frame-indexed lookup (O(1) access)
     - Automatic cache clearing on sequence changes
     - Background preloading with progress signals
+    - Byte accounting for the shared memory budget (core.memory_budget)
 
     Signals:
         cache_progress: Emitted during background preloading (loaded: int, total: int)
+        frame_ready: Emitted when the preload worker adds a frame to the cache (frame: int)
 
     Thread Safety:
     - All public methods acquire lock before cache operations
@@ -212,6 +401,7 @@ class SafeImageCacheManager(QObject):
     """
 
     cache_progress: ClassVar[Signal] = Signal(int, int)  # (loaded_count, total_count)
+    frame_ready: ClassVar[Signal] = Signal(int)  # Frame added by the preload worker
 
     def __init__(self, max_cache_size: int = 100) -> None:
         """
@@ -235,6 +425,12 @@ class SafeImageCacheManager(QObject):
         self._image_files: list[str] = []
         self._lock: threading.Lock = threading.Lock()
         self._preload_worker: SafeImagePreloadWorker | None = None
+        # Serves request_frame while scrubbing; created on the first request
+        self._scrub_worker: SafeImageScrubWorker | None = None
+        # Workers asked to stop without waiting; kept alive until they finish
+        self._retired_workers: list[SafeImagePreloadWorker] = []
+        # Incremented per sequence so late frames from an old sequence's workers are dropped
+        self._sequence_id: int = 0
 
         logger.debug(f"SafeImageCacheManager initialized with max_cache_size={max_cache_size}")
 
@@ -249,12 +445,14 @@ class SafeImageCacheManager(QObject):
             Clears existing cache to prevent stale data from previous sequence.
             Stops any running preload worker.
         """
-        # Stop preload worker before changing sequence
+        # Stop preload workers before changing sequence
         self._stop_preload()
+        self._retire_scrub_worker()
 
         with self._lock:
             self._image_files = image_files
             self._lru_cache.clear()
+            self._sequence_id += 1
 
         logger.info(f"Image sequence set: {len(image_files)} frames")
 
@@ -266,6 +464,7 @@ class SafeImageCacheManager(QObject):
         1. Checks cache for existing image (updates LRU on hit)
         2. Loads from disk if not cached (adds to cache)
         3. Evicts oldest frames if cache exceeds max_cache_size
+        4. Enforces the shared memory budget after a load
 
         Args:
             frame: Frame number (0-indexed, corresponds to image_files index)
@@ -293,11 +492,13 @@ class SafeImageCacheManager(QObject):
             if frame in self._lru_cache:
                 self._lru_cache.move_to_end(frame)
                 logger.debug(f"Cache HIT: frame {frame}")
+                tracing.instant("image_cache.hit", "image_cache", frame=frame)
                 return self._lru_cache[frame]
 
             # Cache miss - load from disk
             file_path = self._image_files[frame]
-            image = self._load_image_from_disk(file_path)
+            with tracing.span("image_cache.load_miss", "image_cache", frame=frame):
+                image = self._load_image_from_disk(file_path)
 
             if image is None:
                 logger.error(f"Failed to load image for frame {frame}: {file_path}")
@@ -307,48 +508,77 @@ class SafeImageCacheManager(QObject):
             self._add_to_cache(frame, image)
             logger.debug(f"Cache MISS: frame {frame} loaded and cached (size: {len(self._lru_cache)})")
 
-            return image
+        # Outside the lock: the budget may call back into evict_bytes()
+        _ = get_memory_budget().enforce()
+        return image
 
-    def _load_image_from_disk(self, file_path: str) -> "QImage | None":
+    def get_cached_or_nearest(self, frame: int) -> "tuple[QImage | None, bool]":
         """
-        Load image from disk (handles EXR and standard formats).
+        Get a frame without decoding it, for scrubbing.
+
+        Returns the frame from memory or from the frame disk cache when
+        available, otherwise the nearest frame in memory as a stand-in.
 
         Args:
-            file_path: Absolute path to image file
+            frame: Frame number (0-indexed)
 
         Returns:
-            QImage object or None if loading fails
+            Tuple of (image or None if nothing is cached, whether it is the requested frame)
         """
-        from PySide6.QtGui import QImage
-
-        try:
-            path = Path(file_path)
+        with self._lock:
+            if frame < 0 or frame >= len(self._image_files):
+                return None, False
+            if frame in self._lru_cache:
+                self._lru_cache.move_to_end(frame)
+                return self._lru_cache[frame], True
+            file_path = self._image_files[frame]
 
-            if not path.exists():
-                logger.error(f"Image file not found: {file_path}")
-                return None
+        disk_cache = get_frame_disk_cache_for([file_path])
+        image = disk_cache.load(file_path) if disk_cache is not None else None
+        if image is not None:
+            with self._lock:
+                # Sequence may have changed while reading
+                if frame < len(self._image_files) and self._image_files[frame] == file_path:
+                    self._add_to_cache(frame, image)
+            _ = get_memory_budget().enforce()
+            return image, True
 
-            # EXR format requires special loader
-            if path.suffix.lower() == ".exr":
-                from io_utils.exr_loader import load_exr_as_qimage
+        with self._lock:
+            if not self._lru_cache:
+                return None, False
+            nearest = min(self._lru_cache, key=lambda cached: abs(cached - frame))
+            return self._lru_cache[nearest], False
 
-                image = load_exr_as_qimage(str(file_path))
-                if image is None:
-                    logger.error(f"Failed to load EXR image: {file_path}")
-                    return None
-                return image
+    def _load_image_from_disk(self, file_path: str) -> "QImage | None":
+        """
+        Load image from disk (handles EXR and standard formats).
 
-            # Standard formats (PNG, JPG, etc.)
-            image = QImage(str(file_path))
-            if image.isNull():
-                logger.error(f"Failed to load image (QImage.isNull): {file_path}")
-                return None
+        Args:
+            file_path: Absolute path to image file
 
-            return image
+        Returns:
+            QImage object or None if loading fails
+        """
+        disk_cache = get_frame_disk_cache_for([file_path])
+        if disk_cache is not None:
+            image = disk_cache.load(file_path)
+            if image is not None:
+                return image
 
-        except Exception as e:
-            logger.error(f"Exception loading image {file_path}: {e}")
+        pool = get_exr_decode_pool_for([file_path])
+        if pool is None:
+            image = decode_image_file(file_path)
+        elif not Path(file_path).exists():
+            logger.error(f"Image file not found: {file_path}")
             return None
+        else:
+            image = pool.decode(file_path)
+            if image is None:
+                logger.error(f"Failed to load EXR image: {file_path}")
+
+        if image is not None and disk_cache is not None:
+            _ = disk_cache.store(file_path, image)
+        return image
 
     def _add_to_cache(self, frame: int, image: "QImage") -> None:
         """
@@ -372,6 +602,8 @@ class SafeImageCacheManager(QObject):
             oldest_frame, _ = self._lru_cache.popitem(last=False)
             logger.debug(f"Cache EVICT: frame {oldest_frame} (cache size: {len(self._lru_cache)})")
 
+        tracing.counter("image_cache.size", len(self._lru_cache), "image_cache")
+
     def clear_cache(self) -> None:
         """
         Clear all cached images.
@@ -383,6 +615,36 @@ class SafeImageCacheManager(QObject):
 
         logger.info("Image cache cleared")
 
+    def memory_usage_bytes(self) -> int:
+        """
+        Get the bytes held by cached images.
+
+        Returns:
+            Sum of the cached images' pixel buffer sizes
+        """
+        with self._lock:
+            return sum(image.sizeInBytes() for image in self._lru_cache.values())
+
+    def evict_bytes(self, target_bytes: int) -> int:
+        """
+        Evict least recently used frames for the shared memory budget.
+
+        Args:
+            target_bytes: Bytes to free
+
+        Returns:
+            Bytes freed (may be less than target_bytes if the cache empties)
+        """
+        freed = 0
+        with self._lock:
+            while self._lru_cache and freed < target_bytes:
+                oldest_frame, oldest_image = self._lru_cache.popitem(last=False)
+                freed += oldest_image.sizeInBytes()
+                logger.debug(f"Budget EVICT: frame {oldest_frame}")
+
+        tracing.counter("image_cache.size", self.cache_size, "image_cache")
+        return freed
+
     def cleanup(self) -> None:
         """
         Stop preload worker and cleanup resources.
@@ -392,6 +654,12 @@ class SafeImageCacheManager(QObject):
         """
         logger.debug("Cleaning up image cache manager")
         self._stop_preload()
+        self._retire_scrub_worker()
+        # Shutting down: the threads must finish before they are destroyed
+        for worker in self._retired_workers:
+            if not worker.wait(1000):
+                logger.warning("Retired preload worker did not stop within timeout")
+        self._retired_workers = [worker for worker in self._retired_workers if not worker.isFinished()]
 
     @property
     def cache_size(self) -> int:
@@ -442,6 +710,46 @@ class SafeImageCacheManager(QObject):
         frames_to_load = list(range(start, end + 1))
         self._start_preload_worker(frames_to_load)
 
+    def request_frame(self, frame: int, window_size: int = 2) -> None:
+        """
+        Decode a frame and its closest neighbours in the background, requested frame first.
+
+        Unlike preload_around_frame, does not wait for a running preload to
+        stop, so it can be called for every scrub position without blocking.
+        All requests are served by one scrub worker and replace each other,
+        so only the latest position is decoded. frame_ready is emitted as
+        frames arrive.
+
+        Args:
+            frame: Frame to decode (0-indexed)
+            window_size: Neighbours to decode before and after the frame
+        """
+        if frame < 0 or frame >= len(self._image_files):
+            return
+
+        start = max(0, frame - window_size)
+        end = min(len(self._image_files) - 1, frame + window_size)
+        # Nearest first; ahead of the frame before behind it at equal distance
+        frames_to_load = sorted(range(start, end + 1), key=lambda candidate: (abs(candidate - frame), candidate < frame))
+        with self._lock:
+            frames_needed = [f for f in frames_to_load if f not in self._lru_cache]
+
+        # A running preload would compete with the scrub decodes
+        self._stop_preload(wait=False)
+
+        # Also sent when everything is cached, to drop the previous position's request
+        if self._scrub_worker is not None and self._scrub_worker.request(frames_needed):
+            return
+        if not frames_needed:
+            return
+
+        # The previous scrub worker ran out of requests and is exiting
+        self._retire_scrub_worker()
+        self._scrub_worker = SafeImageScrubWorker(self._image_files, self._sequence_id)
+        self._scrub_worker.image_loaded.connect(self._on_image_preloaded, Qt.ConnectionType.QueuedConnection)
+        _ = self._scrub_worker.request(frames_needed)
+        self._scrub_worker.start()
+
     def preload_around_frame(self, current_frame: int, window_size: int = 20) -> None:
         """
         Preload frames around current frame in background thread.
@@ -492,7 +800,7 @@ class SafeImageCacheManager(QObject):
         logger.debug(f"Starting preload worker for {len(frames_needed)} frames")
 
         # Create and start worker
-        self._preload_worker = SafeImagePreloadWorker(self._image_files, frames_needed)
+        self._preload_worker = SafeImagePreloadWorker(self._image_files, frames_needed, self._sequence_id)
 
         # Connect signals with QueuedConnection (cross-thread safety)
         self._preload_worker.image_loaded.connect(self._on_image_preloaded, Qt.ConnectionType.QueuedConnection)
@@ -501,23 +809,43 @@ class SafeImageCacheManager(QObject):
         # Start worker thread
         self._preload_worker.start()
 
-    def _stop_preload(self) -> None:
+    def _stop_preload(self, wait: bool = True) -> None:
         """
         Stop background preload worker if running.
 
-        Waits up to 1 second for worker to finish gracefully.
+        Retired workers (stopped without waiting) are never waited for here;
+        they finish their current frame in the background.
+
+        Args:
+            wait: Wait up to 1 second for the worker to finish gracefully. If
+                False, the worker is retired instead.
         """
+        # Drop retired workers that have finished
+        self._retired_workers = [worker for worker in self._retired_workers if not worker.isFinished()]
+
         if self._preload_worker is None:
             return
 
         if self._preload_worker.isRunning():
             logger.debug("Stopping preload worker")
             self._preload_worker.stop()
-            if not self._preload_worker.wait(1000):  # 1 second timeout
+            if not wait:
+                self._retired_workers.append(self._preload_worker)
+            elif not self._preload_worker.wait(1000):  # 1 second timeout
                 logger.warning("Preload worker did not stop within timeout")
+                self._retired_workers.append(self._preload_worker)
 
         self._preload_worker = None
 
+    def _retire_scrub_worker(self) -> None:
+        """Stop the scrub worker without waiting; the next request_frame starts a new one."""
+        if self._scrub_worker is None:
+            return
+        self._scrub_worker.stop()
+        if self._scrub_worker.isRunning():
+            self._retired_workers.append(self._scrub_worker)
+        self._scrub_worker = None
+
     @Slot(int, object)
     def _on_image_preloaded(self, frame: int, qimage: object) -> None:
         """
@@ -537,18 +865,31 @@ class SafeImageCacheManager(QObject):
         """
         from PySide6.QtGui import QImage
 
+        # Retired workers may still deliver their last frame
+        sender = self.sender()
+        worker = sender if isinstance(sender, SafeImagePreloadWorker) else self._preload_worker
+
         try:
             # Type guard - qimage should always be QImage from worker
             if not isinstance(qimage, QImage):
                 logger.error(f"Invalid image type received: {type(qimage)}")
                 return
 
+            added = False
             with self._lock:
+                if worker is not None and worker.sequence_id != self._sequence_id:
+                    logger.debug(f"Dropping preloaded frame {frame} from a previous sequence")
+                    return
                 # Don't overwrite if frame was loaded on-demand during preload
                 if frame not in self._lru_cache:
                     self._add_to_cache(frame, qimage)
+                    added = True
                     logger.debug(f"Preloaded frame {frame} added to cache")
+
+            _ = get_memory_budget().enforce()
+            if added:
+                self.frame_ready.emit(frame)
         finally:
             # Always decrement pending count to release backpressure
-            if self._preload_worker is not None:
-                self._preload_worker.decrement_pending()
+            if worker is not None:
+                worker.decrement_pending()
@@ -15,23 +15,29 @@ Phase 3.2: Refactored with internal helpers for separation of concerns.
 from __future__ import annotations
 
 import contextlib
+import time
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, cast
 
-from PySide6.QtCore import QCoreApplication, QThread
-from PySide6.QtGui import QKeyEvent, QMouseEvent, QWheelEvent
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QPointF, QRect, QRectF, QThread, QTimer
+from PySide6.QtGui import QKeyEvent, QMouseEvent, QPolygon, QPolygonF, QWheelEvent
 from PySide6.QtWidgets import QRubberBand
 
+from core import tracing
+from core.display_mode import DisplayMode
+from core.memory_budget import PRIORITY_UNDO_HISTORY, get_memory_budget
 from core.models import PointSearchResult
-from core.spatial_index import PointIndex
+from core.screen_points import FloatArray, IntArray, ScreenPointCache, curve_xy_array, polygon_mask, visible_mask
+from core.spatial_index import DataPointIndex
 from core.type_aliases import SearchMode
 from stores.application_state import ApplicationState, get_application_state
 
 if TYPE_CHECKING:
-    from PySide6.QtCore import QRect
-
     from core.commands.command_manager import CommandManager
+    from core.type_aliases import CurveDataList
     from protocols.ui import CurveViewProtocol, MainWindowProtocol
-    from services.transform_service import TransformService
+    from services.transform_service import Transform, TransformService
 
 from core.logger_utils import get_logger
 
@@ -54,6 +60,110 @@ def _get_transform_service() -> TransformService:
 
 # ==================== Internal Helper Classes ====================
 
+# Fallback display frame interval when the screen refresh rate is unknown (60 Hz)
+_DEFAULT_FRAME_INTERVAL_MS = 16
+
+
+def frame_interval_ms(view: CurveViewProtocol) -> int:
+    """Display frame interval for the view's screen, in milliseconds."""
+    screen_getter = getattr(view, "screen", None)
+    screen = screen_getter() if callable(screen_getter) else None
+    refresh_rate = getattr(screen, "refreshRate", None)
+    rate = refresh_rate() if callable(refresh_rate) else 0.0
+    if not isinstance(rate, (int, float)) or rate <= 0:
+        return _DEFAULT_FRAME_INTERVAL_MS
+    return max(1, round(1000.0 / rate))
+
+
+class _DragSession:
+    """
+    State of one interactive point drag, from mouse press to release.
+
+    Mouse moves only accumulate a screen-space delta. The delta is applied at
+    most once per display frame: immediately if no update happened during the
+    current frame interval, otherwise by a single-shot timer at the end of it.
+    Each update moves only the dragged points in place via
+    ApplicationState.translate_points() and updates their spatial index
+    entries; the view updates their screen-cache entries from points_moved.
+
+    NOT a QObject - lightweight helper owned by _MouseHandler.
+    """
+
+    def __init__(self, owner: InteractionService, view: CurveViewProtocol, curve_name: str, indices: set[int]) -> None:
+        """Start a drag of the given points."""
+        self._owner: InteractionService = owner
+        self._app_state: ApplicationState = get_application_state()
+        self.view: CurveViewProtocol = view
+        self.curve_name: str = curve_name
+        self.indices: list[int] = sorted(indices)
+        self.moved: bool = False
+
+        self._pending_dx: float = 0.0
+        self._pending_dy: float = 0.0
+        self._frame_interval_ms: int = frame_interval_ms(view)
+        self._last_flush: float = 0.0
+
+        self._flush_timer: QTimer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        _ = self._flush_timer.timeout.connect(self._on_flush_timer)
+
+    def add_screen_delta(self, delta_x: float, delta_y: float) -> None:
+        """
+        Accumulate a mouse delta and schedule it for the next display frame.
+
+        Args:
+            delta_x: Screen X delta in pixels
+            delta_y: Screen Y delta in pixels
+        """
+        self._pending_dx += delta_x
+        self._pending_dy += delta_y
+
+        if self._flush_timer.isActive():
+            return  # Already scheduled for this frame
+
+        elapsed_ms = (time.perf_counter() - self._last_flush) * 1000.0
+        if elapsed_ms >= self._frame_interval_ms:
+            self.flush()
+        else:
+            self._flush_timer.start(max(1, int(self._frame_interval_ms - elapsed_ms)))
+
+    def flush(self) -> None:
+        """Apply the accumulated delta to the dragged points."""
+        self._flush_timer.stop()
+        if self._pending_dx == 0.0 and self._pending_dy == 0.0:
+            return
+
+        with tracing.span("interaction.drag_update", "interaction"):
+            transform = _get_transform_service().get_transform(self.view)
+
+            # Transform has a single scale, not scale_x/scale_y
+            curve_delta_x = self._pending_dx / transform.scale
+            # Y-FLIP BUG FIX: Respect view.flip_y_axis
+            y_multiplier = -1.0 if self.view.flip_y_axis else 1.0
+            curve_delta_y = (self._pending_dy * y_multiplier) / transform.scale
+
+            self._pending_dx = 0.0
+            self._pending_dy = 0.0
+            self._last_flush = time.perf_counter()
+
+            positions = self._app_state.translate_points(self.curve_name, self.indices, curve_delta_x, curve_delta_y)
+            if positions:
+                self.moved = True
+                self._owner.selection.update_spatial_index(self.curve_name, positions)
+                self.view.update()
+
+    def finish(self) -> None:
+        """Apply any pending delta and stop the session."""
+        self.flush()
+
+    def _on_flush_timer(self) -> None:
+        """Apply a deferred delta from the event loop."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Error applying drag update: {e}", exc_info=True)
+            # Don't propagate to Qt event loop - prevents UI crash
+
 
 class _MouseHandler:
     """
@@ -72,6 +182,10 @@ class _MouseHandler:
 
         # Track original positions for drag operations (for undo)
         self._drag_original_positions: dict[int, tuple[float, float]] | None = None
+        self._drag_session: _DragSession | None = None
+
+        # Lasso polygon being drawn (Ctrl+Alt drag), in screen coordinates
+        self._lasso: QPolygonF | None = None
 
     def handle_mouse_press(self, view: CurveViewProtocol, event: QMouseEvent) -> None:
         """Handle mouse press events."""
@@ -155,15 +269,18 @@ class _MouseHandler:
 
                     # Capture original positions of all selected points
                     self._drag_original_positions = {}
+                    self._drag_session = None
                     if view.selected_points:
-                        # Use ApplicationState for active curve data
-                        if (cd := self._app_state.active_curve_data) is None:
-                            return
-                        _, data = cd
-                        for idx in view.selected_points:
-                            if 0 <= idx < len(data):
-                                point = data[idx]
-                                self._drag_original_positions[idx] = (point[1], point[2])
+                        _ = self._begin_drag_session(view)
+
+            elif (
+                ctrl_held
+                and event.button() == Qt.MouseButton.LeftButton
+                and event.modifiers() & Qt.KeyboardModifier.AltModifier
+            ):
+                # No point found, Ctrl+Alt held - start freehand lasso selection
+                self._lasso = QPolygonF([QPointF(pos)])
+                view.lasso_polygon = self._lasso
 
             elif ctrl_held and event.button() == Qt.MouseButton.LeftButton:
                 # No point found, but Ctrl is held - try curve line selection
@@ -233,6 +350,29 @@ class _MouseHandler:
             logger.error(f"Error in mouse press handler: {e}", exc_info=True)
             # Don't propagate to Qt event loop - prevents UI crash
 
+    def _begin_drag_session(self, view: CurveViewProtocol) -> _DragSession | None:
+        """
+        Start a drag session for the selected points of the active curve.
+
+        Captures original positions for undo unless they were already captured.
+
+        Returns:
+            The new session, or None if there is no active curve
+        """
+        if (cd := self._app_state.active_curve_data) is None:
+            return None
+        curve_name, data = cd
+
+        if not self._drag_original_positions:
+            self._drag_original_positions = {}
+            for idx in view.selected_points:
+                if 0 <= idx < len(data):
+                    point = data[idx]
+                    self._drag_original_positions[idx] = (point[1], point[2])
+
+        self._drag_session = _DragSession(self._owner, view, curve_name, view.selected_points)
+        return self._drag_session
+
     def handle_mouse_move(self, view: CurveViewProtocol, event: QMouseEvent) -> None:
         """Handle mouse move events."""
         self._owner.assert_main_thread()
@@ -249,39 +389,12 @@ class _MouseHandler:
                 # Drag selected points
                 # selected_points is defined in CurveViewProtocol
                 if view.selected_points:
-                    delta_x = pos.x() - view.last_drag_pos.x()
-                    delta_y = pos.y() - view.last_drag_pos.y()
-
-                    # Convert screen delta to curve coordinates
-                    transform_service = _get_transform_service()
-                    transform = transform_service.get_transform(view)
-
-                    # Transform has a single scale, not scale_x/scale_y
-                    curve_delta_x = delta_x / transform.scale
-                    # Y-FLIP BUG FIX: Respect view.flip_y_axis
-                    y_multiplier = -1.0 if view.flip_y_axis else 1.0
-                    curve_delta_y = (delta_y * y_multiplier) / transform.scale
-
-                    # Use ApplicationState with batch mode for performance
-                    if (cd := self._app_state.active_curve_data) is None:
+                    # Drags started without a press (e.g. programmatically) get a session on first move
+                    session = self._drag_session or self._begin_drag_session(view)
+                    if session is None:
                         return
-                    curve_name, data = cd
-                    active_curve_data = list(data)  # Mutable copy for modifications
-
-                    # Move all selected points - update via ApplicationState with batch mode
-                    with self._app_state.batch_updates():
-                        for idx in view.selected_points:
-                            if 0 <= idx < len(active_curve_data):
-                                point = active_curve_data[idx]
-                                new_x = point[1] + curve_delta_x
-                                new_y = point[2] + curve_delta_y
-                                # Update in local copy
-                                if len(point) >= 4:
-                                    active_curve_data[idx] = (point[0], new_x, new_y, point[3])
-                                else:
-                                    active_curve_data[idx] = (point[0], new_x, new_y)
-                        # Write back to ApplicationState
-                        self._app_state.set_curve_data(curve_name, active_curve_data)
+                    # Coalesced: applied in place at most once per display frame
+                    session.add_screen_delta(pos.x() - view.last_drag_pos.x(), pos.y() - view.last_drag_pos.y())
 
                 view.last_drag_pos = pos
 
@@ -297,6 +410,11 @@ class _MouseHandler:
                     _ = pan_method(delta_x, delta_y)
                 view.last_pan_pos = pos
 
+            elif self._lasso is not None:
+                # Extend the lasso outline
+                self._lasso.append(QPointF(pos))
+                view.lasso_polygon = self._lasso
+
             # rubber_band_active is bool, rubber_band_origin is QPoint in CurveViewProtocol
             elif view.rubber_band_active:
                 # Update rubber band rectangle
@@ -326,6 +444,12 @@ class _MouseHandler:
                 view.last_drag_pos = None
                 self._owner.drag_point_idx = None
 
+                # Apply the last coalesced delta before recording the move
+                session = self._drag_session
+                self._drag_session = None
+                if session is not None:
+                    session.finish()
+
                 # Create command if points were actually moved
                 if self._drag_original_positions:
                     from core.commands.curve_commands import BatchMoveCommand
@@ -333,7 +457,7 @@ class _MouseHandler:
                     # Collect the moves using ApplicationState
                     if (cd := self._app_state.active_curve_data) is None:
                         return
-                    _, data = cd
+                    curve_name, data = cd
                     moves: list[tuple[int, tuple[float, float], tuple[float, float]]] = []
                     for idx, old_pos in self._drag_original_positions.items():
                         if 0 <= idx < len(data):
@@ -349,10 +473,14 @@ class _MouseHandler:
                             moves=moves,
                         )
                         # The points have already been moved during dragging,
-                        # so we mark the command as executed and add it to history
-                        command.executed = True
+                        # so we record them as applied and add the command to history
+                        command.mark_applied(curve_name, data)
                         _ = self._owner.command_manager.add_executed_command(command, view.main_window)
 
+                # Listeners that skip per-point drag updates catch up once here
+                if session is not None and session.moved:
+                    self._app_state.publish_curve_changes(session.curve_name)
+
                 # Clear the tracked positions
                 self._drag_original_positions = None
 
@@ -363,6 +491,15 @@ class _MouseHandler:
                 view.last_pan_pos = None
                 view.unsetCursor()
 
+            elif self._lasso is not None:
+                # Finish lasso selection (adds to the selections, like the Ctrl rubber band)
+                lasso = self._lasso
+                self._lasso = None
+                view.lasso_polygon = None
+                selected_count = self._owner.selection.select_points_in_region(view, lasso, add_to_selection=True)
+                if selected_count > 0:
+                    self._owner.commands.update_history_buttons(view.main_window)
+
             # rubber_band_active is bool in CurveViewProtocol
             elif view.rubber_band_active:
                 # Finish rectangle selection
@@ -370,28 +507,13 @@ class _MouseHandler:
                 if view.rubber_band is not None:
                     rect = view.rubber_band.geometry()
 
-                    # Find points in rectangle using ApplicationState
-                    if (cd := self._app_state.active_curve_data) is None:
-                        return
-                    _, data = cd
-
-                    selected_count = 0
-                    transform_service = _get_transform_service()
-                    transform = transform_service.get_transform(view)
-
-                    if not view.selected_points:
-                        view.selected_points = set()
-
-                    for i, point in enumerate(data):
-                        screen_x, screen_y = transform.data_to_screen(point[1], point[2])
-                        if rect.contains(int(screen_x), int(screen_y)):
-                            view.selected_points.add(i)
-                            selected_count += 1
-
                     # Hide rubber band
                     view.rubber_band.hide()
                     view.rubber_band_active = False
 
+                    # Add points of all displayed curves inside the rectangle, committed as one update
+                    selected_count = self._owner.selection.select_points_in_region(view, rect, add_to_selection=True)
+
                     # Update history if points were selected
                     if selected_count > 0:
                         self._owner.commands.update_history_buttons(view.main_window)
@@ -543,8 +665,47 @@ class _SelectionManager:
         self._owner = owner
         self._app_state: ApplicationState = get_application_state()
 
-        # Spatial index for efficient point lookups (uses adaptive grid sizing)
-        self._point_index: PointIndex = PointIndex()
+        # Data-space spatial indexes by curve; keyed on the curve's data version,
+        # so they survive pan/zoom and are only rebuilt when the curve changes
+        self._point_indexes: dict[str, DataPointIndex] = {}
+        # Curve most recently searched (reported by get_spatial_index_stats)
+        self._indexed_curve: str | None = None
+
+    def _use_index_for(self, curve_name: str, curve_data: CurveDataList) -> DataPointIndex:
+        """
+        Get the spatial index of a curve, synced to the curve's current data version.
+
+        Args:
+            curve_name: Curve to search
+            curve_data: Current data of the curve
+
+        Returns:
+            Index valid for curve_data
+        """
+        point_index = self._point_indexes.get(curve_name)
+        if point_index is None:
+            # Drop indexes of curves that no longer exist
+            for name in [name for name in self._point_indexes if self._app_state.get_curve_version(name) == 0]:
+                del self._point_indexes[name]
+            point_index = self._point_indexes[curve_name] = DataPointIndex()
+        _ = point_index.sync(curve_data, self._app_state.get_curve_version(curve_name))
+        self._indexed_curve = curve_name
+        return point_index
+
+    @staticmethod
+    def _shared_screen_points(
+        view: CurveViewProtocol, curve_name: str, transform: Transform, curve_data: CurveDataList
+    ) -> FloatArray | None:
+        """
+        Get the screen positions the view's render cache holds for a curve, if still current.
+
+        Lets region queries test the positions the renderer already computed
+        instead of transforming the curve again.
+        """
+        cache: object = getattr(getattr(view, "render_cache", None), "screen_points_cache", None)
+        if not isinstance(cache, ScreenPointCache):
+            return None
+        return cache.get(curve_name, transform, len(curve_data))
 
     def find_point_at(
         self, view: CurveViewProtocol, x: float, y: float, mode: SearchMode = "active"
@@ -586,8 +747,7 @@ class _SelectionManager:
             transform = transform_service.get_transform(view)
 
             threshold = 5.0
-            # Updated API: curve_data is now first parameter
-            idx = self._point_index.find_point_at_position(data, transform, x, y, threshold, view)
+            idx = self._use_index_for(curve_name, data).find_point_at_position(transform, x, y, threshold)
             return PointSearchResult(index=idx, curve_name=curve_name if idx >= 0 else None, distance=0.0)
 
         if mode == "all_visible":
@@ -608,13 +768,8 @@ class _SelectionManager:
                 if not curve_data:
                     continue
 
-                # CRITICAL: Clear spatial index before each curve to prevent cache collision
-                # The spatial index caches by transform hash + point count, but different
-                # curves can have the same point count, leading to stale index data
-                self._point_index.clear_cache()
-
-                # Search this curve with clean API
-                idx = self._point_index.find_point_at_position(curve_data, transform, x, y, threshold, view)
+                # Each curve has its own index, valid until that curve's data changes
+                idx = self._use_index_for(curve_name, curve_data).find_point_at_position(transform, x, y, threshold)
 
                 if idx >= 0:
                     # Calculate distance to find best match
@@ -738,7 +893,7 @@ class _SelectionManager:
         # Use ApplicationState for active curve data
         if (cd := self._app_state.active_curve_data) is None:
             return -1
-        _, data = cd
+        curve_name, data = cd
 
         transform_service = _get_transform_service()
 
@@ -746,7 +901,7 @@ class _SelectionManager:
         transform = transform_service.get_transform(view)
 
         # Use spatial index with specified tolerance
-        return self._point_index.find_point_at_position(data, transform, x, y, tolerance, view)
+        return self._use_index_for(curve_name, data).find_point_at_position(transform, x, y, tolerance)
 
     def select_point_by_index(
         self,
@@ -871,7 +1026,7 @@ class _SelectionManager:
         self, view: CurveViewProtocol, _main_window: MainWindowProtocol, rect: QRect, curve_name: str | None = None
     ) -> int:
         """
-        Select points in rectangle using spatial indexing for O(1) performance.
+        Select points of one curve in a rectangle with a vectorized mask.
 
         Args:
             view: Curve view
@@ -896,42 +1051,148 @@ class _SelectionManager:
         if curve_name is None:
             return 0
 
-        # Get curve data for specified curve
-        curve_data = self._app_state.get_curve_data(curve_name)
-        if not curve_data:
-            return 0
+        hits = self._points_in_region(view, rect, [curve_name])
+        selected_set = set(hits[curve_name].tolist()) if curve_name in hits else set()
 
-        transform_service = _get_transform_service()
+        # Update ApplicationState
+        self._app_state.set_selection(curve_name, selected_set)
 
-        # Create transform for coordinate conversion
-        transform = transform_service.get_transform(view)
+        # Update view for backward compatibility (view selection mirrors the active curve)
+        if curve_name == self._app_state.active_curve:
+            view.selected_points = selected_set
+            view.selected_point_idx = min(selected_set) if selected_set else -1
 
-        # Use spatial index for O(1) rectangular selection
-        point_indices = self._point_index.get_points_in_rect(
-            curve_data, transform, rect.left(), rect.top(), rect.right(), rect.bottom(), view
-        )
+        view.update()
+        return len(selected_set)
 
-        # Convert to set for ApplicationState
-        selected_set = set(point_indices)
+    def find_points_in_region(
+        self, view: CurveViewProtocol, region: QRect | QRectF | QPolygon | QPolygonF, mode: SearchMode = "all_visible"
+    ) -> dict[str, IntArray]:
+        """
+        Find points inside a screen rectangle or lasso polygon.
 
-        # Update ApplicationState
-        self._app_state.set_selection(curve_name, selected_set)
+        Args:
+            view: Curve view the region was drawn in
+            region: Rectangle, or polygon for lasso selection (screen coordinates)
+            mode: "active" for the active curve only, "all_visible" for every displayed curve
 
-        # Update view for backward compatibility
-        view.selected_points.clear()
-        for idx in point_indices:
-            view.selected_points.add(idx)
+        Returns:
+            Sorted point indices by curve name; curves without hits are omitted
+        """
+        self._owner.assert_main_thread()
+        return self._points_in_region(view, region, self._region_curve_names(mode))
 
-        selected_count = len(point_indices)
+    def select_points_in_region(
+        self,
+        view: CurveViewProtocol,
+        region: QRect | QRectF | QPolygon | QPolygonF,
+        mode: SearchMode = "all_visible",
+        add_to_selection: bool = False,
+    ) -> int:
+        """
+        Select points inside a screen rectangle or lasso polygon across curves.
 
-        # Update selected index
-        if view.selected_points:
-            view.selected_point_idx = min(view.selected_points)
-        else:
-            view.selected_point_idx = -1
+        The selections of all searched curves are committed to ApplicationState
+        in one batched update.
+
+        Args:
+            view: Curve view the region was drawn in
+            region: Rectangle, or polygon for lasso selection (screen coordinates)
+            mode: "active" for the active curve only, "all_visible" for every displayed curve
+            add_to_selection: If True, add to existing selections. If False, replace
+                the selections of the searched curves.
+
+        Returns:
+            Number of points inside the region
+        """
+        self._owner.assert_main_thread()
+
+        curve_names = self._region_curve_names(mode)
+        hits = self._points_in_region(view, region, curve_names)
+
+        selections: dict[str, set[int]] = {}
+        for curve_name in curve_names:
+            indices = set(hits[curve_name].tolist()) if curve_name in hits else set()
+            if add_to_selection:
+                if not indices:
+                    continue
+                indices |= self._app_state.get_selection(curve_name)
+            selections[curve_name] = indices
+        self._app_state.set_selections(selections)
 
         view.update()
-        return selected_count
+        return sum(len(indices) for indices in hits.values())
+
+    def _region_curve_names(self, mode: SearchMode) -> list[str]:
+        """Get the curves a region query searches: the active one, or all displayed curves."""
+        active_curve = self._app_state.active_curve
+        if mode == "active":
+            return [active_curve] if active_curve is not None else []
+
+        display_mode = self._app_state.display_mode
+        if display_mode == DisplayMode.ALL_VISIBLE:
+            candidates = self._app_state.get_all_curve_names()
+        elif display_mode == DisplayMode.SELECTED:
+            selected_curves = self._app_state.get_selected_curves()
+            candidates = [name for name in self._app_state.get_all_curve_names() if name in selected_curves]
+        else:
+            candidates = [active_curve] if active_curve is not None else []
+
+        return [name for name in candidates if self._app_state.get_curve_metadata(name).get("visible", True)]
+
+    def _points_in_region(
+        self, view: CurveViewProtocol, region: QRect | QRectF | QPolygon | QPolygonF, curve_names: list[str]
+    ) -> dict[str, IntArray]:
+        """
+        Test the points of several curves against a region in one vectorized pass.
+
+        Screen positions are stacked into one array (the render cache's array
+        where it is current, one batch transform for all other curves), masked
+        once, and the hits split back per curve.
+        """
+        transform = _get_transform_service().get_transform(view)
+
+        order: list[str] = []
+        lengths: list[int] = []
+        parts: list[FloatArray] = []
+        pending_names: list[str] = []
+        pending_xy: list[FloatArray] = []
+        for curve_name in curve_names:
+            curve_data = self._app_state.get_curve_data(curve_name)
+            if not curve_data:
+                continue
+            shared = self._shared_screen_points(view, curve_name, transform, curve_data)
+            if shared is not None:
+                order.append(curve_name)
+                lengths.append(len(shared))
+                parts.append(shared)
+            else:
+                pending_names.append(curve_name)
+                pending_xy.append(curve_xy_array(curve_data))
+
+        if pending_xy:
+            order.extend(pending_names)
+            lengths.extend(len(xy) for xy in pending_xy)
+            parts.append(transform.batch_data_to_screen(np.concatenate(pending_xy)))
+        if not parts:
+            return {}
+
+        screen_points = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        if isinstance(region, QRect | QRectF):
+            mask = visible_mask(screen_points, region.left(), region.top(), region.right(), region.bottom())
+        else:
+            polygon = np.array([(vertex.x(), vertex.y()) for vertex in region], dtype=np.float64).reshape(-1, 2)
+            mask = polygon_mask(screen_points, polygon)
+
+        hits = np.flatnonzero(mask)
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        bounds = np.searchsorted(hits, offsets)
+        result: dict[str, IntArray] = {}
+        for position, curve_name in enumerate(order):
+            curve_hits = hits[bounds[position] : bounds[position + 1]] - offsets[position]
+            if len(curve_hits):
+                result[curve_name] = curve_hits
+        return result
 
     def get_spatial_index_stats(self) -> dict[str, object]:
         """
@@ -940,11 +1201,25 @@ class _SelectionManager:
         Returns:
             Dictionary with spatial index statistics
         """
-        return cast(dict[str, object], self._point_index.get_stats())
+        point_index = self._point_indexes.get(self._indexed_curve) if self._indexed_curve is not None else None
+        return cast(dict[str, object], (point_index or DataPointIndex()).get_stats())
 
     def clear_spatial_index(self) -> None:
         """Clear the spatial index cache to force rebuild."""
-        self._point_index.clear_cache()
+        self._point_indexes.clear()
+        self._indexed_curve = None
+
+    def update_spatial_index(self, curve_name: str, positions: Mapping[int, tuple[float, float]]) -> None:
+        """
+        Update spatial index entries for moved points without a rebuild.
+
+        Args:
+            curve_name: Curve the points belong to
+            positions: New (x, y) data coordinates by point index
+        """
+        point_index = self._point_indexes.get(curve_name)
+        if point_index is not None:
+            _ = point_index.update_points(positions, self._app_state.get_curve_version(curve_name))
 
 
 class _CommandHistory:
@@ -1436,34 +1711,15 @@ class _PointManipulator:
         if curve_name is None:
             return False
 
-        # Get curve data for specified curve
-        curve_data = list(self._app_state.get_curve_data(curve_name))
-        if not curve_data:
+        # Move only the selected points in place, then publish the curve once
+        positions = self._app_state.translate_points(curve_name, view.selected_points, dx, dy)
+        if not positions:
             return False
 
-        success = False
-        # Update via ApplicationState with batch mode for performance
-        with self._app_state.batch_updates():
-            for idx in view.selected_points:
-                if 0 <= idx < len(curve_data):
-                    point = curve_data[idx]
-                    # Preserve frame and status, update x and y
-                    new_x = point[1] + dx
-                    new_y = point[2] + dy
-                    if len(point) >= 4:
-                        curve_data[idx] = (point[0], new_x, new_y, point[3])
-                    else:
-                        curve_data[idx] = (point[0], new_x, new_y)
-                    success = True
-
-            if success:
-                # Write back to ApplicationState
-                self._app_state.set_curve_data(curve_name, curve_data)
-
-        if success:
-            view.update()
-
-        return success
+        self._owner.selection.update_spatial_index(curve_name, positions)
+        self._app_state.publish_curve_changes(curve_name)
+        view.update()
+        return True
 
     def on_data_changed(self, view: CurveViewProtocol, curve_name: str | None = None) -> None:
         """
@@ -1501,9 +1757,7 @@ class _PointManipulator:
         else:
             logger.debug(f"Selection changed for '{curve_name}': {len(indices)} points selected")
 
-        # Clear spatial index since selection affects rendering
-        # (selected points may be highlighted differently)
-        self._owner.selection.clear_spatial_index()
+        # Spatial indexes hold data positions only, so selection changes leave them valid
 
     def on_frame_changed(self, frame: int, curve_name: str | None = None) -> None:
         """
@@ -1519,8 +1773,7 @@ class _PointManipulator:
         else:
             logger.debug(f"Frame changed to {frame} for '{curve_name}'")
 
-        # Clear spatial index since frame affects which points are visible/highlighted
-        self._owner.selection.clear_spatial_index()
+        # Spatial indexes hold data positions only, so frame changes leave them valid
 
     def on_point_moved(self, _main_window: MainWindowProtocol, _idx: int, _x: float, _y: float) -> None:
         """Handle point movement notifications."""
@@ -1665,6 +1918,7 @@ class InteractionService:
             from core.commands.command_manager import CommandManager
 
             self._command_manager = CommandManager(max_history_size=100)
+            get_memory_budget().register("undo_history", self._command_manager, PRIORITY_UNDO_HISTORY, "Undo history")
         return self._command_manager
 
     # ==================== Public Event Handler API (Delegates to _MouseHandler) ====================
@@ -1744,9 +1998,25 @@ class InteractionService:
     def select_points_in_rect(
         self, view: CurveViewProtocol, _main_window: MainWindowProtocol, rect: QRect, curve_name: str | None = None
     ) -> int:
-        """Select points in rectangle using spatial indexing."""
+        """Select points in rectangle using a vectorized mask."""
         return self._selection.select_points_in_rect(view, _main_window, rect, curve_name)
 
+    def find_points_in_region(
+        self, view: CurveViewProtocol, region: QRect | QRectF | QPolygon | QPolygonF, mode: SearchMode = "all_visible"
+    ) -> dict[str, IntArray]:
+        """Find points inside a rectangle or lasso polygon, by curve."""
+        return self._selection.find_points_in_region(view, region, mode)
+
+    def select_points_in_region(
+        self,
+        view: CurveViewProtocol,
+        region: QRect | QRectF | QPolygon | QPolygonF,
+        mode: SearchMode = "all_visible",
+        add_to_selection: bool = False,
+    ) -> int:
+        """Select points inside a rectangle or lasso polygon across curves in one update."""
+        return self._selection.select_points_in_region(view, region, mode, add_to_selection)
+
     def get_spatial_index_stats(self) -> dict[str, object]:
         """Get spatial index performance statistics."""
         return self._selection.get_spatial_index_stats()
@@ -7,13 +7,18 @@ This service merges functionality from:
 - view_state.py: ViewState class for transformation parameters
 
 Provides a unified interface for all coordinate transformations and view state management.
+Transforms are memoized: by view state, and per view by its ``view_version`` counter.
 """
 
 import hashlib
 import threading
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Protocol, cast
+from typing import TYPE_CHECKING, Protocol, TypeAlias, cast
 
+import numpy as np
+from numpy.typing import NDArray
 from typing_extensions import override
 
 from core.defaults import DEFAULT_IMAGE_HEIGHT, DEFAULT_IMAGE_WIDTH
@@ -53,6 +58,11 @@ from core.logger_utils import get_logger
 
 logger = get_logger("transform_service")
 
+FloatArray: TypeAlias = NDArray[np.float64]
+
+# Distinct view states kept by TransformService (zoom/pan history, renderer and views)
+_TRANSFORM_CACHE_SIZE = 256
+
 
 class BackgroundImageProtocol(Protocol):
     """Protocol for background image objects (QPixmap, QImage, etc.)."""
@@ -108,6 +118,30 @@ class ViewState:
         updated.update(kwargs)
         return ViewState(**updated)  # pyright: ignore[reportArgumentType]
 
+    def cache_key(self) -> tuple[object, ...]:
+        """
+        Get a hashable key covering everything a Transform depends on.
+
+        Unlike ``__eq__``, the background image only contributes its presence,
+        so comparing keys never compares image contents.
+        """
+        return (
+            self.display_width,
+            self.display_height,
+            self.widget_width,
+            self.widget_height,
+            self.zoom_factor,
+            self.offset_x,
+            self.offset_y,
+            self.scale_to_image,
+            self.flip_y_axis,
+            self.manual_x_offset,
+            self.manual_y_offset,
+            self.background_image is not None,
+            self.image_width,
+            self.image_height,
+        )
+
     def to_dict(self) -> dict[str, object]:
         """Convert the ViewState to a dictionary."""
         return {
@@ -178,6 +212,13 @@ class ViewState:
         )
 
 
+def _xy_columns(points: FloatArray) -> FloatArray:
+    """Return the x/y columns of an Nx2 [x, y] or Nx3 [frame, x, y] array."""
+    if points.ndim != 2 or points.shape[1] not in (2, 3):
+        raise ValueError(f"Expected Nx2 or Nx3 array, got shape {points.shape}")
+    return points[:, -2:]
+
+
 class Transform:
     """
     Unified immutable class representing a coordinate transformation.
@@ -192,10 +233,33 @@ class Transform:
     4. Centering offset application
     5. Pan offset application
     6. Manual offset application
+
+    The pipeline is affine per axis, so it is folded into one scale and one
+    offset per axis at construction (see ``affine``). Transforms compare and
+    hash by their parameters and cannot be modified after construction.
     """
 
+    __slots__: tuple[str, ...] = (
+        "_divisor_x",
+        "_divisor_y",
+        "_key",
+        "_offset_x",
+        "_offset_y",
+        "_parameters",
+        "_scale_x",
+        "_scale_y",
+        "_stability_hash",
+    )
+
     _parameters: dict[str, float | bool | int]
-    _stability_hash: str
+    _key: tuple[float | bool | int, ...]
+    _stability_hash: str | None
+    _scale_x: float
+    _scale_y: float
+    _offset_x: float
+    _offset_y: float
+    _divisor_x: float
+    _divisor_y: float
 
     def __init__(
         self,
@@ -219,8 +283,7 @@ class Transform:
             height = abs(height)  # Use absolute value for negative heights
         height = min(height, 1_000_000)  # Clamp to reasonable maximum
 
-        # Store all parameters as immutable private attributes
-        self._parameters = {
+        parameters: dict[str, float | bool | int] = {
             "scale": float(scale),
             "center_offset_x": float(center_offset_x),
             "center_offset_y": float(center_offset_y),
@@ -234,9 +297,48 @@ class Transform:
             "image_scale_y": float(image_scale_y),
             "scale_to_image": bool(scale_to_image),
         }
+        object.__setattr__(self, "_parameters", parameters)
+        object.__setattr__(self, "_key", tuple(parameters.values()))
+        object.__setattr__(self, "_stability_hash", None)
+
+        # Fold the pipeline into screen = data * scale + offset per axis
+        main_scale = float(scale)
+        image_x = float(image_scale_x) if scale_to_image else 1.0
+        image_y = float(image_scale_y) if scale_to_image else 1.0
+        scale_x = image_x * main_scale
+        scale_y = image_y * main_scale
+        offset_x = float(center_offset_x) + float(pan_offset_x) + float(manual_offset_x)
+        offset_y = float(center_offset_y) + float(pan_offset_y) + float(manual_offset_y)
+        if flip_y and height > 0:
+            scale_y = -scale_y
+            offset_y = height - offset_y
+
+        # Zero factors are skipped when inverting rather than divided by
+        divisor_x = (main_scale or 1.0) * (image_x or 1.0)
+        divisor_y = (main_scale or 1.0) * (image_y or 1.0)
+        if flip_y and height > 0:
+            divisor_y = -divisor_y
+
+        object.__setattr__(self, "_scale_x", scale_x)
+        object.__setattr__(self, "_scale_y", scale_y)
+        object.__setattr__(self, "_offset_x", offset_x)
+        object.__setattr__(self, "_offset_y", offset_y)
+        object.__setattr__(self, "_divisor_x", divisor_x)
+        object.__setattr__(self, "_divisor_y", divisor_y)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Transform is immutable; use with_updates() instead of setting {name!r}")
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Transform):
+            return NotImplemented
+        return self._key == other._key
 
-        # Compute stability hash for caching
-        self._stability_hash = self._compute_stability_hash()
+    @override
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     def _compute_stability_hash(self) -> str:
         """Compute a hash of the transformation parameters for stability tracking."""
@@ -247,8 +349,20 @@ class Transform:
 
     @property
     def stability_hash(self) -> str:
-        """Get the stability hash for this transformation."""
-        return self._stability_hash
+        """Get the stability hash for this transformation (computed on first use)."""
+        if self._stability_hash is None:
+            object.__setattr__(self, "_stability_hash", self._compute_stability_hash())
+        return cast(str, self._stability_hash)
+
+    @property
+    def affine(self) -> tuple[float, float, float, float]:
+        """
+        Get the combined per-axis coefficients (scale_x, offset_x, scale_y, offset_y).
+
+        ``screen_x = data_x * scale_x + offset_x`` and likewise for y, with Y-flip
+        already folded into the y coefficients. Intended for vectorized callers.
+        """
+        return (self._scale_x, self._offset_x, self._scale_y, self._offset_y)
 
     @property
     def scale(self) -> float:
@@ -306,37 +420,15 @@ class Transform:
         Returns:
             Tuple of (screen_x, screen_y)
         """
-        # Step 1: Apply image scaling if enabled
-        if self.scale_to_image:
-            x *= self._parameters["image_scale_x"]
-            y *= self._parameters["image_scale_y"]
-
-        # Step 2: Apply main scaling
-        x *= self.scale
-        y *= self.scale
-
-        # Step 3: Apply centering offset
-        x += self._parameters["center_offset_x"]
-        y += self._parameters["center_offset_y"]
-
-        # Step 4: Apply pan offset
-        x += self._parameters["pan_offset_x"]
-        y += self._parameters["pan_offset_y"]
-
-        # Step 5: Apply manual offset
-        x += self._parameters["manual_offset_x"]
-        y += self._parameters["manual_offset_y"]
-
-        # Step 6: Apply Y-axis flipping if enabled (last step)
-        if self.flip_y and self.display_height > 0:
-            y = self.display_height - y
-
-        return (x, y)
+        return (x * self._scale_x + self._offset_x, y * self._scale_y + self._offset_y)
 
     def screen_to_data(self, x: float, y: float) -> tuple[float, float]:
         """
         Transform screen coordinates to data coordinates.
 
+        Zero scale factors are treated as 1 when inverting, so degenerate
+        transforms return the offset-corrected position instead of raising.
+
         Args:
             x: Screen X coordinate
             y: Screen Y coordinate
@@ -344,35 +436,49 @@ class Transform:
         Returns:
             Tuple of (data_x, data_y)
         """
-        # Reverse Step 6: Reverse Y-axis flipping if enabled (first in reverse)
-        if self.flip_y and self.display_height > 0:
-            y = self.display_height - y
+        return ((x - self._offset_x) / self._divisor_x, (y - self._offset_y) / self._divisor_y)
+
+    def batch_data_to_screen(self, points: FloatArray) -> FloatArray:
+        """
+        Transform many data points to screen coordinates in one vectorized step.
 
-        # Reverse Step 5: Remove manual offset
-        x -= self._parameters["manual_offset_x"]
-        y -= self._parameters["manual_offset_y"]
+        Args:
+            points: Nx2 array of [x, y] or Nx3 array of [frame, x, y]
 
-        # Reverse Step 4: Remove pan offset
-        x -= self._parameters["pan_offset_x"]
-        y -= self._parameters["pan_offset_y"]
+        Returns:
+            Nx2 float64 array of screen coordinates
 
-        # Reverse Step 3: Remove centering offset
-        x -= self._parameters["center_offset_x"]
-        y -= self._parameters["center_offset_y"]
+        Raises:
+            ValueError: If the array is not Nx2 or Nx3
+        """
+        xy = _xy_columns(points)
+        result = np.empty((len(xy), 2), dtype=np.float64)
+        np.multiply(xy[:, 0], self._scale_x, out=result[:, 0])
+        np.multiply(xy[:, 1], self._scale_y, out=result[:, 1])
+        result[:, 0] += self._offset_x
+        result[:, 1] += self._offset_y
+        return result
+
+    def batch_screen_to_data(self, points: FloatArray) -> FloatArray:
+        """
+        Transform many screen points to data coordinates in one vectorized step.
 
-        # Reverse Step 2: Remove main scaling
-        if self.scale != 0:
-            x /= self.scale
-            y /= self.scale
+        Args:
+            points: Nx2 array of screen [x, y]
 
-        # Reverse Step 1: Remove image scaling if enabled
-        if self.scale_to_image:
-            if self._parameters["image_scale_x"] != 0:
-                x /= self._parameters["image_scale_x"]
-            if self._parameters["image_scale_y"] != 0:
-                y /= self._parameters["image_scale_y"]
+        Returns:
+            Nx2 float64 array of data coordinates
 
-        return (x, y)
+        Raises:
+            ValueError: If the array is not Nx2 or Nx3
+        """
+        xy = _xy_columns(points)
+        result = np.empty((len(xy), 2), dtype=np.float64)
+        np.subtract(xy[:, 0], self._offset_x, out=result[:, 0])
+        np.subtract(xy[:, 1], self._offset_y, out=result[:, 1])
+        result[:, 0] /= self._divisor_x
+        result[:, 1] /= self._divisor_y
+        return result
 
     def data_to_screen_qpoint(self, point: QPointF) -> QPointF:
         """Transform a QPointF from data to screen coordinates."""
@@ -501,10 +607,16 @@ class TransformService:
     """
 
     _lock: threading.RLock
+    _transforms: "OrderedDict[tuple[object, ...], Transform]"
+    _view_transforms: "weakref.WeakKeyDictionary[object, tuple[tuple[int, int, int], Transform]]"
 
     def __init__(self) -> None:
         """Initialize the TransformService."""
         self._lock = threading.RLock()
+        # LRU of transforms by ViewState.cache_key()
+        self._transforms = OrderedDict()
+        # Last transform per view, valid while the view's (view_version, width, height) is unchanged
+        self._view_transforms = weakref.WeakKeyDictionary()
 
     def create_view_state(self, curve_view: "CurveViewProtocol") -> ViewState:
         """Create a ViewState from a CurveView instance."""
@@ -518,9 +630,21 @@ class TransformService:
             view_state: The ViewState to create a transform for
 
         Returns:
-            Transform instance for the given view state
+            Transform instance for the given view state (shared for equal view states)
         """
-        return Transform.from_view_state(view_state)
+        key = view_state.cache_key()
+        with self._lock:
+            transform = self._transforms.get(key)
+            if transform is not None:
+                self._transforms.move_to_end(key)
+                return transform
+
+        transform = Transform.from_view_state(view_state)
+        with self._lock:
+            self._transforms[key] = transform
+            if len(self._transforms) > _TRANSFORM_CACHE_SIZE:
+                _ = self._transforms.popitem(last=False)
+        return transform
 
     def get_transform(self, curve_view: "CurveViewProtocol") -> Transform:
         """
@@ -553,9 +677,33 @@ class TransformService:
                 view_state = transform_service.create_view_state(view)
                 view_state = view_state.with_updates(zoom_factor=2.0)
                 transform = transform_service.create_transform_from_view_state(view_state)
+
+            Views that expose an integer ``view_version`` (bumped whenever zoom,
+            pan, size, image or axis settings change) get their last transform
+            back without re-reading any view state while the version is unchanged.
+            The widget size is checked as well, since hidden widgets only receive
+            their resize event when shown.
         """
-        view_state = self.create_view_state(curve_view)
-        return self.create_transform_from_view_state(view_state)
+        version = getattr(curve_view, "view_version", None)
+        if not isinstance(version, int):
+            return self.create_transform_from_view_state(self.create_view_state(curve_view))
+
+        stamp = (version, curve_view.width(), curve_view.height())
+        with self._lock:
+            cached = self._view_transforms.get(curve_view)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        transform = self.create_transform_from_view_state(self.create_view_state(curve_view))
+        with self._lock:
+            self._view_transforms[curve_view] = (stamp, transform)
+        return transform
+
+    def clear_cache(self) -> None:
+        """Drop all memoized transforms."""
+        with self._lock:
+            self._transforms.clear()
+            self._view_transforms.clear()
 
     def create_transform(
         self,
@@ -7,6 +7,8 @@ via Qt signals, solving the "orphaned component" problem.
 
 from .application_state import ApplicationState, get_application_state, reset_application_state
 from .connection_verifier import ConnectionRegistry, ConnectionReport, ConnectionStatus, ConnectionVerifier
+from .curve_summary import CurveSummary
+from .state_snapshot import StateSnapshot
 from .store_manager import StoreManager
 
 __all__ = [
@@ -15,6 +17,8 @@ __all__ = [
     "ConnectionReport",
     "ConnectionStatus",
     "ConnectionVerifier",
+    "CurveSummary",
+    "StateSnapshot",
     "StoreManager",
     "get_application_state",
     "get_store_manager",
@@ -20,6 +20,8 @@ Thread Safety:
 - Batch operations are main-thread-only (no locking needed)
 - Worker threads should emit signals, handlers then update state
 - _assert_main_thread() validates correct thread usage
+- Workers read state through snapshot() (immutable, any thread) and results are
+  written back on the main thread with commit_curve_data()/commit_curves()
 
 Usage:
     from stores.application_state import get_application_state
@@ -52,17 +54,20 @@ Batching Multiple Updates:
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Iterable, Mapping
 from contextlib import contextmanager
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from PySide6.QtCore import QCoreApplication, QObject, QThread, Signal, SignalInstance
 
 from core.display_mode import DisplayMode
 from core.models import CurvePoint, PointStatus
+from stores.curve_summary import CurveSummary
+from stores.state_snapshot import StateSnapshot
 
 if TYPE_CHECKING:
-    from core.type_aliases import CurveDataInput, CurveDataList
+    from core.type_aliases import CurveDataInput, CurveDataList, LegacyPointData
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +117,7 @@ class ApplicationState(QObject):
     # State change signals
     state_changed: Signal = Signal()  # Emitted on any state change
     curves_changed: Signal = Signal(dict)  # curves_data changed: dict[str, CurveDataList]
+    points_moved: Signal = Signal(str, object)  # (curve_name, {index: (x, y)}) from translate_points()
     selection_changed: Signal = Signal(set, str)  # Point-level (frame indices)
     active_curve_changed: Signal = Signal(object)  # active_curve_name: str | None (matches StateManager pattern)
     frame_changed: Signal = Signal(int)  # current_frame: int
@@ -145,6 +151,22 @@ class ApplicationState(QObject):
         self._emitting: bool = False  # Prevent reentrancy during signal emission
         self._pending_signals: dict[SignalInstance, tuple[Any, ...]] = {}
 
+        # Curves whose list has not been handed to curves_changed listeners since it was
+        # copied, so translate_points() may edit it in place
+        self._private_curves: set[str] = set()
+
+        # Per-curve data version, bumped on every change to a curve's points.
+        # Drawn from one counter so a recreated curve never reuses a version.
+        self._curve_versions: dict[str, int] = {}
+        self._version_counter: int = 0
+
+        # Summary of each curve with the curve version it describes; see get_curve_summary()
+        self._summaries: dict[str, tuple[int, CurveSummary]] = {}
+
+        # Version of the whole state, bumped on every change; snapshot() is cached per version
+        self._state_version: int = 0
+        self._snapshot: StateSnapshot | None = None
+
         # Image sequence state
         self._image_files: list[str] = []
         self._image_directory: str | None = None
@@ -215,6 +237,147 @@ class ApplicationState(QObject):
         self._assert_main_thread()  # Prevent read tearing from wrong thread
         return {name: data.copy() for name, data in self._curves_data.items()}
 
+    def get_curve_version(self, curve_name: str) -> int:
+        """
+        Get the data version of a curve.
+
+        The version changes whenever the curve's points change, so
+        (curve_name, version) identifies curve contents in O(1) for caches.
+
+        Args:
+            curve_name: Curve to query
+
+        Returns:
+            Current version, or 0 if the curve does not exist
+        """
+        return self._curve_versions.get(curve_name, 0)
+
+    def _bump_version(
+        self, curve_name: str, update_summary: Callable[[CurveSummary], CurveSummary | None] | None = None
+    ) -> None:
+        """
+        Assign a new data version to a curve after its points changed.
+
+        Args:
+            curve_name: Curve that changed
+            update_summary: Derives the curve's new summary from its current one (returning
+                None if it cannot); without it, the summary is rebuilt on next use
+        """
+        previous_version = self._curve_versions.get(curve_name, 0)
+        self._version_counter += 1
+        self._curve_versions[curve_name] = self._version_counter
+        self._state_version += 1
+
+        cached = self._summaries.pop(curve_name, None)
+        if update_summary is not None and cached is not None and cached[0] == previous_version:
+            summary = update_summary(cached[1])
+            if summary is not None:
+                self._summaries[curve_name] = (self._version_counter, summary)
+
+    def get_curve_summary(self, curve_name: str) -> CurveSummary:
+        """
+        Get summary statistics of a curve (frame range, bounds, status counts, keyframes, gaps).
+
+        The summary is cached per curve version and single-point edits update it
+        incrementally, so repeated queries are O(1).
+
+        Args:
+            curve_name: Curve to summarize
+
+        Returns:
+            Summary of the curve (empty if the curve does not exist)
+        """
+        self._assert_main_thread()
+        version = self._curve_versions.get(curve_name, 0)
+        cached = self._summaries.get(curve_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        summary = CurveSummary.from_curve(self._curves_data.get(curve_name, []))
+        if curve_name in self._curves_data:
+            self._summaries[curve_name] = (version, summary)
+        return summary
+
+    # ==================== Snapshots ====================
+
+    @property
+    def state_version(self) -> int:
+        """Get the version of the whole state (changes whenever any state changes)."""
+        return self._state_version
+
+    def snapshot(self) -> StateSnapshot:
+        """
+        Get an immutable snapshot of the current state for use on other threads.
+
+        Curve lists are shared rather than copied: from this point on, edits to
+        a curve replace its list instead of modifying it in place. Repeated calls
+        without intervening changes return the same snapshot.
+
+        Returns:
+            Snapshot of curves, curve versions, metadata, selection and frame state
+        """
+        self._assert_main_thread()
+        if self._snapshot is not None and self._snapshot.version == self._state_version:
+            return self._snapshot
+
+        # The snapshot holds the stored lists; later in-place edits must copy first
+        self._private_curves.clear()
+        snapshot = StateSnapshot(
+            version=self._state_version,
+            curves=MappingProxyType(dict(self._curves_data)),
+            curve_versions=MappingProxyType(dict(self._curve_versions)),
+            metadata=MappingProxyType(
+                {name: MappingProxyType(dict(metadata)) for name, metadata in self._curve_metadata.items()}
+            ),
+            selection=MappingProxyType({name: frozenset(indices) for name, indices in self._selection.items()}),
+            active_curve=self._active_curve,
+            selected_curves=frozenset(self._selected_curves),
+            show_all_curves=self._show_all_curves,
+            current_frame=self._current_frame,
+            total_frames=self._total_frames,
+        )
+        self._snapshot = snapshot
+        return snapshot
+
+    def commit_curve_data(self, snapshot: StateSnapshot, curve_name: str, data: CurveDataInput) -> bool:
+        """
+        Write curve data computed from a snapshot, unless the curve changed since.
+
+        Args:
+            snapshot: Snapshot the data was computed from
+            curve_name: Curve to write
+            data: New curve data
+
+        Returns:
+            True if written, False if the curve's version no longer matches the snapshot
+        """
+        return self.commit_curves(snapshot, {curve_name: data})
+
+    def commit_curves(self, snapshot: StateSnapshot, curves: Mapping[str, CurveDataInput]) -> bool:
+        """
+        Write several curves computed from a snapshot, all or nothing.
+
+        Optimistic concurrency: nothing is written if any of the curves changed
+        (or was created or deleted) after the snapshot was taken.
+
+        Args:
+            snapshot: Snapshot the data was computed from
+            curves: New curve data by curve name
+
+        Returns:
+            True if all curves were written, False on a version conflict
+        """
+        self._assert_main_thread()
+        stale = [name for name in curves if self._curve_versions.get(name, 0) != snapshot.curve_version(name)]
+        if stale:
+            logger.info(f"Rejected commit from snapshot {snapshot.version}: curves changed since: {stale}")
+            return False
+
+        with self.batch_updates():
+            for curve_name, data in curves.items():
+                self.set_curve_data(curve_name, data)
+        return True
+
     def set_curve_data(self, curve_name: str, data: CurveDataInput, metadata: dict[str, Any] | None = None) -> None:
         """
         Replace entire curve data.
@@ -239,6 +402,7 @@ class ApplicationState(QObject):
             raise TypeError(f"data must be a sequence of point data, not {type(data).__name__}")
         # Store copy (immutability) - convert Sequence to list
         self._curves_data[curve_name] = list(data)
+        self._bump_version(curve_name)
 
         # Update metadata
         if metadata is not None:
@@ -276,9 +440,12 @@ class ApplicationState(QObject):
             return
 
         # Create new list (immutability)
+        old_point = curve[index]
+        new_point = point.to_tuple4()
         new_curve = curve.copy()
-        new_curve[index] = point.to_tuple4()
+        new_curve[index] = new_point
         self._curves_data[curve_name] = new_curve
+        self._bump_version(curve_name, lambda summary: summary.replace_point(old_point, new_point))
 
         self._emit(self.curves_changed, (self._curves_data.copy(),))
 
@@ -301,9 +468,11 @@ class ApplicationState(QObject):
         curve = self._curves_data.get(curve_name, [])
 
         # Create new list with appended point (immutability)
+        new_point = point.to_tuple4()
         new_curve = curve.copy()
-        new_curve.append(point.to_tuple4())
+        new_curve.append(new_point)
         self._curves_data[curve_name] = new_curve
+        self._bump_version(curve_name, lambda summary: summary.append_point(new_point))
 
         # Initialize metadata if new curve
         if curve_name not in self._curve_metadata:
@@ -343,6 +512,7 @@ class ApplicationState(QObject):
         new_curve = curve.copy()
         del new_curve[index]
         self._curves_data[curve_name] = new_curve
+        self._bump_version(curve_name)
 
         # Update selection: remove index and shift down indices after it
         if curve_name in self._selection:
@@ -389,15 +559,136 @@ class ApplicationState(QObject):
         new_point = current_point.with_status(status_enum)
 
         # Create new list with updated point (immutability)
+        new_point_tuple = new_point.to_tuple4()
         new_curve = curve.copy()
-        new_curve[index] = new_point.to_tuple4()
+        new_curve[index] = new_point_tuple
         self._curves_data[curve_name] = new_curve
+        self._bump_version(curve_name, lambda summary: summary.replace_point(current_point_tuple, new_point_tuple))
 
         self._emit(self.curves_changed, (self._curves_data.copy(),))
 
         logger.debug(f"Set point {index} status to '{status_enum.value}' in curve '{curve_name}'")
         return True
 
+    def set_point_statuses(self, curve_name: str, statuses: Mapping[int, str | PointStatus]) -> bool:
+        """
+        Change the status of several points in one update.
+
+        The curve is copied once, gets one new version and curves_changed is
+        emitted once. Out-of-range indices are skipped with a warning.
+
+        Args:
+            curve_name: Curve containing the points
+            statuses: New status by point index
+
+        Returns:
+            True if any status was set, False if the curve is missing or no index is valid
+        """
+        self._assert_main_thread()
+
+        if curve_name not in self._curves_data:
+            logger.warning(f"Cannot set point statuses: curve '{curve_name}' not found")
+            return False
+
+        curve = self._curves_data[curve_name]
+        new_curve = curve.copy()
+        replaced: list[tuple[LegacyPointData, LegacyPointData]] = []
+        for index, status in statuses.items():
+            if not (0 <= index < len(curve)):
+                logger.warning(f"Cannot set point status: index {index} out of range (0-{len(curve)-1})")
+                continue
+            status_enum = PointStatus.from_legacy(status) if isinstance(status, str) else status
+            new_point_tuple = CurvePoint.from_tuple(curve[index]).with_status(status_enum).to_tuple4()
+            replaced.append((curve[index], new_point_tuple))
+            new_curve[index] = new_point_tuple
+
+        if not replaced:
+            return False
+
+        def update_summary(summary: CurveSummary) -> CurveSummary | None:
+            updated: CurveSummary | None = summary
+            for old_point, new_point in replaced:
+                if updated is None:
+                    return None
+                updated = updated.replace_point(old_point, new_point)
+            return updated
+
+        self._curves_data[curve_name] = new_curve
+        self._bump_version(curve_name, update_summary)
+
+        self._emit(self.curves_changed, (self._curves_data.copy(),))
+
+        logger.debug(f"Set status of {len(replaced)} points in curve '{curve_name}'")
+        return True
+
+    def translate_points(
+        self, curve_name: str, indices: Iterable[int], dx: float, dy: float
+    ) -> dict[int, tuple[float, float]]:
+        """
+        Offset points in place by a data-space delta.
+
+        Fast path for interactive drags. Only the given points are rewritten
+        and points_moved is emitted instead of curves_changed, so listeners can
+        update per-point caches rather than rebuilding. The first call after
+        curves_changed copies the curve once, so lists already delivered to
+        listeners are never mutated. Call publish_curve_changes() when the
+        interaction ends.
+
+        Args:
+            curve_name: Curve containing the points
+            indices: Point indices to move
+            dx: X offset in data units
+            dy: Y offset in data units
+
+        Returns:
+            New (x, y) position by index for each point that was moved
+        """
+        self._assert_main_thread()
+
+        curve = self._curves_data.get(curve_name)
+        if curve is None:
+            logger.warning(f"Cannot translate points: curve '{curve_name}' not found")
+            return {}
+
+        if curve_name not in self._private_curves:
+            curve = curve.copy()
+            self._curves_data[curve_name] = curve
+            self._private_curves.add(curve_name)
+
+        positions: dict[int, tuple[float, float]] = {}
+        old_positions: list[tuple[float, float]] = []
+        for index in indices:
+            if 0 <= index < len(curve):
+                point = curve[index]
+                new_x = point[1] + dx
+                new_y = point[2] + dy
+                if len(point) >= 4:
+                    curve[index] = (point[0], new_x, new_y, point[3])
+                else:
+                    curve[index] = (point[0], new_x, new_y)
+                old_positions.append((point[1], point[2]))
+                positions[index] = (new_x, new_y)
+
+        if positions:
+            self._bump_version(curve_name, lambda summary: summary.move_points(old_positions, positions.values()))
+            self._emit(self.points_moved, (curve_name, positions))
+
+        return positions
+
+    def publish_curve_changes(self, curve_name: str) -> None:
+        """
+        Emit curves_changed after in-place edits made with translate_points().
+
+        Args:
+            curve_name: Curve that was edited
+        """
+        self._assert_main_thread()
+        if curve_name not in self._curves_data:
+            logger.warning(f"Cannot publish changes: curve '{curve_name}' not found")
+            return
+
+        self._emit(self.curves_changed, (self._curves_data.copy(),))
+
     def select_all(self, curve_name: str | None = None) -> None:
         """
         Select all points in curve.
@@ -476,6 +767,8 @@ class ApplicationState(QObject):
         self._assert_main_thread()
         if curve_name in self._curves_data:
             del self._curves_data[curve_name]
+        _ = self._curve_versions.pop(curve_name, None)
+        _ = self._summaries.pop(curve_name, None)
         if curve_name in self._curve_metadata:
             del self._curve_metadata[curve_name]
         if curve_name in self._selection:
@@ -546,6 +839,33 @@ class ApplicationState(QObject):
         else:
             logger.debug(f"Selection for '{curve_name}' unchanged, no signal emitted")
 
+    def set_selections(self, selections: Mapping[str, set[int]]) -> None:
+        """
+        Replace the selection of several curves in one update.
+
+        Curves missing from the mapping keep their selection. selection_changed
+        is emitted once: for the active curve if its selection changed,
+        otherwise for the first curve that changed.
+
+        Args:
+            selections: New selection by curve name (copied internally)
+        """
+        self._assert_main_thread()
+        changed: list[str] = []
+        for curve_name, indices in selections.items():
+            new_selection = set(indices)
+            if new_selection != self._selection.get(curve_name, set()):
+                self._selection[curve_name] = new_selection
+                changed.append(curve_name)
+
+        if not changed:
+            logger.debug("Selections unchanged, no signal emitted")
+            return
+
+        signal_curve = self._active_curve if self._active_curve in changed else changed[0]
+        self._emit(self.selection_changed, (self._selection[signal_curve].copy(), signal_curve))
+        logger.debug(f"Set selection for {len(changed)} curves")
+
     def add_to_selection(self, curve_name: str, index: int) -> None:
         """
         Add single point to selection.
@@ -1004,6 +1324,11 @@ class ApplicationState(QObject):
         During emission, reentrancy is prevented (signals queued, not emitted).
         Last emission wins for each signal type.
         """
+        self._state_version += 1
+        if signal is self.curves_changed:
+            # Listeners receive the stored lists; later in-place edits must copy first
+            self._private_curves.clear()
+
         if self._batching or self._emitting:
             # Queue signal with args (dict deduplicates, last one wins)
             self._pending_signals[signal] = args
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+"""
+Per-curve summary statistics kept by ApplicationState.
+
+Frame range, position bounds, status counts, keyframes and gaps used to be
+recomputed with a full pass over the curve by every consumer (frame store,
+timeline range, fit-to-view, shortcut checks). A CurveSummary is built once
+per curve version in a single vectorized pass, and the common single-point
+edits (moving points, changing a point's status, appending a point) derive
+the next summary from the previous one without touching the other points.
+
+Usage:
+    summary = get_application_state().get_curve_summary("Track1")
+    if summary.frame_range is not None:
+        first_frame, last_frame = summary.frame_range
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from core.frame_indexed_curve import point_status
+from core.models import PointStatus
+
+if TYPE_CHECKING:
+    from core.type_aliases import CurveDataInput, LegacyPointData
+
+_STATUSES: tuple[PointStatus, ...] = tuple(PointStatus)
+
+# Statuses that start or end gaps; changing them can move gap boundaries
+_GAP_STATUSES: frozenset[PointStatus] = frozenset({PointStatus.KEYFRAME, PointStatus.ENDFRAME})
+
+
+@dataclass(frozen=True, slots=True)
+class CurveSummary:
+    """
+    Summary statistics of one curve.
+
+    Attributes:
+        point_count: Number of points
+        frame_range: (first_frame, last_frame), None for an empty curve
+        bounds: (min_x, min_y, max_x, max_y) of point positions, None for an empty curve
+        status_counts: Number of points with each status (every status present, zero if unused)
+        keyframes: Sorted unique frames of KEYFRAME points
+        gaps: Sorted, merged (first, last) frame intervals without tracked data: missing
+            frames between the first and last frame, and the frames after an ENDFRAME up
+            to the next KEYFRAME or ENDFRAME
+    """
+
+    point_count: int
+    frame_range: tuple[int, int] | None
+    bounds: tuple[float, float, float, float] | None
+    status_counts: Mapping[PointStatus, int]
+    keyframes: tuple[int, ...]
+    gaps: tuple[tuple[int, int], ...]
+
+    @classmethod
+    def from_curve(cls, curve_data: CurveDataInput) -> CurveSummary:
+        """
+        Summarize a curve in one pass.
+
+        Args:
+            curve_data: Curve points (frame, x, y[, status]) in any frame order
+
+        Returns:
+            Summary of the curve
+        """
+        count = len(curve_data)
+        if count == 0:
+            return _EMPTY_SUMMARY
+
+        frames = np.fromiter((point[0] for point in curve_data), dtype=np.int64, count=count)
+        xs = np.fromiter((point[1] for point in curve_data), dtype=np.float64, count=count)
+        ys = np.fromiter((point[2] for point in curve_data), dtype=np.float64, count=count)
+
+        # Curves carry a handful of distinct status values, so classify each distinct value once
+        # (True/1 and False/0 share a key, which is fine as they map to the same status)
+        values = [point[3] if len(point) >= 4 else None for point in curve_data]
+        value_codes = {value: _STATUSES.index(PointStatus.from_legacy(value)) for value in set(values)}
+        codes = np.fromiter(map(value_codes.__getitem__, values), dtype=np.int8, count=count)
+        counts = np.bincount(codes, minlength=len(_STATUSES)).tolist()
+
+        keyframe = codes == _STATUSES.index(PointStatus.KEYFRAME)
+        endframe = codes == _STATUSES.index(PointStatus.ENDFRAME)
+        unique_frames = _sorted_unique(frames)
+
+        return cls(
+            point_count=count,
+            frame_range=(int(unique_frames[0]), int(unique_frames[-1])),
+            bounds=(float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())),
+            status_counts=MappingProxyType(dict(zip(_STATUSES, counts, strict=True))),
+            keyframes=tuple(_sorted_unique(frames[keyframe]).tolist()),
+            gaps=_find_gaps(
+                unique_frames, _sorted_unique(frames[endframe]), _sorted_unique(frames[keyframe | endframe])
+            ),
+        )
+
+    def count(self, status: PointStatus) -> int:
+        """Get the number of points with a status."""
+        return self.status_counts[status]
+
+    def move_points(
+        self, old_positions: Iterable[tuple[float, float]], new_positions: Iterable[tuple[float, float]]
+    ) -> CurveSummary | None:
+        """
+        Update the summary for points that moved without changing frame or status.
+
+        Args:
+            old_positions: (x, y) of the points before the move
+            new_positions: (x, y) of the same points after the move
+
+        Returns:
+            Updated summary, or None if the bounds may have shrunk and the curve must be re-summarized
+        """
+        if self.bounds is None:
+            return None
+        min_x, min_y, max_x, max_y = self.bounds
+        for x, y in old_positions:
+            if x in (min_x, max_x) or y in (min_y, max_y):
+                return None
+        for x, y in new_positions:
+            min_x = min(min_x, x)
+            max_x = max(max_x, x)
+            min_y = min(min_y, y)
+            max_y = max(max_y, y)
+        return replace(self, bounds=(min_x, min_y, max_x, max_y))
+
+    def replace_point(self, old_point: LegacyPointData, new_point: LegacyPointData) -> CurveSummary | None:
+        """
+        Update the summary for one point replaced in place.
+
+        Args:
+            old_point: Point before the edit
+            new_point: Point after the edit
+
+        Returns:
+            Updated summary, or None if the edit may change the frame range, keyframes or
+            gaps (or shrink the bounds) and the curve must be re-summarized
+        """
+        old_status = point_status(old_point)
+        new_status = point_status(new_point)
+        if new_point[0] != old_point[0] or (old_status != new_status and {old_status, new_status} & _GAP_STATUSES):
+            return None
+
+        summary = self
+        if (new_point[1], new_point[2]) != (old_point[1], old_point[2]):
+            moved = self.move_points([(old_point[1], old_point[2])], [(new_point[1], new_point[2])])
+            if moved is None:
+                return None
+            summary = moved
+        if old_status != new_status:
+            counts = dict(self.status_counts)
+            counts[old_status] -= 1
+            counts[new_status] += 1
+            summary = replace(summary, status_counts=MappingProxyType(counts))
+        return summary
+
+    def append_point(self, point: LegacyPointData) -> CurveSummary | None:
+        """
+        Update the summary for a point added after the last frame.
+
+        Args:
+            point: Added point
+
+        Returns:
+            Updated summary, or None if the point is not past the last frame or is a KEYFRAME
+            or ENDFRAME (which can close a gap) and the curve must be re-summarized
+        """
+        status = point_status(point)
+        frame = int(point[0])
+        if self.frame_range is None or self.bounds is None or frame <= self.frame_range[1] or status in _GAP_STATUSES:
+            return None
+
+        first_frame, last_frame = self.frame_range
+        min_x, min_y, max_x, max_y = self.bounds
+        counts = dict(self.status_counts)
+        counts[status] += 1
+        gaps = (*self.gaps, (last_frame + 1, frame - 1)) if frame > last_frame + 1 else self.gaps
+        return replace(
+            self,
+            point_count=self.point_count + 1,
+            frame_range=(first_frame, frame),
+            bounds=(min(min_x, point[1]), min(min_y, point[2]), max(max_x, point[1]), max(max_y, point[2])),
+            status_counts=MappingProxyType(counts),
+            gaps=gaps,
+        )
+
+
+def _sorted_unique(frames: np.ndarray) -> np.ndarray:
+    """Sort frames and drop duplicates (np.unique, without its hashing overhead on large integer arrays)."""
+    frames = np.sort(frames)
+    if len(frames) < 2:
+        return frames
+    return frames[np.concatenate(([True], frames[1:] != frames[:-1]))]
+
+
+def _find_gaps(frames: np.ndarray, endframes: np.ndarray, boundaries: np.ndarray) -> tuple[tuple[int, int], ...]:
+    """
+    Find the merged gap intervals of a curve.
+
+    Args:
+        frames: Sorted unique frames with data
+        endframes: Sorted unique ENDFRAME frames
+        boundaries: Sorted unique KEYFRAME and ENDFRAME frames
+
+    Returns:
+        Sorted, merged (first, last) intervals
+    """
+    # Missing frames between consecutive frames with data
+    jumps = np.flatnonzero(np.diff(frames) > 1)
+    starts = [frames[jumps] + 1]
+    ends = [frames[jumps + 1] - 1]
+
+    # Inactive stretches: after an ENDFRAME up to the next boundary
+    if len(endframes):
+        next_index = np.searchsorted(boundaries, endframes, side="right")
+        closed = next_index < len(boundaries)
+        starts.append(endframes[closed] + 1)
+        ends.append(boundaries[next_index[closed]] - 1)
+
+    start = np.concatenate(starts)
+    end = np.concatenate(ends)
+    keep = start <= end
+    order = np.argsort(start[keep], kind="stable")
+
+    gaps: list[tuple[int, int]] = []
+    for first, last in zip(start[keep][order].tolist(), end[keep][order].tolist(), strict=True):
+        if gaps and first <= gaps[-1][1] + 1:
+            gaps[-1] = (gaps[-1][0], max(gaps[-1][1], last))
+        else:
+            gaps.append((first, last))
+    return tuple(gaps)
+
+
+_EMPTY_SUMMARY = CurveSummary(
+    point_count=0,
+    frame_range=None,
+    bounds=None,
+    status_counts=MappingProxyType(dict.fromkeys(_STATUSES, 0)),
+    keyframes=(),
+    gaps=(),
+)
@@ -162,13 +162,22 @@ class FrameStore(QObject):
                 except (ValueError, TypeError):
                     continue
 
-        if frames:
-            min_frame = min(frames)
-            max_frame = max(frames)
-            self._update_frame_range(min_frame, max_frame)
-        else:
+        self.sync_with_frame_range((min(frames), max(frames)) if frames else None)
+
+    def sync_with_frame_range(self, frame_range: tuple[int, int] | None) -> None:
+        """
+        Synchronize frame range with a curve's frame range.
+
+        Use with ApplicationState.get_curve_summary() to avoid scanning the curve.
+
+        Args:
+            frame_range: (first_frame, last_frame) of the curve, or None if it has no points
+        """
+        if frame_range is None:
             # No valid frames - reset to default
             self._update_frame_range(1, 1)
+        else:
+            self._update_frame_range(*frame_range)
 
     def _update_frame_range(self, min_frame: int, max_frame: int) -> None:
         """
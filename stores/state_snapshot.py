@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Immutable, versioned snapshots of ApplicationState for background workers.
+
+ApplicationState may only be touched from the main thread. A StateSnapshot
+is taken on the main thread and can then be read from any thread: it shares
+the stored curve lists instead of copying them (ApplicationState never edits
+a list in place once a snapshot holds it), and copies only the small mutable
+parts (metadata, selection).
+
+Results computed from a snapshot are committed back on the main thread with
+ApplicationState.commit_curve_data(), which rejects the write if the curve
+changed since the snapshot was taken.
+
+Usage:
+    snapshot = get_application_state().snapshot()
+    future = executor.submit(smooth_curve, snapshot.curve("Track1"))
+
+    # Later, on the main thread:
+    if not state.commit_curve_data(snapshot, "Track1", future.result()):
+        ...  # The user edited Track1 meanwhile: recompute or drop the result
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.type_aliases import CurveDataList
+
+
+@dataclass(frozen=True, slots=True)
+class StateSnapshot:
+    """
+    Read-only view of application state at one state version.
+
+    Curve lists are shared with ApplicationState and must not be modified;
+    use get_curve_data() for a private copy.
+
+    Attributes:
+        version: State version the snapshot was taken at (changes on any state change)
+        curves: Curve data by name (shared, read-only)
+        curve_versions: Data version of each curve at snapshot time
+        metadata: Curve metadata by name
+        selection: Selected point indices by curve name
+        active_curve: Active curve name
+        selected_curves: Curves selected for display
+        show_all_curves: Whether all curves are displayed
+        current_frame: Current frame
+        total_frames: Total frames of the image sequence
+    """
+
+    version: int
+    curves: Mapping[str, CurveDataList]
+    curve_versions: Mapping[str, int]
+    metadata: Mapping[str, Mapping[str, Any]]
+    selection: Mapping[str, frozenset[int]]
+    active_curve: str | None
+    selected_curves: frozenset[str]
+    show_all_curves: bool
+    current_frame: int
+    total_frames: int
+
+    def curve_names(self) -> list[str]:
+        """Get the names of all curves in the snapshot."""
+        return list(self.curves)
+
+    def curve(self, curve_name: str) -> CurveDataList:
+        """
+        Get a curve's shared data without copying.
+
+        Args:
+            curve_name: Curve to get
+
+        Returns:
+            Shared curve data (do not modify), empty if the curve does not exist
+        """
+        return self.curves.get(curve_name, [])
+
+    def get_curve_data(self, curve_name: str) -> CurveDataList:
+        """
+        Get a private copy of a curve's data.
+
+        Args:
+            curve_name: Curve to get
+
+        Returns:
+            Copy of the curve data, empty if the curve does not exist
+        """
+        return list(self.curves.get(curve_name, []))
+
+    def curve_version(self, curve_name: str) -> int:
+        """Get a curve's data version at snapshot time (0 if the curve did not exist)."""
+        return self.curve_versions.get(curve_name, 0)
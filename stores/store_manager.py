@@ -145,14 +145,12 @@ class StoreManager(QObject):
         """Sync FrameStore when curve data changes."""
         active = self._app_state.active_curve
         if active and active in curves:
-            curve_data = curves[active]
-            self.frame_store.sync_with_curve_data(curve_data)
+            self.frame_store.sync_with_frame_range(self._app_state.get_curve_summary(active).frame_range)
 
     def _on_active_curve_changed(self, curve_name: str | None) -> None:
         """Sync FrameStore when active curve switches (without data change)."""
         if curve_name:
-            curve_data = self._app_state.get_curve_data(curve_name)
-            self.frame_store.sync_with_curve_data(curve_data)
+            self.frame_store.sync_with_frame_range(self._app_state.get_curve_summary(curve_name).frame_range)
 
     def connect_all_stores(self) -> None:
         """
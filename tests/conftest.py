@@ -19,6 +19,7 @@ to make them available to all tests.
 # pyright: reportUnusedParameter=none
 # pyright: reportUnusedCallResult=none
 
+import os
 import threading
 from collections.abc import Generator
 
@@ -100,6 +101,18 @@ def global_thread_sweep() -> Generator[None, None, None]:
         )
 
 
+@pytest.fixture(autouse=True, scope="session")
+def isolated_frame_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[None, None, None]:
+    """Keep the EXR frame disk cache out of the user's home directory during tests."""
+    previous = os.environ.get("CURVE_EDITOR_FRAME_CACHE_DIR")
+    os.environ["CURVE_EDITOR_FRAME_CACHE_DIR"] = str(tmp_path_factory.mktemp("frame_cache"))
+    yield
+    if previous is None:
+        del os.environ["CURVE_EDITOR_FRAME_CACHE_DIR"]
+    else:
+        os.environ["CURVE_EDITOR_FRAME_CACHE_DIR"] = previous
+
+
 @pytest.fixture(autouse=True)
 def thread_sweep_per_test() -> Generator[None, None, None]:
     """Per-test thread sweep to join stray threads BEFORE Qt cleanup.
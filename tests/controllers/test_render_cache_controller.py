@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""Tests for RenderCacheController.
+
+Covers the array-backed screen point cache:
+- Vectorized rebuild and staleness detection (curve, transform, point count)
+- Vectorized visibility mask
+- Single-point and index-range updates in place
+- Sharing the array with the renderer and region queries
+"""
+
+# Per-file type checking relaxations for test code
+# Tests use mocks, fixtures, and Qt objects with incomplete type stubs
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportAny=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownParameterType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+# pyright: reportUnusedParameter=none
+# pyright: reportUnusedCallResult=none
+
+import pytest
+from PySide6.QtCore import QRect
+
+from core.spatial_index import DataPointIndex
+from services import get_interaction_service
+from stores.application_state import get_application_state
+
+CURVE_DATA = [(frame, 100.0 + frame * 10.0, 200.0 + frame * 5.0, "keyframe") for frame in range(1, 11)]
+
+
+@pytest.fixture
+def widget(curve_view_widget):
+    """Curve view widget showing CURVE_DATA as its active curve."""
+    curve_view_widget.set_curve_data(list(CURVE_DATA))
+    return curve_view_widget
+
+
+def _expected_position(widget, index: int) -> tuple[float, float]:
+    point = widget.curve_data[index]
+    screen = widget.data_to_screen(point[1], point[2])
+    return screen.x(), screen.y()
+
+
+class TestScreenPointsCache:
+    """Building and reusing the screen position array."""
+
+    def test_rebuild_matches_per_point_transform(self, widget):
+        widget.render_cache.update_screen_points_cache()
+
+        cache = widget.render_cache.screen_points_cache
+        assert len(cache) == len(CURVE_DATA)
+        for index in range(len(CURVE_DATA)):
+            assert tuple(cache.points[index]) == pytest.approx(_expected_position(widget, index))
+            position = widget.render_cache.get_screen_position(index)
+            assert position is not None
+            assert (position.x(), position.y()) == pytest.approx(_expected_position(widget, index))
+
+    def test_cache_kept_until_view_changes(self, widget):
+        widget.render_cache.update_screen_points_cache()
+        points = widget.render_cache.screen_points_cache.points
+
+        widget.render_cache.update_screen_points_cache()
+        assert widget.render_cache.screen_points_cache.points is points
+
+        widget.pan_offset_x += 25.0
+        widget.invalidate_caches()
+        widget.render_cache.update_screen_points_cache()
+        rebuilt = widget.render_cache.screen_points_cache.points
+        assert rebuilt is not points
+        assert tuple(rebuilt[0]) == pytest.approx(_expected_position(widget, 0))
+
+    def test_visible_indices_use_margin(self, widget):
+        widget.render_cache.update_screen_points_cache()
+        x, y = _expected_position(widget, 3)
+        radius = int(widget.visual.point_radius)
+
+        # Rect ending just before the point: only the edge margin brings it in
+        widget.render_cache.update_visible_indices(QRect(0, 0, int(x) - radius + 1, int(y) + 1))
+
+        assert widget.render_cache.is_point_visible(3)
+        assert not widget.render_cache.is_point_visible(9)
+        assert 3 in widget.render_cache.get_visible_indices().tolist()
+
+    def test_single_point_update_in_place(self, widget):
+        widget.render_cache.update_screen_points_cache()
+        points = widget.render_cache.screen_points_cache.points
+
+        widget.render_cache.update_single_point_cache(2, 500.0, 600.0)
+
+        expected = widget.data_to_screen(500.0, 600.0)
+        assert widget.render_cache.screen_points_cache.points is points
+        assert tuple(points[2]) == pytest.approx((expected.x(), expected.y()))
+
+    def test_range_update_recomputes_only_range(self, widget):
+        widget.render_cache.update_screen_points_cache()
+        cache = widget.render_cache.screen_points_cache
+        cache.points[:] = -1.0
+
+        widget.render_cache.update_screen_points_range(2, 5)
+
+        assert cache.points[1].tolist() == [-1.0, -1.0]
+        assert cache.points[5].tolist() == [-1.0, -1.0]
+        for index in range(2, 5):
+            assert tuple(cache.points[index]) == pytest.approx(_expected_position(widget, index))
+
+    def test_invalidate_all_clears_cache(self, widget):
+        widget.render_cache.update_screen_points_cache()
+
+        widget.render_cache.invalidate_all()
+
+        assert len(widget.render_cache.screen_points_cache) == 0
+        assert widget.render_cache.get_screen_position(0) is None
+
+
+class TestSharedScreenPoints:
+    """The renderer and region queries read the same array; the spatial index is data-space."""
+
+    def test_paint_populates_cache_for_render_state(self, widget):
+        widget.grab()
+
+        render_state = widget.compute_render_state()
+        cache = widget.render_cache.screen_points_cache
+        assert render_state.screen_points is cache
+        assert cache.get(get_application_state().active_curve, widget.get_transform(), len(CURVE_DATA)) is not None
+
+    def test_point_moves_update_cache_in_place(self, widget):
+        widget.grab()
+        points = widget.render_cache.screen_points_cache.points
+        app_state = get_application_state()
+        curve_name = app_state.active_curve
+        assert curve_name is not None
+
+        app_state.translate_points(curve_name, [4], 50.0, 75.0)
+
+        assert widget.render_cache.screen_points_cache.points is points
+        x, y = _expected_position(widget, 4)
+        assert tuple(points[4]) == pytest.approx((x, y))
+
+    def test_spatial_index_survives_pan_and_zoom(self, widget, monkeypatch):
+        widget.grab()
+        service = get_interaction_service()
+        service.clear_spatial_index()
+        assert service.find_point_at_position(widget, *_expected_position(widget, 6)) == 6
+
+        builds = []
+        monkeypatch.setattr(DataPointIndex, "_build", lambda index, xy: builds.append(len(xy)))
+        widget.pan(40.0, -25.0)
+        widget.zoom_factor = widget.zoom_factor * 2.0
+
+        assert service.find_point_at_position(widget, *_expected_position(widget, 3)) == 3
+        assert builds == []
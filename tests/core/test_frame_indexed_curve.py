@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Tests for the frame-indexed curve view used by Insert Track.
+
+Tests verify:
+- Frame -> row lookup (missing frames, duplicate frames)
+- Neighbouring frame queries and frame ranges
+- Gap detection matches the missing-frame and ENDFRAME rules
+- Status normalization of legacy tuples
+"""
+
+import numpy as np
+
+from core.frame_indexed_curve import FrameIndexedCurve, point_status, to_tuple4
+from core.models import PointStatus
+
+
+class TestFrameLookup:
+    """Tests for frame -> row lookups."""
+
+    def test_rows_at_marks_missing_frames(self) -> None:
+        """Frames without data map to -1, including frames outside the curve's span."""
+        index = FrameIndexedCurve([(5, 1.0, 1.0), (3, 2.0, 2.0), (8, 3.0, 3.0)])
+
+        assert index.frames.tolist() == [3, 5, 8]
+        assert index.rows_at(np.array([1, 3, 4, 5, 8, 20])).tolist() == [-1, 1, -1, 0, 2, -1]
+        assert index.has_frame(5)
+        assert not index.has_frame(6)
+
+    def test_duplicate_frames_resolve_to_last_row(self) -> None:
+        """A frame listed twice resolves to its last row."""
+        index = FrameIndexedCurve([(1, 0.0, 0.0), (2, 1.0, 1.0), (2, 9.0, 9.0)])
+
+        assert index.positions_at(np.array([2])).tolist() == [[9.0, 9.0]]
+
+    def test_neighbouring_frames(self) -> None:
+        """frame_before/frame_after/frames_between only see frames with data."""
+        index = FrameIndexedCurve([(1, 0.0, 0.0), (4, 0.0, 0.0), (9, 0.0, 0.0)])
+
+        assert index.frame_before(4) == 1
+        assert index.frame_before(1) is None
+        assert index.frame_after(4) == 9
+        assert index.frame_after(9) is None
+        assert index.frames_between(2, 9).tolist() == [4, 9]
+
+    def test_common_frames(self) -> None:
+        """common_frames intersects the frames of every curve."""
+        a = FrameIndexedCurve([(f, 0.0, 0.0) for f in range(1, 10)])
+        b = FrameIndexedCurve([(f, 0.0, 0.0) for f in range(5, 15)])
+        c = FrameIndexedCurve([(f, 0.0, 0.0) for f in (2, 6, 7, 12)])
+
+        assert a.common_frames(b, c).tolist() == [6, 7]
+
+    def test_empty_curve(self) -> None:
+        """An empty curve has no frames and no gaps."""
+        index = FrameIndexedCurve([])
+
+        assert len(index) == 0
+        assert not index.has_frame(1)
+        assert index.find_gap(1) is None
+
+
+class TestFindGap:
+    """Tests for gap detection."""
+
+    def test_missing_frame_gap(self) -> None:
+        """A run of missing frames is bounded by the neighbouring data."""
+        index = FrameIndexedCurve([(1, 0.0, 0.0), (2, 0.0, 0.0), (10, 0.0, 0.0)])
+
+        assert index.find_gap(5) == (3, 9)
+        assert index.find_gap(2) is None
+        assert index.find_gap(11) is None
+
+    def test_endframe_gap_ends_at_next_keyframe(self) -> None:
+        """Frames after an ENDFRAME form a gap up to the next KEYFRAME."""
+        index = FrameIndexedCurve(
+            [
+                (1, 0.0, 0.0, "keyframe"),
+                (5, 0.0, 0.0, "endframe"),
+                (10, 0.0, 0.0, "tracked"),
+                (15, 0.0, 0.0, "keyframe"),
+            ]
+        )
+
+        assert index.find_gap(10) == (6, 14)
+        assert index.find_gap(1) is None
+        assert index.find_gap(5) is None
+        assert index.find_gap(15) is None
+
+    def test_endframe_without_following_boundary_is_open(self) -> None:
+        """An ENDFRAME with no later KEYFRAME/ENDFRAME does not close a gap."""
+        index = FrameIndexedCurve([(1, 0.0, 0.0, "keyframe"), (5, 0.0, 0.0, "endframe"), (8, 0.0, 0.0, "tracked")])
+
+        assert index.find_gap(8) is None
+
+
+class TestStatusNormalization:
+    """Tests for point_status/to_tuple4."""
+
+    def test_legacy_statuses(self) -> None:
+        """Legacy statuses are read like CurvePoint.from_tuple()."""
+        assert point_status((1, 0.0, 0.0)) is PointStatus.NORMAL
+        assert point_status((1, 0.0, 0.0, True)) is PointStatus.INTERPOLATED
+        assert point_status((1, 0.0, 0.0, "KEYFRAME")) is PointStatus.KEYFRAME
+        assert to_tuple4((1, 2.0, 3.0)) == (1, 2.0, 3.0, "normal")
+
+    def test_canonical_tuple_is_returned_unchanged(self) -> None:
+        """Tuples already in (frame, x, y, status) form are not rebuilt."""
+        point = (1, 2.0, 3.0, "tracked")
+
+        assert to_tuple4(point) is point
+
+    def test_legacy_endframe_is_indexed(self) -> None:
+        """Endframes given as legacy values still bound gaps."""
+        index = FrameIndexedCurve(
+            [(1, 0.0, 0.0, "keyframe"), (5, 0.0, 0.0, 4), (7, 0.0, 0.0, "tracked"), (9, 0.0, 0.0, "keyframe")]
+        )
+
+        assert index.endframes.tolist() == [5]
+        assert index.find_gap(7) == (6, 8)
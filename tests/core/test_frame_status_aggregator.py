@@ -10,9 +10,16 @@ Tests verify:
 - is_inactive AND logic (ALL curves must be inactive)
 - is_startframe OR logic (ANY curve matches)
 - has_selected OR logic (ANY curve matches)
+- Status rows and FrameStatusTable add/subtract deltas
 """
 
-from core.frame_status_aggregator import FrameStatusAccumulator, aggregate_frame_statuses
+from core.frame_status_aggregator import (
+    FrameStatusAccumulator,
+    FrameStatusTable,
+    aggregate_frame_statuses,
+    frame_statuses_to_rows,
+    row_to_frame_status,
+)
 from core.models import FrameStatus
 
 
@@ -315,3 +322,62 @@ class TestAggregateFrameStatuses:
 
         assert isinstance(result, FrameStatus)
         assert not isinstance(result, FrameStatusAccumulator)
+
+
+class TestFrameStatusTable:
+    """Tests for status rows and the delta-maintained FrameStatusTable."""
+
+    def test_rows_round_trip(self) -> None:
+        """Verify packing and unpacking keeps every field."""
+        statuses = {
+            5: FrameStatus(1, 0, 2, 0, 0, True, False, True),
+            7: FrameStatus(0, 1, 0, 1, 3, False, True, False),
+        }
+
+        start, rows = frame_statuses_to_rows(statuses)
+
+        assert start == 5
+        assert len(rows) == 3
+        assert row_to_frame_status(rows[0]) == statuses[5]
+        assert row_to_frame_status(rows[1]) is None  # Frame 6 has no status
+        assert row_to_frame_status(rows[2]) == statuses[7]
+
+    def test_add_matches_aggregate_frame_statuses(self) -> None:
+        """Verify summed rows follow the aggregate_frame_statuses() rules."""
+        curve1 = {1: FrameStatus(1, 0, 0, 0, 0, True, True, False), 2: FrameStatus(0, 1, 0, 0, 0, False, True, False)}
+        curve2 = {2: FrameStatus(0, 0, 1, 0, 0, False, True, True), 3: FrameStatus(0, 0, 0, 1, 0, False, False, False)}
+        table = FrameStatusTable()
+
+        table.add(*frame_statuses_to_rows(curve1))
+        table.add(*frame_statuses_to_rows(curve2))
+
+        assert table.get(1) == aggregate_frame_statuses([curve1[1]])
+        assert table.get(2) == aggregate_frame_statuses([curve1[2], curve2[2]])
+        assert table.get(3) == aggregate_frame_statuses([curve2[3]])
+        assert table.get(4) is None
+
+    def test_subtract_restores_previous_aggregate(self) -> None:
+        """Verify subtracting a curve's rows removes exactly its contribution."""
+        curve1 = {1: FrameStatus(1, 0, 0, 0, 0, False, True, False)}
+        curve2 = {1: FrameStatus(0, 1, 0, 0, 0, False, False, True), 9: FrameStatus(1, 0, 0, 0, 0, False, False, False)}
+        table = FrameStatusTable()
+        table.add(*frame_statuses_to_rows(curve1))
+
+        start, rows = frame_statuses_to_rows(curve2)
+        table.add(start, rows)
+        table.add(start, rows, sign=-1)
+
+        assert table.get(1) == curve1[1]
+        assert table.get(9) is None
+
+    def test_set_row_and_clear_span(self) -> None:
+        """Verify single rows can be overwritten and spans cleared."""
+        table = FrameStatusTable()
+
+        table.set_row(10, (2, 0, 0, 0, 0, 0, 0, 1, 1))
+        table.set_row(12, (0, 1, 0, 0, 0, 0, 0, 0, 1))
+
+        assert table.get(10) == FrameStatus(2, 0, 0, 0, 0, False, False, True)
+        table.clear_span(9, 10)
+        assert table.get(10) is None
+        assert table.get(12) == FrameStatus(0, 1, 0, 0, 0, False, False, False)
@@ -112,6 +112,21 @@ def reset_config_safely() -> list[str]:
     except Exception as e:
         warnings.append(f"Config reset error: {e}")
 
+    try:
+        # Worker processes are sized from the config; also stops their manager thread
+        from io_utils.exr_decode_pool import reset_exr_decode_pool
+
+        reset_exr_decode_pool()
+    except Exception as e:
+        warnings.append(f"EXR decode pool reset error: {e}")
+
+    try:
+        from io_utils.frame_disk_cache import reset_frame_disk_cache
+
+        reset_frame_disk_cache()
+    except Exception as e:
+        warnings.append(f"Frame disk cache reset error: {e}")
+
     return warnings
 
 
@@ -0,0 +1,151 @@
+"""
+Tests for bulk line emission.
+
+Covers QPolygonF construction from NumPy arrays, frame-ordered row slicing and
+grouping polylines by pen into as few QPainter calls as possible.
+"""
+
+# Per-file type checking relaxations for test code
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportAny=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+
+from unittest.mock import MagicMock
+
+import numpy as np
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPen
+
+from rendering.line_batch import FrameRows, LineBatch, polygon_from_array
+
+
+def _black_canvas() -> QImage:
+    image = QImage(40, 40, QImage.Format.Format_ARGB32)
+    image.fill(QColor(0, 0, 0))
+    return image
+
+
+def _polygon_points(polygon) -> list[tuple[float, float]]:
+    return [(polygon.at(i).x(), polygon.at(i).y()) for i in range(polygon.size())]
+
+
+class TestPolygonFromArray:
+    """Tests for polygon_from_array."""
+
+    def test_round_trip(self):
+        points = np.array([[0.5, 1.5], [-2.0, 3.25], [1e6, -1e-3]])
+
+        polygon = polygon_from_array(points)
+
+        assert _polygon_points(polygon) == [tuple(row) for row in points.tolist()]
+
+    def test_empty_array(self):
+        assert polygon_from_array(np.empty((0, 2))).isEmpty()
+
+    def test_non_contiguous_input(self):
+        points = np.arange(20, dtype=np.float64).reshape(10, 2)[::2]
+
+        polygon = polygon_from_array(points)
+
+        assert polygon.size() == 5
+        assert polygon.at(4) == QPointF(16.0, 17.0)
+
+
+class TestFrameRows:
+    """Tests for FrameRows."""
+
+    def test_between_returns_rows_in_frame_order(self):
+        frames = np.array([30, 10, 20, 40, 15])
+
+        frame_rows = FrameRows(frames)
+
+        assert frame_rows.between(10, 30).tolist() == [1, 4, 2, 0]
+        assert frame_rows.between(31, 39).tolist() == []
+
+    def test_include_mask_excludes_rows(self):
+        frames = np.array([1, 2, 3, 4])
+
+        frame_rows = FrameRows(frames, include=np.array([True, False, True, True]))
+
+        assert frame_rows.between(1, 4).tolist() == [0, 2, 3]
+
+
+class TestLineBatch:
+    """Tests for LineBatch."""
+
+    def test_solid_polylines_share_one_draw_call(self):
+        painter = MagicMock()
+        batch = LineBatch()
+        pen = QPen(QColor(255, 0, 0), 2)
+        batch.add_polyline(pen, np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 0.0]]))
+        batch.add_polyline(QPen(pen), np.array([[5.0, 5.0], [6.0, 6.0]]))
+
+        batch.flush(painter)
+
+        assert painter.setPen.call_count == 1
+        assert painter.drawLines.call_count == 1
+        painter.drawPolyline.assert_not_called()
+        pairs = _polygon_points(painter.drawLines.call_args[0][0])
+        assert pairs == [(0.0, 0.0), (1.0, 1.0), (1.0, 1.0), (2.0, 0.0), (5.0, 5.0), (6.0, 6.0)]
+        assert len(batch) == 0
+
+    def test_dashed_polylines_are_drawn_separately(self):
+        painter = MagicMock()
+        batch = LineBatch()
+        solid = QPen(QColor(255, 0, 0), 2)
+        dashed = QPen(QColor(128, 128, 128), 1, Qt.PenStyle.DashLine)
+        batch.add_polyline(solid, np.array([[0.0, 0.0], [1.0, 1.0]]))
+        batch.add_polyline(dashed, np.array([[1.0, 1.0], [2.0, 2.0]]))
+        batch.add_polyline(dashed, np.array([[3.0, 3.0], [4.0, 4.0], [5.0, 3.0]]))
+
+        batch.flush(painter)
+
+        assert painter.setPen.call_count == 2
+        assert painter.drawPolyline.call_count == 3
+
+    def test_translucent_polylines_are_drawn_separately(self):
+        painter = MagicMock()
+        batch = LineBatch()
+        pen = QPen(QColor(255, 255, 255, 128), 3)
+        batch.add_polyline(pen, np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 0.0]]))
+        batch.add_polyline(QPen(pen), np.array([[5.0, 5.0], [6.0, 6.0]]))
+
+        batch.flush(painter)
+
+        painter.drawLines.assert_not_called()
+        assert painter.drawPolyline.call_count == 2
+
+    def test_translucent_vertices_match_polyline_rendering(self, qapp):
+        pen = QPen(QColor(255, 255, 255, 128), 3)
+        polylines = [
+            np.array([[5.0, 10.0], [15.0, 10.0], [15.0, 20.0], [25.0, 20.0]]),
+            np.array([[5.0, 30.0], [15.0, 30.0], [15.0, 35.0], [30.0, 35.0]]),
+        ]
+        batch = LineBatch()
+        for polyline in polylines:
+            batch.add_polyline(pen, polyline)
+
+        expected = _black_canvas()
+        painter = QPainter(expected)
+        painter.setPen(pen)
+        for polyline in polylines:
+            painter.drawPolyline(polygon_from_array(polyline))
+        painter.end()
+
+        image = _black_canvas()
+        painter = QPainter(image)
+        batch.flush(painter)
+        painter.end()
+
+        for x, y in [(15, 10), (15, 20), (15, 30), (15, 35)]:
+            assert image.pixelColor(x, y) == expected.pixelColor(x, y)
+        assert image == expected
+
+    def test_short_polylines_are_ignored(self):
+        batch = LineBatch()
+        batch.add_polyline(QPen(), np.array([[0.0, 0.0]]))
+
+        assert len(batch) == 0
@@ -0,0 +1,160 @@
+"""
+Tests for batched point marker and label drawing.
+
+Covers bulk marker drawing onto real images, vectorized
+inactive-segment lookup and status-bucketed marker rendering.
+"""
+
+# Per-file type checking relaxations for test code
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportAny=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+
+from unittest.mock import MagicMock
+
+import numpy as np
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QFont, QImage, QPainter
+
+from core.curve_segments import SegmentedCurve
+from core.models import CurvePoint
+from rendering.marker_batch import StaticLabelCache, draw_markers
+from rendering.optimized_curve_renderer import OptimizedCurveRenderer, _inactive_frame_mask
+from rendering.render_state import RenderState
+from rendering.visual_settings import VisualSettings
+
+
+def _render_image(draw, width: int = 200, height: int = 100) -> QImage:
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    painter = QPainter(image)
+    try:
+        draw(painter)
+    finally:
+        _ = painter.end()
+    return image
+
+
+class TestDrawMarkers:
+    """Tests for draw_markers."""
+
+    def test_markers_are_centered_on_points(self, qapp):
+        points = np.array([[50.0, 50.0], [150.0, 30.0]])
+
+        image = _render_image(lambda painter: draw_markers(painter, QColor("#ff0000"), 4.0, points))
+
+        assert image.pixelColor(50, 50).red() == 255
+        assert image.pixelColor(150, 30).red() == 255
+        assert image.pixelColor(100, 50).alpha() == 0
+
+    def test_markers_keep_subpixel_positions(self, qapp):
+        def draw(painter):
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            _ = draw_markers(painter, QColor("#ff0000"), 3.0, np.array([[50.0, 50.0], [150.5, 50.0]]))
+
+        image = _render_image(draw)
+
+        def centroid_x(start: int, stop: int) -> float:
+            # Coverage-weighted center of the marker's pixel columns (pixel i is centered at i + 0.5)
+            coverage = [sum(image.pixelColor(x, y).alpha() for y in range(44, 56)) for x in range(start, stop)]
+            return sum((x + 0.5) * c for x, c in zip(range(start, stop), coverage, strict=True)) / sum(coverage)
+
+        assert abs(centroid_x(44, 56) - 50.0) < 0.1
+        assert abs(centroid_x(144, 157) - 150.5) < 0.1
+
+    def test_one_draw_call_per_bucket(self):
+        painter = MagicMock()
+        points = np.array([[20.0, 20.0], [20.2, 19.9], [40.0, 20.0]])
+
+        drawn = draw_markers(painter, QColor("#ff0000"), 3.0, points)
+
+        assert drawn == 3
+        assert painter.drawPoints.call_count == 1
+        pen = painter.setPen.call_args.args[0]
+        assert pen.widthF() == 6.0
+        assert pen.capStyle() == Qt.PenCapStyle.RoundCap
+
+    def test_empty_bucket_draws_nothing(self):
+        painter = MagicMock()
+
+        assert draw_markers(painter, QColor("#ff0000"), 3.0, np.empty((0, 2))) == 0
+        painter.drawPoints.assert_not_called()
+
+
+class TestStaticLabelCache:
+    """Tests for StaticLabelCache."""
+
+    def test_labels_are_reused(self, qapp):
+        labels = StaticLabelCache(QFont("Arial", 9))
+
+        assert labels.label("KEYFRAME") is labels.label("KEYFRAME")
+        assert labels.label("KEYFRAME") is not labels.label("TRACKED")
+
+
+class TestInactiveFrameMask:
+    """Tests for the vectorized inactive segment lookup."""
+
+    def test_matches_segment_lookup(self):
+        curve_data = [
+            (1, 0.0, 0.0, "keyframe"),
+            (5, 0.0, 0.0, "tracked"),
+            (10, 0.0, 0.0, "endframe"),
+            (15, 0.0, 0.0, "tracked"),
+            (20, 0.0, 0.0, "keyframe"),
+            (25, 0.0, 0.0, "tracked"),
+        ]
+        segmented = SegmentedCurve.from_points([CurvePoint.from_tuple(point) for point in curve_data])
+        frames = np.arange(-1, 30)
+
+        mask = _inactive_frame_mask(segmented, frames)
+
+        expected = []
+        for frame in frames.tolist():
+            segment = segmented.get_segment_at_frame(frame)
+            expected.append(segment is not None and not segment.is_active)
+        assert mask.tolist() == expected
+        assert mask.any()
+
+
+class TestStatusMarkers:
+    """Tests for status-bucketed marker rendering on a real image."""
+
+    def test_markers_use_status_selection_and_current_frame_colors(self, qapp):
+        points = [
+            (1, 20.0, 50.0, "keyframe"),
+            (2, 60.0, 50.0, "tracked"),
+            (3, 100.0, 50.0, "tracked"),
+            (4, 140.0, 50.0, "normal"),
+        ]
+        render_state = RenderState(
+            points=points,
+            current_frame=4,
+            selected_points={2},
+            widget_width=200,
+            widget_height=100,
+            zoom_factor=1.0,
+            pan_offset_x=0.0,
+            pan_offset_y=0.0,
+            manual_offset_x=0.0,
+            manual_offset_y=0.0,
+            flip_y_axis=False,
+            show_background=False,
+            visual=VisualSettings(),
+        )
+        screen_points = np.array([[p[1], p[2]] for p in points])
+        renderer = OptimizedCurveRenderer()
+
+        image = _render_image(
+            lambda painter: renderer._render_points_with_status(painter, render_state, screen_points, points)
+        )
+
+        from ui.color_manager import SPECIAL_COLORS, get_status_color
+
+        assert image.pixelColor(20, 50).name() == get_status_color("keyframe")
+        assert image.pixelColor(60, 50).name() == get_status_color("tracked")
+        assert image.pixelColor(100, 50).name() == SPECIAL_COLORS["selected_point"]
+        assert image.pixelColor(140, 50).name() == SPECIAL_COLORS["current_frame"]
@@ -0,0 +1,101 @@
+"""
+Tests for screen-space point decimation.
+
+Covers min/max decimation per pixel column and the points that must always
+survive it (keyframes, endframes, selected and current-frame points).
+"""
+
+# Per-file type checking relaxations for test code
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportAny=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+
+import numpy as np
+
+from core.models import PointStatus
+from rendering.optimized_curve_renderer import LevelOfDetail, RenderQuality
+from rendering.point_decimation import decimate_min_max, decimate_with_required, required_point_mask
+
+
+def _dense_curve(count: int = 100_000, width: float = 1000.0) -> np.ndarray:
+    """Smooth curve with many points per pixel column."""
+    x = np.linspace(0.0, width, count)
+    return np.column_stack([x, 300.0 + 100.0 * np.sin(x / 50.0)])
+
+
+class TestDecimateMinMax:
+    """Tests for decimate_min_max."""
+
+    def test_dense_curve_keeps_at_most_four_points_per_column(self):
+        points = _dense_curve()
+
+        kept = decimate_min_max(points)
+
+        assert len(kept) <= 4 * 1001
+        assert kept[0] == 0
+        assert kept[-1] == len(points) - 1
+        assert np.all(np.diff(kept) > 0)
+
+    def test_spike_is_preserved(self):
+        points = _dense_curve(10_000)
+        points[4321, 1] = -500.0
+        points[7654, 1] = 2000.0
+
+        kept = decimate_min_max(points)
+
+        assert 4321 in kept
+        assert 7654 in kept
+
+    def test_sparse_curve_is_unchanged(self):
+        points = np.array([[0.0, 0.0], [5.0, 10.0], [10.0, 0.0], [15.0, 10.0]])
+
+        assert decimate_min_max(points).tolist() == [0, 1, 2, 3]
+
+    def test_wider_columns_keep_fewer_points(self):
+        points = _dense_curve(20_000)
+
+        assert len(decimate_min_max(points, column_width=4.0)) < len(decimate_min_max(points, column_width=1.0))
+
+
+class TestRequiredPoints:
+    """Tests for points that must survive decimation."""
+
+    def test_required_point_mask(self):
+        curve_data = [
+            (1, 0.0, 0.0, "keyframe"),
+            (2, 0.0, 0.0, "tracked"),
+            (3, 0.0, 0.0, PointStatus.ENDFRAME),
+            (4, 0.0, 0.0, "interpolated"),
+            (5, 0.0, 0.0, "tracked"),
+            (6, 0.0, 0.0),
+        ]
+
+        mask = required_point_mask(curve_data, selected_indices={4, 99}, current_frame=6)
+
+        assert mask.tolist() == [True, False, True, False, True, True]
+
+    def test_required_points_survive_decimation(self):
+        points = _dense_curve(50_000)
+        required = np.zeros(len(points), dtype=np.bool_)
+        required[[1234, 25_001, 40_000]] = True
+
+        kept = decimate_with_required(points, np.arange(len(points)), 1.0, required)
+
+        assert {1234, 25_001, 40_000} <= set(kept.tolist())
+        assert len(kept) < len(points) // 10
+
+    def test_lod_keeps_required_visible_points_only(self):
+        points = _dense_curve(20_000)
+        visible = np.arange(5_000, 15_000)
+        required = np.zeros(len(points), dtype=np.bool_)
+        required[[100, 7_777]] = True
+
+        lod_points, lod_indices = LevelOfDetail().get_lod_points(points, RenderQuality.NORMAL, visible, required)
+
+        assert 7_777 in lod_indices
+        assert 100 not in lod_indices
+        assert lod_indices.min() >= 5_000
+        np.testing.assert_array_equal(points[lod_indices], lod_points)
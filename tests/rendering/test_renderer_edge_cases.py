@@ -80,6 +80,38 @@ class TestRendererCacheManagement:
         for _ in range(10):
             renderer.clear_segmented_curve_cache()  # Should not raise
 
+    def test_segmented_curve_cache_is_version_keyed(self):
+        """Cached segments should be reused per curve version and rebuilt when the version changes."""
+        renderer = OptimizedCurveRenderer()
+        points = [CurvePoint(1, 0.0, 0.0), CurvePoint(2, 1.0, 1.0, PointStatus.ENDFRAME)]
+
+        first = renderer._get_segmented_curve(points, ("Track1", 1, "stored"))
+        assert renderer._get_segmented_curve(list(points), ("Track1", 1, "stored")) is first
+        assert renderer._get_segmented_curve(points, ("Track2", 1, "stored")) is not first
+        assert renderer._get_segmented_curve(points, ("Track1", 2, "stored")) is not first
+
+    def test_segmented_curve_cache_holds_more_than_ten_curves(self):
+        """Many visible curves should not evict each other's segments."""
+        renderer = OptimizedCurveRenderer()
+        points = [CurvePoint(1, 0.0, 0.0), CurvePoint(2, 1.0, 1.0)]
+
+        cached = [renderer._get_segmented_curve(points, (f"Track{i}", 1, "stored")) for i in range(20)]
+        assert all(
+            renderer._get_segmented_curve(points, (f"Track{i}", 1, "stored")) is curve for i, curve in enumerate(cached)
+        )
+
+    def test_evict_removed_curves(self):
+        """Segments of curves that are no longer live should be dropped."""
+        renderer = OptimizedCurveRenderer()
+        points = [CurvePoint(1, 0.0, 0.0), CurvePoint(2, 1.0, 1.0)]
+        kept = renderer._get_segmented_curve(points, ("Track1", 1, "stored"))
+        removed = renderer._get_segmented_curve(points, ("Track2", 1, "stored"))
+
+        renderer.evict_removed_curves({"Track1"})
+
+        assert renderer._get_segmented_curve(points, ("Track1", 1, "stored")) is kept
+        assert renderer._get_segmented_curve(points, ("Track2", 1, "stored")) is not removed
+
 
 class TestPointStatusValues:
     """Tests for point status handling in data preparation."""
@@ -538,3 +538,169 @@ class TestActiveCurveDataProperty:
         result2 = state.active_curve_data
         assert result2 is not None
         assert result2[0] == "Track2"
+
+
+class TestStateSnapshots:
+    """Tests for immutable snapshots and optimistic commits."""
+
+    @pytest.fixture(autouse=True)
+    def reset_state(self) -> Generator[None, None, None]:
+        """Reset state before each test."""
+        reset_application_state()
+        yield
+        reset_application_state()
+
+    def test_snapshot_shares_curve_lists_and_is_cached(self) -> None:
+        """Snapshots share stored lists and are reused until the state changes."""
+        state = get_application_state()
+        state.set_curve_data("Track1", [(1, 10.0, 20.0), (2, 15.0, 25.0)])
+        state.set_selection("Track1", {1})
+
+        snapshot = state.snapshot()
+
+        assert snapshot.curve("Track1") is state._curves_data["Track1"]
+        assert snapshot.selection["Track1"] == frozenset({1})
+        assert snapshot.curve_version("Track1") == state.get_curve_version("Track1")
+        assert state.snapshot() is snapshot
+
+        state.set_frame(1)  # No change: same snapshot
+        assert state.snapshot() is snapshot
+        state.set_curve_visibility("Track1", False)
+        assert state.snapshot() is not snapshot
+        assert snapshot.metadata["Track1"]["visible"] is True
+
+    def test_snapshot_is_unaffected_by_later_edits(self) -> None:
+        """In-place edits after a snapshot copy the curve instead of modifying the shared list."""
+        state = get_application_state()
+        state.set_curve_data("Track1", [(1, 10.0, 20.0), (2, 15.0, 25.0)])
+        state.translate_points("Track1", [0], 1.0, 1.0)  # Curve is now edited in place
+
+        snapshot = state.snapshot()
+        state.translate_points("Track1", [0], 5.0, 5.0)
+        state.update_point("Track1", 1, CurvePoint(frame=2, x=0.0, y=0.0))
+
+        assert snapshot.curve("Track1") == [(1, 11.0, 21.0), (2, 15.0, 25.0)]
+        assert state.get_curve_data("Track1")[0] == (1, 16.0, 26.0)
+
+    def test_snapshot_can_be_read_from_worker_threads(self) -> None:
+        """Worker threads read a snapshot while the main thread keeps editing."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        state = get_application_state()
+        state.set_curve_data("Track1", [(frame, float(frame), 0.0) for frame in range(1, 1001)])
+        snapshot = state.snapshot()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(lambda: sum(point[1] for point in snapshot.curve("Track1"))) for _ in range(4)]
+            for _ in range(50):
+                state.translate_points("Track1", range(1000), 1.0, 0.0)
+            results = [future.result() for future in futures]
+
+        assert results == [500500.0] * 4
+
+    def test_commit_applies_when_curve_unchanged(self) -> None:
+        """Results computed from a current snapshot are written."""
+        state = get_application_state()
+        state.set_curve_data("Track1", [(1, 10.0, 20.0)])
+        snapshot = state.snapshot()
+        state.set_frame(1)
+        state.set_curve_data("Other", [(1, 0.0, 0.0)])  # Other curves may change
+
+        assert state.commit_curve_data(snapshot, "Track1", [(1, 12.0, 22.0)]) is True
+        assert state.get_curve_data("Track1") == [(1, 12.0, 22.0)]
+
+    def test_commit_rejects_stale_snapshot(self) -> None:
+        """Nothing is written if any committed curve changed since the snapshot."""
+        state = get_application_state()
+        state.set_curve_data("Track1", [(1, 10.0, 20.0)])
+        state.set_curve_data("Track2", [(1, 30.0, 40.0)])
+        snapshot = state.snapshot()
+        state.translate_points("Track2", [0], 1.0, 0.0)
+
+        committed = state.commit_curves(snapshot, {"Track1": [(1, 0.0, 0.0)], "Track2": [(1, 0.0, 0.0)]})
+
+        assert committed is False
+        assert state.get_curve_data("Track1") == [(1, 10.0, 20.0)]
+        assert state.get_curve_data("Track2") == [(1, 31.0, 40.0)]
+
+
+class TestCurveSummaries:
+    """Tests for the per-curve summary kept by ApplicationState."""
+
+    @pytest.fixture(autouse=True)
+    def reset_state(self) -> Generator[None, None, None]:
+        """Reset state before each test."""
+        reset_application_state()
+        yield
+        reset_application_state()
+
+    def _assert_summary_current(self, state, curve_name: str) -> None:
+        from stores.curve_summary import CurveSummary
+
+        assert state.get_curve_summary(curve_name) == CurveSummary.from_curve(state.get_curve_data(curve_name))
+
+    def test_summary_is_cached_per_version(self) -> None:
+        """Repeated queries return the same summary until the curve changes."""
+        state = get_application_state()
+        state.set_curve_data("Track1", [(1, 10.0, 20.0, "keyframe"), (5, 15.0, 25.0, "tracked")])
+
+        summary = state.get_curve_summary("Track1")
+
+        assert state.get_curve_summary("Track1") is summary
+        assert summary.frame_range == (1, 5)
+        assert summary.gaps == ((2, 4),)
+
+        state.set_curve_data("Track1", [(2, 0.0, 0.0)])
+        assert state.get_curve_summary("Track1").frame_range == (2, 2)
+
+    def test_single_point_edits_update_summary_incrementally(self, monkeypatch) -> None:
+        """Moves, status changes and appends derive the summary without a rebuild."""
+        from stores.curve_summary import CurveSummary
+
+        state = get_application_state()
+        state.set_curve_data("Track1", [(frame, float(frame), float(-frame), "tracked") for frame in range(1, 11)])
+        _ = state.get_curve_summary("Track1")
+
+        rebuilds: list[int] = []
+        original = CurveSummary.from_curve.__func__
+        monkeypatch.setattr(
+            CurveSummary,
+            "from_curve",
+            classmethod(lambda cls, data: rebuilds.append(len(data)) or original(cls, data)),
+        )
+
+        state.translate_points("Track1", [4, 5], 0.5, -0.5)
+        state.update_point("Track1", 3, CurvePoint(frame=4, x=4.5, y=-4.0, status=PointStatus.TRACKED))
+        state.set_point_status("Track1", 6, PointStatus.INTERPOLATED)
+        state.add_point("Track1", CurvePoint(frame=15, x=20.0, y=-20.0))
+        summary = state.get_curve_summary("Track1")
+
+        assert rebuilds == []
+        monkeypatch.undo()
+        self._assert_summary_current(state, "Track1")
+        assert summary.gaps == ((11, 14),)
+
+    def test_structural_edits_rebuild_summary(self) -> None:
+        """Edits that may move gaps or shrink bounds rebuild the summary on next use."""
+        state = get_application_state()
+        state.set_curve_data("Track1", [(frame, float(frame), 0.0, "tracked") for frame in range(1, 6)])
+        _ = state.get_curve_summary("Track1")
+
+        state.set_point_status("Track1", 2, PointStatus.ENDFRAME)
+        self._assert_summary_current(state, "Track1")
+        state.translate_points("Track1", [4], -10.0, 0.0)  # Moves the max-x point inward
+        self._assert_summary_current(state, "Track1")
+        state.remove_point("Track1", 0)
+        self._assert_summary_current(state, "Track1")
+        assert state.get_curve_summary("Track1").frame_range == (2, 5)
+
+    def test_deleted_curve_has_empty_summary(self) -> None:
+        """Deleted and unknown curves summarize as empty."""
+        state = get_application_state()
+        state.set_curve_data("Track1", [(1, 0.0, 0.0)])
+        _ = state.get_curve_summary("Track1")
+
+        state.delete_curve("Track1")
+
+        assert state.get_curve_summary("Track1").point_count == 0
+        assert state.get_curve_summary("Missing").frame_range is None
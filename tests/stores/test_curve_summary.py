@@ -0,0 +1,118 @@
+"""
+Tests for CurveSummary.
+
+Covers one-pass summaries (frame range, bounds, status counts, keyframes,
+gaps) and the incremental updates for moved, replaced and appended points.
+"""
+
+# Per-file type checking relaxations for test code
+# pyright: reportArgumentType=none
+# pyright: reportOptionalSubscript=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownVariableType=none
+
+from core.models import PointStatus
+from stores.curve_summary import CurveSummary
+
+
+def _sample_curve():
+    return [
+        (1, 10.0, 20.0, "keyframe"),
+        (2, 12.0, 22.0, "tracked"),
+        (3, 14.0, 24.0, "endframe"),
+        (4, 16.0, 26.0, "tracked"),
+        (5, 18.0, 28.0, "tracked"),
+        (6, 5.0, 30.0, "keyframe"),
+        (9, 20.0, 15.0, "tracked"),
+        (10, 22.0, 18.0),
+    ]
+
+
+class TestFromCurve:
+    """Tests for building a summary in one pass."""
+
+    def test_summarizes_curve(self):
+        summary = CurveSummary.from_curve(_sample_curve())
+
+        assert summary.point_count == 8
+        assert summary.frame_range == (1, 10)
+        assert summary.bounds == (5.0, 15.0, 22.0, 30.0)
+        assert summary.count(PointStatus.TRACKED) == 4
+        assert summary.count(PointStatus.KEYFRAME) == 2
+        assert summary.count(PointStatus.ENDFRAME) == 1
+        assert summary.count(PointStatus.NORMAL) == 1
+        assert summary.count(PointStatus.INTERPOLATED) == 0
+        assert summary.keyframes == (1, 6)
+        # Inactive after the ENDFRAME up to the next keyframe, and frames 7-8 are missing
+        assert summary.gaps == ((4, 5), (7, 8))
+
+    def test_adjacent_and_overlapping_gaps_are_merged(self):
+        curve = [(1, 0.0, 0.0, "endframe"), (2, 0.0, 0.0, "tracked"), (5, 0.0, 0.0, "keyframe")]
+
+        assert CurveSummary.from_curve(curve).gaps == ((2, 4),)
+
+    def test_open_gap_after_last_endframe_is_not_reported(self):
+        curve = [(1, 0.0, 0.0, "keyframe"), (2, 0.0, 0.0, "endframe"), (3, 0.0, 0.0, "tracked")]
+
+        assert CurveSummary.from_curve(curve).gaps == ()
+
+    def test_empty_curve(self):
+        summary = CurveSummary.from_curve([])
+
+        assert summary.point_count == 0
+        assert summary.frame_range is None
+        assert summary.bounds is None
+        assert summary.keyframes == ()
+        assert sum(summary.status_counts.values()) == 0
+
+
+class TestIncrementalUpdates:
+    """Tests that incremental updates match a full rebuild."""
+
+    def test_move_points_inside_bounds(self):
+        curve = _sample_curve()
+        summary = CurveSummary.from_curve(curve)
+
+        moved = summary.move_points([(12.0, 22.0)], [(40.0, 21.0)])
+        curve[1] = (2, 40.0, 21.0, "tracked")
+
+        assert moved == CurveSummary.from_curve(curve)
+
+    def test_move_point_on_bounds_requires_rebuild(self):
+        summary = CurveSummary.from_curve(_sample_curve())
+
+        assert summary.move_points([(5.0, 30.0)], [(6.0, 29.0)]) is None
+
+    def test_replace_point_status(self):
+        curve = _sample_curve()
+        summary = CurveSummary.from_curve(curve)
+        new_point = (4, 16.0, 26.0, "interpolated")
+
+        updated = summary.replace_point(curve[3], new_point)
+        curve[3] = new_point
+
+        assert updated == CurveSummary.from_curve(curve)
+
+    def test_replace_point_with_gap_status_requires_rebuild(self):
+        curve = _sample_curve()
+        summary = CurveSummary.from_curve(curve)
+
+        assert summary.replace_point(curve[3], (4, 16.0, 26.0, "keyframe")) is None
+        assert summary.replace_point(curve[3], (7, 16.0, 26.0, "tracked")) is None
+
+    def test_append_point_after_last_frame(self):
+        curve = _sample_curve()
+        summary = CurveSummary.from_curve(curve)
+        new_point = (14, 50.0, -3.0, "tracked")
+
+        updated = summary.append_point(new_point)
+        curve.append(new_point)
+
+        assert updated == CurveSummary.from_curve(curve)
+        assert updated.gaps[-1] == (11, 13)
+
+    def test_append_point_inside_range_requires_rebuild(self):
+        summary = CurveSummary.from_curve(_sample_curve())
+
+        assert summary.append_point((7, 0.0, 0.0, "tracked")) is None
+        assert summary.append_point((11, 0.0, 0.0, "keyframe")) is None
@@ -545,5 +545,102 @@ def test_immutability_of_returned_data(app_state, sample_curve_data):
     assert len(state_data) == original_len
 
 
+# ==================== translate_points() (in-place drag path) ====================
+
+
+def test_translate_points_moves_only_given_indices(app_state, sample_curve_data):
+    """Test translate_points offsets the given points and keeps frame and status."""
+    app_state.set_curve_data("test_curve", sample_curve_data)
+
+    positions = app_state.translate_points("test_curve", [1, 3], 5.0, -10.0)
+
+    assert positions == {1: (115.0, 200.0), 3: (145.0, 230.0)}
+    data = app_state.get_curve_data("test_curve")
+    assert data[0] == sample_curve_data[0]
+    assert data[1] == (2, 115.0, 200.0, "normal")
+    assert data[3] == (5, 145.0, 230.0, "endframe")
+
+
+def test_translate_points_emits_points_moved_not_curves_changed(app_state, sample_curve_data):
+    """Test translate_points emits the lightweight signal; publish emits curves_changed once."""
+    app_state.set_curve_data("test_curve", sample_curve_data)
+    curves_spy = SignalSpy(app_state.curves_changed)
+    moved_spy = SignalSpy(app_state.points_moved)
+
+    app_state.translate_points("test_curve", [0], 1.0, 1.0)
+    app_state.translate_points("test_curve", [0], 1.0, 1.0)
+
+    assert curves_spy.count() == 0
+    assert moved_spy.count() == 2
+    assert moved_spy.last_args() == ("test_curve", {0: (102.0, 202.0)})
+
+    app_state.publish_curve_changes("test_curve")
+    assert curves_spy.count() == 1
+
+
+def test_translate_points_does_not_mutate_delivered_lists(app_state, sample_curve_data):
+    """Test lists already handed to curves_changed listeners are never edited in place."""
+    delivered: list[dict[str, CurveDataList]] = []
+    app_state.curves_changed.connect(delivered.append)
+    app_state.set_curve_data("test_curve", sample_curve_data)
+    delivered_curve = delivered[-1]["test_curve"]
+
+    app_state.translate_points("test_curve", [0], 50.0, 50.0)
+
+    assert delivered_curve[0] == (1, 100.0, 200.0, "keyframe")
+    assert app_state.get_curve_data("test_curve")[0] == (1, 150.0, 250.0, "keyframe")
+
+    # After publishing, the next in-place edit copies again
+    app_state.publish_curve_changes("test_curve")
+    published_curve = delivered[-1]["test_curve"]
+    app_state.translate_points("test_curve", [0], 1.0, 0.0)
+    assert published_curve[0] == (1, 150.0, 250.0, "keyframe")
+
+
+def test_translate_points_invalid_curve(app_state):
+    """Test translate_points on unknown curve moves nothing."""
+    assert app_state.translate_points("missing", [0], 1.0, 1.0) == {}
+
+
+# ==================== set_selections() (multi-curve selection) ====================
+
+
+def test_set_selections_replaces_listed_curves_only(app_state, sample_curve_data):
+    """Test set_selections replaces the listed curves and keeps the others."""
+    for name in ("curve_a", "curve_b", "curve_c"):
+        app_state.set_curve_data(name, sample_curve_data)
+    app_state.set_selection("curve_c", {3})
+
+    app_state.set_selections({"curve_a": {0, 1}, "curve_b": {2}})
+
+    assert app_state.get_selection("curve_a") == {0, 1}
+    assert app_state.get_selection("curve_b") == {2}
+    assert app_state.get_selection("curve_c") == {3}
+
+
+def test_set_selections_emits_once_preferring_active_curve(app_state, sample_curve_data):
+    """Test set_selections emits a single selection_changed, for the active curve if it changed."""
+    app_state.set_curve_data("curve_a", sample_curve_data)
+    app_state.set_curve_data("curve_b", sample_curve_data)
+    app_state.set_active_curve("curve_b")
+    spy = SignalSpy(app_state.selection_changed)
+
+    app_state.set_selections({"curve_a": {0}, "curve_b": {1, 2}})
+
+    assert spy.count() == 1
+    assert spy.last_args() == ({1, 2}, "curve_b")
+
+
+def test_set_selections_unchanged_emits_nothing(app_state, sample_curve_data):
+    """Test set_selections with unchanged selections emits no signal."""
+    app_state.set_curve_data("curve_a", sample_curve_data)
+    app_state.set_selection("curve_a", {1})
+    spy = SignalSpy(app_state.selection_changed)
+
+    app_state.set_selections({"curve_a": {1}})
+
+    assert spy.count() == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
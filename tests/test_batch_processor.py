@@ -0,0 +1,173 @@
+"""Tests for headless batch processing of tracking files and its CLI helpers."""
+
+# Per-file type checking relaxations for test code
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownParameterType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+# pyright: reportUnusedCallResult=none
+
+import argparse
+import json
+
+import pytest
+
+from core.batch_processor import ProcessingSettings, load_curves, process_curves, process_files
+from core.models import TrackingDirection
+from process_cli import collect_input_files, parse_positive_int
+from services.data_service import DataService
+
+IMAGE_HEIGHT = 1080
+
+
+def _write_tracked_file(path, tracks: dict[str, list[tuple[int, float, float]]]) -> str:
+    """Write a 2DTrackDatav2 file with a resolution header (bottom-left origin coordinates)."""
+    lines = [str(len(tracks))]
+    for name, points in tracks.items():
+        lines.extend([name, "0", str(len(points))])
+        lines.extend(f"{frame} {x} {y}" for frame, x, y in points)
+    path.write_text("# Resolution: 1920x1080\n" + "\n".join(lines) + "\n")
+    return str(path)
+
+
+def _make_tracks() -> dict[str, list[tuple[int, float, float]]]:
+    """Two tracks, the second with a 2-frame gap."""
+    return {
+        "Point1": [(frame, 100.0 + frame, 200.0) for frame in range(1, 11)],
+        "Point2": [(frame, 300.0, 400.0 + frame) for frame in (*range(1, 5), *range(7, 11))],
+    }
+
+
+class TestProcessCurves:
+    """Tests for loading and the per-curve operations."""
+
+    def test_load_flips_to_top_left_origin(self, tmp_path):
+        file_path = _write_tracked_file(tmp_path / "shot.txt", _make_tracks())
+
+        curves, image_height = load_curves(DataService(), file_path)
+
+        assert sorted(curves) == ["Point1", "Point2"]
+        assert image_height == IMAGE_HEIGHT
+        assert curves["Point1"][0][:3] == (1, 101.0, IMAGE_HEIGHT - 200.0)
+        # Default statuses are applied on load
+        assert curves["Point1"][0][3] == "keyframe"
+
+    def test_operations_apply_in_order(self, tmp_path):
+        data_service = DataService()
+        curves, _ = load_curves(data_service, _write_tracked_file(tmp_path / "shot.txt", _make_tracks()))
+        settings = ProcessingSettings(
+            direction=TrackingDirection.TRACKING_FW, fill_gaps=2, average=True, output_format="json"
+        )
+
+        processed = process_curves(data_service, curves, settings)
+
+        # Gap frames 5 and 6 are filled
+        assert [point[0] for point in processed["Point2"]] == list(range(1, 11))
+        assert processed["Point2"][4][3] == "interpolated"
+        # Averaging adds a curve over the common frames
+        assert "avrg_01" in processed
+        assert len(processed["avrg_01"]) == 10
+        # Input curves are not modified
+        assert len(curves["Point2"]) == 8
+
+    def test_negative_settings_rejected(self):
+        with pytest.raises(ValueError, match="negative"):
+            ProcessingSettings(smooth_window=-1)
+        with pytest.raises(ValueError, match="output format"):
+            ProcessingSettings(output_format="xlsx")
+        with pytest.raises(ValueError, match="not stored in 2dtrack"):
+            ProcessingSettings(direction=TrackingDirection.TRACKING_BW)
+
+
+class TestProcessFiles:
+    """Tests for in-process and pooled batch runs."""
+
+    def test_round_trips_2dtrack_output(self, tmp_path):
+        tracks = _make_tracks()
+        file_path = _write_tracked_file(tmp_path / "shot.txt", tracks)
+
+        result = process_files([file_path], tmp_path / "out", ProcessingSettings(), workers=1)
+
+        assert result.files_processed == 1
+        assert result.points_processed == 18
+        lines = (tmp_path / "out" / "shot.txt").read_text().splitlines()
+        assert lines[:4] == ["2", "Point1", "0", "10"]
+        # Coordinates are written back in 3DEqualizer's bottom-left origin
+        written = [tuple(float(value) for value in line.split()) for line in lines[4:14]]
+        assert written == [(float(frame), x, y) for frame, x, y in tracks["Point1"]]
+
+    def test_json_output_writes_one_file_per_curve(self, tmp_path):
+        file_path = _write_tracked_file(tmp_path / "shot.txt", _make_tracks())
+
+        result = process_files([file_path], tmp_path / "out", ProcessingSettings(output_format="json"), workers=1)
+
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["shot_Point1.json", "shot_Point2.json"]
+        with open(result.files[0].output_paths[0], encoding="utf-8") as f:
+            assert len(json.load(f)["points"]) == 10
+
+    def test_direction_statuses_are_written(self, tmp_path):
+        file_path = _write_tracked_file(tmp_path / "shot.txt", _make_tracks())
+        settings = ProcessingSettings(direction=TrackingDirection.TRACKING_BW, output_format="json")
+
+        result = process_files([file_path], tmp_path / "out", settings, workers=1)
+
+        with open(result.files[0].output_paths[1], encoding="utf-8") as f:
+            statuses = [point["status"] for point in json.load(f)["points"]]
+        # Loading marks Point2's first frame a keyframe; tracking backward makes it the endframe
+        assert statuses[0] == "endframe"
+        assert statuses[-1] == "keyframe"
+
+    def test_averaged_and_renamed_tracks_reopen(self, tmp_path):
+        tracks = {"shot_a": _make_tracks()["Point1"], "Track 2": _make_tracks()["Point1"]}
+        file_path = _write_tracked_file(tmp_path / "shot.txt", tracks)
+
+        result = process_files([file_path], tmp_path / "out", ProcessingSettings(average=True), workers=1)
+
+        reopened = DataService().load_tracked_data(result.files[0].output_paths[0])
+        assert sorted(reopened) == ["Track 2", "avrg_01", "shot_a"]
+        assert len(reopened["avrg_01"]) == 10
+
+    def test_bad_files_are_reported_without_stopping(self, tmp_path):
+        good = _write_tracked_file(tmp_path / "good.txt", _make_tracks())
+        bad = tmp_path / "bad.txt"
+        bad.write_text("not tracking data\n")
+
+        result = process_files([str(bad), good], tmp_path / "out", ProcessingSettings(), workers=1)
+
+        assert [file_result.succeeded for file_result in result.files] == [False, True]
+        assert "1 failed" in result.summary()
+        assert "FAILED bad.txt" in result.report()
+
+    def test_process_pool_processes_all_files(self, tmp_path):
+        files = [_write_tracked_file(tmp_path / f"shot_{index}.txt", _make_tracks()) for index in range(3)]
+
+        result = process_files(files, tmp_path / "out", ProcessingSettings(smooth_window=3), workers=2)
+
+        assert result.workers == 2
+        assert result.files_processed == 3
+        assert [file_result.input_path for file_result in result.files] == files
+        assert len(list((tmp_path / "out").iterdir())) == 3
+
+
+class TestProcessCliArguments:
+    """Tests for CLI argument helpers."""
+
+    def test_parse_positive_int(self):
+        assert parse_positive_int("5") == 5
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_positive_int("0")
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_positive_int("five")
+
+    def test_collect_input_files_expands_directories(self, tmp_path):
+        (tmp_path / "b.txt").write_text("")
+        (tmp_path / "a.json").write_text("")
+        (tmp_path / "notes.md").write_text("")
+        extra = str(tmp_path / "b.txt")
+
+        files = collect_input_files([str(tmp_path), extra])
+
+        assert files == [str(tmp_path / "a.json"), str(tmp_path / "b.txt")]
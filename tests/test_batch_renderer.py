@@ -0,0 +1,143 @@
+"""Tests for the offscreen batch overlay renderer and its CLI helpers."""
+
+# Per-file type checking relaxations for test code
+# Tests use mocks, fixtures, and Qt objects with incomplete type stubs
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportAny=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownParameterType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+# pyright: reportUnusedParameter=none
+# pyright: reportUnusedCallResult=none
+
+import argparse
+
+import pytest
+from PySide6.QtGui import QColor, QImage
+
+from core.type_aliases import CurveDataList
+from render_cli import parse_frame_range, parse_size
+from rendering.batch_renderer import (
+    OverlayRenderJob,
+    OverlayRenderSettings,
+    _chunk_frames,
+    render_overlays,
+)
+
+PLATE_COLOR = QColor(40, 80, 120)
+
+
+def _make_curves() -> dict[str, CurveDataList]:
+    """Two tracks over the same frames at different positions."""
+    return {
+        "Point1": [(frame, 100.0, 50.0, "keyframe") for frame in range(1, 6)],
+        "Point2": [(frame, 300.0, 150.0, "keyframe") for frame in range(1, 6)],
+    }
+
+
+def _make_plates(directory, count: int) -> list[str]:
+    """Write solid-colour 400x200 plates."""
+    directory.mkdir()
+    files = []
+    for index in range(count):
+        image = QImage(400, 200, QImage.Format.Format_RGB32)
+        image.fill(PLATE_COLOR)
+        path = directory / f"plate.{index + 1:04d}.png"
+        assert image.save(str(path))
+        files.append(str(path))
+    return files
+
+
+def _is_black(image: QImage, x: int, y: int) -> bool:
+    return QColor(image.pixel(x, y)).rgb() == QColor(0, 0, 0).rgb()
+
+
+class TestRenderOverlays:
+    """Tests for in-process and pooled rendering."""
+
+    def test_renders_each_frame_without_plate(self, qapp, tmp_path):
+        settings = OverlayRenderSettings(width=200, height=100, plate_width=400, plate_height=200)
+        job = OverlayRenderJob(
+            curves=_make_curves(), image_files=[], frames=range(2, 5), output_dir=tmp_path / "out", settings=settings
+        )
+
+        result = render_overlays(job, workers=1)
+
+        assert result.frames_rendered == 3
+        assert result.failed_frames == []
+        assert sorted(p.name for p in job.output_dir.iterdir()) == [
+            "overlay.0002.png",
+            "overlay.0003.png",
+            "overlay.0004.png",
+        ]
+        image = QImage(str(job.output_path(3)))
+        assert (image.width(), image.height()) == (200, 100)
+        # Plate fitted at half size: both tracks land at their own scaled positions
+        assert not _is_black(image, 50, 25)
+        assert not _is_black(image, 150, 75)
+        assert _is_black(image, 10, 90)
+
+    def test_plate_is_drawn_under_overlay(self, qapp, tmp_path):
+        plates = _make_plates(tmp_path / "plates", 5)
+        settings = OverlayRenderSettings(width=200, height=100)
+        job = OverlayRenderJob(
+            curves=_make_curves(), image_files=plates, frames=[1], output_dir=tmp_path / "out", settings=settings
+        )
+
+        result = render_overlays(job, workers=1)
+
+        assert result.frames_rendered == 1
+        image = QImage(str(job.output_path(1)))
+        assert QColor(image.pixel(10, 90)).rgb() == PLATE_COLOR.rgb()
+
+    def test_unwritable_frames_are_reported(self, qapp, tmp_path):
+        settings = OverlayRenderSettings(width=64, height=64, output_pattern="overlay.{frame}.unknownformat")
+        job = OverlayRenderJob(
+            curves=_make_curves(), image_files=[], frames=[1, 2], output_dir=tmp_path / "out", settings=settings
+        )
+
+        result = render_overlays(job, workers=1)
+
+        assert result.frames_rendered == 0
+        assert result.failed_frames == [1, 2]
+        assert "2 failed" in result.summary()
+
+    def test_process_pool_renders_all_frames(self, qapp, tmp_path):
+        settings = OverlayRenderSettings(width=64, height=32, plate_width=400, plate_height=200)
+        job = OverlayRenderJob(
+            curves=_make_curves(), image_files=[], frames=range(1, 6), output_dir=tmp_path / "out", settings=settings
+        )
+
+        result = render_overlays(job, workers=2)
+
+        assert result.workers == 2
+        assert result.frames_rendered == 5
+        assert len(list(job.output_dir.iterdir())) == 5
+
+    def test_frames_are_split_into_contiguous_chunks(self):
+        chunks = _chunk_frames(range(1, 11), workers=2)
+
+        assert [frame for chunk in chunks for frame in chunk] == list(range(1, 11))
+        assert all(chunk == list(range(chunk[0], chunk[-1] + 1)) for chunk in chunks)
+
+    def test_invalid_output_size_rejected(self):
+        with pytest.raises(ValueError, match="positive"):
+            OverlayRenderSettings(width=0)
+
+
+class TestRenderCliArguments:
+    """Tests for CLI argument parsing."""
+
+    def test_parse_size(self):
+        assert parse_size("1920x1080") == (1920, 1080)
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_size("1920")
+
+    def test_parse_frame_range(self):
+        assert parse_frame_range("1001-1100") == (1001, 1100)
+        assert parse_frame_range("12") == (12, 12)
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_frame_range("20-10")
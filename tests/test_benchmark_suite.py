@@ -0,0 +1,139 @@
+"""Tests for the synthetic large-scene benchmark suite."""
+
+# Per-file type checking relaxations for test code
+# Tests use mocks, fixtures, and Qt objects with incomplete type stubs
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportAny=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownParameterType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+# pyright: reportUnusedParameter=none
+# pyright: reportUnusedCallResult=none
+
+import itertools
+
+import pytest
+
+from benchmarks import (
+    BenchmarkResult,
+    BenchmarkSuite,
+    SceneSpec,
+    compare_results,
+    generate_scene,
+    load_baseline,
+    save_baseline,
+)
+from benchmarks.__main__ import main as benchmark_main
+from services.data_service import DataService
+
+SMALL_SPEC = SceneSpec(tracks=4, frames=120, gaps_per_track=2, max_gap_length=5)
+
+
+def _result(name: str, median_ms: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name, repeats=1, min_ms=median_ms, median_ms=median_ms, mean_ms=median_ms, max_ms=median_ms
+    )
+
+
+class TestSceneGenerator:
+    """Tests for generate_scene."""
+
+    def test_scene_is_deterministic(self):
+        """Same spec must produce identical scenes."""
+        assert generate_scene(SMALL_SPEC) == generate_scene(SMALL_SPEC)
+
+    def test_scene_shape(self):
+        """Scene has one curve per track with sorted frames and valid statuses."""
+        scene = generate_scene(SMALL_SPEC)
+        assert len(scene) == SMALL_SPEC.tracks
+        for points in scene.values():
+            frames = [p[0] for p in points]
+            assert frames == sorted(frames)
+            assert len(points) <= SMALL_SPEC.frames
+            assert {p[3] for p in points} <= {"keyframe", "tracked", "interpolated", "endframe"}
+
+    def test_gaps_are_endframe_terminated(self):
+        """Every frame gap is preceded by an endframe and followed by a keyframe."""
+        scene = generate_scene(SMALL_SPEC)
+        gaps_seen = 0
+        for points in scene.values():
+            for before, after in itertools.pairwise(points):
+                if after[0] - before[0] > 1:
+                    gaps_seen += 1
+                    assert before[3] == "endframe"
+                    assert after[3] == "keyframe"
+        assert gaps_seen > 0
+
+    def test_2dtrack_round_trip(self, tmp_path):
+        """Scenes saved as 2DTrackDatav2 load back to the same coordinates."""
+        scene = generate_scene(SMALL_SPEC)
+        path = str(tmp_path / "scene.txt")
+        assert DataService().save_tracked_data(path, scene, SMALL_SPEC.image_height)
+
+        loaded = DataService().load_tracked_data(path)
+
+        assert set(loaded) == set(scene)
+        for name, points in scene.items():
+            assert [p[0] for p in loaded[name]] == [p[0] for p in points]
+            assert loaded[name][0][1] == pytest.approx(points[0][1])
+            assert loaded[name][0][2] == pytest.approx(points[0][2])
+
+
+class TestBaselineComparison:
+    """Tests for baseline persistence and regression detection."""
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        results = {"render_offscreen": _result("render_offscreen", 12.5)}
+        path = save_baseline(results, SMALL_SPEC, tmp_path / "nested" / "baseline.json")
+
+        spec, loaded = load_baseline(path)
+
+        assert spec == SMALL_SPEC
+        assert loaded == results
+
+    def test_regression_above_threshold(self):
+        comparisons = compare_results({"a": _result("a", 10.0)}, {"a": _result("a", 14.0)}, threshold=0.25)
+        assert comparisons[0].is_regression
+
+    def test_slowdown_within_threshold_passes(self):
+        comparisons = compare_results({"a": _result("a", 10.0)}, {"a": _result("a", 12.0)}, threshold=0.25)
+        assert not comparisons[0].is_regression
+
+    def test_small_absolute_slowdown_is_noise(self):
+        """Doubling a 0.1 ms scenario is below the absolute floor and not a regression."""
+        comparisons = compare_results({"a": _result("a", 0.1)}, {"a": _result("a", 0.2)}, min_delta_ms=0.5)
+        assert not comparisons[0].is_regression
+
+    def test_missing_scenarios_are_skipped(self):
+        comparisons = compare_results({"a": _result("a", 1.0)}, {"b": _result("b", 1.0)})
+        assert comparisons == []
+
+
+class TestBenchmarkSuite:
+    """Smoke tests running the scenarios on a tiny scene."""
+
+    def test_all_scenarios_run(self, qapp):
+        suite = BenchmarkSuite(SMALL_SPEC, repeats=1, widget_size=(320, 240))
+
+        results = suite.run()
+
+        assert list(results) == suite.scenario_names
+        assert all(r.median_ms >= 0.0 for r in results.values())
+
+    def test_unknown_scenario_raises(self, qapp):
+        with pytest.raises(KeyError, match="no_such_scenario"):
+            _ = BenchmarkSuite(SMALL_SPEC, repeats=1).run(["no_such_scenario"])
+
+    def test_cli_compare_fails_on_regression(self, qapp, tmp_path):
+        """Compare mode exits non-zero when the baseline is much faster than the current run."""
+        baseline_path = tmp_path / "baseline.json"
+        save_baseline({"parse_2dtrack": _result("parse_2dtrack", 0.0)}, SMALL_SPEC, baseline_path)
+
+        exit_code = benchmark_main(
+            ["--compare", str(baseline_path), "--only", "parse_2dtrack", "--repeats", "1", "--min-delta-ms", "0"]
+        )
+
+        assert exit_code == 1
@@ -784,6 +784,29 @@ class TestBatchMoveCommand:
         assert curve_data[1] == (2, 150.0, 250.0)  # Unchanged
         assert curve_data[2] == (3, 220.0, 320.0)
 
+    def test_merged_executed_moves_redo_to_final_position(self):
+        """Test merging two executed moves keeps the first origin and the last target."""
+        from stores.application_state import get_application_state
+
+        initial_data = [(1, 100.0, 200.0), (2, 150.0, 250.0)]
+        main_window = MockMainWindow(MockCurveWidget(initial_data))
+        app_state = get_application_state()
+        app_state.set_curve_data("test_curve", initial_data)
+        app_state.set_active_curve("test_curve")
+
+        first = BatchMoveCommand("Move", [(1, (150.0, 250.0), (151.0, 250.0))])
+        second = BatchMoveCommand("Move", [(1, (151.0, 250.0), (155.0, 250.0))])
+        assert first.execute(as_main_window(main_window))
+        assert second.execute(as_main_window(main_window))
+
+        merged = first.merge_with(second)
+        merged.executed = True
+
+        assert merged.undo(as_main_window(main_window))
+        assert app_state.get_curve_data("test_curve")[1] == (2, 150.0, 250.0)
+        assert merged.redo(as_main_window(main_window))
+        assert app_state.get_curve_data("test_curve")[1] == (2, 155.0, 250.0)
+
 
 class TestSetPointStatusCommand:
     """Test SetPointStatusCommand class."""
@@ -13,6 +13,7 @@
 # pyright: reportUnusedParameter=none
 # pyright: reportUnusedCallResult=none
 
+import numpy as np
 import pytest
 
 from core.coordinate_detector import CoordinateDetector, get_system_info
@@ -21,6 +22,7 @@ from core.curve_data import (
     CurveDataWithMetadata,
     create_metadata_from_file_type,
     ensure_metadata_aware,
+    normalize_curves,
     wrap_legacy_data,
 )
 
@@ -184,6 +186,71 @@ class TestCurveDataWithMetadata:
         assert point is None
 
 
+_CONVERSION_METADATA = (
+    CoordinateMetadata(
+        system=CoordinateSystem.THREE_DE_EQUALIZER, origin=CoordinateOrigin.BOTTOM_LEFT, width=1280, height=720
+    ),
+    CoordinateMetadata(
+        system=CoordinateSystem.MAYA,
+        origin=CoordinateOrigin.CENTER,
+        width=1920,
+        height=1080,
+        unit_scale=2.5,
+        pixel_aspect_ratio=1.5,
+    ),
+    CoordinateMetadata(
+        system=CoordinateSystem.THREE_DE_EQUALIZER,
+        origin=CoordinateOrigin.BOTTOM_LEFT,
+        width=2048,
+        height=1556,
+        uses_normalized_coordinates=True,
+    ),
+    CoordinateMetadata(
+        system=CoordinateSystem.QT_SCREEN,
+        origin=CoordinateOrigin.TOP_LEFT,
+        width=0,
+        height=0,
+        uses_normalized_coordinates=True,
+    ),
+)
+
+
+class TestArrayConversion:
+    """Test whole-curve array conversions against the per-point conversions."""
+
+    @pytest.mark.parametrize("metadata", _CONVERSION_METADATA)
+    def test_arrays_match_per_point_conversion(self, metadata):
+        """Test that array conversions match to_normalized/from_normalized exactly."""
+        xy = np.random.default_rng(7).uniform(-50.0, 2000.0, size=(200, 2))
+
+        normalized = metadata.to_normalized_array(xy)
+        restored = metadata.from_normalized_array(normalized)
+
+        assert normalized.tolist() == [list(metadata.to_normalized(x, y)) for x, y in xy.tolist()]
+        assert restored.tolist() == [list(metadata.from_normalized(x, y)) for x, y in normalized.tolist()]
+        assert metadata.to_normalized_array(np.empty((0, 2))).shape == (0, 2)
+
+    def test_normalize_curves_matches_per_curve_normalization(self):
+        """Test that a scene sharing metadata is normalized like each curve on its own."""
+        metadata = _CONVERSION_METADATA[0]
+        other = _CONVERSION_METADATA[1]
+        curves = {
+            "Point1": CurveDataWithMetadata([(1, 10.0, 20.0, "keyframe"), (2, 11.0, 21.0)], metadata),
+            "Point2": CurveDataWithMetadata([(1, 30.0, 40.0)], metadata),
+            "Point3": CurveDataWithMetadata([(5, 1.0, 2.0)], other),
+            "Plain": CurveDataWithMetadata([(1, 5.0, 6.0)]),
+        }
+
+        normalized = normalize_curves(curves)
+
+        assert list(normalized) == list(curves)
+        for name, curve in curves.items():
+            expected = curve.to_normalized()
+            assert normalized[name].data == expected.data
+            assert normalized[name].metadata == expected.metadata
+            assert normalized[name].is_normalized
+
+
 class TestCoordinateDetector:
     """Test automatic coordinate system detection."""
 
@@ -252,6 +319,33 @@ class TestCoordinateDetector:
         assert width == 1280
         assert height == 720
 
+    def test_parsed_coordinates_replace_content_scan(self):
+        """Test that parsed coordinates drive data-range checks beyond the content sample."""
+        header = "1\nPoint1\n0\n3\n"
+        content = header + "1 0.1 0.2\n2 0.3 0.4\n3 0.5 0.6\n"
+
+        metadata = CoordinateDetector.detect_from_file("2dtrack.txt", content)
+        assert metadata.uses_normalized_coordinates
+
+        # Pixel coordinates from the parsed file override the normalized-looking sample
+        metadata = CoordinateDetector.detect_from_file("2dtrack.txt", content, xy=[(0.1, 0.2), (2400.0, 1300.0)])
+        assert not metadata.uses_normalized_coordinates
+        assert (metadata.width, metadata.height) == (2560, 1440)
+
+    def test_detection_examines_bounded_sample(self):
+        """Test that detection only scans a bounded prefix of the content."""
+        lines = [f"{frame} 100.0 200.0\n" for frame in range(1, 5001)]
+        content = "".join(lines) + "IMAGE 1920x1080\n"
+
+        sample = CoordinateDetector._sample(content)
+        assert len(sample) <= CoordinateDetector.SAMPLE_SIZE
+        assert sample.endswith("\n")
+        assert CoordinateDetector.sample_lines(lines).startswith(sample)
+
+        # The dimension header lies beyond the sample, so dimensions come from the data range
+        metadata = CoordinateDetector.detect_from_file("2dtrack.txt", content)
+        assert (metadata.width, metadata.height) == (1280, 720)
+
     def test_looks_like_3de_data(self):
         """Test recognition of 3DE data format."""
         # Valid 3DE data
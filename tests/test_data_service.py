@@ -268,6 +268,20 @@ class TestDataAnalysis:
         assert result["min_frame"] == 1
         assert result["max_frame"] == 3
 
+    def test_analyze_points_uses_curve_summary(self):
+        """Test that analysis of an ApplicationState curve matches a pass over its points."""
+        from stores.application_state import get_application_state, reset_application_state
+
+        reset_application_state()
+        try:
+            service = DataService()
+            points: CurveDataList = [(1, 10.0, 20.0), (5, 50.0, 80.0), (3, 30.0, 40.0)]
+            get_application_state().set_curve_data("Track1", points)
+
+            assert service.analyze_points(points, "Track1") == service.analyze_points(points)
+        finally:
+            reset_application_state()
+
     def test_analyze_points_empty_data(self):
         """Test point analysis with empty data."""
         service = DataService()
@@ -915,6 +929,136 @@ class TestThreadSafety:
         assert len(results) == 3
 
 
+GAP_CURVE: CurveDataList = [
+    (1, 100.0, 100.0, "keyframe"),
+    (5, 150.0, 150.0, "keyframe"),
+    (10, 200.0, 200.0, "keyframe"),
+    (15, 250.0, 250.0, "keyframe"),
+]
+
+
+class TestVersionedSegmentedCurveCache:
+    """Test SegmentedCurve caching keyed by ApplicationState curve versions."""
+
+    def test_version_changes_on_every_edit(self):
+        """Test that every point edit assigns the curve a new version."""
+        from stores.application_state import get_application_state
+
+        app_state = get_application_state()
+        app_state.set_curve_data("Track1", GAP_CURVE)
+        versions = [app_state.get_curve_version("Track1")]
+
+        app_state.set_point_status("Track1", 1, "endframe")
+        versions.append(app_state.get_curve_version("Track1"))
+        app_state.translate_points("Track1", [0], 1.0, 1.0)
+        versions.append(app_state.get_curve_version("Track1"))
+        app_state.delete_curve("Track1")
+
+        assert len(set(versions)) == 3
+        assert app_state.get_curve_version("Track1") == 0
+
+    def test_named_lookup_reuses_curve_until_it_changes(self):
+        """Test that a named lookup builds once per version."""
+        from stores.application_state import get_application_state
+
+        service = DataService()
+        app_state = get_application_state()
+        app_state.set_curve_data("Track1", GAP_CURVE)
+
+        data = app_state.get_curve_data("Track1")
+        assert service.get_position_at_frame(data, 3, "Track1") == (125.0, 125.0)
+        cached = service._curve_segmented_curves["Track1"][1]
+        assert service.get_position_at_frame(data, 7, "Track1") == (170.0, 170.0)
+        assert service._curve_segmented_curves["Track1"][1] is cached
+
+        app_state.set_point_status("Track1", 1, "endframe")
+        data = app_state.get_curve_data("Track1")
+        assert service.get_position_at_frame(data, 7, "Track1") == (150.0, 150.0)
+        assert service._curve_segmented_curves["Track1"][1] is not cached
+
+    def test_evict_drops_only_changed_curves(self):
+        """Test that eviction keeps entries of curves that did not change."""
+        from stores.application_state import get_application_state
+
+        service = DataService()
+        app_state = get_application_state()
+        for name in ("Track1", "Track2"):
+            app_state.set_curve_data(name, GAP_CURVE)
+            _ = service.get_position_at_frame(app_state.get_curve_data(name), 3, name)
+
+        app_state.set_point_status("Track1", 2, "endframe")
+        service.evict_changed_curves()
+
+        assert "Track1" not in service._curve_segmented_curves
+        assert "Track2" in service._curve_segmented_curves
+
+    def test_set_point_status_updates_cached_curve_in_place(self):
+        """Test that a status change patches the cached SegmentedCurve instead of rebuilding it."""
+        from stores.application_state import get_application_state
+
+        service = DataService()
+        app_state = get_application_state()
+        app_state.set_curve_data("Track1", GAP_CURVE)
+        _ = service.get_position_at_frame(app_state.get_curve_data("Track1"), 3, "Track1")
+        cached = service._curve_segmented_curves["Track1"][1]
+
+        assert service.set_point_status("Track1", 1, "endframe")
+        assert service.set_point_status("Track1", 1, "keyframe")
+        assert service.set_point_status("Track1", 2, "endframe")
+
+        entry = service._curve_segmented_curves["Track1"]
+        assert entry == (app_state.get_curve_version("Track1"), cached)
+
+        # Patched curve answers exactly like one rebuilt from the new data
+        data = app_state.get_curve_data("Track1")
+        fresh = DataService()
+        for frame in range(1, 20):
+            assert service.get_position_at_frame(data, frame, "Track1") == fresh.get_position_at_frame(data, frame)
+
+    def test_set_point_status_invalid_index_keeps_cache(self):
+        """Test that a rejected status change leaves the cache untouched."""
+        from stores.application_state import get_application_state
+
+        service = DataService()
+        app_state = get_application_state()
+        app_state.set_curve_data("Track1", GAP_CURVE)
+        _ = service.get_position_at_frame(app_state.get_curve_data("Track1"), 3, "Track1")
+        entry = service._curve_segmented_curves["Track1"]
+
+        assert not service.set_point_status("Track1", 99, "endframe")
+        assert service._curve_segmented_curves["Track1"] is entry
+
+    def test_status_commands_patch_cached_curve_in_place(self):
+        """Test that status commands update the cached SegmentedCurve without re-segmenting the curve."""
+        from core.commands.curve_commands import BatchSetPointStatusCommand, SetPointStatusCommand
+        from services import get_data_service
+        from stores.application_state import get_application_state
+
+        service = get_data_service()
+        app_state = get_application_state()
+        app_state.set_curve_data("Track1", GAP_CURVE)
+        app_state.set_active_curve("Track1")
+        _ = service.get_position_at_frame(app_state.get_curve_data("Track1"), 3, "Track1")
+        cached = service._curve_segmented_curves["Track1"][1]
+
+        command = SetPointStatusCommand("Set endframe", [(1, "keyframe", "endframe")])
+        batch = BatchSetPointStatusCommand("Set endframes", {"Track1": [(2, "keyframe", "endframe")]})
+        with patch("core.curve_segments.SegmentedCurve.from_curve_data") as from_curve_data:
+            assert command.execute(Mock())
+            assert batch.execute(Mock())
+            assert batch.undo(Mock())
+            assert command.undo(Mock())
+            assert command.redo(Mock())
+            from_curve_data.assert_not_called()
+
+        assert service._curve_segmented_curves["Track1"] == (app_state.get_curve_version("Track1"), cached)
+        assert app_state.get_curve_data("Track1")[1][3] == "endframe"
+        data = app_state.get_curve_data("Track1")
+        fresh = DataService()
+        for frame in range(1, 20):
+            assert service.get_position_at_frame(data, frame, "Track1") == fresh.get_position_at_frame(data, frame)
+
+
 class TestServiceIntegration:
     """Test integration with logging and status services."""
 
@@ -324,7 +324,7 @@ class TestErrorBoundaryStateConsistency:
         """Test that exceptions during ApplicationState updates are caught.
 
         This tests the critical path where data corruption is most likely - during
-        actual state mutations in set_curve_data().
+        actual state mutations in translate_points() (the in-place drag path).
         """
         view = MockCurveView([(1, 100.0, 100.0)])
         self.app_state.set_curve_data("test_curve", view.curve_data)
@@ -335,7 +335,7 @@ class TestErrorBoundaryStateConsistency:
         view.selected_points = {0}
 
         # Inject error during state mutation (critical untested path)
-        with patch.object(self.app_state, "set_curve_data", side_effect=RuntimeError("State mutation error")):
+        with patch.object(self.app_state, "translate_points", side_effect=RuntimeError("State mutation error")):
             event = Mock(spec=QMouseEvent)
             event.position.return_value = QPoint(110, 110)
             event.buttons.return_value = Qt.MouseButton.LeftButton
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+"""
+Tests for process-pool EXR decoding with shared-memory handoff.
+
+Tests the io_utils/exr_decode_pool.py module: worker decode into shared
+memory, zero-copy QImage wrapping, block lifecycle and the in-process fallback.
+"""
+
+# Per-file type checking relaxations for test code
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownParameterType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+# pyright: reportUnusedCallResult=none
+
+import gc
+from multiprocessing import shared_memory
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from io_utils import exr_decode_pool
+from io_utils.exr_decode_pool import (
+    ExrDecodePool,
+    decode_to_shared_memory,
+    get_exr_decode_pool,
+    reset_exr_decode_pool,
+    shared_memory_supported,
+)
+from io_utils.exr_loader import load_exr_as_qimage
+
+OpenEXR = pytest.importorskip("OpenEXR")
+
+pytestmark = pytest.mark.skipif(not shared_memory_supported(), reason="Shared memory handoff needs POSIX")
+
+
+def _write_exr(path, width: int = 16, height: int = 8) -> str:
+    """Write a linear float RGB gradient EXR file."""
+    ramp = np.linspace(0.0, 2.0, width * height, dtype=np.float32).reshape(height, width)
+    pixels = np.stack([ramp, ramp * 0.5, ramp * 0.25], axis=-1)
+    with OpenEXR.File({"compression": OpenEXR.ZIP_COMPRESSION, "type": OpenEXR.scanlineimage}, {"RGB": pixels}) as f:
+        f.write(str(path))
+    return str(path)
+
+
+def _block_exists(name: str) -> bool:
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    block.close()
+    return True
+
+
+@pytest.fixture
+def pool():
+    """Two-process pool, shut down after the test."""
+    decode_pool = ExrDecodePool(2)
+    yield decode_pool
+    decode_pool.shutdown()
+
+
+class TestSharedMemoryHandoff:
+    """Tests for worker decode and zero-copy wrapping (run in this process)."""
+
+    def test_decoded_pixels_match_in_process_loader(self, qapp, tmp_path):
+        file_path = _write_exr(tmp_path / "frame.exr")
+        decode_pool = ExrDecodePool(1)
+
+        frame = decode_to_shared_memory(file_path)
+        assert frame is not None
+        image = decode_pool.wrap(frame)
+        expected = load_exr_as_qimage(file_path)
+
+        assert expected is not None
+        assert (image.width(), image.height()) == (16, 8)
+        assert image == expected
+        assert image.colorSpace() == expected.colorSpace()
+
+    def test_block_name_removed_on_wrap_and_closed_with_image(self, qapp, tmp_path):
+        decode_pool = ExrDecodePool(1)
+        frame = decode_to_shared_memory(_write_exr(tmp_path / "frame.exr"))
+        assert frame is not None
+        assert _block_exists(frame.name)
+
+        image = decode_pool.wrap(frame)
+        copy = image  # Implicitly shared: keeps the block mapped
+
+        assert not _block_exists(frame.name)
+        assert decode_pool.live_frames == 1
+        assert decode_pool.live_bytes == 16 * 8 * 3
+
+        del image
+        gc.collect()
+        assert decode_pool.live_frames == 1
+        assert copy.pixelColor(0, 0).isValid()
+
+        del copy
+        gc.collect()
+        assert decode_pool.live_frames == 0
+        assert decode_pool.live_bytes == 0
+
+    def test_unreadable_file_returns_none(self, tmp_path):
+        bad = tmp_path / "bad.exr"
+        bad.write_bytes(b"not an exr")
+
+        assert decode_to_shared_memory(str(bad)) is None
+
+
+class TestExrDecodePool:
+    """Tests for decoding through worker processes."""
+
+    def test_decode_ordered_yields_in_input_order(self, qapp, tmp_path, pool):
+        files = [_write_exr(tmp_path / f"frame_{index}.exr", width=8 + index) for index in range(4)]
+
+        images = list(pool.decode_ordered(files, lookahead=2))
+
+        assert [image.width() for image in images] == [8, 9, 10, 11]
+        assert images[2] == load_exr_as_qimage(files[2])
+
+    def test_closing_early_frees_pending_blocks(self, qapp, tmp_path, pool):
+        files = [_write_exr(tmp_path / f"frame_{index}.exr") for index in range(6)]
+        released: list[str] = []
+
+        def tracking_release(frame):
+            released.append(frame.name)
+            original_release(frame)
+
+        original_release = exr_decode_pool._release
+        with patch("io_utils.exr_decode_pool._release", side_effect=tracking_release):
+            images = pool.decode_ordered(files, lookahead=4)
+            first = next(images)
+            images.close()
+            pool.shutdown()  # Waits for running decodes and their done-callbacks
+
+        assert first is not None
+        # Decodes finished after the close are freed, never left behind under their name
+        assert all(not _block_exists(name) for name in released)
+
+    def test_worker_failure_falls_back_to_in_process_loader(self, qapp, tmp_path, pool):
+        bad = tmp_path / "bad.exr"
+        bad.write_bytes(b"not an exr")
+
+        with patch("io_utils.exr_loader.load_exr_as_qimage", return_value=None) as fallback:
+            assert pool.decode(str(bad)) is None
+
+        fallback.assert_called_once_with(str(bad))
+        assert pool.available
+
+    def test_shutdown_pool_decodes_in_process(self, qapp, tmp_path, pool):
+        file_path = _write_exr(tmp_path / "frame.exr")
+        pool.shutdown()
+
+        image = pool.decode(file_path)
+
+        assert not pool.available
+        assert pool.live_frames == 0
+        assert image == load_exr_as_qimage(file_path)
+
+    def test_invalid_process_count_rejected(self):
+        with pytest.raises(ValueError, match="positive"):
+            ExrDecodePool(0)
+
+
+class TestGetExrDecodePool:
+    """Tests for the process-wide pool configuration."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, monkeypatch):
+        from core.config import reset_config
+
+        reset_exr_decode_pool()
+        yield
+        monkeypatch.undo()
+        reset_config()
+        reset_exr_decode_pool()
+
+    def test_zero_processes_disables_pool(self, monkeypatch):
+        from core.config import reset_config
+
+        monkeypatch.setenv("CURVE_EDITOR_EXR_DECODE_PROCESSES", "0")
+        reset_config()
+
+        assert get_exr_decode_pool() is None
+
+    def test_configured_process_count(self, monkeypatch):
+        from core.config import reset_config
+
+        monkeypatch.setenv("CURVE_EDITOR_EXR_DECODE_PROCESSES", "3")
+        reset_config()
+
+        pool = get_exr_decode_pool()
+        assert pool is not None
+        assert pool.processes == 3
+        assert get_exr_decode_pool() is pool
@@ -313,3 +313,81 @@ class TestFrameChangeCoordinator:
         # Trigger frame change while coordinator not connected
         # This should be handled by other handlers (if any remain)
         get_application_state().set_frame(42)  # Should not crash
+
+
+class TestScrubFrameChanges:
+    """Test frame change coalescing and scrub mode."""
+
+    @pytest.fixture
+    def main_window(self, qtbot):
+        """Create main window fixture."""
+        from stores.application_state import reset_application_state
+        from stores.store_manager import StoreManager
+        from ui.main_window import MainWindow
+
+        window = MainWindow()
+        qtbot.addWidget(window)
+        get_application_state().set_image_files([f"frame_{i:04d}.png" for i in range(1, 101)])
+        process_qt_events()
+        yield window
+        StoreManager.reset()
+        reset_application_state()
+
+    def test_stale_queued_frames_skipped(self, main_window, qtbot):
+        """Test only the latest of several queued frame changes is processed."""
+        coordinator = main_window.frame_change_coordinator
+
+        with patch.object(coordinator, "on_frame_changed") as frame_mock:
+            for frame in (10, 20, 30):
+                get_application_state().set_frame(frame)
+            process_qt_events()
+
+        frame_mock.assert_called_once_with(30)
+
+    def test_slider_drag_toggles_scrub_mode(self, main_window, qtbot):
+        """Test slider press and release enter and leave scrub mode."""
+        from rendering.optimized_curve_renderer import RenderQuality
+
+        coordinator = main_window.frame_change_coordinator
+        renderer = main_window.curve_widget._optimized_renderer
+        slider = main_window.timeline_controller.frame_slider
+
+        slider.sliderPressed.emit()
+        assert coordinator.scrubbing
+        assert renderer.effective_quality == RenderQuality.DRAFT
+
+        with patch.object(coordinator, "on_frame_changed") as frame_mock:
+            slider.sliderReleased.emit()
+
+        assert not coordinator.scrubbing
+        assert renderer.effective_quality == renderer._render_quality
+        # One full-quality pass for the frame the scrub ended on
+        frame_mock.assert_called_once_with(get_application_state().current_frame)
+
+    def test_stand_in_replaced_when_exact_frame_arrives(self, main_window, qtbot):
+        """Test a stand-in background is replaced once its frame decodes."""
+        coordinator = main_window.frame_change_coordinator
+        coordinator.view_management.image_filenames = ["image1.png"]
+        get_application_state().set_frame(5)
+        process_qt_events()
+        coordinator.begin_scrub()
+
+        with (
+            patch.object(
+                coordinator.view_management, "update_background_for_frame", return_value=False
+            ) as background_mock,
+            patch.object(coordinator, "_trigger_repaint") as repaint_mock,
+        ):
+            coordinator.on_frame_changed(5)
+            background_mock.assert_called_once_with(5, scrubbing=True)
+
+            coordinator._on_background_frame_ready(7)  # Neighbour, not the shown frame
+            assert background_mock.call_count == 1
+
+            background_mock.return_value = True
+            coordinator._on_background_frame_ready(4)  # 0-based index of frame 5
+
+        assert background_mock.call_count == 2
+        assert repaint_mock.call_count == 2
+        assert coordinator._stand_in_frame is None
+
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+"""
+Tests for the disk cache of display-ready EXR frames.
+
+Tests the io_utils/frame_disk_cache.py module and its use by
+SafeImageCacheManager for EXR sequences.
+"""
+
+# Per-file type checking relaxations for test code
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownParameterType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+# pyright: reportUnusedCallResult=none
+
+import os
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtGui import QColor, QColorSpace, QImage
+
+from io_utils.frame_disk_cache import HEADER_SIZE, FrameDiskCache, get_frame_disk_cache
+
+
+def _make_frame(width: int = 7, height: int = 5, color: QColor | None = None) -> QImage:
+    """sRGB-tagged RGB888 frame with an odd width so scanlines are padded."""
+    image = QImage(width, height, QImage.Format.Format_RGB888)
+    image.setColorSpace(QColorSpace(QColorSpace.NamedColorSpace.SRgb))
+    image.fill(color or QColor(10, 20, 30))
+    image.setPixelColor(0, 0, QColor(200, 100, 50))
+    return image
+
+
+def _make_source(tmp_path, name: str = "frame_0001.exr", content: bytes = b"exr data") -> str:
+    path = tmp_path / "plate" / name
+    path.parent.mkdir(exist_ok=True)
+    path.write_bytes(content)
+    return str(path)
+
+
+def _frame_bytes(width: int = 7, height: int = 5) -> int:
+    return HEADER_SIZE + _make_frame(width, height).bytesPerLine() * height
+
+
+class TestFrameDiskCache:
+    """Tests for storing, loading and evicting frames."""
+
+    def test_round_trip_returns_same_pixels(self, qapp, tmp_path):
+        cache = FrameDiskCache(tmp_path / "cache", 10 * 1024 * 1024)
+        source = _make_source(tmp_path)
+        frame = _make_frame()
+
+        assert cache.load(source) is None
+        assert cache.store(source, frame)
+        loaded = cache.load(source)
+
+        assert loaded is not None
+        assert loaded == frame
+        assert loaded.colorSpace().isValid()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_index_survives_restart(self, qapp, tmp_path):
+        source = _make_source(tmp_path)
+        FrameDiskCache(tmp_path / "cache", 10 * 1024 * 1024).store(source, _make_frame())
+
+        cache = FrameDiskCache(tmp_path / "cache", 10 * 1024 * 1024)
+
+        assert cache.entry_count == 1
+        assert cache.total_bytes == _frame_bytes()
+        assert cache.load(source) == _make_frame()
+
+    def test_modified_source_misses(self, qapp, tmp_path):
+        cache = FrameDiskCache(tmp_path / "cache", 10 * 1024 * 1024)
+        source = _make_source(tmp_path)
+        cache.store(source, _make_frame())
+
+        _make_source(tmp_path, content=b"re-rendered exr data")
+
+        assert not cache.contains(source)
+        assert cache.load(source) is None
+
+    def test_tone_mapping_change_misses(self, qapp, tmp_path):
+        cache = FrameDiskCache(tmp_path / "cache", 10 * 1024 * 1024)
+        source = _make_source(tmp_path)
+        cache.store(source, _make_frame())
+
+        with patch("io_utils.exr_loader.TONE_MAP_SIGNATURE", "other tone mapping"):
+            assert not cache.contains(source)
+
+    def test_least_recently_used_evicted_past_limit(self, qapp, tmp_path):
+        cache = FrameDiskCache(tmp_path / "cache", 2 * _frame_bytes())
+        sources = [_make_source(tmp_path, f"frame_{index}.exr") for index in range(3)]
+        cache.store(sources[0], _make_frame())
+        cache.store(sources[1], _make_frame())
+
+        assert cache.load(sources[0]) is not None  # Now most recently used
+        cache.store(sources[2], _make_frame())
+
+        assert cache.entry_count == 2
+        assert cache.contains(sources[0])
+        assert not cache.contains(sources[1])
+        assert cache.contains(sources[2])
+        assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    def test_loaded_image_outlives_eviction(self, qapp, tmp_path):
+        cache = FrameDiskCache(tmp_path / "cache", 10 * 1024 * 1024)
+        source = _make_source(tmp_path)
+        cache.store(source, _make_frame())
+        loaded = cache.load(source)
+
+        cache.clear()
+
+        assert cache.entry_count == 0
+        assert loaded.pixelColor(0, 0) == QColor(200, 100, 50)
+
+    def test_corrupt_entry_dropped(self, qapp, tmp_path):
+        cache = FrameDiskCache(tmp_path / "cache", 10 * 1024 * 1024)
+        source = _make_source(tmp_path)
+        cache.store(source, _make_frame())
+        entry = next((tmp_path / "cache").iterdir())
+        entry.write_bytes(entry.read_bytes()[: HEADER_SIZE + 4])
+
+        assert cache.load(source) is None
+        assert cache.entry_count == 0
+        assert not entry.exists()
+
+    def test_other_formats_converted_to_rgb888(self, qapp, tmp_path):
+        cache = FrameDiskCache(tmp_path / "cache", 10 * 1024 * 1024)
+        source = _make_source(tmp_path)
+        frame = _make_frame().convertToFormat(QImage.Format.Format_ARGB32)
+
+        cache.store(source, frame)
+
+        loaded = cache.load(source)
+        assert loaded.format() == QImage.Format.Format_RGB888
+        assert loaded.pixelColor(0, 0) == frame.pixelColor(0, 0)
+
+    def test_invalid_limit_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="positive"):
+            FrameDiskCache(tmp_path, 0)
+
+
+class TestImageCacheManagerDiskCache:
+    """Tests for the second-level cache in SafeImageCacheManager."""
+
+    def test_evicted_exr_frame_served_from_disk(self, qapp, tmp_path, monkeypatch):
+        from core.config import reset_config
+        from services.image_cache_manager import SafeImageCacheManager
+
+        monkeypatch.setenv("CURVE_EDITOR_EXR_DECODE_PROCESSES", "0")
+        reset_config()
+        source = _make_source(tmp_path)
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence([source])
+
+        with patch("io_utils.exr_loader.load_exr_as_qimage", return_value=_make_frame()) as decode:
+            first = cache.get_image(0)
+            cache.clear_cache()
+            second = cache.get_image(0)
+
+        decode.assert_called_once()
+        assert second == first
+        assert get_frame_disk_cache().hits == 1
+
+    def test_preload_reads_cached_frames_and_decodes_the_rest(self, qapp, tmp_path, monkeypatch):
+        from core.config import reset_config
+        from services.image_cache_manager import SafeImagePreloadWorker
+
+        monkeypatch.setenv("CURVE_EDITOR_EXR_DECODE_PROCESSES", "0")
+        reset_config()
+        sources = [_make_source(tmp_path, f"frame_{index}.exr") for index in range(3)]
+        get_frame_disk_cache().store(sources[1], _make_frame(color=QColor(1, 2, 3)))
+        worker = SafeImagePreloadWorker(sources, [0, 1, 2])
+
+        with patch("io_utils.exr_loader.load_exr_as_qimage", return_value=_make_frame()) as decode:
+            images = list(worker._decode_frames([0, 1, 2]))
+
+        assert [call.args[0] for call in decode.call_args_list] == [sources[0], sources[2]]
+        assert images[1].pixelColor(1, 1) == QColor(1, 2, 3)
+        assert all(get_frame_disk_cache().contains(source) for source in sources)
+
+    def test_disabled_when_size_is_zero(self, monkeypatch):
+        from core.config import reset_config
+
+        monkeypatch.setenv("CURVE_EDITOR_FRAME_CACHE_MB", "0")
+        reset_config()
+
+        assert get_frame_disk_cache() is None
+        assert os.environ["CURVE_EDITOR_FRAME_CACHE_DIR"]
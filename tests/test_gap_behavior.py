@@ -293,3 +293,13 @@ class TestEdgeCases:
 
         # Frame 5 should be startframe
         assert data_service.get_position_at_frame(curve_data, 5) == (150.0, 150.0)
+
+    def test_curves_with_same_frames_do_not_share_cache(self):
+        """Test that tracks sharing frames and statuses resolve their own positions."""
+        data_service = DataService()
+
+        first: CurveDataList = [(1, 100.0, 100.0, "keyframe"), (5, 140.0, 100.0, "keyframe")]
+        second: CurveDataList = [(1, 300.0, 200.0, "keyframe"), (5, 340.0, 200.0, "keyframe")]
+
+        assert data_service.get_position_at_frame(first, 3) == (120.0, 100.0)
+        assert data_service.get_position_at_frame(second, 3) == (320.0, 200.0)
@@ -100,11 +100,8 @@ class TestDataServiceSegmentedCurveUpdates:
 class TestSetPointStatusCommandUpdatesDataService:
     """Phase 2: Test that SetPointStatusCommand calls DataService correctly."""
 
-    def test_execute_calls_update_curve_data(self, main_window_mock):
-        """Test that execute() calls update_curve_data on DataService.
-
-        RED: Initially fails if execute() doesn't call update_curve_data.
-        """
+    def test_execute_updates_segmented_curve(self, main_window_mock):
+        """Test that execute() leaves DataService with a segmented curve split at the endframe."""
         # Arrange: Setup application state with curve data
         app_state = get_application_state()
         curve_data = [(i, 100.0 + i * 10, 200.0 + i * 5, "tracked") for i in range(1, 16)]
@@ -124,14 +121,12 @@ class TestSetPointStatusCommandUpdatesDataService:
         assert result, "Command execution should succeed"
 
         # Assert: DataService should have updated SegmentedCurve
-        assert data_service.segmented_curve is not None, "SegmentedCurve should be updated"
-        assert len(data_service.segmented_curve.segments) >= 2, "Should have multiple segments"
-
-    def test_execute_calls_handle_point_status_change(self, main_window_mock):
-        """Test that execute() calls handle_point_status_change for each change.
+        segmented_curve = data_service._get_versioned_segmented_curve("TestTrack", app_state.get_curve_data("TestTrack"))
+        assert segmented_curve is not None, "SegmentedCurve should be updated"
+        assert len(segmented_curve.segments) >= 2, "Should have multiple segments"
 
-        RED: Initially fails if execute() doesn't call handle_point_status_change.
-        """
+    def test_execute_sets_status_in_segmented_curve(self, main_window_mock):
+        """Test that execute() applies each change to DataService's segmented curve."""
         # Arrange: Setup application state
         app_state = get_application_state()
         curve_data = [(i, 100.0 + i * 10, 200.0 + i * 5, "tracked") for i in range(1, 16)]
@@ -148,7 +143,7 @@ class TestSetPointStatusCommandUpdatesDataService:
         command.execute(main_window_mock)
 
         # Assert: SegmentedCurve should be updated
-        segmented_curve = data_service.segmented_curve
+        segmented_curve = data_service._get_versioned_segmented_curve("TestTrack", app_state.get_curve_data("TestTrack"))
         assert segmented_curve is not None
 
         # Verify that frame 10 is now an endframe
@@ -319,7 +314,7 @@ class TestEndToEndGapRendering:
         assert result, "Command should execute successfully"
 
         # Step 2: Verify DataService has updated SegmentedCurve
-        segmented_curve = data_service.segmented_curve
+        segmented_curve = data_service._get_versioned_segmented_curve("TestTrack", app_state.get_curve_data("TestTrack"))
         assert segmented_curve is not None, "DataService should have SegmentedCurve"
 
         segments = segmented_curve.segments
@@ -353,7 +348,7 @@ class TestEndToEndGapRendering:
         assert point_at_10[3] == "endframe", "Frame 10 should be ENDFRAME"
 
         # Step 5: Verify DataService's SegmentedCurve is accessible
-        assert data_service.segmented_curve is not None, "Renderer can get SegmentedCurve from DataService"
+        assert segmented_curve is not None, "Renderer can get SegmentedCurve from DataService"
 
     def test_timeline_and_curve_show_same_gap(self, main_window_mock):
         """Test that timeline and curve renderer see the same gap state.
@@ -371,7 +366,6 @@ class TestEndToEndGapRendering:
         app_state.set_active_curve("TestTrack")
 
         data_service = get_data_service()
-        data_service.update_curve_data(curve_data)
 
         # Act: Execute command to create gap
         changes = [(1, "tracked", "endframe")]  # Frame 10 becomes ENDFRAME
@@ -390,7 +384,7 @@ class TestEndToEndGapRendering:
                 assert frame_status[frame].is_inactive, f"Frame {frame} should be inactive on timeline"
 
         # Step 2: Check renderer view (via SegmentedCurve)
-        segmented_curve = data_service.segmented_curve
+        segmented_curve = data_service._get_versioned_segmented_curve("TestTrack", app_state.get_curve_data("TestTrack"))
         assert segmented_curve is not None, "SegmentedCurve should exist"
 
         # Frames 11-14 should be in inactive segment
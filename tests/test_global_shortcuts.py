@@ -374,5 +374,124 @@ class TestEventFilterIntegration:
         assert isinstance(double_spin_box, skip_types)
 
 
+
+def _numpad_event(event_type, auto_repeat: bool = False) -> QKeyEvent:
+    return QKeyEvent(event_type, Qt.Key.Key_6, Qt.KeyboardModifier.KeypadModifier, "6", auto_repeat)
+
+
+class TestNudgeRepeatCoalescing:
+    """Test that holding a nudge key is coalesced into per-frame updates and one undo entry."""
+
+    def _hold_nudge(self, window, repeats: int) -> None:
+        event_filter = window.global_event_filter
+        widget = window.curve_widget
+        event_filter.eventFilter(widget, _numpad_event(QKeyEvent.Type.KeyPress))
+        for _ in range(repeats):
+            event_filter.eventFilter(widget, _numpad_event(QKeyEvent.Type.KeyPress, auto_repeat=True))
+
+    def _release(self, window) -> None:
+        window.global_event_filter.eventFilter(window.curve_widget, _numpad_event(QKeyEvent.Type.KeyRelease))
+
+    def test_repeats_within_a_frame_applied_once(self, main_window_with_shortcuts, monkeypatch):
+        window = main_window_with_shortcuts
+        app_state = get_application_state()
+        window.curve_widget._select_point(1, add_to_selection=False)
+        monkeypatch.setattr(window.global_event_filter.repeat_coalescer, "_get_frame_interval_ms", lambda _: 10_000)
+
+        applied = []
+        original_translate = app_state.translate_points
+
+        def counting_translate(*args, **kwargs):
+            applied.append(args)
+            return original_translate(*args, **kwargs)
+
+        monkeypatch.setattr(app_state, "translate_points", counting_translate)
+
+        self._hold_nudge(window, repeats=5)
+
+        # Leading edge applies the first repeat; the rest wait for the frame timer
+        assert len(applied) == 1
+        assert app_state.get_curve_data("__test__")[1][1] == pytest.approx(152.0)
+
+        self._release(window)
+
+        assert len(applied) == 2
+        assert app_state.get_curve_data("__test__")[1][1] == pytest.approx(156.0)
+        assert window.global_event_filter.repeat_coalescer.active_command is None
+
+    def test_curves_changed_published_once_on_release(self, main_window_with_shortcuts, qtbot):
+        window = main_window_with_shortcuts
+        app_state = get_application_state()
+        window.curve_widget._select_point(1, add_to_selection=False)
+        self._hold_nudge(window, repeats=0)
+
+        published = []
+        app_state.curves_changed.connect(lambda curves: published.append(curves))
+        for _ in range(4):
+            window.global_event_filter.eventFilter(
+                window.curve_widget, _numpad_event(QKeyEvent.Type.KeyPress, auto_repeat=True)
+            )
+            qtbot.wait(20)
+
+        assert published == []
+
+        self._release(window)
+
+        assert len(published) == 1
+        assert app_state.get_curve_data("__test__")[1][1:3] == pytest.approx((155.0, 120.0))
+
+    def test_hold_undone_in_one_step(self, main_window_with_shortcuts):
+        window = main_window_with_shortcuts
+        app_state = get_application_state()
+        from services import get_interaction_service
+
+        command_manager = get_interaction_service().command_manager
+        command_manager.clear_history(window)
+        window.curve_widget._select_point(1, add_to_selection=False)
+
+        self._hold_nudge(window, repeats=6)
+        self._release(window)
+
+        assert app_state.get_curve_data("__test__")[1][1] == pytest.approx(157.0)
+        assert len(command_manager._history) == 1
+
+        assert command_manager.undo(window)
+        assert app_state.get_curve_data("__test__")[1][1:3] == pytest.approx((150.0, 120.0))
+        assert not command_manager.can_undo()
+
+        assert command_manager.redo(window)
+        assert app_state.get_curve_data("__test__")[1][1] == pytest.approx(157.0)
+
+    def test_idle_timeout_ends_burst_without_release(self, main_window_with_shortcuts, qtbot):
+        from core.commands.shortcut_commands import REPEAT_IDLE_TIMEOUT_MS
+
+        window = main_window_with_shortcuts
+        window.curve_widget._select_point(1, add_to_selection=False)
+        coalescer = window.global_event_filter.repeat_coalescer
+
+        self._hold_nudge(window, repeats=3)
+        assert coalescer.active_command is not None
+
+        qtbot.waitUntil(lambda: coalescer.active_command is None, timeout=REPEAT_IDLE_TIMEOUT_MS * 4)
+        assert get_application_state().get_curve_data("__test__")[1][1] == pytest.approx(154.0)
+
+    def test_non_keyframe_points_not_coalesced(self, main_window_with_shortcuts):
+        window = main_window_with_shortcuts
+        app_state = get_application_state()
+        window.curve_widget._select_point(0, add_to_selection=False)
+        event_filter = window.global_event_filter
+
+        # Repeats of a NORMAL point execute normally (which converts it to a keyframe)
+        handled = event_filter.eventFilter(
+            window.curve_widget, _numpad_event(QKeyEvent.Type.KeyPress, auto_repeat=True)
+        )
+
+        assert handled
+        assert event_filter.repeat_coalescer.active_command is None
+        point = app_state.get_curve_data("__test__")[0]
+        assert point[1] == pytest.approx(101.0)
+        assert point[3] == PointStatus.KEYFRAME.value
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
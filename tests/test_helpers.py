@@ -400,6 +400,8 @@ class MockCurveView:
             except ImportError:
                 # Fallback for non-Qt environments - use object
                 self.rubber_band_origin = object()
+        # Lasso selection outline (QPolygonF while drawing, None when inactive)
+        self.lasso_polygon: object | None = None
 
         # Display settings
         self.show_background: bool = True
@@ -1071,5 +1071,163 @@ class TestWorkerThreadSafety:
         assert 0 not in cache._lru_cache
 
 
+class TestScrubFrameAccess:
+    """Test non-blocking frame access while scrubbing."""
+
+    def test_cached_frame_is_exact(self):
+        """Test that a frame in memory is returned as exact."""
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence([f"/path/frame_{i:04d}.png" for i in range(10)])
+        cached_image = Mock(spec=QImage)
+        cache._lru_cache[4] = cached_image
+
+        image, exact = cache.get_cached_or_nearest(4)
+
+        assert image is cached_image
+        assert exact
+
+    def test_missing_frame_returns_nearest_without_loading(self):
+        """Test that a missing frame returns the nearest cached frame and never decodes."""
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence([f"/path/frame_{i:04d}.png" for i in range(10)])
+        near_image = Mock(spec=QImage)
+        cache._lru_cache[2] = Mock(spec=QImage)
+        cache._lru_cache[6] = near_image
+
+        with patch.object(cache, "_load_image_from_disk") as mock_load:
+            image, exact = cache.get_cached_or_nearest(5)
+
+        mock_load.assert_not_called()
+        assert image is near_image
+        assert not exact
+
+    def test_nothing_cached_returns_none(self):
+        """Test that an empty cache returns no stand-in."""
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence([f"/path/frame_{i:04d}.png" for i in range(10)])
+
+        assert cache.get_cached_or_nearest(5) == (None, False)
+
+    def test_request_frame_loads_nearest_first_without_waiting(self):
+        """Test that request_frame orders frames by distance and does not wait for the old worker."""
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence([f"/path/frame_{i:04d}.png" for i in range(100)])
+
+        old_worker = Mock()
+        old_worker.isRunning.return_value = True
+        cache._preload_worker = old_worker
+
+        with patch("services.image_cache_manager.SafeImageScrubWorker") as mock_worker_class:
+            cache.request_frame(50, window_size=2)
+
+        old_worker.stop.assert_called_once()
+        old_worker.wait.assert_not_called()
+        assert cache._retired_workers == [old_worker]
+        mock_worker_class.return_value.request.assert_called_once_with([50, 51, 49, 52, 48])
+
+    def test_request_frame_reuses_one_scrub_worker(self):
+        """Test that every scrub position is sent to the same worker."""
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence([f"/path/frame_{i:04d}.png" for i in range(100)])
+        cache._lru_cache[20] = Mock(spec=QImage)
+
+        with patch("services.image_cache_manager.SafeImageScrubWorker") as mock_worker_class:
+            cache.request_frame(10, window_size=0)
+            cache.request_frame(11, window_size=0)
+            cache.request_frame(20, window_size=0)
+
+        mock_worker_class.assert_called_once()
+        scrub_worker = mock_worker_class.return_value
+        scrub_worker.start.assert_called_once()
+        # The cached position still replaces the stale request
+        assert [c.args[0] for c in scrub_worker.request.call_args_list] == [[10], [11], []]
+        assert cache._retired_workers == []
+
+    def test_request_frame_replaces_exited_scrub_worker(self):
+        """Test that a request reaching a scrub worker that ran out of work starts a new one."""
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence([f"/path/frame_{i:04d}.png" for i in range(100)])
+        exited_worker = Mock()
+        exited_worker.request.return_value = False
+        exited_worker.isRunning.return_value = False
+        cache._scrub_worker = exited_worker
+
+        with patch("services.image_cache_manager.SafeImageScrubWorker") as mock_worker_class:
+            cache.request_frame(10, window_size=0)
+
+        assert cache._scrub_worker is mock_worker_class.return_value
+        mock_worker_class.return_value.request.assert_called_once_with([10])
+        mock_worker_class.return_value.start.assert_called_once()
+
+    def test_preload_after_scrub_does_not_wait_for_retired_workers(self):
+        """Test that the end-of-scrub preload never joins retired workers on the calling thread."""
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence([f"/path/frame_{i:04d}.png" for i in range(100)])
+        retired_worker = Mock()
+        retired_worker.isFinished.return_value = False
+        cache._retired_workers = [retired_worker]
+
+        with patch("services.image_cache_manager.SafeImagePreloadWorker"):
+            cache.preload_around_frame(50, window_size=5)
+
+        retired_worker.wait.assert_not_called()
+        assert cache._retired_workers == [retired_worker]
+
+    def test_scrub_worker_serves_latest_request(self):
+        """Test that a newer request supersedes the rest of the one being decoded."""
+        from services.image_cache_manager import SafeImageScrubWorker
+
+        files = [f"/path/frame_{i:04d}.png" for i in range(10)]
+        worker = SafeImageScrubWorker(files)
+        decoding = threading.Event()
+        release = threading.Event()
+        decoded: list[str] = []
+
+        def load_image(file_path):
+            decoded.append(file_path)
+            decoding.set()
+            _ = release.wait(5)
+
+        with patch.object(worker, "_load_image", side_effect=load_image):
+            assert worker.request([0, 1, 2, 3])
+            worker.start()
+            assert decoding.wait(5)
+            decoding.clear()
+            assert worker.request([9])
+            release.set()
+            # Frame 0 finishes, then the worker moves straight to frame 9 and exits
+            assert worker.wait(5000)
+
+        assert not worker.request([5])
+
+        assert decoded == [files[0], files[9]]
+
+    def test_frame_ready_emitted_for_added_frame(self):
+        """Test that frame_ready is emitted when a preloaded frame is added."""
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence(["/path/frame_0001.png"])
+        ready: list[int] = []
+        cache.frame_ready.connect(ready.append)
+
+        cache._on_image_preloaded(0, Mock(spec=QImage))
+        cache._on_image_preloaded(0, Mock(spec=QImage))  # Already cached
+
+        assert ready == [0]
+
+    def test_frames_from_previous_sequence_dropped(self):
+        """Test that frames delivered by a worker of a replaced sequence are dropped."""
+        from services.image_cache_manager import SafeImagePreloadWorker
+
+        cache = SafeImageCacheManager()
+        cache.set_image_sequence(["/path/a_0001.png"])
+        stale_worker = SafeImagePreloadWorker(["/path/a_0001.png"], [0], cache._sequence_id)
+        cache.set_image_sequence(["/path/b_0001.png"])
+        cache._preload_worker = stale_worker
+
+        cache._on_image_preloaded(0, Mock(spec=QImage))
+
+        assert 0 not in cache._lru_cache
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
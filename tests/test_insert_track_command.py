@@ -33,7 +33,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from core.commands.insert_track_command import InsertTrackCommand
+from core.commands.insert_track_command import CurveRangePatch, InsertTrackCommand
 from core.models import CurvePoint
 from stores.application_state import get_application_state
 
@@ -177,6 +177,27 @@ class TestInsertTrackCommand:
         frames = {p[0] for p in new_data}
         assert 6 in frames
 
+    def test_undo_state_holds_only_filled_rows(self, mock_main_window, curve_with_gap):
+        """Test undo state keeps the changed rows, not copies of whole curves."""
+        # Setup
+        app_state = get_application_state()
+        app_state.set_curve_data("curve_01", curve_with_gap)
+
+        command = InsertTrackCommand(selected_curves=["curve_01"], current_frame=6)
+        command.execute(mock_main_window)
+
+        # Only the filled frames 5-7 differ; the rows around the gap are shared
+        patch = command.patches["curve_01"]
+        assert patch.old_rows == []
+        assert [p[0] for p in patch.new_rows] == [5, 6, 7]
+
+        # Undo/redo round-trips exactly
+        filled_data = app_state.get_curve_data("curve_01")
+        command.undo(mock_main_window)
+        assert app_state.get_curve_data("curve_01") == curve_with_gap
+        command.redo(mock_main_window)
+        assert app_state.get_curve_data("curve_01") == filled_data
+
     def test_scenario_1_no_gap_at_frame_returns_false(self, mock_main_window, curve_without_gap):
         """Test Scenario 1: Returns False when no gap at current frame."""
         # Setup - curve has no gap
@@ -799,3 +820,29 @@ class TestInsertTrackEmptyCollectionBounds:
         # All curves have data at frame 2, should execute Scenario 3 (create averaged)
         assert result is True
         assert command.scenario == 3  # Create averaged curve scenario
+
+
+class TestCurveRangePatch:
+    """Test suite for CurveRangePatch."""
+
+    def test_patch_covers_only_differing_rows(self):
+        """Test common prefix and suffix are left out of the patch."""
+        old = [(1, 0.0, 0.0, "normal"), (2, 1.0, 1.0, "endframe"), (5, 5.0, 5.0, "normal")]
+        new = [(1, 0.0, 0.0, "normal"), (2, 1.0, 1.0, "keyframe"), (3, 2.0, 2.0, "tracked"), (5, 5.0, 5.0, "normal")]
+
+        patch = CurveRangePatch.between(old, new)
+
+        assert patch.start == 1
+        assert patch.old_rows == [(2, 1.0, 1.0, "endframe")]
+        assert patch.new_rows == [(2, 1.0, 1.0, "keyframe"), (3, 2.0, 2.0, "tracked")]
+        assert patch.apply(old) == new
+        assert patch.revert(new) == old
+
+    def test_identical_data_gives_empty_patch(self):
+        """Test an unchanged curve produces a no-op patch."""
+        data = [(1, 0.0, 0.0, "normal"), (2, 1.0, 1.0, "normal")]
+
+        patch = CurveRangePatch.between(data, list(data))
+
+        assert patch.old_rows == patch.new_rows == []
+        assert patch.apply(data) == data
@@ -306,4 +306,4 @@ class TestMemoryAndStats:
         self.service.clear_spatial_index()
 
         # Index should be reset (verified by internal state, now in _selection helper)
-        assert self.service._selection._point_index._last_point_count == 0
+        assert self.service._selection._point_indexes == {}
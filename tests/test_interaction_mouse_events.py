@@ -42,7 +42,7 @@ from stores.application_state import get_application_state
 if TYPE_CHECKING:
     from services.interaction_service import InteractionService
 
-from tests.test_helpers import MockCurveView
+from tests.test_helpers import MockCurveView, MockMainWindow
 
 
 class TestMousePressEvents:
@@ -285,6 +285,84 @@ class TestMouseMoveEvents:
             assert rect.width() > 0 or rect.height() > 0
 
 
+class TestDragSession:
+    """Test the coalesced drag path from press to release."""
+
+    service: "InteractionService"  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    @pytest.fixture(autouse=True)
+    def setup(self, qapp) -> None:
+        """Setup test environment."""
+        self.service = get_interaction_service()
+        self.service.command_manager.clear_history(MockMainWindow())
+        self.service.clear_spatial_index()
+
+    def _mouse_event(self, x: float, y: float) -> Mock:
+        event = Mock(spec=QMouseEvent)
+        event.position.return_value = QPointF(x, y)
+        event.button.return_value = Qt.MouseButton.LeftButton
+        event.modifiers.return_value = Qt.KeyboardModifier.NoModifier
+        return event
+
+    def test_drag_is_recorded_as_single_undoable_move(self) -> None:
+        """Test a multi-step drag yields one history entry that undo fully reverts."""
+        app_state = get_application_state()
+        test_data = cast(CurveDataList, [(1, 100.0, 100.0, "keyframe"), (2, 300.0, 300.0, "keyframe")])
+        app_state.set_curve_data("test_curve", test_data)
+        app_state.set_active_curve("test_curve")
+
+        view = MockCurveView(test_data)
+        main_window = MockMainWindow()
+        view.main_window = main_window
+
+        self.service.handle_mouse_press(view, self._mouse_event(100.0, 100.0))
+        assert view.drag_active is True
+        for step in range(1, 6):
+            self.service.handle_mouse_move(view, self._mouse_event(100.0 + 10.0 * step, 100.0))
+        self.service.handle_mouse_release(view, self._mouse_event(150.0, 100.0))
+
+        moved = app_state.get_curve_data("test_curve")
+        assert moved[0][1] != 100.0
+        assert moved[0][3] == "keyframe"
+        assert moved[1] == test_data[1]
+        assert len(self.service.command_manager._history) == 1
+
+        assert self.service.command_manager.undo(main_window)
+        assert app_state.get_curve_data("test_curve")[0] == test_data[0]
+
+    def test_moves_within_a_frame_are_coalesced(self) -> None:
+        """Test moves arriving faster than the frame interval are applied once, at release."""
+        app_state = get_application_state()
+        test_data = cast(CurveDataList, [(1, 100.0, 100.0)])
+        app_state.set_curve_data("test_curve", test_data)
+        app_state.set_active_curve("test_curve")
+
+        view = MockCurveView(test_data)
+        view.main_window = MockMainWindow()
+        moved_signals: list[str] = []
+        app_state.points_moved.connect(lambda name, _positions: moved_signals.append(name))
+
+        self.service.handle_mouse_press(view, self._mouse_event(100.0, 100.0))
+        session = self.service._mouse._drag_session
+        assert session is not None
+        session._frame_interval_ms = 60_000
+
+        self.service.handle_mouse_move(view, self._mouse_event(110.0, 100.0))
+        first_x = app_state.get_curve_data("test_curve")[0][1]
+        self.service.handle_mouse_move(view, self._mouse_event(120.0, 100.0))
+        self.service.handle_mouse_move(view, self._mouse_event(130.0, 100.0))
+
+        # The leading move is applied at once, the rest wait for the next frame
+        assert len(moved_signals) == 1
+        assert app_state.get_curve_data("test_curve")[0][1] == first_x
+
+        self.service.handle_mouse_release(view, self._mouse_event(130.0, 100.0))
+
+        assert len(moved_signals) == 2
+        final_x = app_state.get_curve_data("test_curve")[0][1]
+        assert final_x - 100.0 == pytest.approx(3 * (first_x - 100.0))
+
+
 class TestMouseReleaseEvents:
     """Test mouse release event handling."""
 
@@ -250,6 +250,79 @@ class TestInteractionServiceSelection:
         assert 2 not in view.selected_points
 
 
+class TestRegionSelection:
+    """Test rubber band and lasso selection across displayed curves."""
+
+    service: "InteractionService" = cast("InteractionService", None)  # pyright: ignore[reportInvalidCast]
+
+    @pytest.fixture(autouse=True)
+    def setup(self, qapp) -> None:
+        """Set up two displayed curves whose points sit at their data coordinates."""
+        from stores.application_state import get_application_state
+
+        self.service = get_interaction_service()
+        self.app_state = get_application_state()
+        self.app_state.set_curve_data("curve_a", [(1, 100.0, 100.0), (2, 150.0, 150.0), (3, 300.0, 300.0)])
+        self.app_state.set_curve_data("curve_b", [(1, 120.0, 130.0), (2, 400.0, 400.0)])
+        self.app_state.set_active_curve("curve_a")
+        self.app_state.set_show_all_curves(True)
+        self.view = MockCurveView(self.app_state.get_curve_data("curve_a"))
+
+    def test_find_points_in_rect_returns_indices_per_curve(self) -> None:
+        hits = self.service.find_points_in_region(self.view, QRect(90, 90, 70, 70))
+
+        assert {name: indices.tolist() for name, indices in hits.items()} == {"curve_a": [0, 1], "curve_b": [0]}
+
+    def test_find_points_active_mode_searches_active_curve_only(self) -> None:
+        hits = self.service.find_points_in_region(self.view, QRect(90, 90, 70, 70), mode="active")
+
+        assert list(hits) == ["curve_a"]
+
+    def test_hidden_curves_are_not_searched(self) -> None:
+        self.app_state.set_curve_visibility("curve_b", False)
+
+        hits = self.service.find_points_in_region(self.view, QRect(90, 90, 70, 70))
+
+        assert list(hits) == ["curve_a"]
+
+    def test_lasso_polygon_selects_points_inside(self) -> None:
+        from PySide6.QtCore import QPointF
+        from PySide6.QtGui import QPolygonF
+
+        # Triangle containing (100,100) and (120,130) but not (150,150)
+        lasso = QPolygonF([QPointF(80, 80), QPointF(160, 80), QPointF(100, 160)])
+
+        count = self.service.select_points_in_region(self.view, lasso)
+
+        assert count == 2
+        assert self.app_state.get_selection("curve_a") == {0}
+        assert self.app_state.get_selection("curve_b") == {0}
+
+    def test_replace_clears_searched_curves_without_hits(self) -> None:
+        self.app_state.set_selection("curve_b", {1})
+
+        _ = self.service.select_points_in_region(self.view, QRect(290, 290, 20, 20))
+
+        assert self.app_state.get_selection("curve_a") == {2}
+        assert self.app_state.get_selection("curve_b") == set()
+
+    def test_add_to_selection_keeps_existing(self) -> None:
+        self.app_state.set_selection("curve_b", {1})
+
+        _ = self.service.select_points_in_region(self.view, QRect(90, 90, 70, 70), add_to_selection=True)
+
+        assert self.app_state.get_selection("curve_a") == {0, 1}
+        assert self.app_state.get_selection("curve_b") == {0, 1}
+
+    def test_selection_committed_with_one_signal(self) -> None:
+        emissions: list[tuple[object, ...]] = []
+        self.app_state.selection_changed.connect(lambda *args: emissions.append(args))
+
+        _ = self.service.select_points_in_region(self.view, QRect(90, 90, 70, 70))
+
+        assert emissions == [({0, 1}, "curve_a")]
+
+
 class TestInteractionServiceHistory:
     """Test history management (undo/redo) functionality."""
 
@@ -1084,6 +1157,40 @@ class TestMouseReleaseEvents:
         assert view.rubber_band.hide.called
         assert not view.rubber_band_active
         assert view.update_called
+        # Points inside the band are added to the selection
+        assert app_state.get_selection("test_curve") == {0, 1}
+
+    def test_handle_lasso_drag_selects_enclosed_points(self) -> None:
+        """Test Ctrl+Alt drag draws a lasso and selects the points it encloses."""
+        from PySide6.QtGui import QMouseEvent
+
+        from stores.application_state import get_application_state
+
+        app_state = get_application_state()
+        test_data = [(1, 100.0, 100.0), (2, 150.0, 150.0), (3, 300.0, 300.0)]
+        app_state.set_curve_data("test_curve", test_data)
+        app_state.set_active_curve("test_curve")
+
+        view = MockCurveView(cast(CurveDataList, test_data))
+        view.main_window = MockMainWindow()
+
+        def mouse_event(x: int, y: int) -> Mock:
+            event = Mock(spec=QMouseEvent)
+            event.position.return_value = QPoint(x, y)
+            event.button.return_value = Qt.MouseButton.LeftButton
+            event.buttons.return_value = Qt.MouseButton.LeftButton
+            event.modifiers.return_value = Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.AltModifier
+            return event
+
+        self.service.handle_mouse_press(view, mouse_event(80, 80))
+        assert view.lasso_polygon is not None
+        for x, y in [(200, 80), (200, 200), (80, 200)]:
+            self.service.handle_mouse_move(view, mouse_event(x, y))
+        self.service.handle_mouse_release(view, mouse_event(80, 200))
+
+        assert view.lasso_polygon is None
+        assert not view.rubber_band_active
+        assert app_state.get_selection("test_curve") == {0, 1}
 
 
 class TestWheelEvents:
@@ -0,0 +1,229 @@
+"""Tests for the shared cache memory budget."""
+
+# Per-file type checking relaxations for test code
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownParameterType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+# pyright: reportUnusedCallResult=none
+
+import gc
+from unittest.mock import MagicMock
+
+import pytest
+from PySide6.QtGui import QImage
+
+from core.commands.base_command import Command
+from core.commands.command_manager import CommandManager
+from core.config import AppConfig
+from core.memory_budget import MIB, MemoryBudget, get_memory_budget, reset_memory_budget
+from core.workers.directory_scan_cache import DirectoryScanCache
+from services.image_cache_manager import SafeImageCacheManager
+
+
+class _FakeCache:
+    """Cache of fixed-size entries, oldest first."""
+
+    def __init__(self, entries: int, entry_bytes: int) -> None:
+        self.entries = entries
+        self.entry_bytes = entry_bytes
+
+    def memory_usage_bytes(self) -> int:
+        return self.entries * self.entry_bytes
+
+    def evict_bytes(self, target_bytes: int) -> int:
+        freed = 0
+        while self.entries and freed < target_bytes:
+            self.entries -= 1
+            freed += self.entry_bytes
+        return freed
+
+
+class _SizedCommand(Command):
+    def __init__(self, size: int) -> None:
+        super().__init__(f"{size} bytes")
+        self.size = size
+
+    def execute(self, main_window) -> bool:
+        self.executed = True
+        return True
+
+    def undo(self, main_window) -> bool:
+        return True
+
+    def redo(self, main_window) -> bool:
+        return True
+
+    def get_memory_usage(self) -> int:
+        return self.size
+
+
+@pytest.fixture
+def fresh_budget():
+    """Reset the process-wide budget before and after the test."""
+    reset_memory_budget()
+    yield
+    reset_memory_budget()
+
+
+class TestMemoryBudget:
+    """Tests for registration and cross-cache eviction."""
+
+    def test_no_eviction_under_budget(self):
+        budget = MemoryBudget(100)
+        cache = _FakeCache(entries=5, entry_bytes=10)
+        budget.register("cache", cache, priority=10)
+
+        assert budget.enforce() == 0
+        assert cache.entries == 5
+        assert budget.total_bytes() == 50
+
+    def test_evicts_lowest_priority_first(self):
+        budget = MemoryBudget(100)
+        low = _FakeCache(entries=5, entry_bytes=10)
+        high = _FakeCache(entries=10, entry_bytes=10)
+        budget.register("high", high, priority=50)
+        budget.register("low", low, priority=10)
+
+        freed = budget.enforce()
+
+        assert freed == 50
+        assert low.entries == 0
+        assert high.entries == 10
+        assert budget.evicted_bytes == 50
+
+    def test_spills_over_to_higher_priority(self):
+        budget = MemoryBudget(100)
+        low = _FakeCache(entries=2, entry_bytes=10)
+        high = _FakeCache(entries=12, entry_bytes=10)
+        budget.register("low", low, priority=10)
+        budget.register("high", high, priority=50)
+
+        budget.enforce()
+
+        assert low.entries == 0
+        assert high.entries == 10
+        assert budget.total_bytes() <= budget.budget_bytes
+
+    def test_set_budget_evicts_down(self):
+        budget = MemoryBudget(1000)
+        cache = _FakeCache(entries=10, entry_bytes=10)
+        budget.register("cache", cache, priority=10)
+
+        budget.set_budget_bytes(30)
+
+        assert cache.memory_usage_bytes() == 30
+
+    def test_invalid_budget_raises(self):
+        with pytest.raises(ValueError, match="budget_bytes must be positive"):
+            MemoryBudget(0)
+
+    def test_dead_caches_drop_out(self):
+        budget = MemoryBudget(100)
+        cache = _FakeCache(entries=1, entry_bytes=10)
+        budget.register("cache", cache, priority=10)
+
+        del cache
+        gc.collect()
+
+        assert budget.usage() == []
+
+    def test_register_same_name_replaces(self):
+        budget = MemoryBudget(100)
+        first = _FakeCache(entries=1, entry_bytes=10)
+        second = _FakeCache(entries=2, entry_bytes=10)
+        budget.register("cache", first, priority=10)
+        budget.register("cache", second, priority=10)
+
+        assert budget.total_bytes() == 20
+
+    def test_report_lists_caches(self):
+        budget = MemoryBudget(100 * MIB)
+        frames = _FakeCache(entries=3, entry_bytes=MIB)
+        budget.register("frames", frames, priority=60, description="Decoded frames")
+
+        report = budget.format_report()
+
+        assert "Decoded frames" in report
+        assert "3.0 MB" in report
+        assert "Budget" in report
+
+    def test_budget_from_config(self, fresh_budget, monkeypatch):
+        monkeypatch.setenv("CURVE_EDITOR_MEMORY_BUDGET_MB", "256")
+        assert AppConfig.from_environment().memory_budget_mb == 256
+
+        from core import config
+
+        monkeypatch.setattr(config, "_config", AppConfig(memory_budget_mb=256))
+        assert get_memory_budget().budget_bytes == 256 * MIB
+
+
+class TestBudgetedCaches:
+    """Tests for the byte accounting of the registered caches."""
+
+    def test_image_cache_tracks_and_evicts_bytes(self, qapp, fresh_budget):
+        cache = SafeImageCacheManager(max_cache_size=10)
+        images = [QImage(64, 64, QImage.Format.Format_ARGB32) for _ in range(3)]
+        with cache._lock:
+            for frame, image in enumerate(images):
+                cache._add_to_cache(frame, image)
+
+        frame_bytes = images[0].sizeInBytes()
+        assert cache.memory_usage_bytes() == 3 * frame_bytes
+
+        freed = cache.evict_bytes(frame_bytes + 1)
+
+        assert freed == 2 * frame_bytes
+        assert cache.cache_size == 1
+        assert cache.memory_usage_bytes() == frame_bytes
+
+    def test_image_cache_enforces_budget_on_load(self, qapp, fresh_budget, tmp_path):
+        image = QImage(64, 64, QImage.Format.Format_ARGB32)
+        image.fill(0)
+        files = []
+        for frame in range(4):
+            path = tmp_path / f"frame_{frame:04d}.png"
+            image.save(str(path))
+            files.append(str(path))
+
+        cache = SafeImageCacheManager(max_cache_size=10)
+        cache.set_image_sequence(files)
+        first = cache.get_image(0)
+        assert first is not None
+        frame_bytes = first.sizeInBytes()
+
+        budget = get_memory_budget()
+        budget.register("image_cache", cache, priority=60)
+        budget.set_budget_bytes(2 * frame_bytes)
+        for frame in range(1, 4):
+            cache.get_image(frame)
+
+        assert cache.cache_size == 2
+        assert cache.memory_usage_bytes() <= 2 * frame_bytes
+
+    def test_directory_scan_cache_evicts_oldest(self, tmp_path):
+        cache = DirectoryScanCache(max_size=10)
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            cache.put(str(tmp_path / name), [{"file_list": [f"{name}.{i:04d}.exr" for i in range(100)]}])
+
+        per_directory = cache.memory_usage_bytes() // 2
+        freed = cache.evict_bytes(1)
+
+        assert freed == per_directory
+        assert cache.get_cached_directories() == [str(tmp_path / "b")]
+
+    def test_command_history_keeps_latest_undo_step(self):
+        manager = CommandManager(max_history_size=10)
+        main_window = MagicMock()
+        for size in (100, 200, 300):
+            assert manager.execute_command(_SizedCommand(size), main_window)
+
+        freed = manager.evict_bytes(10_000)
+
+        assert freed == 300
+        assert manager.memory_usage_bytes() == 300
+        assert manager.can_undo()
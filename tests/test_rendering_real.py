@@ -37,20 +37,15 @@ from tests.qt_test_helpers import create_test_image, safe_painter
 class TestViewportCuller:
     """Test viewport culling with real data."""
 
-    def test_spatial_index_creation(self) -> None:
-        """Test creating spatial index for points."""
+    def test_mask_culling_matches_rectangle(self) -> None:
+        """Test that culling returns exactly the points inside the rectangle."""
         culler = ViewportCuller()
 
-        # Create test points
         points: Any = np.array([[100, 100], [200, 200], [300, 300], [400, 400], [500, 500]])
 
-        viewport = QRectF(0, 0, 600, 600)
+        visible_indices: Any = culler.get_visible_points(points, QRectF(0, 0, 300, 300), padding=0)
 
-        # Update spatial index
-        culler.update_spatial_index(points, viewport)
-
-        # Check that index was created
-        assert len(culler._spatial_index) > 0
+        assert visible_indices.tolist() == [0, 1, 2]
 
     def test_visible_points_detection(self) -> None:
         """Test detecting visible points in viewport."""
@@ -103,7 +98,7 @@ class TestViewportCuller:
         assert len(visible_with_pad) == 2  # Includes point at 305
 
     def test_large_dataset_performance(self) -> None:
-        """Test spatial indexing performance with large dataset."""
+        """Test culling a large dataset."""
         culler = ViewportCuller()
 
         # Create large dataset
@@ -112,14 +107,23 @@ class TestViewportCuller:
 
         viewport = QRectF(400, 400, 200, 200)
 
-        # This should use spatial indexing (>1000 points)
-        visible_indices: Any = culler.get_visible_points(points, viewport)
+        visible_indices: Any = culler.get_visible_points(points, viewport, padding=0)
+
+        # Should return exactly the points in the viewport area
+        expected = np.flatnonzero(
+            (points[:, 0] >= 400) & (points[:, 0] <= 600) & (points[:, 1] >= 400) & (points[:, 1] <= 600)
+        )
+        assert len(visible_indices) > 0
+        assert sorted(visible_indices.tolist()) == expected.tolist()
+
+    def test_large_dataset_without_index_uses_mask(self) -> None:
+        """Culling a large dataset before any index is built still finds the visible points."""
+        culler = ViewportCuller()
+        points: Any = np.array([[500.0, 500.0]] * 1500 + [[5000.0, 5000.0]] * 500)
+
+        visible_indices: Any = culler.get_visible_points(points, QRectF(0, 0, 1000, 1000))
 
-        # Should only return points in the viewport area
-        for idx in visible_indices:
-            point = points[idx]
-            assert 400 <= point[0] <= 600
-            assert 400 <= point[1] <= 600
+        assert visible_indices.tolist() == list(range(1500))
 
 
 class TestLevelOfDetail:
@@ -129,29 +133,28 @@ class TestLevelOfDetail:
         """Test LOD thresholds for different quality levels."""
         lod = LevelOfDetail()
 
-        # Create test points
-        points: Any = np.random.rand(5000, 2) * 500
+        # Dense curve: 5000 points across 500 pixels
+        x: Any = np.linspace(0, 500, 5000)
+        points: Any = np.column_stack([x, np.sin(x / 20) * 100 + 200 + np.random.rand(5000)])
 
         # Test different quality levels
         draft_points: Any
-        draft_step: Any
-        draft_points, draft_step = lod.get_lod_points(points, RenderQuality.DRAFT)
+        draft_indices: Any
+        draft_points, draft_indices = lod.get_lod_points(points, RenderQuality.DRAFT)
         normal_points: Any
-        normal_step: Any
-        normal_points, normal_step = lod.get_lod_points(points, RenderQuality.NORMAL)
+        normal_points, _normal_indices = lod.get_lod_points(points, RenderQuality.NORMAL)
         high_points: Any
-        high_step: Any
-        high_points, high_step = lod.get_lod_points(points, RenderQuality.HIGH)
+        high_indices: Any
+        high_points, high_indices = lod.get_lod_points(points, RenderQuality.HIGH)
 
         # Draft should show fewer points
         assert len(draft_points) < len(normal_points)
         assert len(normal_points) < len(high_points)
         assert len(high_points) == len(points)  # High quality shows all
+        assert high_indices.tolist() == list(range(len(points)))
 
-        # Check step sizes
-        assert draft_step > normal_step
-        assert normal_step > high_step
-        assert high_step == 1
+        # Indices map the LOD points back to the input
+        np.testing.assert_array_equal(points[draft_indices], draft_points)
 
     def test_lod_with_visible_indices(self) -> None:
         """Test LOD with pre-filtered visible indices."""
@@ -162,11 +165,12 @@ class TestLevelOfDetail:
 
         # Apply LOD to visible points only
         lod_points: Any
-        _step: Any
-        lod_points, _step = lod.get_lod_points(points, RenderQuality.NORMAL, visible_indices)
+        lod_indices: Any
+        lod_points, lod_indices = lod.get_lod_points(points, RenderQuality.NORMAL, visible_indices)
 
         # Should subsample from visible points
         assert len(lod_points) <= len(visible_indices)
+        assert set(lod_indices.tolist()) <= set(visible_indices.tolist())
 
 
 class TestVectorizedTransform:
@@ -363,8 +367,7 @@ class TestRenderingIntegration:
         # Apply LOD
         screen_points: Any = np.column_stack([x * 50, y])
         lod_points: Any
-        _step: Any
-        lod_points, _step = lod.get_lod_points(screen_points, RenderQuality.NORMAL)
+        lod_points, _lod_indices = lod.get_lod_points(screen_points, RenderQuality.NORMAL)
 
         # Check that we still have the general shape
         # Min and max should be preserved
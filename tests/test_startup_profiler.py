@@ -0,0 +1,104 @@
+"""Tests for the startup-time profiler."""
+
+# Per-file type checking relaxations for test code
+# Tests use mocks, fixtures, and Qt objects with incomplete type stubs
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportAny=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownParameterType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+# pyright: reportUnusedParameter=none
+# pyright: reportUnusedCallResult=none
+
+import json
+import sys
+
+import pytest
+
+from core.startup_profiler import (
+    DEFAULT_STARTUP_BUDGET_MS,
+    StartupProfiler,
+    startup_budget_from_environment,
+)
+
+
+class TestStartupProfiler:
+    """Tests for phase recording and reporting."""
+
+    def test_phases_are_recorded_in_order(self):
+        profiler = StartupProfiler(budget_ms=10_000)
+
+        with profiler.phase("first"):
+            pass
+        with profiler.phase("second"):
+            pass
+        report = profiler.finish()
+
+        assert [p.name for p in report.phases] == ["first", "second"]
+        assert report.phases[1].start_ms >= report.phases[0].start_ms
+        assert report.total_ms >= sum(p.duration_ms for p in report.phases)
+        assert not report.over_budget
+
+    def test_phase_recorded_when_block_raises(self):
+        profiler = StartupProfiler()
+
+        with pytest.raises(RuntimeError), profiler.phase("failing"):
+            raise RuntimeError("boom")
+
+        assert [p.name for p in profiler.finish().phases] == ["failing"]
+
+    def test_phase_counts_imported_modules(self):
+        profiler = StartupProfiler()
+
+        with profiler.phase("import"):
+            sys.modules["_startup_profiler_test_module"] = sys  # Simulate a fresh import
+        try:
+            report = profiler.finish()
+        finally:
+            del sys.modules["_startup_profiler_test_module"]
+
+        assert report.phases[0].modules_imported == 1
+
+    def test_over_budget_logs_warning(self, caplog):
+        profiler = StartupProfiler(budget_ms=0.0)
+        with profiler.phase("slow"):
+            pass
+
+        with caplog.at_level("WARNING", logger="startup_profiler"):
+            report = profiler.finish()
+
+        assert report.over_budget
+        assert "over the 0ms budget" in caplog.text
+        assert "OVER BUDGET" in report.format()
+
+    def test_report_written_from_environment(self, tmp_path, monkeypatch):
+        report_path = tmp_path / "reports" / "startup.json"
+        monkeypatch.setenv("CURVE_EDITOR_STARTUP_REPORT", str(report_path))
+        profiler = StartupProfiler(budget_ms=500)
+        with profiler.phase("qapplication"):
+            pass
+
+        _ = profiler.finish()
+
+        document = json.loads(report_path.read_text())
+        assert document["budget_ms"] == 500
+        assert document["phases"][0]["name"] == "qapplication"
+
+
+class TestStartupBudget:
+    """Tests for reading the budget from the environment."""
+
+    def test_default_budget(self, monkeypatch):
+        monkeypatch.delenv("CURVE_EDITOR_STARTUP_BUDGET_MS", raising=False)
+        assert startup_budget_from_environment() == DEFAULT_STARTUP_BUDGET_MS
+
+    def test_budget_override(self, monkeypatch):
+        monkeypatch.setenv("CURVE_EDITOR_STARTUP_BUDGET_MS", "750")
+        assert StartupProfiler().budget_ms == 750.0
+
+    def test_invalid_budget_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("CURVE_EDITOR_STARTUP_BUDGET_MS", "fast")
+        assert startup_budget_from_environment() == DEFAULT_STARTUP_BUDGET_MS
@@ -0,0 +1,161 @@
+"""Tests for the span/counter tracing API and performance HUD."""
+
+# Per-file type checking relaxations for test code
+# Tests use mocks, fixtures, and Qt objects with incomplete type stubs
+# pyright: reportAttributeAccessIssue=none
+# pyright: reportArgumentType=none
+# pyright: reportAny=none
+# pyright: reportUnknownMemberType=none
+# pyright: reportUnknownParameterType=none
+# pyright: reportUnknownVariableType=none
+# pyright: reportMissingParameterType=none
+# pyright: reportPrivateUsage=none
+# pyright: reportUnusedParameter=none
+# pyright: reportUnusedCallResult=none
+
+import json
+import threading
+
+import pytest
+from PySide6.QtGui import QImage, QPainter
+
+from core import tracing
+from rendering.performance_hud import draw_performance_hud
+
+
+@pytest.fixture
+def tracer_enabled():
+    """Enable tracing with an empty buffer, restoring the disabled state afterwards."""
+    tracing.clear()
+    tracing.enable()
+    yield tracing.get_tracer()
+    tracing.disable()
+    tracing.clear()
+
+
+class TestDisabledTracing:
+    """Disabled tracing must be a no-op."""
+
+    def test_span_returns_shared_null_span(self):
+        tracing.disable()
+        assert tracing.span("a") is tracing.span("b")
+
+    def test_nothing_recorded_when_disabled(self):
+        tracing.disable()
+        tracing.clear()
+
+        with tracing.span("ignored"):
+            pass
+        tracing.counter("ignored", 1)
+        tracing.instant("ignored")
+
+        assert tracing.get_tracer().event_count() == 0
+        assert tracing.get_stage_timings() == {}
+
+    def test_traced_decorator_passes_through(self):
+        tracing.disable()
+
+        @tracing.traced("double")
+        def double(x: int) -> int:
+            return x * 2
+
+        assert double(21) == 42
+        assert tracing.get_tracer().event_count() == 0
+
+
+class TestEnabledTracing:
+    """Recording spans, counters and stage timings."""
+
+    def test_span_records_complete_event(self, tracer_enabled):
+        with tracing.span("render.lines", "render", curves=3):
+            pass
+
+        trace = tracer_enabled.to_chrome_trace()
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert len(events) == 1
+        assert events[0]["name"] == "render.lines"
+        assert events[0]["cat"] == "render"
+        assert events[0]["args"] == {"curves": 3}
+        assert events[0]["dur"] >= 0
+
+    def test_span_records_even_when_block_raises(self, tracer_enabled):
+        with pytest.raises(ValueError), tracing.span("failing"):
+            raise ValueError("boom")
+
+        assert "failing" in tracing.get_stage_timings()
+
+    def test_stage_timings_accumulate(self, tracer_enabled):
+        for _ in range(3):
+            with tracing.span("stage"):
+                pass
+
+        timing = tracing.get_stage_timings()["stage"]
+        assert timing.count == 3
+        assert timing.max_ms >= timing.last_ms >= 0.0
+
+    def test_counter_and_instant_events(self, tracer_enabled):
+        tracing.counter("image_cache.size", 7, "image_cache")
+        tracing.instant("image_cache.hit", "image_cache", frame=3)
+
+        events = tracer_enabled.to_chrome_trace()["traceEvents"]
+        counter = next(e for e in events if e["ph"] == "C")
+        instant = next(e for e in events if e["ph"] == "i")
+        assert counter["args"] == {"image_cache.size": 7}
+        assert instant["args"] == {"frame": 3}
+
+    def test_traced_decorator_records_span(self, tracer_enabled):
+        @tracing.traced("command.execute", "command")
+        def execute() -> bool:
+            return True
+
+        assert execute() is True
+        assert tracing.get_stage_timings()["command.execute"].count == 1
+
+    def test_worker_thread_events_get_own_tid(self, tracer_enabled):
+        with tracing.span("main"):
+            pass
+
+        def worker() -> None:
+            with tracing.span("worker"):
+                pass
+
+        thread = threading.Thread(target=worker, name="DecodeWorker")
+        thread.start()
+        thread.join()
+
+        events = tracer_enabled.to_chrome_trace()["traceEvents"]
+        spans = {e["name"]: e["tid"] for e in events if e["ph"] == "X"}
+        assert spans["main"] != spans["worker"]
+        thread_names = [e["args"]["name"] for e in events if e["ph"] == "M"]
+        assert "DecodeWorker" in thread_names
+
+    def test_export_chrome_trace_writes_valid_json(self, tracer_enabled, tmp_path):
+        with tracing.span("frame_change", "frame_change", frame=12):
+            pass
+
+        path = tracing.export_chrome_trace(tmp_path / "trace.json")
+
+        document = json.loads(path.read_text())
+        assert document["displayTimeUnit"] == "ms"
+        assert any(e.get("name") == "frame_change" for e in document["traceEvents"])
+
+
+class TestPerformanceHud:
+    """Smoke tests for the HUD overlay."""
+
+    @pytest.mark.parametrize("with_timings", [False, True])
+    def test_draws_without_error(self, qapp, tracer_enabled, with_timings):
+        if with_timings:
+            with tracing.span("render"):
+                pass
+        image = QImage(400, 300, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(0)
+
+        painter = QPainter(image)
+        try:
+            draw_performance_hud(painter, tracing.get_stage_timings(), image.width())
+        finally:
+            painter.end()
+
+        # Panel is drawn in the top-right corner
+        assert image.pixelColor(image.width() - 12, 12).alpha() > 0
@@ -20,8 +20,14 @@ when tracking direction changes, following the behavior patterns from
 # pyright: reportUnusedParameter=none
 # pyright: reportUnusedCallResult=none
 
+import random
+
+import pytest
+
 from core.models import PointStatus, TrackingDirection
 from data.tracking_direction_utils import (
+    apply_status_changes,
+    compute_tracking_direction_changes,
     get_point_status,
     has_valid_position,
     update_keyframe_status_for_backward_tracking,
@@ -304,3 +310,51 @@ class TestRealWorldScenarios:
         assert updated_data[2] == (12, 110.0, 210.0, "keyframe")
         # Frame 14 should stay keyframe (has valid next)
         assert updated_data[4] == (14, 120.0, 220.0, "keyframe")
+
+
+class TestVectorizedDirectionChanges:
+    """The vectorized batch path must match the per-point update functions."""
+
+    @staticmethod
+    def _random_curve(seed: int, length: int = 300) -> list[tuple[int, float, float, str]]:
+        rng = random.Random(seed)
+        statuses = ["keyframe", "endframe", "tracked", "normal", "interpolated"]
+        curve = []
+        for frame in range(1, length + 1):
+            if rng.random() < 0.1:
+                x, y = -1.0, -1.0
+            else:
+                x, y = rng.uniform(0, 1920), rng.uniform(0, 1080)
+            curve.append((frame, x, y, rng.choice(statuses)))
+        return curve
+
+    @pytest.mark.parametrize(
+        ("new_direction", "previous_direction"),
+        [
+            (TrackingDirection.TRACKING_FW, TrackingDirection.TRACKING_BW),
+            (TrackingDirection.TRACKING_BW, TrackingDirection.TRACKING_FW),
+            (TrackingDirection.TRACKING_FW_BW, TrackingDirection.TRACKING_BW),
+            (TrackingDirection.TRACKING_FW_BW, TrackingDirection.TRACKING_FW),
+        ],
+    )
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_scalar_update(self, new_direction, previous_direction, seed):
+        curve_data = self._random_curve(seed)
+
+        expected = update_keyframe_status_for_tracking_direction(curve_data, new_direction, previous_direction)
+        changes = compute_tracking_direction_changes(curve_data, new_direction, previous_direction)
+
+        assert apply_status_changes(curve_data, changes) == expected
+        for index, old_status, new_status in changes:
+            assert curve_data[index][3] == old_status
+            assert expected[index][3] == new_status
+
+    def test_three_element_points_are_keyframes(self):
+        curve_data = [(1, 100.0, 200.0), (2, -1.0, -1.0)]
+
+        changes = compute_tracking_direction_changes(curve_data, TrackingDirection.TRACKING_FW)
+
+        assert changes == [(0, "keyframe", "endframe")]
+
+    def test_empty_curve(self):
+        assert compute_tracking_direction_changes([], TrackingDirection.TRACKING_BW) == []
@@ -306,6 +306,32 @@ class TestTrackingDirectionUndo:
         assert final_history_size >= initial_history_size, "History size should not decrease"
 
 
+    def test_batch_direction_change_is_single_undo_step(self, main_window_with_tracking_data):
+        """Changing direction on several curves creates one command that undoes all of them."""
+        from stores.application_state import get_application_state
+
+        main_window = main_window_with_tracking_data
+        app_state = get_application_state()
+        app_state.set_curve_data("Point2", list(app_state.get_curve_data("Point1")))
+        initial = {name: list(app_state.get_curve_data(name)) for name in ("Point1", "Point2")}
+
+        command_manager = get_interaction_service().command_manager
+        initial_history_size = len(command_manager._history)
+
+        main_window.tracking_controller.on_tracking_directions_changed(
+            ["Point1", "Point2"], TrackingDirection.TRACKING_BW
+        )
+
+        assert len(command_manager._history) == initial_history_size + 1
+        for name in ("Point1", "Point2"):
+            assert app_state.get_curve_data(name) != initial[name]
+            assert main_window.tracking_controller.point_tracking_directions[name] == TrackingDirection.TRACKING_BW
+
+        assert command_manager.undo(main_window)
+        for name in ("Point1", "Point2"):
+            assert app_state.get_curve_data(name) == initial[name]
+
+
 class TestStatusColorUpdates:
     """Test that status changes trigger immediate color updates."""
 
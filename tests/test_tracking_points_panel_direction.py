@@ -198,8 +198,9 @@ class TestTrackingPointsPanelDirection:
         """Test setting direction for multiple selected points."""
         table = populated_panel.table
 
-        # Create signal spy
+        # Create signal spies
         direction_spy = qt_api.QtTest.QSignalSpy(populated_panel.tracking_direction_changed)
+        bulk_spy = qt_api.QtTest.QSignalSpy(populated_panel.tracking_directions_changed)
 
         # Select multiple rows using QTableWidget selection API
         selection_model = table.selectionModel()
@@ -220,9 +221,11 @@ class TestTrackingPointsPanelDirection:
             direction = populated_panel.get_tracking_direction(point_name)
             assert direction == TrackingDirection.TRACKING_BW
 
-        # Verify signals were emitted (could be more than 3 due to UI updates)
-        # At minimum, we should have 3 signals for the 3 points
-        assert direction_spy.count() >= 3
+        # Bulk changes are emitted once for all points, not once per point
+        assert bulk_spy.count() == 1
+        assert sorted(bulk_spy.at(0)[0]) == sorted(selected_points)
+        assert bulk_spy.at(0)[1] == TrackingDirection.TRACKING_BW
+        assert direction_spy.count() == 0
 
     def test_bulk_direction_setting_updates_ui_dropdowns(self, populated_panel: TrackingPointsPanel):
         """Test that bulk direction setting updates UI dropdowns."""
@@ -255,11 +258,13 @@ class TestTrackingPointsPanelDirection:
         """Test direction operations with invalid point names."""
         # Should not crash and should not emit signals
         direction_spy = qt_api.QtTest.QSignalSpy(populated_panel.tracking_direction_changed)
+        bulk_spy = qt_api.QtTest.QSignalSpy(populated_panel.tracking_directions_changed)
 
         populated_panel._set_direction_for_points(["InvalidPoint"], TrackingDirection.TRACKING_FW)
 
         # No signal should be emitted for invalid point
         assert direction_spy.count() == 0
+        assert bulk_spy.count() == 0
 
     def test_direction_dropdown_prevents_recursive_updates(self, populated_panel: TrackingPointsPanel):
         """Test that direction changes don't cause recursive updates."""
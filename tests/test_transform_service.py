@@ -30,6 +30,7 @@ import os
 import sys
 from typing import Any
 
+import numpy as np
 import pytest
 from pytestqt.qtbot import QtBot
 
@@ -623,6 +624,42 @@ class TestTransform:
         assert "pan_offset=(25.0, 30.0)" in repr_str
         assert "flip_y=True" in repr_str
 
+    def test_transform_equality_and_hash(self, complex_transform: Transform) -> None:
+        """Test transforms with equal parameters compare and hash equal."""
+        same = complex_transform.with_updates()
+        assert same == complex_transform
+        assert hash(same) == hash(complex_transform)
+        assert len({same, complex_transform}) == 1
+        assert complex_transform.with_updates(pan_offset_x=26.0) != complex_transform
+
+    def test_transform_is_immutable(self, basic_transform: Transform) -> None:
+        """Test Transform attributes cannot be reassigned."""
+        with pytest.raises(AttributeError):
+            basic_transform._parameters = {}
+        with pytest.raises(AttributeError):
+            basic_transform.scale = 2.0
+
+    def test_affine_coefficients_match_data_to_screen(self, complex_transform: Transform) -> None:
+        """Test the exposed affine coefficients reproduce data_to_screen."""
+        scale_x, offset_x, scale_y, offset_y = complex_transform.affine
+
+        screen_x, screen_y = complex_transform.data_to_screen(100.0, 200.0)
+
+        assert screen_x == pytest.approx(100.0 * scale_x + offset_x)
+        assert screen_y == pytest.approx(200.0 * scale_y + offset_y)
+
+    def test_batch_transforms_match_scalar(self, complex_transform: Transform) -> None:
+        """Test vectorized transforms agree with the scalar path and round-trip."""
+        frames_xy = np.array([[1, 0.0, 0.0], [2, 100.0, 200.0], [3, -50.5, 1e5]])
+
+        screen = complex_transform.batch_data_to_screen(frames_xy)
+
+        for row, (x, y) in zip(screen, frames_xy[:, 1:], strict=True):
+            assert tuple(row) == pytest.approx(complex_transform.data_to_screen(x, y))
+        assert complex_transform.batch_screen_to_data(screen) == pytest.approx(frames_xy[:, 1:])
+        with pytest.raises(ValueError, match="Nx2 or Nx3"):
+            complex_transform.batch_data_to_screen(np.zeros((3, 4)))
+
 
 class TestTransformService:
     """Test suite for TransformService class."""
@@ -747,6 +784,41 @@ class TestTransformService:
         assert updated_transform.pan_offset == (50.0, 0.0)
         assert updated_transform.center_offset == original_transform.center_offset  # Unchanged
 
+    def test_transform_from_view_state_is_memoized(self, transform_service: TransformService, qapp) -> None:
+        """Test equal view states share one Transform, regardless of which image object is set."""
+        from PySide6.QtGui import QImage
+
+        first = ViewState(
+            display_width=1920,
+            display_height=1080,
+            widget_width=800,
+            widget_height=600,
+            background_image=QImage(1920, 1080, QImage.Format.Format_RGB32),
+        )
+        second = first.with_updates(background_image=QImage(1920, 1080, QImage.Format.Format_RGB32))
+
+        transform = transform_service.create_transform_from_view_state(first)
+
+        assert transform_service.create_transform_from_view_state(second) is transform
+        assert transform_service.create_transform_from_view_state(first.with_updates(zoom_factor=2.0)) is not transform
+
+    def test_get_transform_memoized_until_view_changes(self, transform_service: TransformService, qtbot) -> None:
+        """Test get_transform reuses the view's transform until a transform input changes."""
+        view = self._create_curve_view(qtbot)
+
+        transform = transform_service.get_transform(view)
+        assert transform_service.get_transform(view) is transform
+
+        view.manual_offset_x = 12.0
+        moved = transform_service.get_transform(view)
+        assert moved is not transform
+        assert moved.manual_offset == (12.0, 0.0)
+
+        view.resize(640, 480)
+        resized = transform_service.get_transform(view)
+        assert resized is not moved
+        assert transform_service.create_view_state(view).widget_width == 640
+
 
 class TestTransformServiceIntegration:
     """Integration tests for TransformService with real-world scenarios."""
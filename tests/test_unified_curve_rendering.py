@@ -170,8 +170,8 @@ class TestUnifiedCurveRendering:
         assert mock_get_status_color.called, "get_status_color should be called for rendering points"
 
         # Verify painter methods were called
-        assert mock_painter.setBrush.called, "setBrush should be called for drawing points"
-        assert mock_painter.drawEllipse.called, "drawEllipse should be called for drawing points"
+        # Markers are drawn as round-capped points, one drawPoints call per bucket
+        assert mock_painter.drawPoints.called, "drawPoints should be called for drawing points"
 
     def test_current_frame_highlighting_works_across_curves(self, renderer, mock_curve_view, mock_painter):
         """Test that current frame highlighting works in multi-curve rendering."""
@@ -284,17 +284,14 @@ class TestUnifiedCurveRendering:
             point_radius=5,
         )
 
-        # Track setBrush calls to verify selection highlighting
-        brush_calls = []
+        # Track marker draws to verify selection highlighting
+        draw_calls = []
 
-        def track_setBrush(brush):
-            # Extract color from QBrush mock
-            brush_calls.append(brush)
-            return MagicMock()
-
-        mock_painter.setBrush.side_effect = track_setBrush
+        def track_draw(painter, color, radius, points):
+            draw_calls.append(points.tolist())
+            return len(points)
 
-        with patch("ui.color_manager.get_status_color", return_value="#ffffff"), patch("ui.color_manager.SPECIAL_COLORS", {"selected_point": "#ffff00", "current_frame": "#ff00ff"}):
+        with patch("rendering.optimized_curve_renderer.draw_markers", side_effect=track_draw), patch("ui.color_manager.get_status_color", return_value="#ffffff"), patch("ui.color_manager.SPECIAL_COLORS", {"selected_point": "#ffff00", "current_frame": "#ff00ff"}):
             renderer._render_points_with_status(
                 painter=mock_painter,
                 render_state=render_state,
@@ -307,8 +304,8 @@ class TestUnifiedCurveRendering:
                 is_active_curve=True,
             )
 
-        # Verify setBrush was called multiple times (for different point types)
-        assert len(brush_calls) > 0, "setBrush should be called for rendering points"
+        # Selected points are drawn as their own bucket, on top of the normal ones
+        assert draw_calls == [[[150.0, 250.0]], [[100.0, 200.0], [200.0, 300.0]]]
 
     def test_unified_rendering_preserves_curve_colors_for_inactive_curves(
         self, renderer, mock_curve_view, mock_painter
@@ -861,7 +858,7 @@ class TestGapRenderingConsistency:
 
             # Verify drawing operations occurred (behavior, not implementation)
             assert mock_painter.setPen.called, "Should set pen for line drawing"
-            assert mock_painter.drawPath.called, "Should draw path for curve lines"
+            assert mock_painter.drawLines.called or mock_painter.drawPolyline.called, "Should draw curve lines"
 
     def test_gap_rendering_consistency_behavioral(self, renderer, segmented_curve_data):
         """Test that gaps render consistently between views (behavioral test)."""
@@ -938,15 +935,17 @@ class TestGapRenderingConsistency:
 
         # Verify both views produce consistent drawing behavior
         assert single_painter.setPen.called, "Single curve view should set pen for drawing"
-        assert single_painter.drawPath.called, "Single curve view should draw paths"
+        assert single_painter.drawLines.called or single_painter.drawPolyline.called, (
+            "Single curve view should draw lines"
+        )
 
         assert multi_painter.setPen.called, "Multi-curve view should set pen for drawing"
-        assert multi_painter.drawPath.called, "Multi-curve view should draw paths"
+        assert multi_painter.drawLines.called or multi_painter.drawPolyline.called, "Multi-curve view should draw lines"
 
-        # Both should have called setPen multiple times for different segment types (active/inactive)
-        # This indicates gap-aware rendering is occurring
-        assert single_painter.setPen.call_count >= 2, "Should set different pens for active/inactive segments"
-        assert multi_painter.setPen.call_count >= 2, "Should set different pens for active/inactive segments"
+        # The two active segments on either side of the gap share a pen, so each view
+        # draws them with one bulk call instead of one path per segment
+        assert single_painter.drawLines.call_count == 1, "Segments sharing a pen should be drawn together"
+        assert multi_painter.drawLines.call_count == 1, "Segments sharing a pen should be drawn together"
 
     def test_inactive_segments_render_as_dashed_lines(self, renderer, mock_painter, segmented_curve_data):
         """Test that inactive segments between endframes render as dashed lines."""
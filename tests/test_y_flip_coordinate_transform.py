@@ -381,14 +381,13 @@ NegPoint
 2 100.0 800.0""")
 
         data_service = get_data_service()
-        tracked_data = data_service.load_tracked_data(str(tracking_file))
+        tracked_data, image_height = data_service.load_tracked_data_with_height(str(tracking_file))
 
-        if "NegPoint" in tracked_data:
-            point_data = tracked_data["NegPoint"]
-            # -50 flipped: 720 - (-50) = 770
-            assert point_data[0][2] == 770.0
-            # 800 flipped: 720 - 800 = -80
-            assert point_data[1][2] == -80.0
+        point_data = tracked_data["NegPoint"]
+        # -50 flipped: height - (-50)
+        assert point_data[0][2] == image_height + 50.0
+        # 800 flipped: height - 800
+        assert point_data[1][2] == image_height - 800.0
 
 
 if __name__ == "__main__":
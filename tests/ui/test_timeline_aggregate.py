@@ -7,7 +7,7 @@ Tests Phase 1C: UI Integration for multi-curve timeline aggregate view.
 import pytest
 from PySide6.QtCore import Qt
 
-from core.models import PointStatus
+from core.models import CurvePoint, PointStatus
 from core.type_aliases import CurveDataList
 from stores.application_state import get_application_state
 from ui.timeline_tabs import TimelineTabWidget
@@ -458,5 +458,87 @@ class TestIntegrationWithApplicationState:
         qtbot.mouseClick(timeline_widget.mode_toggle_btn, Qt.MouseButton.LeftButton)
 
         # Cache should be refreshed with aggregate data
-        # (exact verification depends on internal implementation)
-        assert len(timeline_widget.status_cache._cache) >= 0  # pyright: ignore[reportPrivateUsage]
+        status = timeline_widget.status_cache.get_status(1)
+        assert status is not None
+        assert status.keyframe_count == 1
+
+
+class TestIncrementalStatusUpdates:
+    """Test that only changed curves are recomputed."""
+
+    @staticmethod
+    def _count_status_computations(monkeypatch) -> list[int]:
+        from services import get_data_service
+
+        data_service = get_data_service()
+        original = data_service.get_frame_range_point_status
+        calls: list[int] = []
+
+        def counting(points):
+            calls.append(len(points))
+            return original(points)
+
+        monkeypatch.setattr(data_service, "get_frame_range_point_status", counting)
+        return calls
+
+    def test_editing_one_curve_recomputes_only_that_curve(
+        self, timeline_widget: TimelineTabWidget, monkeypatch
+    ) -> None:
+        """Verify 300 curves in aggregate mode are not re-scanned when one changes."""
+        app_state = get_application_state()
+        with app_state.batch_updates():
+            for i in range(300):
+                app_state.set_curve_data(f"Track{i}", [(frame, float(i), float(frame), "keyframe") for frame in range(1, 51)])
+        timeline_widget.toggle_aggregate_mode(True)
+        calls = self._count_status_computations(monkeypatch)
+
+        app_state.update_point("Track7", 9, CurvePoint(10, 1.0, 2.0, PointStatus.TRACKED))
+
+        assert len(calls) == 1
+        status = timeline_widget.status_cache.get_status(10)
+        assert status is not None
+        assert status.keyframe_count == 299
+        assert status.tracked_count == 1
+        assert timeline_widget.frame_tabs[10].tracked_count == 1
+
+        # Timeline refreshes that change no data recompute nothing
+        timeline_widget._on_curves_changed(app_state.get_all_curves())  # pyright: ignore[reportPrivateUsage]
+        assert len(calls) == 1
+
+    def test_deleting_curve_subtracts_its_statuses(self, timeline_widget: TimelineTabWidget) -> None:
+        """Verify the aggregate drops a deleted curve without recomputing the others."""
+        app_state = get_application_state()
+        app_state.set_curve_data("Track1", [(1, 10.0, 20.0, "keyframe"), (2, 11.0, 21.0, "keyframe")])
+        app_state.set_curve_data("Track2", [(1, 30.0, 40.0, "tracked")])
+        timeline_widget.toggle_aggregate_mode(True)
+
+        app_state.delete_curve("Track2")
+
+        status = timeline_widget.status_cache.get_status(1)
+        assert status is not None
+        assert status.keyframe_count == 1
+        assert status.tracked_count == 0
+        assert timeline_widget.frame_tabs[1].tracked_count == 0
+
+    def test_selection_updates_flag_without_recompute(
+        self, timeline_widget: TimelineTabWidget, monkeypatch
+    ) -> None:
+        """Verify selection changes only touch the has_selected flags."""
+        app_state = get_application_state()
+        app_state.set_curve_data("Track1", [(frame, 10.0, 20.0, "keyframe") for frame in range(1, 6)])
+        app_state.set_curve_data("Track2", [(frame, 30.0, 40.0, "keyframe") for frame in range(1, 6)])
+        timeline_widget.toggle_aggregate_mode(True)
+        calls = self._count_status_computations(monkeypatch)
+
+        app_state.set_selections({"Track1": {1}, "Track2": {3}})
+
+        assert calls == []
+        selected = [frame for frame in range(1, 6) if timeline_widget.status_cache.get_status(frame).has_selected]
+        assert selected == [2, 4]
+        assert timeline_widget.frame_tabs[2].has_selected_points
+
+        app_state.set_selection("Track1", set())
+
+        assert not timeline_widget.status_cache.get_status(2).has_selected
+        assert timeline_widget.status_cache.get_status(4).has_selected
+        assert not timeline_widget.frame_tabs[2].has_selected_points
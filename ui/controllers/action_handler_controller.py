@@ -7,11 +7,14 @@ handled directly in MainWindow. It maintains exact compatibility with the
 existing ShortcutManager connections and behavior.
 """
 
+from pathlib import Path
 from typing import cast
 
 from PySide6.QtCore import Slot
 
+from core import tracing
 from core.logger_utils import get_logger
+from core.memory_budget import get_memory_budget
 from core.type_aliases import CurveDataList
 from protocols.ui import MainWindowProtocol, StateManagerProtocol
 from services import get_data_service
@@ -192,6 +195,53 @@ class ActionHandlerController:
             if self.main_window.status_label:
                 self.main_window.status_label.setText("Fitted to view")
 
+    @Slot(bool)
+    def on_toggle_performance_hud(self, checked: bool) -> None:
+        """Handle performance HUD toggle action."""
+        if self.main_window.curve_widget:
+            self.main_window.curve_widget.set_performance_hud_enabled(checked)
+
+    @Slot()
+    def on_export_performance_trace(self) -> None:
+        """Handle export performance trace action."""
+        from PySide6.QtWidgets import QFileDialog, QWidget
+
+        if not tracing.is_enabled() and tracing.get_tracer().event_count() == 0:
+            if self.main_window.status_label:
+                self.main_window.status_label.setText(
+                    "Tracing is off - enable the Performance HUD or set CURVE_EDITOR_TRACE=1"
+                )
+            return
+
+        default_path = str(Path.home() / "curveeditor_trace.json")
+        file_path, _ = QFileDialog.getSaveFileName(
+            cast(QWidget, cast(object, self.main_window)),
+            "Export Performance Trace",
+            default_path,
+            "Chrome Trace (*.json)",
+        )
+        if not file_path:
+            return
+
+        written = tracing.export_chrome_trace(file_path)
+        if self.main_window.status_label:
+            self.main_window.status_label.setText(f"Performance trace saved to {written}")
+
+    @Slot()
+    def on_show_memory_usage(self) -> None:
+        """Handle memory usage report action."""
+        from html import escape
+
+        from PySide6.QtWidgets import QMessageBox, QWidget
+
+        report = get_memory_budget().format_report()
+        logger.info(report)
+
+        message_box = QMessageBox(cast(QWidget, cast(object, self.main_window)))
+        message_box.setWindowTitle("Memory Usage")
+        message_box.setText(f"<pre>{escape(report)}</pre>")
+        _ = message_box.exec()
+
     # ==================== Curve Action Handlers ====================
 
     @Slot()
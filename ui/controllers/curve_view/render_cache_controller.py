@@ -18,7 +18,7 @@ from typing import TYPE_CHECKING
 from PySide6.QtCore import QPointF, QRect, QRectF
 
 from core.logger_utils import get_logger
-from core.point_types import safe_extract_point
+from core.screen_points import IntArray, ScreenPointCache
 
 if TYPE_CHECKING:
     from ui.curve_view_widget import CurveViewWidget
@@ -31,17 +31,20 @@ class RenderCacheController:
     Controller for rendering cache management.
 
     Manages performance-critical caches for rendering:
-    - Screen point positions (data coords → screen coords)
-    - Visible indices (viewport culling)
+    - Screen point positions (data coords → screen coords), as an Nx2 array
+    - Visible indices (viewport culling), as a boolean mask over that array
     - Update regions (partial repaints)
 
+    The screen positions are shared: the renderer draws the active curve from
+    them and the interaction service's spatial index bins them, so the curve is
+    transformed once per view change instead of once per consumer.
+
     Pattern: Controller holds widget reference (Pattern B - like StateSyncController)
     No manual widget.update() calls - caches are passive, queried during paintEvent.
 
     Attributes:
         widget: Reference to CurveViewWidget for curve data access
-        _screen_points_cache: Cached screen positions for points
-        _visible_indices_cache: Set of indices visible in viewport
+        _screen_points: Cached screen positions and visibility mask for the active curve
         _update_region: Accumulated region needing repaint
     """
 
@@ -55,8 +58,7 @@ class RenderCacheController:
         self.widget: CurveViewWidget = widget
 
         # Rendering caches (moved from widget)
-        self._screen_points_cache: dict[int, QPointF] = {}
-        self._visible_indices_cache: set[int] = set()
+        self._screen_points: ScreenPointCache = ScreenPointCache()
         self._update_region: QRectF | None = None
 
         logger.debug("RenderCacheController initialized")
@@ -70,8 +72,7 @@ class RenderCacheController:
         Clears screen point cache, visible indices, and update region.
         Note: Transform cache is managed by ViewCameraController (Phase 1).
         """
-        self._screen_points_cache.clear()
-        self._visible_indices_cache.clear()
+        self._screen_points.clear()
         self._update_region = None
 
     def invalidate_point_region(self, index: int) -> None:
@@ -84,36 +85,36 @@ class RenderCacheController:
         Args:
             index: Point index to invalidate
         """
-        if index in self._screen_points_cache:
-            pos = self._screen_points_cache[index]
+        pos = self.get_screen_position(index)
+        if pos is None:
+            return
 
-            # Create update region around point
-            margin = self.widget.visual.point_radius + 10
-            region = QRectF(pos.x() - margin, pos.y() - margin, margin * 2, margin * 2)
+        # Create update region around point
+        margin = self.widget.visual.point_radius + 10
+        region = QRectF(pos.x() - margin, pos.y() - margin, margin * 2, margin * 2)
 
-            if self._update_region:
-                self._update_region = self._update_region.united(region)
-            else:
-                self._update_region = region
+        if self._update_region:
+            self._update_region = self._update_region.united(region)
+        else:
+            self._update_region = region
 
-            logger.debug(f"Invalidated region around point {index}")
+        logger.debug(f"Invalidated region around point {index}")
 
     # ==================== Cache Updates ====================
 
     def update_screen_points_cache(self) -> None:
         """
-        Update cached screen positions for all curve points.
+        Update cached screen positions for all active curve points.
 
-        Rebuilds the screen points cache by transforming all curve data points
-        from data coordinates to screen coordinates. Only rebuilds if cache is empty.
+        Rebuilds the array in one vectorized transform when the active curve,
+        the view transform or the point count changed since the last build;
+        otherwise the cache is kept (point moves are applied incrementally).
         """
-        if not self._screen_points_cache:
-            self._screen_points_cache.clear()
-
-            for idx, point in enumerate(self.widget.curve_data):
-                _, x, y, _ = safe_extract_point(point)
-                screen_pos = self.widget.data_to_screen(x, y)
-                self._screen_points_cache[idx] = screen_pos
+        curve_data = self.widget.curve_data
+        curve_name = self.widget.active_curve_name
+        transform = self.widget.get_transform()
+        if not self._screen_points.is_valid_for(curve_name, transform, len(curve_data)):
+            self._screen_points.rebuild(curve_name, curve_data, transform)
 
     def update_visible_indices(self, rect: QRect) -> None:
         """
@@ -125,15 +126,11 @@ class RenderCacheController:
         Args:
             rect: Visible rectangle in screen coordinates
         """
-        self._visible_indices_cache.clear()
-
         # Expand rect slightly for points on edges
         margin = int(self.widget.visual.point_radius)
         expanded = rect.adjusted(-margin, -margin, margin, margin)
 
-        for idx, pos in self._screen_points_cache.items():
-            if expanded.contains(pos.toPoint()):
-                self._visible_indices_cache.add(idx)
+        _ = self._screen_points.update_visibility(expanded.left(), expanded.top(), expanded.right(), expanded.bottom())
 
     def update_single_point_cache(self, index: int, x: float, y: float) -> None:
         """
@@ -146,8 +143,21 @@ class RenderCacheController:
             x: New X coordinate in data space
             y: New Y coordinate in data space
         """
-        if index in self._screen_points_cache:
-            self._screen_points_cache[index] = self.widget.data_to_screen(x, y)
+        self._screen_points.update_point(index, x, y)
+
+    def update_screen_points_range(self, start: int, stop: int) -> None:
+        """
+        Recompute screen positions for a contiguous range of points.
+
+        Used when an edit rewrites a run of points (e.g. filling a gap) without
+        changing the point count.
+
+        Args:
+            start: First point index to update
+            stop: One past the last point index to update
+        """
+        if len(self._screen_points):
+            self._screen_points.update_range(self.widget.curve_data, start, stop)
 
     # ==================== Cache Queries ====================
 
@@ -161,7 +171,10 @@ class RenderCacheController:
         Returns:
             Screen position or None if not in cache
         """
-        return self._screen_points_cache.get(index)
+        if not 0 <= index < len(self._screen_points):
+            return None
+        x, y = self._screen_points.points[index]
+        return QPointF(float(x), float(y))
 
     def is_point_visible(self, index: int) -> bool:
         """
@@ -173,7 +186,16 @@ class RenderCacheController:
         Returns:
             True if point is visible
         """
-        return index in self._visible_indices_cache
+        return 0 <= index < len(self._screen_points.visible) and bool(self._screen_points.visible[index])
+
+    def get_visible_indices(self) -> IntArray:
+        """
+        Get the indices of points found visible by the last update_visible_indices().
+
+        Returns:
+            Sorted array of point indices
+        """
+        return self._screen_points.visible.nonzero()[0]
 
     def get_screen_points_items(self) -> list[tuple[int, QPointF]]:
         """
@@ -182,7 +204,7 @@ class RenderCacheController:
         Returns:
             List of (index, screen_position) pairs
         """
-        return list(self._screen_points_cache.items())
+        return [(idx, QPointF(x, y)) for idx, (x, y) in enumerate(self._screen_points.points.tolist())]
 
     def has_cached_position(self, index: int) -> bool:
         """
@@ -194,7 +216,7 @@ class RenderCacheController:
         Returns:
             True if position is cached
         """
-        return index in self._screen_points_cache
+        return 0 <= index < len(self._screen_points)
 
     @property
     def update_region(self) -> QRectF | None:
@@ -202,6 +224,6 @@ class RenderCacheController:
         return self._update_region
 
     @property
-    def screen_points_cache(self) -> dict[int, QPointF]:
-        """Get the screen points cache (read-only access)."""
-        return self._screen_points_cache
+    def screen_points_cache(self) -> ScreenPointCache:
+        """Get the shared screen points cache (read-only access)."""
+        return self._screen_points
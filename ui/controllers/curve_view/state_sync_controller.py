@@ -72,6 +72,7 @@ class StateSyncController:
     def _connect_app_state_signals(self) -> None:
         """Connect to ApplicationState signals for multi-curve reactive updates."""
         self._app_state.curves_changed.connect(self._on_app_state_curves_changed)
+        self._app_state.points_moved.connect(self._on_app_state_points_moved)
         self._app_state.selection_changed.connect(self._on_app_state_selection_changed)
         self._app_state.active_curve_changed.connect(self._on_app_state_active_curve_changed)
         self._app_state.curve_visibility_changed.connect(self._on_app_state_visibility_changed)
@@ -96,13 +97,12 @@ class StateSyncController:
         Args:
             curves: Dictionary mapping curve names to curve data
         """
-        # Clear SegmentedCurve cache in DataService (all curves changed)
+        # Evict DataService SegmentedCurves of the curves that changed (others stay cached)
         data_service = get_data_service()
         try:
-            data_service.clear_segmented_curve_cache()
-            logger.debug("Cleared DataService SegmentedCurve cache")
+            data_service.evict_changed_curves()
         except Exception as e:
-            logger.error(f"Failed to clear DataService cache: {e}")
+            logger.error(f"Failed to evict DataService cache: {e}")
 
         # Update widget caches and display
         self.widget.invalidate_caches()
@@ -115,13 +115,32 @@ class StateSyncController:
         active_curve = self._app_state.active_curve
         if active_curve and active_curve in curves:
             try:
-                data_service.update_curve_data(curves[active_curve])
+                data_service.update_curve_data(curves[active_curve], active_curve)
                 logger.debug(f"Synced active curve '{active_curve}' to DataService")
             except Exception as e:
                 logger.error(f"Failed to sync DataService: {e}")
 
         logger.debug(f"ApplicationState curves changed: {len(curves)} curves")
 
+    @safe_slot
+    def _on_app_state_points_moved(self, curve_name: str, positions: dict[int, tuple[float, float]]) -> None:
+        """Handle ApplicationState points_moved signal (in-place drag updates).
+
+        Only the moved points' screen-cache entries are updated; full cache
+        invalidation and DataService sync happen on the curves_changed that
+        ends the drag.
+
+        Args:
+            curve_name: Curve containing the moved points
+            positions: New (x, y) data coordinates by point index
+        """
+        if curve_name == self._app_state.active_curve:
+            render_cache = self.widget.render_cache
+            for index, (x, y) in positions.items():
+                render_cache.update_single_point_cache(index, x, y)
+
+        self.widget.update()
+
     @safe_slot
     def _on_app_state_selection_changed(self, indices: set[int], curve_name: str) -> None:
         """Handle ApplicationState selection_changed signal."""
@@ -32,6 +32,17 @@ Why This Matters:
     The coordinator makes the order explicit and deterministic, eliminating
     timing-dependent bugs that tests can't reliably catch.
 
+Coalescing and Scrubbing:
+    Frame changes arrive queued. When several are pending (fast slider or
+    timeline tab drags), only the latest is processed: a queued change whose
+    frame is no longer the current frame is dropped.
+
+    While the slider or timeline tabs are dragged (scrub mode), the
+    background never decodes on the UI thread. The cached frame, or else the
+    nearest cached frame, is shown at once and the exact frame decodes in the
+    background; it replaces the stand-in when it arrives. Curves render at
+    draft quality. Releasing the mouse runs one full-quality frame change.
+
 Usage:
     coordinator = FrameChangeCoordinator(main_window)
     coordinator.connect()  # Replaces 6 independent frame_changed connections
@@ -42,6 +53,7 @@ from __future__ import annotations
 import warnings
 from typing import TYPE_CHECKING
 
+from core import tracing
 from core.logger_utils import get_logger
 
 if TYPE_CHECKING:
@@ -76,6 +88,17 @@ class FrameChangeCoordinator:
         self.timeline_tabs: TimelineTabWidget | None = main_window.timeline_tabs
         self._connected: bool = False  # Track connection state to prevent Qt warnings
         self._curve_change_connected: bool = False  # Track active_curve_changed connection
+        self._scrub_connected: bool = False  # Track scrub and frame_ready connections
+
+        # Scrub mode state
+        self._scrubbing: bool = False
+        # Frame showing a stand-in background while its image decodes
+        self._stand_in_frame: int | None = None
+
+    @property
+    def scrubbing(self) -> bool:
+        """Whether the timeline is being scrubbed."""
+        return self._scrubbing
 
     @property
     def curve_widget(self):
@@ -122,7 +145,7 @@ class FrameChangeCoordinator:
         # Connect to frame_changed with QueuedConnection to defer execution
         # This breaks the synchronous nested execution that causes timeline desync bugs
         _ = self.main_window.state_manager.frame_changed.connect(
-            self.on_frame_changed,
+            self._on_frame_changed_queued,
             Qt.QueuedConnection,  # pyright: ignore[reportAttributeAccessIssue]  # Defers coordinator execution, prevents nested calls
         )
         self._connected = True
@@ -135,8 +158,23 @@ class FrameChangeCoordinator:
         )
         self._curve_change_connected = True
 
+        self._connect_scrub_signals()
+
         logger.info("FrameChangeCoordinator connected to frame_changed and active_curve_changed")
 
+    def _connect_scrub_signals(self) -> None:
+        """Connect scrub start/finish from the slider and timeline tabs, and background frame arrival."""
+        from services import get_data_service
+
+        if self.timeline_controller:
+            _ = self.timeline_controller.scrub_started.connect(self.begin_scrub)
+            _ = self.timeline_controller.scrub_finished.connect(self.end_scrub)
+        if self.timeline_tabs:
+            _ = self.timeline_tabs.scrub_started.connect(self.begin_scrub)
+            _ = self.timeline_tabs.scrub_finished.connect(self.end_scrub)
+        _ = get_data_service().image_cache.frame_ready.connect(self._on_background_frame_ready)
+        self._scrub_connected = True
+
     def disconnect(self) -> None:
         """Disconnect from state manager and ApplicationState (cleanup)."""
         from stores.application_state import get_application_state
@@ -146,7 +184,7 @@ class FrameChangeCoordinator:
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore", category=RuntimeWarning, message="Failed to disconnect.*")
                 try:
-                    _ = self.main_window.state_manager.frame_changed.disconnect(self.on_frame_changed)
+                    _ = self.main_window.state_manager.frame_changed.disconnect(self._on_frame_changed_queued)
                     self._connected = False
                     logger.debug("Disconnected from frame_changed")
                 except (RuntimeError, TypeError):
@@ -166,9 +204,89 @@ class FrameChangeCoordinator:
                     # Signal already disconnected or connection never made
                     self._curve_change_connected = False
 
+        if self._scrub_connected:
+            self._disconnect_scrub_signals()
+
         if not self._connected and not self._curve_change_connected:
             logger.info("FrameChangeCoordinator fully disconnected")
 
+    def _disconnect_scrub_signals(self) -> None:
+        """Disconnect scrub and frame_ready signals (suppress warnings if already gone)."""
+        from services import get_data_service
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=RuntimeWarning, message="Failed to disconnect.*")
+            try:
+                if self.timeline_controller:
+                    _ = self.timeline_controller.scrub_started.disconnect(self.begin_scrub)
+                    _ = self.timeline_controller.scrub_finished.disconnect(self.end_scrub)
+                if self.timeline_tabs:
+                    _ = self.timeline_tabs.scrub_started.disconnect(self.begin_scrub)
+                    _ = self.timeline_tabs.scrub_finished.disconnect(self.end_scrub)
+                _ = get_data_service().image_cache.frame_ready.disconnect(self._on_background_frame_ready)
+            except (RuntimeError, TypeError):
+                # Signal already disconnected or sender destroyed
+                pass
+        self._scrub_connected = False
+
+    def begin_scrub(self) -> None:
+        """Enter scrub mode: stand-in backgrounds and draft rendering until end_scrub()."""
+        if self._scrubbing:
+            return
+        self._scrubbing = True
+        if self.curve_widget:
+            self.curve_widget.set_scrubbing(True)
+        tracing.instant("frame_change.scrub_start", "frame_change")
+        logger.debug("Scrub started")
+
+    def end_scrub(self) -> None:
+        """Leave scrub mode and process the current frame at full quality."""
+        if not self._scrubbing:
+            return
+        self._scrubbing = False
+        self._stand_in_frame = None
+        if self.curve_widget:
+            self.curve_widget.set_scrubbing(False)
+        tracing.instant("frame_change.scrub_end", "frame_change")
+        logger.debug("Scrub finished")
+
+        # Exact background (decoded now if still missing), preloading and full-quality repaint
+        if self.main_window.state_manager:
+            self.on_frame_changed(self.main_window.state_manager.current_frame)
+
+    def _on_frame_changed_queued(self, frame: int) -> None:
+        """
+        Process a queued frame change unless a newer one is already pending (latest wins).
+
+        Args:
+            frame: Frame number carried by the queued signal
+        """
+        if self.main_window.state_manager and frame != self.main_window.state_manager.current_frame:
+            # The frame changed again after this signal was queued; its own signal follows
+            tracing.instant("frame_change.coalesced", "frame_change", frame=frame)
+            return
+        self.on_frame_changed(frame)
+
+    def _on_background_frame_ready(self, image_idx: int) -> None:
+        """
+        Replace a stand-in background once its exact frame has decoded.
+
+        Args:
+            image_idx: 0-based image index added to the image cache
+        """
+        frame = image_idx + 1
+        if self._stand_in_frame != frame or not self.main_window.state_manager:
+            return
+        if self.main_window.state_manager.current_frame != frame:
+            return
+
+        try:
+            with tracing.span("frame_change.stand_in_replaced", "frame_change", frame=frame):
+                self._update_background(frame)
+                self._trigger_repaint()
+        except Exception as e:
+            logger.error(f"Background update failed for frame {frame}: {e}", exc_info=True)
+
     def on_frame_changed(self, frame: int) -> None:
         """
         Handle frame change with coordinated updates.
@@ -188,46 +306,58 @@ class FrameChangeCoordinator:
         """
         errors: list[str] = []
 
-        # Phase 1: Pre-paint state updates (all must attempt even if one fails)
-        try:
-            self._update_background(frame)
-        except Exception as e:
-            errors.append(f"background: {e}")
-            logger.error(f"Background update failed for frame {frame}: {e}", exc_info=True)
-
-        try:
-            self._apply_centering(frame)
-        except Exception as e:
-            errors.append(f"centering: {e}")
-            logger.error(f"Centering failed for frame {frame}: {e}", exc_info=True)
-
-        try:
-            self._invalidate_caches()
-        except Exception as e:
-            errors.append(f"cache: {e}")
-            logger.error(f"Cache invalidation failed for frame {frame}: {e}", exc_info=True)
-
-        # Phase 2: Widget updates
-        try:
-            self._update_timeline_widgets(frame)
-        except Exception as e:
-            errors.append(f"timeline: {e}")
-            logger.error(f"Timeline widget update failed for frame {frame}: {e}", exc_info=True)
-
-        # Phase 3: Single repaint (must always attempt, even if previous phases failed)
-        try:
-            self._trigger_repaint()
-        except Exception as e:
-            errors.append(f"repaint: {e}")
-            logger.error(f"Repaint failed for frame {frame}: {e}", exc_info=True)
+        with tracing.span("frame_change", "frame_change", frame=frame):
+            # Phase 1: Pre-paint state updates (all must attempt even if one fails)
+            try:
+                with tracing.span("frame_change.background", "frame_change"):
+                    self._update_background(frame)
+            except Exception as e:
+                errors.append(f"background: {e}")
+                logger.error(f"Background update failed for frame {frame}: {e}", exc_info=True)
+
+            try:
+                with tracing.span("frame_change.centering", "frame_change"):
+                    self._apply_centering(frame)
+            except Exception as e:
+                errors.append(f"centering: {e}")
+                logger.error(f"Centering failed for frame {frame}: {e}", exc_info=True)
+
+            try:
+                with tracing.span("frame_change.invalidate_caches", "frame_change"):
+                    self._invalidate_caches()
+            except Exception as e:
+                errors.append(f"cache: {e}")
+                logger.error(f"Cache invalidation failed for frame {frame}: {e}", exc_info=True)
+
+            # Phase 2: Widget updates
+            try:
+                with tracing.span("frame_change.timeline", "frame_change"):
+                    self._update_timeline_widgets(frame)
+            except Exception as e:
+                errors.append(f"timeline: {e}")
+                logger.error(f"Timeline widget update failed for frame {frame}: {e}", exc_info=True)
+
+            # Phase 3: Single repaint (must always attempt, even if previous phases failed)
+            try:
+                with tracing.span("frame_change.schedule_repaint", "frame_change"):
+                    self._trigger_repaint()
+            except Exception as e:
+                errors.append(f"repaint: {e}")
+                logger.error(f"Repaint failed for frame {frame}: {e}", exc_info=True)
 
         if errors:
             logger.warning(f"Frame {frame} completed with {len(errors)} errors: {errors}")
 
     def _update_background(self, frame: int) -> None:
-        """Update background image for frame (if images loaded)."""
+        """Update background image for frame (if images loaded); cached or stand-in only while scrubbing."""
         if self.view_management and self.view_management.image_filenames:
-            self.view_management.update_background_for_frame(frame)
+            if not self._scrubbing:
+                self.view_management.update_background_for_frame(frame)
+                self._stand_in_frame = None
+            elif not self.view_management.update_background_for_frame(frame, scrubbing=True):
+                self._stand_in_frame = frame
+            else:
+                self._stand_in_frame = None
 
     def _apply_centering(self, frame: int) -> None:
         """Apply centering if centering mode is enabled."""
@@ -156,6 +156,20 @@ class MultiPointTrackingController(BaseTrackingController):
         if isinstance(new_direction, TrackingDirection):
             self.point_tracking_directions[point_name] = new_direction
 
+    def on_tracking_directions_changed(self, point_names: list[str], new_direction: object) -> None:
+        """
+        Handle tracking direction change for several points as one batched update.
+
+        Args:
+            point_names: Names of the tracking points
+            new_direction: New tracking direction (passed as object from signal)
+        """
+        self.data_controller.on_tracking_directions_changed(point_names, new_direction)
+        # Update tracking direction mapping (kept at facade level)
+        if isinstance(new_direction, TrackingDirection):
+            for point_name in point_names:
+                self.point_tracking_directions[point_name] = new_direction
+
     def clear_tracking_data(self) -> None:
         """Clear all tracking data."""
         self.data_controller.clear_tracking_data()
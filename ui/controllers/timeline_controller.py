@@ -68,6 +68,8 @@ class TimelineController(QObject):
 
     # Signals
     frame_changed: Signal = Signal(int)  # Emitted when frame changes
+    scrub_started: Signal = Signal()  # Slider grabbed: frame changes follow the mouse
+    scrub_finished: Signal = Signal()  # Slider released
     playback_started: Signal = Signal()
     playback_stopped: Signal = Signal()
     playback_state_changed: Signal = Signal(PlaybackMode)  # For UI updates
@@ -118,6 +120,8 @@ class TimelineController(QObject):
                 _ = self.frame_spinbox.valueChanged.disconnect(self._on_frame_changed)
             if self.frame_slider:
                 _ = self.frame_slider.valueChanged.disconnect(self._on_slider_changed)
+                _ = self.frame_slider.sliderPressed.disconnect(self.scrub_started)
+                _ = self.frame_slider.sliderReleased.disconnect(self.scrub_finished)
             if self.btn_first:
                 _ = self.btn_first.clicked.disconnect(self._on_first_frame)
             if self.btn_prev:
@@ -186,6 +190,8 @@ class TimelineController(QObject):
         # Navigation signals
         _ = self.frame_spinbox.valueChanged.connect(self._on_frame_changed)
         _ = self.frame_slider.valueChanged.connect(self._on_slider_changed)
+        _ = self.frame_slider.sliderPressed.connect(self.scrub_started)
+        _ = self.frame_slider.sliderReleased.connect(self.scrub_finished)
         _ = self.btn_first.clicked.connect(self._on_first_frame)
         _ = self.btn_prev.clicked.connect(self._on_prev_frame)
         _ = self.btn_next.clicked.connect(self._on_next_frame)
@@ -447,16 +453,13 @@ class TimelineController(QObject):
         self.playback_state.min_frame = self.frame_spinbox.minimum()
         self.playback_state.max_frame = self.frame_spinbox.maximum()
 
-        # Try to get actual frame range from curve data if available
-        parent = self.parent()  # Returns non-None QObject
-        curve_widget = getattr(parent, "curve_widget", None)
-        if curve_widget is not None:
-            curve_data = curve_widget.curve_data
-            if curve_data:
-                # Get actual frame range from curve data
-                frames = [point[0] for point in curve_data]
-                self.playback_state.min_frame = min(frames)
-                self.playback_state.max_frame = max(frames)
+        # Use the active curve's actual frame range if it has data
+        app_state = get_application_state()
+        active_curve = app_state.active_curve
+        if active_curve:
+            frame_range = app_state.get_curve_summary(active_curve).frame_range
+            if frame_range is not None:
+                self.playback_state.min_frame, self.playback_state.max_frame = frame_range
 
         logger.debug(f"Updated playback bounds: {self.playback_state.min_frame}-{self.playback_state.max_frame}")
 
@@ -13,7 +13,7 @@ from PySide6.QtWidgets import QApplication
 from core.logger_utils import get_logger
 from core.models import TrackingDirection
 from core.type_aliases import CurveDataInput, CurveDataList
-from data.tracking_direction_utils import update_keyframe_status_for_tracking_direction
+from data.tracking_direction_utils import apply_status_changes, compute_tracking_direction_changes
 from protocols.ui import MainWindowProtocol
 from ui.controllers.base_tracking_controller import BaseTrackingController
 
@@ -294,72 +294,87 @@ class TrackingDataController(BaseTrackingController):
             logger.warning(f"Tracking direction changed for unknown point: {point_name}")
             return
 
+        self.on_tracking_directions_changed([point_name], new_direction)
+
+    @Slot(list, object)
+    def on_tracking_directions_changed(self, point_names: list[str], new_direction: object) -> None:
+        """Handle a tracking direction change for several points at once.
+
+        New statuses for every affected curve are computed in one vectorized
+        pass per curve and committed as a single undoable command, so changing
+        direction on hundreds of points is one state update and one undo step.
+
+        Args:
+            point_names: Names of the tracking points
+            new_direction: New tracking direction (passed as object from signal)
+        """
         # Convert object back to TrackingDirection (signal passes as object)
         if not isinstance(new_direction, TrackingDirection):
             logger.error(f"Invalid tracking direction type: {type(new_direction)}")
             return
 
-        # Get previous direction (default to forward if unknown)
-        previous_direction = self.point_tracking_directions.get(point_name, TrackingDirection.TRACKING_FW)
+        known_curves = set(self._app_state.get_all_curve_names())
+        changed_points: list[str] = []
+        changes_by_curve: dict[str, list[tuple[int, str, str]]] = {}
+        for point_name in point_names:
+            if point_name not in known_curves:
+                logger.warning(f"Tracking direction changed for unknown point: {point_name}")
+                continue
+
+            # Get previous direction (default to forward if unknown)
+            previous_direction = self.point_tracking_directions.get(point_name, TrackingDirection.TRACKING_FW)
+
+            # Skip update if direction hasn't actually changed
+            if previous_direction == new_direction:
+                logger.debug(f"Tracking direction unchanged for {point_name}: {new_direction.value}")
+                continue
+
+            changed_points.append(point_name)
+            status_changes = compute_tracking_direction_changes(
+                self._app_state.get_curve_data(point_name), new_direction, previous_direction
+            )
+            if status_changes:
+                changes_by_curve[point_name] = status_changes
 
-        # Skip update if direction hasn't actually changed
-        if previous_direction == new_direction:
-            logger.debug(f"Tracking direction unchanged for {point_name}: {new_direction.value}")
+        if not changed_points:
             return
 
-        logger.info(f"Tracking direction changed for {point_name}: {previous_direction.value} -> {new_direction.value}")
-
-        # Get curve data and calculate what will change
-        curve_data = self._app_state.get_curve_data(point_name)
-        updated_data = update_keyframe_status_for_tracking_direction(curve_data, new_direction, previous_direction)
-
-        # Detect status changes - build list of (index, old_status, new_status)
-        status_changes: list[tuple[int, str, str]] = []
-        for i, (old_point, new_point) in enumerate(zip(curve_data, updated_data, strict=True)):
-            old_status = str(old_point[3]) if len(old_point) > 3 else "keyframe"
-            new_status = str(new_point[3]) if len(new_point) > 3 else "keyframe"
-            if old_status != new_status:
-                status_changes.append((i, old_status, new_status))
-
-        logger.debug(f"Detected {len(status_changes)} status changes for direction change")
+        total_changes = sum(len(changes) for changes in changes_by_curve.values())
+        logger.info(
+            f"Tracking direction changed to {new_direction.value} for {len(changed_points)} point(s): "
+            + f"{total_changes} status changes in {len(changes_by_curve)} curve(s)"
+        )
 
-        # Create and execute command for undo support (only for active curve)
-        if status_changes and self._app_state.active_curve == point_name:
-            from core.commands.curve_commands import SetPointStatusCommand
+        # Create and execute one command for undo support
+        if changes_by_curve:
+            from core.commands.curve_commands import BatchSetPointStatusCommand
             from services import get_interaction_service
 
-            command = SetPointStatusCommand(
+            command = BatchSetPointStatusCommand(
                 description=f"Change tracking direction to {new_direction.value}",
-                changes=status_changes,
+                changes_by_curve=changes_by_curve,
             )
 
             interaction_service = get_interaction_service()
             if interaction_service:
-                success = interaction_service.command_manager.execute_command(
+                if not interaction_service.command_manager.execute_command(
                     command, cast(MainWindowProtocol, cast(object, self.main_window))
-                )
-
-                if success:
-                    # Sync ApplicationState from curve widget after command executes
-                    if self.main_window.curve_widget:
-                        updated_curve_data = self.main_window.curve_widget.curve_data
-                        self._app_state.set_curve_data(point_name, updated_curve_data)
-                        logger.info("Synced ApplicationState from curve widget after direction change")
-                else:
+                ):
                     logger.error("Failed to execute direction change command")
                     return
             else:
                 logger.warning("InteractionService not available, updating data directly")
-                self._app_state.set_curve_data(point_name, updated_data)
-        else:
-            # Not active curve or no changes - just update ApplicationState
-            self._app_state.set_curve_data(point_name, updated_data)
+                with self._app_state.batch_updates():
+                    for point_name, status_changes in changes_by_curve.items():
+                        curve_data = self._app_state.get_curve_data(point_name)
+                        self._app_state.set_curve_data(point_name, apply_status_changes(curve_data, status_changes))
 
         # Store the new direction
-        self.point_tracking_directions[point_name] = new_direction
+        for point_name in changed_points:
+            self.point_tracking_directions[point_name] = new_direction
 
         self.data_changed.emit()
-        logger.info(f"Keyframe status update completed for {point_name}")
+        logger.info(f"Keyframe status update completed for {len(changed_points)} point(s)")
 
     def clear_tracking_data(self) -> None:
         """Clear all tracking data."""
@@ -251,10 +251,9 @@ class TrackingDisplayController(BaseTrackingController):
         """Update frame range based on all trajectories in multi-point data."""
         max_frame = 0
         for curve_name in self._app_state.get_all_curve_names():
-            traj = self._app_state.get_curve_data(curve_name)
-            if traj:
-                traj_max = max(point[0] for point in traj)
-                max_frame = max(max_frame, traj_max)
+            frame_range = self._app_state.get_curve_summary(curve_name).frame_range
+            if frame_range is not None:
+                max_frame = max(max_frame, frame_range[1])
 
         if max_frame > 0 and self.main_window.timeline_controller:
             self.main_window.timeline_controller.update_frame_range(1, max_frame)
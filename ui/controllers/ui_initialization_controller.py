@@ -75,7 +75,7 @@ class UIInitializationController:
         except (RuntimeError, AttributeError):
             pass  # Already disconnected or objects destroyed
 
-        # Disconnect tracking panel signals (5 connections)
+        # Disconnect tracking panel signals (6 connections)
         try:
             if self.main_window.tracking_panel is not None:
                 panel = self.main_window.tracking_panel
@@ -86,6 +86,9 @@ class UIInitializationController:
                 _ = panel.tracking_direction_changed.disconnect(
                     self.main_window.tracking_controller.on_tracking_direction_changed
                 )
+                _ = panel.tracking_directions_changed.disconnect(
+                    self.main_window.tracking_controller.on_tracking_directions_changed
+                )
         except (RuntimeError, AttributeError):
             pass  # Already disconnected or objects destroyed
 
@@ -455,6 +458,9 @@ class UIInitializationController:
         _ = self.main_window.tracking_panel.tracking_direction_changed.connect(
             self.main_window.tracking_controller.on_tracking_direction_changed
         )
+        _ = self.main_window.tracking_panel.tracking_directions_changed.connect(
+            self.main_window.tracking_controller.on_tracking_directions_changed
+        )
 
         logger.info("Tracking points panel dock widget initialized")
 
@@ -28,6 +28,7 @@ from core.point_types import safe_extract_point
 from core.type_aliases import CurveDataList
 from services import get_data_service, get_transform_service
 from services.transform_service import Transform, ViewState
+from stores.application_state import get_application_state
 from ui.ui_constants import (
     DEFAULT_ZOOM_FACTOR,
     MAX_ZOOM_FACTOR,
@@ -100,6 +101,9 @@ class ViewCameraController:
         # Transform cache (managed internally)
         self._transform_cache: Transform | None = None
 
+        # Bumped on every view change; TransformService memoizes per-view transforms on it
+        self.view_version: int = 0
+
     # Core Transform API
 
     def get_transform(self) -> Transform:
@@ -200,6 +204,7 @@ class ViewCameraController:
     def invalidate_caches(self) -> None:
         """Invalidate transform cache (called when view state changes)."""
         self._transform_cache = None
+        self.view_version += 1
 
     # Zoom Operations
 
@@ -329,7 +334,8 @@ class ViewCameraController:
 
         # Use gap-aware position lookup through data service
         data_service = get_data_service()
-        position = data_service.get_position_at_frame(self.widget.curve_data, frame)
+        active_curve = get_application_state().active_curve
+        position = data_service.get_position_at_frame(self.widget.curve_data, frame, active_curve)
 
         if position:
             x, y = position
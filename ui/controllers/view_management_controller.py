@@ -282,18 +282,55 @@ class ViewManagementController:
     # Image caching now handled by SafeImageCacheManager in DataService
     # Methods removed: _load_image_from_disk(), _get_cached_image(), clear_image_cache()
 
-    def update_background_for_frame(self, frame: int) -> None:
+    def update_background_for_frame(self, frame: int, scrubbing: bool = False) -> bool:
         """
         Update the background image based on the current frame.
 
         Phase 2C: Uses SafeImageCacheManager for efficient caching with background preloading.
         First playthrough loads from disk, subsequent playback uses cached images (instant).
 
+        While scrubbing, never decodes on the UI thread: shows the frame if it is
+        cached, otherwise the nearest cached frame, and decodes the exact frame
+        in the background.
+
         Args:
             frame: Frame number to display (1-based indexing)
+            scrubbing: Whether the timeline is being scrubbed
+
+        Returns:
+            True if the background shows the exact frame, False if a stand-in
+            is shown while the frame decodes
         """
+        if scrubbing:
+            return self._update_background_image_for_scrub(frame)
+
         # Phase 2C: Delegate to cache-based implementation
         self._update_background_image(frame)
+        return True
+
+    def _update_background_image_for_scrub(self, frame: int) -> bool:
+        """
+        Show the cached frame or the nearest cached stand-in, and request the exact frame.
+
+        Args:
+            frame: Frame number to display (1-based indexing)
+
+        Returns:
+            True if the exact frame is shown
+        """
+        from services import get_data_service
+
+        if not self.main_window.curve_widget:
+            return True
+
+        image_idx = frame - 1
+        image, exact = get_data_service().get_scrub_background_image(image_idx)
+        if image is not None and not image.isNull():
+            self.main_window.curve_widget.background_image = image
+
+        if not exact:
+            get_data_service().request_background_image(image_idx)
+        return exact
 
     def _update_background_image(self, frame: int) -> None:
         """
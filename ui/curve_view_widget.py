@@ -48,13 +48,17 @@ from PySide6.QtGui import (
     QPainter,
     QPaintEvent,
     QPen,
+    QPolygonF,
+    QResizeEvent,
     QWheelEvent,
 )
 from PySide6.QtWidgets import QRubberBand, QStatusBar, QWidget
 from typing_extensions import override
 
 # Import core modules
+from core import tracing
 from core.display_mode import DisplayMode
+from core.memory_budget import PRIORITY_SEGMENTED_CURVES, get_memory_budget
 from core.models import PointCollection, PointStatus
 from core.point_types import safe_extract_point
 from core.signal_manager import SignalManager
@@ -62,6 +66,7 @@ from core.type_aliases import CurveDataInput, CurveDataList
 
 # Import optimized renderer for 47x performance improvement
 from rendering.optimized_curve_renderer import OptimizedCurveRenderer
+from rendering.performance_hud import draw_performance_hud
 from rendering.render_state import RenderState
 from rendering.visual_settings import VisualSettings
 
@@ -223,12 +228,13 @@ class CurveViewWidget(QWidget):
 
         # View transformation (zoom/pan managed by view_camera controller)
         # Note: zoom_factor, pan_offset_x, pan_offset_y are now properties delegating to view_camera
-        self.manual_offset_x: float = 0.0
-        self.manual_offset_y: float = 0.0
+        # The transform inputs below are properties too; setting them invalidates the transform
+        self._manual_offset_x: float = 0.0
+        self._manual_offset_y: float = 0.0
         # For tracking data from video, Y=0 is at top, Y increases downward
         # Qt's coordinate system also has Y=0 at top, so we don't need to flip
-        self.flip_y_axis: bool = False
-        self.scale_to_image: bool = True
+        self._flip_y_axis: bool = False
+        self._scale_to_image: bool = True
 
         # Display settings
         # Note: Visual rendering parameters (point_radius, line_width, show_grid, etc.)
@@ -236,13 +242,16 @@ class CurveViewWidget(QWidget):
         self.show_background: bool = True  # Architectural setting, not visual
 
         # Background image (QImage preserves color space metadata for EXR)
-        self.background_image: QImage | None = None
-        self.image_width: int = DEFAULT_IMAGE_WIDTH
-        self.image_height: int = DEFAULT_IMAGE_HEIGHT
+        self._background_image: QImage | None = None
+        self._image_width: int = DEFAULT_IMAGE_WIDTH
+        self._image_height: int = DEFAULT_IMAGE_HEIGHT
 
         # Centering mode - stays centered on current frame when navigating timeline
         self.centering_mode: bool = False
 
+        # Performance HUD - per-stage timings from core.tracing drawn over the view
+        self.show_performance_hud: bool = False
+
         # Interaction state (Phase 2: InteractionService integration)
         self.drag_active: bool = False
         self.pan_active: bool = False
@@ -257,6 +266,9 @@ class CurveViewWidget(QWidget):
         self.rubber_band: QRubberBand | None = None
         self.rubber_band_origin: QPointF = QPointF()
 
+        # Lasso selection outline while drawing (set by InteractionService)
+        self.lasso_polygon: QPolygonF | None = None
+
         # Performance optimization caches
         # Transform cache → view_camera controller (Phase 1)
         # Rendering caches → render_cache controller (Phase 5)
@@ -273,6 +285,12 @@ class CurveViewWidget(QWidget):
 
         # Initialize optimized renderer for 47x performance improvement
         self._optimized_renderer: OptimizedCurveRenderer = OptimizedCurveRenderer()
+        get_memory_budget().register(
+            "renderer.segmented_curves",
+            self._optimized_renderer,
+            PRIORITY_SEGMENTED_CURVES,
+            "Segmented curves (renderer)",
+        )
 
         # Widget setup
         self._setup_widget()
@@ -431,6 +449,90 @@ class CurveViewWidget(QWidget):
         self.view_camera.pan_offset_y = value
         self.view_camera.invalidate_caches()
 
+    @property
+    def view_version(self) -> int:
+        """Counter bumped whenever any transform input changes (see TransformService.get_transform)."""
+        return self.view_camera.view_version
+
+    # Transform inputs owned by the widget - setters invalidate the cached transform
+
+    @property
+    def manual_offset_x(self) -> float:
+        """Get manual X offset."""
+        return self._manual_offset_x
+
+    @manual_offset_x.setter
+    def manual_offset_x(self, value: float) -> None:
+        """Set manual X offset."""
+        self._manual_offset_x = value
+        self.view_camera.invalidate_caches()
+
+    @property
+    def manual_offset_y(self) -> float:
+        """Get manual Y offset."""
+        return self._manual_offset_y
+
+    @manual_offset_y.setter
+    def manual_offset_y(self, value: float) -> None:
+        """Set manual Y offset."""
+        self._manual_offset_y = value
+        self.view_camera.invalidate_caches()
+
+    @property
+    def flip_y_axis(self) -> bool:
+        """Get whether the Y axis is flipped."""
+        return self._flip_y_axis
+
+    @flip_y_axis.setter
+    def flip_y_axis(self, value: bool) -> None:
+        """Set whether the Y axis is flipped."""
+        self._flip_y_axis = value
+        self.view_camera.invalidate_caches()
+
+    @property
+    def scale_to_image(self) -> bool:
+        """Get whether data is scaled to the image dimensions."""
+        return self._scale_to_image
+
+    @scale_to_image.setter
+    def scale_to_image(self, value: bool) -> None:
+        """Set whether data is scaled to the image dimensions."""
+        self._scale_to_image = value
+        self.view_camera.invalidate_caches()
+
+    @property
+    def background_image(self) -> QImage | None:
+        """Get the background image (QImage preserves color space metadata for EXR)."""
+        return self._background_image
+
+    @background_image.setter
+    def background_image(self, value: QImage | None) -> None:
+        """Set the background image."""
+        self._background_image = value
+        self.view_camera.invalidate_caches()
+
+    @property
+    def image_width(self) -> int:
+        """Get the data image width."""
+        return self._image_width
+
+    @image_width.setter
+    def image_width(self, value: int) -> None:
+        """Set the data image width."""
+        self._image_width = value
+        self.view_camera.invalidate_caches()
+
+    @property
+    def image_height(self) -> int:
+        """Get the data image height."""
+        return self._image_height
+
+    @image_height.setter
+    def image_height(self, value: int) -> None:
+        """Set the data image height."""
+        self._image_height = value
+        self.view_camera.invalidate_caches()
+
     # ==================== Signal Handlers (Phase 3: Extracted to StateSyncController) ====================
     # All signal connection and handling logic moved to ui/controllers/curve_view/state_sync_controller.py
     # This eliminates 186 lines of signal handling code from the widget
@@ -827,6 +929,17 @@ class CurveViewWidget(QWidget):
 
     # Painting
 
+    @override
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """
+        Invalidate the transform when the widget size changes.
+
+        Args:
+            event: Resize event
+        """
+        super().resizeEvent(event)
+        self.view_camera.invalidate_caches()
+
     @override
     def paintEvent(self, event: QPaintEvent) -> None:
         """
@@ -861,6 +974,10 @@ class CurveViewWidget(QWidget):
         # DELEGATE ALL RENDERING TO OPTIMIZED RENDERER
         # This is the ONLY rendering path - do not add paint methods to this widget
 
+        # Refresh the shared screen-point array (no-op unless the view or curve changed);
+        # the renderer, hover indicator and spatial index all read it
+        self.render_cache.update_screen_points_cache()
+
         # Compute render state with pre-computed visibility (performance optimization)
         # This eliminates redundant visibility checks during rendering by computing
         # the visible_curves set once instead of checking each curve multiple times
@@ -876,6 +993,10 @@ class CurveViewWidget(QWidget):
         if self.rubber_band_active and self.rubber_band:
             _ = self.rubber_band.show()  # Suppress unused return value
 
+        # Draw lasso outline if active
+        if self.lasso_polygon is not None:
+            self._paint_lasso(painter, self.lasso_polygon)
+
         # Draw hover indicator
         if self.hover_index >= 0:
             self._paint_hover_indicator(painter)
@@ -884,6 +1005,25 @@ class CurveViewWidget(QWidget):
         if self.centering_mode:
             self._paint_centering_indicator(painter)
 
+        # Draw performance HUD
+        if self.show_performance_hud:
+            draw_performance_hud(painter, tracing.get_stage_timings(), self.width())
+
+    def set_performance_hud_enabled(self, enabled: bool) -> None:
+        """
+        Show or hide the performance HUD overlay.
+
+        Showing the HUD enables tracing so there are timings to display;
+        hiding it leaves tracing as it was (a trace may still be recording).
+
+        Args:
+            enabled: True to show the HUD
+        """
+        self.show_performance_hud = enabled
+        if enabled:
+            tracing.enable()
+        self.update()
+
     def _paint_hover_indicator(self, painter: QPainter) -> None:
         """Paint hover indicator for point under mouse."""
         if self.hover_index >= 0:
@@ -900,6 +1040,14 @@ class CurveViewWidget(QWidget):
 
             painter.restore()
 
+    def _paint_lasso(self, painter: QPainter, polygon: QPolygonF) -> None:
+        """Paint the outline of a lasso selection in progress."""
+        painter.save()
+        painter.setBrush(QColor(255, 255, 255, 30))
+        painter.setPen(QPen(QColor(255, 255, 255, 180), 1, Qt.PenStyle.DashLine))
+        painter.drawPolygon(polygon)
+        painter.restore()
+
     def _paint_centering_indicator(self, painter: QPainter) -> None:
         """Paint centering mode indicator in the top-right corner."""
         painter.save()
@@ -1654,6 +1802,14 @@ class CurveViewWidget(QWidget):
         # Invalidate SegmentedCurve cache in optimized renderer
         self._optimized_renderer.clear_segmented_curve_cache()
 
+    def set_scrubbing(self, scrubbing: bool) -> None:
+        """
+        Render at draft quality while the timeline is scrubbed.
+
+        Note: Delegates to OptimizedCurveRenderer; full quality resumes when scrubbing stops.
+        """
+        self._optimized_renderer.set_scrubbing(scrubbing)
+
     def _invalidate_point_region(self, index: int) -> None:
         """Note: Delegates to RenderCacheController (Phase 5 extraction)"""
         self.render_cache.invalidate_point_region(index)
@@ -4,7 +4,8 @@ Application-level event filter for global keyboard shortcuts.
 
 This module provides an event filter that intercepts keyboard events at the
 application level, enabling global keyboard shortcuts that work regardless
-of which widget has focus.
+of which widget has focus. Auto-repeated presses of repeatable shortcuts are
+coalesced by a ShortcutRepeatCoalescer.
 """
 # pyright: reportImportCycles=false
 
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
     from ui.shortcut_registry import ShortcutRegistry
 
 from core.commands.shortcut_command import ShortcutContext
+from core.commands.shortcut_commands import RepeatableShortcutCommand, ShortcutRepeatCoalescer
 from core.logger_utils import get_logger
 
 logger = get_logger("global_event_filter")
@@ -43,6 +45,7 @@ class GlobalEventFilter(QObject):
         super().__init__()
         self.main_window: MainWindow = main_window
         self.registry: ShortcutRegistry = registry
+        self.repeat_coalescer: ShortcutRepeatCoalescer = ShortcutRepeatCoalescer()
         logger.info("GlobalEventFilter initialized")
 
     @override
@@ -57,6 +60,12 @@ class GlobalEventFilter(QObject):
             True if the event was handled and should be filtered out,
             False to allow normal event processing to continue
         """
+        # A real key release (not auto-repeat) ends a coalesced repeat burst
+        if event.type() == QEvent.Type.KeyRelease:
+            if isinstance(event, QKeyEvent) and not event.isAutoRepeat():
+                self.repeat_coalescer.finish()
+            return False
+
         # Only handle key press events
         if event.type() != QEvent.Type.KeyPress:
             return False
@@ -65,6 +74,10 @@ class GlobalEventFilter(QObject):
         if not isinstance(event, QKeyEvent):
             return False
 
+        # Any new key press ends a repeat burst first, so e.g. undo sees its history entry
+        if not event.isAutoRepeat():
+            self.repeat_coalescer.finish()
+
         # Handle Page Up/Down for keyframe navigation (check before skipping widgets)
         key = event.key()
         if key == Qt.Key.Key_PageUp or key == Qt.Key.Key_PageDown:
@@ -131,6 +144,19 @@ class GlobalEventFilter(QObject):
             )
             return False
 
+        # Coalesce auto-repeat of repeatable commands into per-frame updates
+        if event.isAutoRepeat() and isinstance(command, RepeatableShortcutCommand):
+            try:
+                if self.repeat_coalescer.add_repeat(command, context):
+                    event.accept()
+                    return True
+                # Burst could not start: handle this press like a normal one
+            except Exception as e:
+                logger.error(f"Error coalescing shortcut [{command.key_sequence}]: {e}")
+                return False
+        else:
+            self.repeat_coalescer.finish()
+
         # Execute the command
         try:
             success = command.execute(context)
@@ -41,6 +41,7 @@ from typing_extensions import override
 
 from core.favorites_manager import FavoritesManager
 from core.logger_utils import get_logger
+from core.memory_budget import PRIORITY_DIRECTORY_SCANS, PRIORITY_THUMBNAILS, get_memory_budget
 from core.metadata_extractor import ImageMetadataExtractor
 from core.workers import DirectoryScanCache, DirectoryScanWorker, ThumbnailCache
 from ui.ui_constants import (
@@ -417,6 +418,11 @@ class ImageSequenceBrowserDialog(QDialog):
         # Initialize workers and caches
         self.thumbnail_cache: ThumbnailCache = ThumbnailCache()
         self.scan_cache: DirectoryScanCache = DirectoryScanCache(max_size=50)
+        memory_budget = get_memory_budget()
+        memory_budget.register("thumbnails", self.thumbnail_cache, PRIORITY_THUMBNAILS, "Thumbnails (browser)")
+        memory_budget.register(
+            "directory_scans", self.scan_cache, PRIORITY_DIRECTORY_SCANS, "Directory scans (browser)"
+        )
         self.scan_worker: DirectoryScanWorker | None = None
         self.metadata_extractor: ImageMetadataExtractor = ImageMetadataExtractor()
 
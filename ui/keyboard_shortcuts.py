@@ -51,6 +51,9 @@ class ShortcutManager(QObject):
     action_toggle_grid: QAction
     action_increase_grid_size: QAction
     action_decrease_grid_size: QAction
+    action_toggle_performance_hud: QAction
+    action_export_performance_trace: QAction
+    action_show_memory_usage: QAction
 
     # Curve actions
     action_smooth_curve: QAction
@@ -163,6 +166,17 @@ class ShortcutManager(QObject):
         self.action_decrease_grid_size.setShortcut("Ctrl+-")
         self.action_decrease_grid_size.setStatusTip("Decrease grid cell size (Ctrl+-)")
 
+        self.action_toggle_performance_hud = QAction("Performance &HUD", self.parent_widget)
+        self.action_toggle_performance_hud.setShortcut("Ctrl+Shift+H")
+        self.action_toggle_performance_hud.setCheckable(True)
+        self.action_toggle_performance_hud.setStatusTip("Show per-stage timings over the curve view")
+
+        self.action_export_performance_trace = QAction("Export Performance &Trace...", self.parent_widget)
+        self.action_export_performance_trace.setStatusTip("Save recorded timings as a Chrome trace (JSON)")
+
+        self.action_show_memory_usage = QAction("&Memory Usage...", self.parent_widget)
+        self.action_show_memory_usage.setStatusTip("Show cache memory use against the memory budget")
+
     def _create_curve_actions(self) -> None:
         """Create curve manipulation QActions."""
         self.action_smooth_curve = QAction("S&mooth Curve", self.parent_widget)
@@ -259,6 +273,10 @@ class ShortcutManager(QObject):
             None,  # Separator
             self.action_increase_grid_size,
             self.action_decrease_grid_size,
+            None,  # Separator
+            self.action_toggle_performance_hud,
+            self.action_export_performance_trace,
+            self.action_show_memory_usage,
         ]
 
     def get_curve_actions(self) -> list[QAction | None]:
@@ -317,6 +335,9 @@ class ShortcutManager(QObject):
             "toggle_grid": self.action_toggle_grid,
             "increase_grid_size": self.action_increase_grid_size,
             "decrease_grid_size": self.action_decrease_grid_size,
+            "toggle_performance_hud": self.action_toggle_performance_hud,
+            "export_performance_trace": self.action_export_performance_trace,
+            "show_memory_usage": self.action_show_memory_usage,
             "smooth_curve": self.action_smooth_curve,
             "filter_curve": self.action_filter_curve,
             "analyze_curve": self.action_analyze_curve,
@@ -357,6 +378,9 @@ class ShortcutManager(QObject):
         _ = self.action_toggle_grid.triggered.connect(main_window.on_toggle_grid)
         _ = self.action_increase_grid_size.triggered.connect(main_window.on_increase_grid_size)
         _ = self.action_decrease_grid_size.triggered.connect(main_window.on_decrease_grid_size)
+        _ = self.action_toggle_performance_hud.toggled.connect(main_window.on_toggle_performance_hud)
+        _ = self.action_export_performance_trace.triggered.connect(main_window.on_export_performance_trace)
+        _ = self.action_show_memory_usage.triggered.connect(main_window.on_show_memory_usage)
 
         # Curve actions
         _ = self.action_smooth_curve.triggered.connect(main_window.on_smooth_curve)
@@ -373,6 +397,7 @@ class ShortcutManager(QObject):
         main_window.addAction(self.action_toggle_grid)
         main_window.addAction(self.action_increase_grid_size)
         main_window.addAction(self.action_decrease_grid_size)
+        main_window.addAction(self.action_toggle_performance_hud)
 
         # Navigation actions (now handled by TimelineController)
         _ = self.action_next_frame.triggered.connect(main_window.timeline_controller._on_next_frame)
@@ -308,15 +308,21 @@ class MainWindow(QMainWindow):  # Implements MainWindowProtocol (structural typi
         # Setup tab order for keyboard navigation
         self._setup_tab_order()
 
-        # Auto-load session data (or fallback to burger data if no session exists)
+        # Auto-load session data (or fallback to burger data if no session exists).
+        # main.py passes auto_load_data=False and calls load_initial_session() after
+        # the window is shown so the first paint is not delayed by file loading.
         if auto_load_data:
-            self._session_manager.load_session_or_fallback(self)
+            self.load_initial_session()
 
         # Initialize tooltips as disabled by default
         self.view_management_controller.toggle_tooltips()
 
         logger.info("MainWindow initialized successfully")
 
+    def load_initial_session(self) -> None:
+        """Restore the last session, or fall back to the default burger data."""
+        self._session_manager.load_session_or_fallback(self)
+
     def on_store_selection_changed(self, selection: set[int], curve_name: str | None = None) -> None:
         """Handle store selection changed.
 
@@ -831,6 +837,21 @@ class MainWindow(QMainWindow):  # Implements MainWindowProtocol (structural typi
         """Handle zoom fit action (delegated to ActionHandlerController)."""
         self.action_controller.on_zoom_fit()
 
+    @Slot(bool)
+    def on_toggle_performance_hud(self, checked: bool) -> None:
+        """Handle performance HUD toggle (delegated to ActionHandlerController)."""
+        self.action_controller.on_toggle_performance_hud(checked)
+
+    @Slot()
+    def on_export_performance_trace(self) -> None:
+        """Handle export performance trace action (delegated to ActionHandlerController)."""
+        self.action_controller.on_export_performance_trace()
+
+    @Slot()
+    def on_show_memory_usage(self) -> None:
+        """Handle memory usage report action (delegated to ActionHandlerController)."""
+        self.action_controller.on_show_memory_usage()
+
     @Slot()
     def on_smooth_curve(self) -> None:
         """Handle smooth curve action (delegated to ActionHandlerController)."""
@@ -162,6 +162,8 @@ class TimelineControllerProtocol(Protocol):
     frame_slider: Any  # QSlider but avoiding circular imports
     frame_spinbox: Any  # QSpinBox but avoiding circular imports
     frame_changed: Any  # Signal(int) - emitted when frame changes
+    scrub_started: Any  # Signal() - emitted when the slider is grabbed
+    scrub_finished: Any  # Signal() - emitted when the slider is released
     status_message: Any  # Signal(str) - emitted to update status bar
 
     def on_timeline_tab_clicked(self, frame: int) -> None:
@@ -253,8 +255,8 @@ class BackgroundImageProtocol(Protocol):
         """Handle image sequence loaded."""
         ...
 
-    def update_background_for_frame(self, frame: int) -> None:
-        """Update background image for frame."""
+    def update_background_for_frame(self, frame: int, scrubbing: bool = False) -> bool:
+        """Update background image for frame; returns False if a stand-in is shown while scrubbing."""
         ...
 
     def clear_background_images(self) -> None:
@@ -326,6 +328,10 @@ class MultiPointTrackingProtocol(Protocol):
         """Handle tracking direction change."""
         ...
 
+    def on_tracking_directions_changed(self, point_names: list[str], new_direction: object) -> None:
+        """Handle tracking direction change for several points."""
+        ...
+
     def on_curve_selection_changed(self, selection: set[int]) -> None:
         """Handle curve selection change from ApplicationState."""
         ...
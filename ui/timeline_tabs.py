@@ -8,6 +8,8 @@ Supports horizontal scrolling for many frames with performance optimizations.
 """
 
 import contextlib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QTimer, Signal
@@ -24,7 +26,14 @@ from PySide6.QtWidgets import (
 )
 from typing_extensions import override
 
-from core.frame_utils import clamp_frame, get_frame_range_with_limits
+from core.frame_status_aggregator import (
+    SELECTED_COLUMN,
+    FrameStatusTable,
+    StatusRows,
+    frame_statuses_to_rows,
+    row_to_frame_status,
+)
+from core.frame_utils import clamp_frame
 from core.logger_utils import get_logger
 from core.models import FrameNumber, FrameStatus
 from core.type_aliases import CurveDataList
@@ -41,6 +50,19 @@ from ui.qt_utils import safe_slot
 
 logger = get_logger(__name__)
 
+# Maximum number of frames one curve may widen the timeline by (UI performance limit)
+MAX_TIMELINE_RANGE = 200
+
+_EMPTY_STATUS = FrameStatus(0, 0, 0, 0, 0, False, False, False)
+
+
+def _merge_spans(*spans: tuple[int, int] | None) -> tuple[int, int] | None:
+    """Get the smallest frame span covering all given spans (None entries are ignored)."""
+    present = [span for span in spans if span is not None]
+    if not present:
+        return None
+    return (min(first for first, _ in present), max(last for _, last in present))
+
 
 class TimelineScrollArea(QScrollArea):
     """Custom scroll area optimized for timeline tabs."""
@@ -76,16 +98,49 @@ class TimelineScrollArea(QScrollArea):
             super().wheelEvent(arg__1)
 
 
+@dataclass
+class _CurveStatusRows:
+    """Status rows of one curve as last computed."""
+
+    version: int
+    start: int
+    rows: StatusRows
+    selected_indices: frozenset[int] = frozenset()
+    selected_frames: frozenset[int] = frozenset()
+
+    @property
+    def span(self) -> tuple[int, int] | None:
+        """First and last frame with rows, or None for an empty curve."""
+        if len(self.rows) == 0:
+            return None
+        return (self.start, self.start + len(self.rows) - 1)
+
+
 class FrameStatusCache:
-    """Cache for frame point status to improve performance."""
+    """Array-backed cache for frame point status.
+
+    Each curve's statuses are kept as fixed-width NumPy rows, and a running
+    aggregate holds their sum. Replacing or removing one curve subtracts its
+    old rows and adds its new ones over that curve's frame span only, so the
+    other curves are never re-scanned. Frames can also be given an explicit
+    status with set_status(), which takes precedence over computed rows.
+    """
 
     # Attributes - initialized in __init__
-    _cache: dict[FrameNumber, FrameStatus]
+    _curves: dict[str, _CurveStatusRows]
+    _aggregate: FrameStatusTable
+    _overrides: FrameStatusTable
+    _display_curve: str | None
+    _aggregate_mode: bool
     _dirty_frames: set[FrameNumber]
 
     def __init__(self) -> None:
         """Initialize empty cache."""
-        self._cache = {}
+        self._curves = {}
+        self._aggregate = FrameStatusTable()
+        self._overrides = FrameStatusTable()
+        self._display_curve = None
+        self._aggregate_mode = False
         self._dirty_frames = set()
 
     def get_status(self, frame: FrameNumber) -> FrameStatus | None:
@@ -97,7 +152,20 @@ class FrameStatusCache:
         Returns:
             FrameStatus named tuple or None if not cached
         """
-        return self._cache.get(frame)
+        override = self._overrides.get(frame)
+        if override is not None:
+            return override
+        if self._aggregate_mode:
+            return self._aggregate.get(frame)
+        if self._display_curve is None:
+            return None
+        curve = self._curves.get(self._display_curve)
+        if curve is None:
+            return None
+        offset = frame - curve.start
+        if not 0 <= offset < len(curve.rows):
+            return None
+        return row_to_frame_status(curve.rows[offset])
 
     def set_status(
         self,
@@ -124,29 +192,148 @@ class FrameStatusCache:
             is_inactive: Whether frame is in an inactive segment
             has_selected: Whether frame has selected points
         """
-        self._cache[frame] = FrameStatus(
-            keyframe_count=keyframe_count,
-            interpolated_count=interpolated_count,
-            tracked_count=tracked_count,
-            endframe_count=endframe_count,
-            normal_count=normal_count,
-            is_startframe=is_startframe,
-            is_inactive=is_inactive,
-            has_selected=has_selected,
+        self._overrides.set_row(
+            frame,
+            (
+                keyframe_count,
+                interpolated_count,
+                tracked_count,
+                endframe_count,
+                normal_count,
+                is_startframe,
+                is_inactive,
+                has_selected,
+                1,
+            ),
         )
         self._dirty_frames.discard(frame)
 
+    def set_display_source(self, curve_name: str | None, aggregate: bool = False) -> bool:
+        """Choose which statuses get_status() reports.
+
+        Args:
+            curve_name: Curve shown in single-curve mode
+            aggregate: True to report the sum over all cached curves
+
+        Returns:
+            True if the source changed
+        """
+        changed = aggregate != self._aggregate_mode or (not aggregate and curve_name != self._display_curve)
+        self._aggregate_mode = aggregate
+        self._display_curve = curve_name
+        return changed
+
+    def curve_version(self, curve_name: str) -> int | None:
+        """Get the data version a curve's rows were computed from, or None if not cached."""
+        curve = self._curves.get(curve_name)
+        return curve.version if curve is not None else None
+
+    def curve_names(self) -> list[str]:
+        """Get the names of all cached curves."""
+        return list(self._curves)
+
+    def curve_span(self, curve_name: str) -> tuple[int, int] | None:
+        """Get the first and last frame with a status for a cached curve."""
+        curve = self._curves.get(curve_name)
+        return curve.span if curve is not None else None
+
+    def set_curve(
+        self, curve_name: str, version: int, frame_statuses: Mapping[int, FrameStatus]
+    ) -> tuple[int, int] | None:
+        """Replace the statuses of one curve, updating the aggregate by delta.
+
+        Selection flags of the curve are kept for frames it still covers.
+
+        Args:
+            curve_name: Curve the statuses belong to
+            version: ApplicationState data version they were computed from
+            frame_statuses: Status by frame, e.g. from get_frame_range_point_status()
+
+        Returns:
+            Frame span (first, last) whose status may have changed, or None
+        """
+        old_span = self.remove_curve(curve_name)
+        start, rows = frame_statuses_to_rows(frame_statuses)
+        curve = _CurveStatusRows(version, start, rows)
+        self._curves[curve_name] = curve
+        self._aggregate.add(start, rows)
+        return _merge_spans(old_span, curve.span)
+
+    def remove_curve(self, curve_name: str) -> tuple[int, int] | None:
+        """Drop a curve's statuses and subtract them from the aggregate.
+
+        Returns:
+            Frame span the curve covered, or None if it was not cached
+        """
+        curve = self._curves.pop(curve_name, None)
+        if curve is None:
+            return None
+        self._aggregate.add(curve.start, curve.rows, sign=-1)
+        span = curve.span
+        if span is not None:
+            self._overrides.clear_span(*span)
+        return span
+
+    def mark_curves_stale(self) -> None:
+        """Force every cached curve to be recomputed on its next sync."""
+        for curve in self._curves.values():
+            curve.version = -1
+
+    def get_curve_selection(self, curve_name: str) -> frozenset[int]:
+        """Get the selected point indices last applied to a cached curve."""
+        curve = self._curves.get(curve_name)
+        return curve.selected_indices if curve is not None else frozenset()
+
+    def set_curve_selection(self, curve_name: str, indices: Iterable[int], frames: Iterable[int]) -> set[int]:
+        """Set which frames of a cached curve hold selected points.
+
+        Args:
+            curve_name: Curve whose selection changed
+            indices: Selected point indices (remembered to detect later changes)
+            frames: Frames of the selected points
+
+        Returns:
+            Frames whose has_selected flag changed
+        """
+        curve = self._curves.get(curve_name)
+        if curve is None:
+            return set()
+
+        new_frames = frozenset(frames)
+        changed = set(new_frames.symmetric_difference(curve.selected_frames))
+        curve.selected_indices = frozenset(indices)
+        curve.selected_frames = new_frames
+        for frame in changed:
+            offset = frame - curve.start
+            if not 0 <= offset < len(curve.rows):
+                continue
+            value = 1 if frame in new_frames else 0
+            delta = value - int(curve.rows[offset, SELECTED_COLUMN])
+            if delta:
+                curve.rows[offset, SELECTED_COLUMN] = value
+                self._aggregate.adjust(frame, SELECTED_COLUMN, delta)
+        return changed
+
+    def clear_overrides(self) -> None:
+        """Drop all statuses set with set_status()."""
+        self._overrides.clear()
+
     def invalidate_frame(self, frame: FrameNumber) -> None:
         """Mark frame as needing update."""
         self._dirty_frames.add(frame)
 
     def invalidate_all(self) -> None:
         """Mark all frames as needing update."""
-        self._dirty_frames.update(self._cache.keys())
+        self.mark_curves_stale()
+        span = _merge_spans(*(curve.span for curve in self._curves.values()))
+        if span is not None:
+            self._dirty_frames.update(range(span[0], span[1] + 1))
 
     def clear(self) -> None:
         """Clear entire cache."""
-        self._cache.clear()
+        self._curves.clear()
+        self._aggregate.clear()
+        self._overrides.clear()
         self._dirty_frames.clear()
 
 
@@ -155,6 +342,8 @@ class TimelineTabWidget(QWidget):
 
     # Signals
     frame_hovered: Signal = Signal(int)
+    scrub_started: Signal = Signal()  # Mouse pressed on the tabs
+    scrub_finished: Signal = Signal()  # Mouse released after scrubbing
 
     # Layout constants
     TAB_SPACING: int = 0  # No spacing for seamless look
@@ -372,123 +561,118 @@ class TimelineTabWidget(QWidget):
     def _on_curves_changed(self, curves: dict[str, CurveDataList]) -> None:
         """Handle ApplicationState curves_changed signal.
 
-        Supports both single-curve and aggregate display modes.
+        Supports both single-curve and aggregate display modes. Only curves whose
+        ApplicationState data version changed since their statuses were cached are
+        recomputed, and only the frames they cover are pushed to the tabs.
         """
         logger.info(f"[TIMELINE] _on_curves_changed called with {len(curves)} curves (aggregate={self.show_all_curves_mode})")
 
-        # Invalidate status cache when curve data changes (segmentation may have changed)
-        self.status_cache.invalidate_all()
-        logger.info(f"[TIMELINE] Invalidated all cache entries (cache size: {len(self.status_cache._cache)})")  # pyright: ignore[reportPrivateUsage]
-
-        # Get active timeline point data (the curve whose timeline should be displayed)
-        from services import get_data_service
-
-        data_service = get_data_service()
+        active_timeline_point = self._app_state.active_curve
+        source_changed = self.status_cache.set_display_source(active_timeline_point, self.show_all_curves_mode)
 
         # Determine which curves to process based on mode
         if self.show_all_curves_mode:
-            # Aggregate mode - use all available curves
-            selected_curves = list(curves.keys())
-            if not selected_curves:
-                # No curves to aggregate - use default range
-                total_frames = get_application_state().get_total_frames()
-                if total_frames > 1:
-                    self.set_frame_range(1, total_frames)
-                else:
-                    self.set_frame_range(1, 1)
-                return
+            curve_names = list(curves)
+        elif active_timeline_point and active_timeline_point in curves:
+            curve_names = [active_timeline_point]
+        else:
+            curve_names = []
 
-            # Get aggregated status across all curves
-            frame_status = data_service.aggregate_frame_statuses_for_curves(selected_curves)
+        # Drop curves that were deleted, then recompute the ones whose data changed
+        touched = [
+            self.status_cache.remove_curve(name) for name in self.status_cache.curve_names() if name not in curves
+        ]
+        touched.extend(self._sync_curve_statuses(curves, curve_names))
 
-            # Calculate frame range from all curves
-            min_frame = 1
-            max_frame = 1
-            for curve_data in curves.values():
-                if curve_data:
-                    frame_range = get_frame_range_with_limits(curve_data, max_range=200)
-                    if frame_range:
-                        curve_min, curve_max = frame_range
-                        min_frame = min(min_frame, curve_min) if min_frame > 1 else curve_min
-                        max_frame = max(max_frame, curve_max)
+        old_range = (self.min_frame, self.max_frame)
+        self._update_frame_range(curve_names)
 
-            # Also consider image sequence length
-            image_sequence_frames = get_application_state().get_total_frames()
-            max_frame = max(max_frame, image_sequence_frames)
+        # set_frame_range() recreates the tabs from the cache when the range changes
+        if (self.min_frame, self.max_frame) == old_range:
+            self._refresh_tab_statuses(None if source_changed else [span for span in touched if span is not None])
 
-            # Update frame range
-            self.set_frame_range(min_frame, max_frame)
+        logger.debug(f"Timeline updated from ApplicationState: {len(curve_names)} curves shown")
 
-        else:
-            # Single-curve mode - use active timeline point
-            # Use ApplicationState.active_curve as single source of truth
-            active_timeline_point = self._app_state.active_curve
+    def _sync_curve_statuses(
+        self, curves: Mapping[str, CurveDataList], curve_names: Iterable[str]
+    ) -> list[tuple[int, int]]:
+        """Recompute the cached statuses of curves whose data version changed.
 
-            if not active_timeline_point or active_timeline_point not in curves:
-                # Check if image sequence is loaded even without tracking data
-                total_frames = get_application_state().get_total_frames()
-                if total_frames > 1:
-                    logger.debug(f"_on_curves_changed: No tracking data, using image sequence range 1-{total_frames}")
-                    self.set_frame_range(1, total_frames)
-                else:
-                    logger.debug("_on_curves_changed: No data, setting frame range to 1-1")
-                    self.set_frame_range(1, 1)
-                return
+        Args:
+            curves: Curve data by name
+            curve_names: Curves to bring up to date
 
-            curve_data = curves[active_timeline_point]
-            logger.debug(f"_on_curves_changed: got {len(curve_data) if curve_data else 0} points from ApplicationState")
+        Returns:
+            Frame spans whose status may have changed
+        """
+        from services import get_data_service
 
-            if not curve_data:
-                total_frames = get_application_state().get_total_frames()
-                if total_frames > 1:
-                    self.set_frame_range(1, total_frames)
-                else:
-                    self.set_frame_range(1, 1)
-                return
+        data_service = get_data_service()
+        touched: list[tuple[int, int]] = []
+        for curve_name in curve_names:
+            # Version 0 means the data is not tracked by ApplicationState, so always recompute
+            version = self._app_state.get_curve_version(curve_name)
+            if version and self.status_cache.curve_version(curve_name) == version:
+                continue
 
-            # Calculate frame range from data (with performance limits)
-            frame_range = get_frame_range_with_limits(curve_data, max_range=200)
-            if not frame_range:
-                return
+            curve_data = curves[curve_name]
+            frame_status = data_service.get_frame_range_point_status(curve_data)
+            span = self.status_cache.set_curve(curve_name, version, frame_status)
+            if span is not None:
+                touched.append(span)
+            selection = self._app_state.get_selection(curve_name)
+            touched.extend((frame, frame) for frame in self._apply_curve_selection(curve_name, curve_data, selection))
+        return touched
 
-            min_frame, max_frame = frame_range
+    def _apply_curve_selection(self, curve_name: str, curve_data: CurveDataList, selection: Iterable[int]) -> set[int]:
+        """Update the has_selected flags of a cached curve.
 
-            # Also consider image sequence length from ApplicationState
-            image_sequence_frames = get_application_state().get_total_frames()
-            max_frame = max(max_frame, image_sequence_frames)
+        Returns:
+            Frames whose has_selected flag changed
+        """
+        indices = frozenset(selection)
+        selected_frames = {int(curve_data[index][0]) for index in indices if 0 <= index < len(curve_data)}
+        return self.status_cache.set_curve_selection(curve_name, indices, selected_frames)
+
+    def _update_frame_range(self, curve_names: Iterable[str]) -> None:
+        """Fit the frame range to the cached spans of the shown curves and the image sequence."""
+        spans = [span for name in curve_names if (span := self.status_cache.curve_span(name)) is not None]
+        total_frames = get_application_state().get_total_frames()
+        if not spans:
+            # No tracking data - use the image sequence range if one is loaded
+            logger.debug(f"_on_curves_changed: No tracking data, using frame range 1-{max(total_frames, 1)}")
+            self.set_frame_range(1, max(total_frames, 1))
+            return
 
-            # Check if we actually limited the range
-            original_max = max([int(point[0]) for point in curve_data if len(point) >= 3])
-            if max_frame < original_max:
-                logger.warning(
-                    f"Timeline limited to 200 frames for performance (actual range: {min_frame}-{original_max})"
-                )
+        min_frame = min(first for first, _ in spans)
+        # Limit each curve's contribution for performance
+        max_frame = max(min(last, first + MAX_TIMELINE_RANGE - 1) for first, last in spans)
+        original_max = max(last for _, last in spans)
+        if max(max_frame, total_frames) < original_max:
+            logger.warning(
+                f"Timeline limited to {MAX_TIMELINE_RANGE} frames for performance (actual range: {min_frame}-{original_max})"
+            )
 
-            # Update frame range
-            self.set_frame_range(min_frame, max_frame)
+        # Also consider image sequence length
+        self.set_frame_range(min_frame, max(max_frame, total_frames))
 
-            # Update status for all frames
-            frame_status = data_service.get_frame_range_point_status(curve_data)
+    def _refresh_tab_statuses(self, spans: Iterable[tuple[int, int]] | None = None) -> None:
+        """Push cached statuses to the tabs.
 
-        # Update frame status for all frames (common path for both modes)
-        inactive_count = 0
-        for frame, status in frame_status.items():
-            if status.is_inactive:
-                inactive_count += 1
-            self.update_frame_status(
-                frame,
-                keyframe_count=status.keyframe_count,
-                interpolated_count=status.interpolated_count,
-                tracked_count=status.tracked_count,
-                endframe_count=status.endframe_count,
-                normal_count=status.normal_count,
-                is_startframe=status.is_startframe,
-                is_inactive=status.is_inactive,
-                has_selected=status.has_selected,
-            )
+        Args:
+            spans: Frame spans (first, last) to refresh, or None for every tab
+        """
+        if spans is None:
+            frames: Iterable[int] = list(self.frame_tabs)
+        else:
+            frames = set()
+            for first, last in spans:
+                frames.update(range(max(first, self.min_frame), min(last, self.max_frame) + 1))
 
-        logger.info(f"[TIMELINE] Updated {len(frame_status)} frames ({inactive_count} inactive)")
-        logger.debug(f"Timeline updated from ApplicationState: {len(frame_status)} frames")
+        for frame in frames:
+            tab = self.frame_tabs.get(frame)
+            if tab is not None:
+                tab.set_point_status(*(self.status_cache.get_status(frame) or _EMPTY_STATUS))
 
     @safe_slot
     def _on_active_curve_changed(self, curve_name: str | None) -> None:
@@ -514,6 +698,9 @@ class TimelineTabWidget(QWidget):
 
         Phase 4: Removed __default__ - curve_name is now optional.
 
+        Only the has_selected flags of frames whose selection changed are updated;
+        point statuses are not recomputed.
+
         Args:
             selection: Selected indices
             curve_name: Curve with selection change (None uses active_curve from ApplicationState)
@@ -529,64 +716,23 @@ class TimelineTabWidget(QWidget):
         if not curve_data:
             return
 
-        # Find frames that contain selected points
-        selected_frames: set[int] = set()
-        for index in selection:
-            if 0 <= index < len(curve_data):
-                point = curve_data[index]
-                if len(point) >= 3:
-                    frame = int(point[0])
-                    selected_frames.add(frame)
+        if self.status_cache.curve_version(curve_name) is None:
+            # Statuses of this curve were never computed - sync the timeline first
+            self._on_curves_changed(self._app_state.get_all_curves())
 
-        # Update has_selected status for all frames
-        from services import get_data_service
+        changed = self._apply_curve_selection(curve_name, curve_data, selection)
 
-        data_service = get_data_service()
-        frame_status = data_service.get_frame_range_point_status(curve_data)
+        if self.show_all_curves_mode:
+            # Multi-curve selections emit a single signal, so pick up the other curves too
+            for name in self.status_cache.curve_names():
+                if name == curve_name:
+                    continue
+                other_selection = self._app_state.get_selection(name)
+                if other_selection != self.status_cache.get_curve_selection(name):
+                    other_data = self._app_state.get_curve_data(name)
+                    changed.update(self._apply_curve_selection(name, other_data, other_selection))
 
-        for frame in range(self.min_frame, self.max_frame + 1):
-            # Check if this frame has selected points
-            has_selected = frame in selected_frames
-
-            # Get existing status from cache or calculate defaults
-            status = self.status_cache.get_status(frame)
-            if status:
-                # Use cached status
-                keyframe_count = status.keyframe_count
-                interpolated_count = status.interpolated_count
-                tracked_count = status.tracked_count
-                endframe_count = status.endframe_count
-                normal_count = status.normal_count
-                is_startframe = status.is_startframe
-                is_inactive = status.is_inactive
-            # Get status from data service if not cached
-            elif frame in frame_status:
-                status = frame_status[frame]
-                keyframe_count = status.keyframe_count
-                interpolated_count = status.interpolated_count
-                tracked_count = status.tracked_count
-                endframe_count = status.endframe_count
-                normal_count = status.normal_count
-                is_startframe = status.is_startframe
-                is_inactive = status.is_inactive
-            else:
-                # Default values for frames with no points
-                keyframe_count = interpolated_count = tracked_count = 0
-                endframe_count = normal_count = 0
-                is_startframe = is_inactive = False
-
-            # Update frame status with new has_selected value
-            self.update_frame_status(
-                frame,
-                keyframe_count=keyframe_count,
-                interpolated_count=interpolated_count,
-                tracked_count=tracked_count,
-                endframe_count=endframe_count,
-                normal_count=normal_count,
-                is_startframe=is_startframe,
-                is_inactive=is_inactive,
-                has_selected=has_selected,
-            )
+        self._refresh_tab_statuses((frame, frame) for frame in changed)
 
     @safe_slot
     def toggle_aggregate_mode(self, checked: bool) -> None:
@@ -974,62 +1120,13 @@ class TimelineTabWidget(QWidget):
 
     def _perform_deferred_updates(self) -> None:
         """Perform any pending status updates."""
-        # Recalculate status for dirty frames
-        from services import get_data_service
-
-        data_service = get_data_service()
-
-        # Get active curve data from ApplicationState - use active_curve_data property
-        if (cd := self._app_state.active_curve_data) is None:
-            return
-        _curve_name, curve_data = cd
-
-        # Clear status for frames that no longer have points
-        for frame in range(self.min_frame, self.max_frame + 1):
-            self.status_cache.set_status(
-                frame,
-                keyframe_count=0,
-                interpolated_count=0,
-                tracked_count=0,
-                endframe_count=0,
-                normal_count=0,
-                is_startframe=False,
-                is_inactive=False,
-                has_selected=False,
-            )
-
-        if curve_data:
-            # Get frame status for all points
-            frame_status = data_service.get_frame_range_point_status(curve_data)
-
-            # Update cache for all frames with data
-            for frame, status in frame_status.items():
-                self.status_cache.set_status(
-                    frame,
-                    keyframe_count=status.keyframe_count,
-                    interpolated_count=status.interpolated_count,
-                    tracked_count=status.tracked_count,
-                    endframe_count=status.endframe_count,
-                    normal_count=status.normal_count,
-                    is_startframe=status.is_startframe,
-                    is_inactive=status.is_inactive,
-                    has_selected=status.has_selected,
-                )
+        # Recompute every shown curve and drop explicit per-frame statuses
+        self.status_cache.clear_overrides()
+        self.status_cache.mark_curves_stale()
+        self._on_curves_changed(self._app_state.get_all_curves())
 
         # Now refresh visible tabs with updated status
-        for frame, tab in self.frame_tabs.items():
-            status = self.status_cache.get_status(frame)
-            if status:
-                tab.set_point_status(
-                    keyframe_count=status.keyframe_count,
-                    interpolated_count=status.interpolated_count,
-                    tracked_count=status.tracked_count,
-                    endframe_count=status.endframe_count,
-                    normal_count=status.normal_count,
-                    is_startframe=status.is_startframe,
-                    is_inactive=status.is_inactive,
-                    has_selected=status.has_selected,
-                )
+        self._refresh_tab_statuses()
 
     @override
     def resizeEvent(self, event: QResizeEvent) -> None:
@@ -1081,6 +1178,7 @@ class TimelineTabWidget(QWidget):
             if frame is not None:
                 self.is_scrubbing = True
                 self.scrub_start_frame = frame
+                self.scrub_started.emit()
                 # Delegate to ApplicationState (single source of truth)
                 get_application_state().set_frame(frame)
                 event.accept()
@@ -1105,6 +1203,7 @@ class TimelineTabWidget(QWidget):
         """Stop scrubbing when mouse is released."""
         if event.button() == Qt.MouseButton.LeftButton and self.is_scrubbing:
             self.is_scrubbing = False
+            self.scrub_finished.emit()
             event.accept()
         else:
             super().mouseReleaseEvent(event)
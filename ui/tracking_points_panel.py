@@ -108,14 +108,8 @@ class TrackingTableEventFilter(QObject):
             # No points selected, don't consume the event
             return False
 
-        # Set tracking direction for all selected points
-        for point_name in selected_points:
-            if point_name in self.panel.point_metadata:
-                self.panel.point_metadata[point_name]["tracking_direction"] = direction
-                self.panel.tracking_direction_changed.emit(point_name, direction)
-
-        # Update the direction dropdowns in the table
-        self.panel.update_direction_dropdowns_for_points(selected_points, direction)
+        # Set tracking direction for all selected points (one batched update)
+        self.panel.set_direction_for_points(selected_points, direction)
 
         # Event was handled, consume it
         return True
@@ -136,6 +130,7 @@ class TrackingPointsPanel(QWidget):
     point_visibility_changed: Signal = Signal(str, bool)  # Point name, visible
     point_color_changed: Signal = Signal(str, str)  # Point name, color hex
     tracking_direction_changed: Signal = Signal(str, object)  # Point name, TrackingDirection
+    tracking_directions_changed: Signal = Signal(list, object)  # Point names, TrackingDirection (bulk change)
     point_deleted: Signal = Signal(str)  # Point name
     point_renamed: Signal = Signal(str, str)  # Old name, new name
 
@@ -721,19 +716,26 @@ class TrackingPointsPanel(QWidget):
         self._set_direction_for_points(points, direction)
 
     def _set_direction_for_points(self, points: list[str], direction: TrackingDirection) -> None:
-        """Set tracking direction for multiple points (internal implementation)."""
+        """Set tracking direction for multiple points (internal implementation).
+
+        Emits tracking_directions_changed once for all known points so the
+        status update is applied as one batch instead of once per point.
+        """
+        changed_points: list[str] = []
         for point_name in points:
             if point_name in self.point_metadata:
                 self.point_metadata[point_name]["tracking_direction"] = direction
-                self.tracking_direction_changed.emit(point_name, direction)
+                changed_points.append(point_name)
+        if changed_points:
+            self.tracking_directions_changed.emit(changed_points, direction)
 
-        # Update dropdowns
-        for row in range(self.table.rowCount()):
-            point_name = self.table.item(row, 1).text()
-            if point_name in points:
-                direction_combo = self.table.cellWidget(row, 3)  # Direction is in column 3
-                if direction_combo and isinstance(direction_combo, QComboBox):
-                    direction_combo.setCurrentText(direction.abbreviation)
+        # Update dropdowns without re-emitting a per-point change for each combo box
+        was_updating = self._updating
+        self._updating = True
+        try:
+            self.update_direction_dropdowns_for_points(points, direction)
+        finally:
+            self._updating = was_updating
 
     def update_direction_dropdowns_for_points(self, points: list[str], direction: TrackingDirection) -> None:
         """Update direction dropdowns for specified points without changing metadata."""